@@ -3,6 +3,11 @@ ASGI config for Hi_Trip_v3 project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+The monitoring live stream (``/api/monitoring/trips/<id>/stream/``) is an async
+Server-Sent Events view, so serve the project through this module (e.g.
+``uvicorn Hi_Trip_v3.asgi:application``) to keep those connections open
+without buffering or tying up a worker thread per client.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
@@ -194,3 +194,74 @@ MEDIA_ROOT = BASE_DIR / 'media'
 # .env 파일에 GOOGLE_MAPS_API_KEY 값을 추가한 뒤, config 함수가 값을 찾지 못하면
 # 기본값으로 빈 문자열을 반환해 개발 환경에서도 안전하게 동작하도록 합니다.
 GOOGLE_MAPS_API_KEY = config("GOOGLE_MAPS_API_KEY", default="")
+# 비워 두면 실제 Google 주소를 호출합니다. 부하 테스트/오프라인 개발 시
+# `python manage.py run_fake_google`로 띄운 가짜 서버 주소(예: http://127.0.0.1:8765)를 지정합니다.
+GOOGLE_MAPS_BASE_URL = config("GOOGLE_MAPS_BASE_URL", default="")
+
+# GoogleApiCache(DB) 앞단 프로세스 메모리 캐시에 보관할 최대 항목 수. 0이면 메모리 계층을 끕니다.
+GOOGLE_API_MEMORY_CACHE_SIZE = config("GOOGLE_API_MEMORY_CACHE_SIZE", default=1024, cast=int)
+
+# GoogleApiCache 정리(prune_google_cache) 설정.
+# 서비스별 행 수/바이트 한도 예: {"places_nearby": 5000}. 비워 두면 만료 행만 정리합니다.
+GOOGLE_API_CACHE_ROW_BUDGETS = {}
+GOOGLE_API_CACHE_BYTE_BUDGETS = {}
+# 0보다 크면 캐시 저장 시 이 간격(초)마다 만료 행 한 배치를 함께 정리합니다(프로세스 단위).
+GOOGLE_API_CACHE_JANITOR_INTERVAL_SECONDS = config("GOOGLE_API_CACHE_JANITOR_INTERVAL_SECONDS", default=0, cast=int)
+# 캐시 적중 기록(hit_count/last_accessed_at)을 모았다가 DB에 반영하는 간격(초)과, 그 전이라도 반영할 누적 키 수
+GOOGLE_API_ACCESS_FLUSH_SECONDS = config("GOOGLE_API_ACCESS_FLUSH_SECONDS", default=300, cast=int)
+GOOGLE_API_ACCESS_FLUSH_MAX_KEYS = config("GOOGLE_API_ACCESS_FLUSH_MAX_KEYS", default=1000, cast=int)
+# 만료 후 이 시간(초) 동안은 기존 응답을 바로 돌려주고 백그라운드에서 갱신합니다(stale-while-revalidate). 0이면 끕니다.
+GOOGLE_API_STALE_GRACE_SECONDS = config("GOOGLE_API_STALE_GRACE_SECONDS", default=0, cast=int)
+GOOGLE_API_REFRESH_WORKERS = config("GOOGLE_API_REFRESH_WORKERS", default=2, cast=int)  # 백그라운드 갱신 작업자 수
+# true이면 GoogleApiCache.response_data를 zlib으로 압축해 저장합니다(기존 행은 그대로 읽힘).
+GOOGLE_API_CACHE_COMPRESS = config("GOOGLE_API_CACHE_COMPRESS", default=False, cast=bool)
+
+# Google Maps 서비스별 호출 한도. 예: {"places_nearby": {"qps": 10, "burst": 20, "daily_quota": 5000}}
+# 비워 두면 제한하지 않습니다. 한도를 넘는 호출은 최대 대기 시간만큼 기다린 뒤 거절(502)합니다.
+GOOGLE_MAPS_RATE_LIMITS = {}
+GOOGLE_MAPS_GOVERNOR_MAX_WAIT_SECONDS = config("GOOGLE_MAPS_GOVERNOR_MAX_WAIT_SECONDS", default=2.0, cast=float)
+# memory: 프로세스 단위, cache: Django 캐시(CACHES)로 여러 프로세스가 한도를 공유
+GOOGLE_MAPS_GOVERNOR_BACKEND = config("GOOGLE_MAPS_GOVERNOR_BACKEND", default="memory")
+GOOGLE_MAPS_QUOTA_TIMEZONE = "America/Los_Angeles"  # Google 일일 할당량 초기화 기준 시간대
+
+# sync_place_coordinates 명령의 기본 초당 Place Details 호출 수(--qps로 덮어쓸 수 있음)
+GOOGLE_PLACE_DETAILS_QPS = config("GOOGLE_PLACE_DETAILS_QPS", default=10, cast=float)
+
+# 추천 API에서 Google Place ID → Place pk를 찾을 때 쓰는 프로세스 메모리 캐시(항목 수, 유지 시간 초). 0이면 끕니다.
+PLACE_PK_CACHE_SIZE = config("PLACE_PK_CACHE_SIZE", default=4096, cast=int)
+PLACE_PK_CACHE_SECONDS = config("PLACE_PK_CACHE_SECONDS", default=3600, cast=int)
+
+# Google Maps 호출용 공용 HTTP 세션(연결 풀 + 재시도) 설정.
+# 서비스별 타임아웃은 GOOGLE_MAPS_TIMEOUTS = {"routes_matrix": 15} 처럼 덮어쓸 수 있습니다.
+GOOGLE_MAPS_HTTP_POOL_CONNECTIONS = config("GOOGLE_MAPS_HTTP_POOL_CONNECTIONS", default=4, cast=int)  # 호스트별 풀 개수
+GOOGLE_MAPS_HTTP_POOL_MAXSIZE = config("GOOGLE_MAPS_HTTP_POOL_MAXSIZE", default=16, cast=int)  # 호스트당 최대 연결 수
+GOOGLE_MAPS_HTTP_MAX_RETRIES = config("GOOGLE_MAPS_HTTP_MAX_RETRIES", default=2, cast=int)  # 429/5xx 재시도 횟수
+GOOGLE_MAPS_HTTP_BACKOFF_FACTOR = config("GOOGLE_MAPS_HTTP_BACKOFF_FACTOR", default=0.3, cast=float)
+GOOGLE_MAPS_TIMEOUTS = {}
+# 고정 추천처럼 여러 Google 호출을 동시에 보낼 때 공유 스레드 풀의 최대 작업자 수
+GOOGLE_MAPS_FANOUT_WORKERS = config("GOOGLE_MAPS_FANOUT_WORKERS", default=8, cast=int)
+
+# 구간 단위 이동 시간 캐시(RouteLegCache). 하루를 ROUTE_LEG_BUCKET_HOURS 시간 단위로 나눠 시간대별로 저장합니다.
+ROUTE_LEG_BUCKET_HOURS = config("ROUTE_LEG_BUCKET_HOURS", default=3, cast=int)
+ROUTE_LEG_CACHE_SECONDS = config("ROUTE_LEG_CACHE_SECONDS", default=60 * 60 * 24, cast=int)
+
+# 모니터링 스냅샷 월별 파티션(보관 테이블) 설정.
+# MONITORING_PARTITIONING을 켜면 manage_snapshot_partitions 명령으로 오래된 스냅샷을
+# 월별 파티션으로 옮기고, 보존 기간이 지난 파티션을 삭제할 수 있습니다.
+MONITORING_PARTITIONING = config("MONITORING_PARTITIONING", default=False, cast=bool)
+MONITORING_HOT_MONTHS = config("MONITORING_HOT_MONTHS", default=3, cast=int)  # 운영 테이블에 남길 개월 수
+MONITORING_RETENTION_MONTHS = config("MONITORING_RETENTION_MONTHS", default=12, cast=int)  # 0이면 무기한 보관
+
+# 실시간 모니터링 스트림(SSE) 설정.
+# MONITORING_EVENT_BUS_URL이 비어 있으면 프로세스 내부 버스를, redis:// URL이면 Redis pub/sub을 사용합니다.
+MONITORING_EVENT_BUS_URL = config("MONITORING_EVENT_BUS_URL", default="")
+MONITORING_STREAM_HEARTBEAT_SECONDS = config("MONITORING_STREAM_HEARTBEAT_SECONDS", default=15, cast=int)
+MONITORING_STREAM_MAX_SECONDS = config("MONITORING_STREAM_MAX_SECONDS", default=300, cast=int)  # 이후 클라이언트가 재연결
+
+# 백그라운드 데모 생성 작업 상태 보관: 완료 후 보관 시간(초)과 프로세스당 최대 보관 작업 수.
+MONITORING_DEMO_JOB_TTL_SECONDS = config("MONITORING_DEMO_JOB_TTL_SECONDS", default=3600, cast=int)
+MONITORING_DEMO_JOB_MAX = config("MONITORING_DEMO_JOB_MAX", default=100, cast=int)
+
+# 시계열 조회(history)를 분/시간 집계 테이블에서 읽을지 여부.
+# 기존 데이터가 있다면 backfill_monitoring_rollups를 먼저 실행한 뒤 켜세요.
+MONITORING_HISTORY_USE_ROLLUPS = config("MONITORING_HISTORY_USE_ROLLUPS", default=False, cast=bool)
@@ -2,7 +2,7 @@
 
 from django.contrib import admin
 
-from .models import HealthSnapshot, LocationSnapshot, MonitoringAlert
+from .models import HealthRollup, HealthSnapshot, LocationRollup, LocationSnapshot, MonitoringAlert
 
 
 @admin.register(HealthSnapshot)
@@ -39,4 +39,22 @@ class MonitoringAlertAdmin(admin.ModelAdmin):
     ordering = ("-created_at",)
 
     # 향후 개선 아이디어:
-    # - action으로 "CSV 내보내기"를 추가하면 관리자 페이지에서 바로 다운로드가 가능합니다.
\ No newline at end of file
+    # - action으로 "CSV 내보내기"를 추가하면 관리자 페이지에서 바로 다운로드가 가능합니다.
+
+
+@admin.register(HealthRollup)
+class HealthRollupAdmin(admin.ModelAdmin):
+    """분/시간 단위 건강 집계 확인용 설정 (집계는 서비스에서만 갱신)."""
+
+    list_display = ("participant", "granularity", "bucket_start", "heart_rate_min", "heart_rate_max", "spo2_min", "samples")
+    list_filter = ("granularity", "participant__trip")
+    ordering = ("-bucket_start",)
+
+
+@admin.register(LocationRollup)
+class LocationRollupAdmin(admin.ModelAdmin):
+    """분/시간 단위 마지막 위치 집계 확인용 설정."""
+
+    list_display = ("participant", "granularity", "bucket_start", "measured_at", "latitude", "longitude", "samples")
+    list_filter = ("granularity", "participant__trip")
+    ordering = ("-bucket_start",)
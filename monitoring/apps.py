@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class MonitoringConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'monitoring'
+
+    def ready(self):
+        # Trip 저장 시 임계치 캐시를 무효화하는 시그널 수신기를 등록합니다.
+        from . import signals  # noqa: F401
@@ -0,0 +1,316 @@
+"""실시간 모니터링 스트림(SSE)에 새 스냅샷/경보를 전달하는 pub/sub 버스.
+
+스냅샷 생성 서비스가 저장을 마친 뒤 ``publish_trip_events``로 이벤트를 발행하고,
+``views.trip_event_stream``이 여행 단위 채널을 구독해 클라이언트로 흘려보냅니다.
+
+- 기본값은 프로세스 내부 버스(``InProcessEventBus``)입니다. ASGI 워커 하나에서 발행과 구독이 모두
+  일어나는 개발/단일 인스턴스 환경에 적합합니다.
+- ``MONITORING_EVENT_BUS_URL``에 ``redis://`` URL을 설정하면 Redis pub/sub(``RedisEventBus``)을 사용해
+  여러 워커/서버 사이에서 이벤트를 공유합니다. 구독은 ``redis.asyncio``로 이벤트 루프에서 직접 기다리며,
+  워커마다 pubsub 연결 하나를 두고 SSE 클라이언트별 큐로 나눠 주므로 클라이언트 수만큼 스레드나 연결을
+  잡지 않습니다. ``publish``/``pubsub``만 있으면 되므로 테스트에서는 로컬 스텁 클라이언트를 넣을 수 있습니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import weakref
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+Event = Dict[str, Any]
+
+
+class InProcessSubscription:
+    """이벤트 루프 하나에 묶인 구독. 발행은 어느 스레드에서든 가능하다."""
+
+    def __init__(self, bus: "InProcessEventBus", trip_id: int, max_pending: int):
+        self._bus = bus
+        self._trip_id = trip_id
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+
+    def deliver(self, events: List[Event]) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._put, events)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫혔다면 연결이 끊긴 구독이므로 무시한다.
+            pass
+
+    def _put(self, events: List[Event]) -> None:
+        if self._queue.full():
+            # 느린 클라이언트 때문에 메모리가 늘지 않도록 가장 오래된 묶음을 버린다.
+            self._queue.get_nowait()
+        self._queue.put_nowait(events)
+
+    async def get(self, timeout: float) -> Optional[List[Event]]:
+        """다음 이벤트 묶음을 기다린다. timeout 동안 없으면 None."""
+
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self) -> None:
+        self._bus._unsubscribe(self._trip_id, self)
+
+
+class InProcessEventBus:
+    """프로세스 메모리 안에서 여행별 구독자에게 이벤트를 전달한다."""
+
+    def __init__(self, max_pending: int = 1000):
+        self.max_pending = max_pending
+        self._subscribers: Dict[int, Set[InProcessSubscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def publish(self, trip_id: int, events: List[Event]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(trip_id, ()))
+        for subscriber in subscribers:
+            subscriber.deliver(events)
+
+    async def subscribe(self, trip_id: int) -> InProcessSubscription:
+        subscription = InProcessSubscription(self, trip_id, self.max_pending)
+        with self._lock:
+            self._subscribers[trip_id].add(subscription)
+        return subscription
+
+    def _unsubscribe(self, trip_id: int, subscription: InProcessSubscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(trip_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[trip_id]
+
+
+class RedisSubscription(InProcessSubscription):
+    """워커 공용 Redis 리스너가 채워 주는 큐에서 이벤트를 읽는 구독."""
+
+    async def close(self) -> None:
+        await self._bus._unsubscribe(self._trip_id, self)
+
+
+class _RedisListener:
+    """이벤트 루프 하나에서 Redis pubsub 연결 하나로 받은 메시지를 구독자별 큐로 나눠 준다.
+
+    SSE 클라이언트마다 연결이나 스레드를 잡지 않도록, 여행 채널은 첫 구독자가 생길 때 구독하고
+    마지막 구독자가 떠나면 해제합니다. 메시지 수신 작업은 구독자가 있는 동안만 돕니다.
+    """
+
+    def __init__(self, bus: "RedisEventBus", client):
+        self._bus = bus
+        self._pubsub = client.pubsub()
+        self._subscribers: Dict[str, Set[RedisSubscription]] = defaultdict(set)
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    async def subscribe(self, trip_id: int) -> RedisSubscription:
+        channel = self._bus.channel(trip_id)
+        subscription = RedisSubscription(self, trip_id, self._bus.max_pending)
+        async with self._lock:
+            if not self._subscribers.get(channel):
+                await self._pubsub.subscribe(channel)
+            self._subscribers[channel].add(subscription)
+            if self._task is None:
+                self._task = asyncio.create_task(self._listen())
+        return subscription
+
+    async def _unsubscribe(self, trip_id: int, subscription: RedisSubscription) -> None:
+        channel = self._bus.channel(trip_id)
+        async with self._lock:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[channel]
+                await self._pubsub.unsubscribe(channel)
+
+    async def _listen(self) -> None:
+        while True:
+            async with self._lock:
+                if not self._subscribers:
+                    self._task = None
+                    return
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=self._bus.poll_seconds
+                )
+            except Exception:  # pragma: no cover - 연결이 끊겨도 다음 폴링에서 다시 시도한다.
+                logger.exception("모니터링 이벤트 수신 실패")
+                await asyncio.sleep(self._bus.poll_seconds)
+                continue
+            if message and message.get("type") == "message":
+                self._dispatch(message)
+
+    def _dispatch(self, message: Dict[str, Any]) -> None:
+        channel, data = message["channel"], message["data"]
+        if isinstance(channel, bytes):
+            channel = channel.decode("utf-8")
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        events = json.loads(data)
+        for subscription in list(self._subscribers.get(channel, ())):
+            subscription._put(events)
+
+
+class RedisEventBus:
+    """Redis pub/sub으로 여러 프로세스에 이벤트를 전달한다.
+
+    발행은 동기 클라이언트(``publish``)로, 구독은 ``async_client_factory``가 만든 asyncio 클라이언트
+    (``redis.asyncio``)로 합니다. 구독은 이벤트 루프마다 pubsub 연결 하나를 공유합니다.
+    """
+
+    channel_prefix = "hi_trip:monitoring:trip:"
+    # 리스너가 구독자 변화를 확인하는 최대 대기 시간(초)
+    poll_seconds = 1.0
+
+    def __init__(self, client, async_client_factory: Callable[[], Any], max_pending: int = 1000):
+        self.client = client
+        self.max_pending = max_pending
+        self._async_client_factory = async_client_factory
+        self._listeners: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _RedisListener]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def channel(self, trip_id: int) -> str:
+        return f"{self.channel_prefix}{trip_id}"
+
+    def publish(self, trip_id: int, events: List[Event]) -> None:
+        self.client.publish(self.channel(trip_id), json.dumps(events, cls=DjangoJSONEncoder))
+
+    async def subscribe(self, trip_id: int) -> RedisSubscription:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            listener = self._listeners.get(loop)
+            if listener is None:
+                listener = self._listeners[loop] = _RedisListener(self, self._async_client_factory())
+        return await listener.subscribe(trip_id)
+
+
+_bus = None
+_bus_lock = threading.Lock()
+
+
+def _build_bus_from_settings():
+    url = getattr(settings, "MONITORING_EVENT_BUS_URL", "")
+    if not url:
+        return InProcessEventBus()
+    try:
+        import redis
+        import redis.asyncio as redis_asyncio
+    except ImportError as exc:
+        raise ImproperlyConfigured(
+            "MONITORING_EVENT_BUS_URL을 사용하려면 redis 패키지(4.2 이상)를 설치해야 합니다."
+        ) from exc
+    return RedisEventBus(redis.Redis.from_url(url), lambda: redis_asyncio.Redis.from_url(url))
+
+
+def get_event_bus():
+    """설정에 맞는 이벤트 버스를 한 번만 만들어 재사용한다."""
+
+    global _bus
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                _bus = _build_bus_from_settings()
+    return _bus
+
+
+def set_event_bus(bus) -> None:
+    """이벤트 버스를 교체한다. None을 주면 다음 호출 때 설정에서 다시 만든다(테스트용)."""
+
+    global _bus
+    _bus = bus
+
+
+def _publish(trip_id: int, events: List[Event]) -> None:
+    try:
+        get_event_bus().publish(trip_id, events)
+    except Exception:  # pragma: no cover - 스트림 장애가 저장 로직을 깨뜨리지 않도록 한다.
+        logger.exception("모니터링 이벤트 발행 실패: trip=%s", trip_id)
+
+
+def _health_event(snapshot) -> Event:
+    return {
+        "type": "health",
+        "participant_id": snapshot.participant_id,
+        "id": snapshot.id,
+        "measured_at": snapshot.measured_at,
+        "heart_rate": snapshot.heart_rate,
+        "spo2": str(snapshot.spo2),
+        "status": snapshot.status,
+    }
+
+
+def _location_event(snapshot) -> Event:
+    return {
+        "type": "location",
+        "participant_id": snapshot.participant_id,
+        "id": snapshot.id,
+        "measured_at": snapshot.measured_at,
+        "latitude": str(snapshot.latitude),
+        "longitude": str(snapshot.longitude),
+        "accuracy_m": str(snapshot.accuracy_m) if snapshot.accuracy_m is not None else None,
+    }
+
+
+def _alert_event(alert) -> Event:
+    return {
+        "type": "alert",
+        "participant_id": alert.participant_id,
+        "id": alert.id,
+        "alert_type": alert.alert_type,
+        "message": alert.message,
+        "snapshot_time": alert.snapshot_time,
+        "created_at": alert.created_at,
+    }
+
+
+def publish_trip_events(
+    trip_id: int,
+    *,
+    health: Iterable = (),
+    location: Iterable = (),
+    alerts: Iterable = (),
+) -> None:
+    """저장된 스냅샷/경보를 이벤트로 변환해 발행한다.
+
+    트랜잭션 안에서 호출되면 커밋 이후에 발행하므로, 롤백된 데이터가 스트림에 흘러가지 않습니다.
+    """
+
+    events = (
+        [_health_event(snapshot) for snapshot in health]
+        + [_location_event(snapshot) for snapshot in location]
+        + [_alert_event(alert) for alert in alerts]
+    )
+    if not events:
+        return
+    # datetime 등은 발행 시점에 JSON 호환 값으로 바꿔 둔다(백엔드와 무관하게 같은 형태 유지).
+    events = json.loads(json.dumps(events, cls=DjangoJSONEncoder))
+
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _publish(trip_id, events))
+    else:
+        _publish(trip_id, events)
+
+
+__all__ = [
+    "InProcessEventBus",
+    "RedisEventBus",
+    "get_event_bus",
+    "publish_trip_events",
+    "set_event_bus",
+]
@@ -0,0 +1,29 @@
+"""시계열 집계에 사용하는 DB 함수 표현식."""
+
+from __future__ import annotations
+
+from django.db.models import BigIntegerField, Func
+
+
+class EpochBucket(Func):
+    """시각을 ``seconds`` 초 단위 구간 번호(UNIX epoch 기준, UTC)로 바꾼다.
+
+    구간 시작 시각은 ``번호 * seconds`` epoch 초이며, 같은 번호끼리 GROUP BY 하면 서버 측 다운샘플링이 됩니다.
+    Django의 Trunc 함수는 분/시 같은 고정 단위만 지원하므로 임의 초 단위를 위해 직접 구현했습니다.
+    """
+
+    output_field = BigIntegerField()
+
+    def __init__(self, expression, seconds: int, **extra):
+        if int(seconds) <= 0:
+            raise ValueError("seconds는 1 이상이어야 합니다.")
+        self.seconds = int(seconds)
+        super().__init__(expression, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        if connection.vendor == "sqlite":
+            # SQLite는 UTC 문자열로 저장하므로 strftime('%s')가 곧 epoch 초다.
+            return f"(CAST(strftime('%%s', {sql}) AS INTEGER) / %s)", [*params, self.seconds]
+        return f"CAST(FLOOR(EXTRACT(EPOCH FROM {sql}) / %s) AS BIGINT)", [*params, self.seconds]
+
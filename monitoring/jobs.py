@@ -0,0 +1,135 @@
+"""HTTP 요청을 막지 않고 대량 데모 데이터를 생성하기 위한 간단한 백그라운드 작업 관리자.
+
+별도 작업 큐(Celery 등)를 두지 않은 프로젝트이므로 프로세스 내부 스레드 하나로 작업을 순서대로
+실행하고, 상태는 메모리에 보관합니다. 작업 상태는 같은 프로세스에서만 조회할 수 있으므로
+멀티 워커 환경에서 대용량 데이터셋을 만들 때는 ``generate_bulk_telemetry`` 관리 커맨드를 사용하세요.
+
+끝난 작업은 ``MONITORING_DEMO_JOB_TTL_SECONDS``가 지나면 목록에서 지우고, 보관 작업 수가
+``MONITORING_DEMO_JOB_MAX``를 넘으면 오래된 완료 작업부터 지워 장시간 실행되는 워커의 메모리가 늘지 않게 합니다.
+
+테스트에서는 ``set_job_runner``로 동기 실행기를 주입해 스레드 없이 검증할 수 있습니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+JobRunner = Callable[[Callable[[], None]], None]
+
+
+@dataclass
+class DemoGenerationJob:
+    """백그라운드 데모 생성 작업의 진행 상태."""
+
+    trip_id: int
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = "pending"  # pending → running → succeeded | failed
+    health_created: int = 0
+    location_created: int = 0
+    alerts_created: int = 0
+    error: Optional[str] = None
+    created_at: object = field(default_factory=timezone.now)
+    finished_at: object = None
+
+
+_jobs: Dict[str, DemoGenerationJob] = {}
+_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+_runner: Optional[JobRunner] = None
+
+
+def _thread_runner(task: Callable[[], None]) -> None:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="monitoring-demo")
+    _executor.submit(task)
+
+
+def set_job_runner(runner: Optional[JobRunner]) -> None:
+    """작업 실행기를 교체한다. None을 주면 기본 스레드 실행기로 돌아간다."""
+
+    global _runner
+    _runner = runner
+
+
+def _prune_jobs() -> None:
+    """보관 기간이 지난 완료 작업을 지우고, 한도를 넘으면 오래된 완료 작업부터 지운다. ``_lock``을 잡고 호출한다."""
+
+    ttl = timedelta(seconds=getattr(settings, "MONITORING_DEMO_JOB_TTL_SECONDS", 3600))
+    max_jobs = getattr(settings, "MONITORING_DEMO_JOB_MAX", 100)
+    cutoff = timezone.now() - ttl
+    finished = [job_id for job_id, job in _jobs.items() if job.finished_at is not None]
+    overflow = len(_jobs) - max_jobs
+    # dict는 등록 순서를 유지하므로 앞쪽이 오래된 작업이다. 실행 중인 작업은 지우지 않는다.
+    for job_id in finished:
+        if _jobs[job_id].finished_at < cutoff or overflow > 0:
+            del _jobs[job_id]
+            overflow -= 1
+
+
+def get_job(job_id: str) -> Optional[DemoGenerationJob]:
+    with _lock:
+        _prune_jobs()
+        return _jobs.get(job_id)
+
+
+def submit_demo_generation(
+    *,
+    trip_id: int,
+    minutes: int,
+    interval_seconds: int,
+    seed: Optional[int] = None,
+) -> DemoGenerationJob:
+    """데모 생성 작업을 등록하고 즉시 반환한다. 실제 생성은 실행기에서 진행된다."""
+
+    job = DemoGenerationJob(trip_id=trip_id)
+    with _lock:
+        _prune_jobs()
+        _jobs[job.job_id] = job
+
+    def task() -> None:
+        from trips.models import Trip
+
+        from .services import generate_bulk_demo_snapshots
+
+        def on_progress(result) -> None:
+            job.health_created = result.health_created
+            job.location_created = result.location_created
+            job.alerts_created = result.alerts_created
+
+        job.status = "running"
+        try:
+            trip = Trip.objects.get(pk=trip_id)
+            generate_bulk_demo_snapshots(
+                trip=trip,
+                minutes=minutes,
+                interval_seconds=interval_seconds,
+                seed=seed,
+                progress=on_progress,
+            )
+            job.status = "succeeded"
+        except Exception as exc:  # pragma: no cover - 예외 종류와 무관하게 상태에 기록
+            logger.exception("데모 데이터 생성 작업 실패: job=%s", job.job_id)
+            job.status = "failed"
+            job.error = str(exc)
+        finally:
+            job.finished_at = timezone.now()
+            if _runner is None:
+                # 작업 스레드가 연 DB 연결을 정리한다.
+                close_old_connections()
+
+    (_runner or _thread_runner)(task)
+    return job
@@ -0,0 +1 @@
+"""monitoring 앱의 manage.py 명령 패키지."""
@@ -0,0 +1 @@
+"""monitoring 앱의 커스텀 manage.py 명령 모음."""
@@ -0,0 +1,113 @@
+"""관리 커맨드: 원본 스냅샷에서 분/시간 집계(rollup) 테이블을 다시 계산한다."""
+
+from __future__ import annotations
+
+from datetime import timedelta, timezone as dt_timezone
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Min
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from monitoring.models import HealthSnapshot, LocationSnapshot
+from monitoring.rollups import GRANULARITY_SECONDS, align_range, rebuild_rollups
+from trips.models import Trip
+
+
+class Command(BaseCommand):
+    """`python manage.py backfill_monitoring_rollups --trip 1 --since 2026-01-01T00:00:00Z` 형태로 실행한다."""
+
+    help = (
+        "HealthSnapshot/LocationSnapshot을 GROUP BY로 다시 집계해 분/시간 집계 행을 교체합니다. "
+        "집계 테이블 도입 이전 데이터를 채우거나, 집계가 어긋났을 때 복구하는 용도입니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--trip", type=int, default=None, help="특정 Trip의 참가자만 처리합니다.")
+        parser.add_argument("--since", default=None, help="시작 시각(ISO 8601). 생략하면 가장 오래된 스냅샷부터.")
+        parser.add_argument("--until", default=None, help="종료 시각(ISO 8601, 미포함). 생략하면 현재 시각.")
+        parser.add_argument(
+            "--granularity",
+            choices=sorted(GRANULARITY_SECONDS),
+            action="append",
+            default=None,
+            help="다시 계산할 집계 단위 (여러 번 지정 가능, 기본: 전체).",
+        )
+        parser.add_argument(
+            "--window-hours",
+            type=int,
+            default=24,
+            help="한 트랜잭션에서 처리할 기간(시간). 기본 24시간.",
+        )
+
+    def handle(self, *args, **options):
+        if options["window_hours"] <= 0:
+            raise CommandError("window-hours 값은 1 이상이어야 합니다.")
+
+        participant_ids = None
+        if options["trip"] is not None:
+            try:
+                trip = Trip.objects.get(pk=options["trip"])
+            except Trip.DoesNotExist as exc:
+                raise CommandError(f"Trip(id={options['trip']})을 찾을 수 없습니다.") from exc
+            participant_ids = list(trip.participants.values_list("id", flat=True))
+
+        since = self._parse(options["since"], "since")
+        until = self._parse(options["until"], "until") or timezone.now()
+        if since is None:
+            since = self._oldest_snapshot(participant_ids)
+            if since is None:
+                self.stdout.write("집계할 스냅샷이 없습니다.")
+                return
+        if since >= until:
+            raise CommandError("since는 until보다 이전 시각이어야 합니다.")
+
+        granularities = options["granularity"] or list(GRANULARITY_SECONDS)
+        start, end = align_range(since, until)
+        window = timedelta(hours=options["window_hours"])
+        totals = {"health": 0, "location": 0}
+
+        cursor = start
+        while cursor < end:
+            window_end = min(cursor + window, end)
+            counts = rebuild_rollups(
+                start=cursor,
+                end=window_end,
+                participant_ids=participant_ids,
+                granularities=granularities,
+            )
+            for key, value in counts.items():
+                totals[key] += value
+            if options["verbosity"] >= 2:
+                self.stdout.write(f"  {cursor:%Y-%m-%d %H:%M} ~ {window_end:%Y-%m-%d %H:%M}: {counts}")
+            cursor = window_end
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{start:%Y-%m-%d %H:%M} ~ {end:%Y-%m-%d %H:%M} 집계 완료: "
+                f"건강 {totals['health']}건, 위치 {totals['location']}건 ({', '.join(granularities)})"
+            )
+        )
+
+    @staticmethod
+    def _parse(value, name):
+        if value is None:
+            return None
+        parsed = parse_datetime(value)
+        if parsed is None:
+            raise CommandError(f"{name} 값은 ISO 8601 형식이어야 합니다.")
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed, dt_timezone.utc)
+        return parsed
+
+    @staticmethod
+    def _oldest_snapshot(participant_ids):
+        candidates = []
+        for model in (HealthSnapshot, LocationSnapshot):
+            queryset = model.objects.all()
+            if participant_ids is not None:
+                queryset = queryset.filter(participant_id__in=participant_ids)
+            oldest = queryset.aggregate(oldest=Min("measured_at"))["oldest"]
+            if oldest is not None:
+                candidates.append(oldest)
+        return min(candidates) if candidates else None
@@ -0,0 +1,146 @@
+"""관리 커맨드: 참가자 최신 상태 조회의 쿼리 수와 지연 시간을 측정한다."""
+
+from __future__ import annotations
+
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from monitoring.models import HealthSnapshot, LocationSnapshot
+from monitoring.services import ParticipantStatus, get_participant_statuses
+from trips.models import Trip, TripParticipant
+from users.models import Traveler
+
+
+def _legacy_participant_statuses(trip: Trip) -> list[ParticipantStatus]:
+    """비교 기준: 참가자마다 .first()를 두 번 호출하던 이전(2N+1) 구현."""
+
+    result = []
+    for participant in trip.participants.select_related("traveler"):
+        result.append(
+            ParticipantStatus(
+                participant=participant,
+                health=participant.health_snapshots.order_by("-measured_at").first(),
+                location=participant.location_snapshots.order_by("-measured_at").first(),
+            )
+        )
+    return result
+
+
+class Command(BaseCommand):
+    """`python manage.py benchmark_participant_statuses --sizes 10 100 1000` 형태로 실행한다."""
+
+    help = (
+        "임시 여행/참가자/스냅샷을 만든 뒤 get_participant_statuses의 쿼리 수와 지연 시간을 "
+        "이전 구현과 비교합니다. 모든 데이터는 측정 후 롤백되므로 운영 DB에도 흔적이 남지 않습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[10, 100, 1000],
+            help="측정할 참가자 수 목록 (기본 10 100 1000).",
+        )
+        parser.add_argument(
+            "--snapshots",
+            type=int,
+            default=5,
+            help="참가자별로 만들 건강/위치 스냅샷 개수 (기본 5).",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="각 구현을 반복 실행한 뒤 가장 빠른 값을 사용합니다 (기본 3).",
+        )
+
+    def handle(self, *args, **options):
+        sizes = options["sizes"]
+        snapshots = options["snapshots"]
+        repeat = options["repeat"]
+        if any(size <= 0 for size in sizes) or snapshots <= 0 or repeat <= 0:
+            raise CommandError("sizes, snapshots, repeat 값은 모두 1 이상이어야 합니다.")
+
+        self.stdout.write(
+            f"{'참가자':>8} | {'구현':<8} | {'쿼리 수':>7} | {'최소 지연(ms)':>13}"
+        )
+        for size in sizes:
+            with transaction.atomic():
+                trip = self._build_dataset(size, snapshots)
+                for label, func in (("legacy", _legacy_participant_statuses), ("current", get_participant_statuses)):
+                    queries, best_ms = self._measure(func, trip, repeat)
+                    self.stdout.write(f"{size:>8} | {label:<8} | {queries:>7} | {best_ms:>13.2f}")
+                transaction.set_rollback(True)
+
+    @staticmethod
+    def _measure(func, trip: Trip, repeat: int) -> tuple[int, float]:
+        """쿼리 수(첫 실행 기준)와 가장 빠른 실행 시간(ms)을 반환한다."""
+
+        timings = []
+        query_count = 0
+        for attempt in range(repeat):
+            with CaptureQueriesContext(connection) as ctx:
+                started = time.perf_counter()
+                func(trip)
+                timings.append((time.perf_counter() - started) * 1000)
+            if attempt == 0:
+                query_count = len(ctx.captured_queries)
+        return query_count, min(timings)
+
+    @staticmethod
+    def _build_dataset(size: int, snapshots: int) -> Trip:
+        """벤치마크 전용 여행과 참가자, 스냅샷을 bulk_create로 빠르게 만든다."""
+
+        today = date.today()
+        trip = Trip.objects.create(
+            title=f"벤치마크 여행 ({size}명)",
+            destination="서울",
+            start_date=today,
+            end_date=today + timedelta(days=1),
+        )
+        travelers = Traveler.objects.bulk_create(
+            Traveler(
+                last_name_kr="벤치",
+                first_name_kr=f"참가자{index}",
+                birth_date=date(1990, 1, 1),
+                gender="M",
+                phone=f"bench-{trip.id}-{index}",
+            )
+            for index in range(size)
+        )
+        participants = TripParticipant.objects.bulk_create(
+            TripParticipant(trip=trip, traveler=traveler) for traveler in travelers
+        )
+
+        now = timezone.now()
+        health_rows = []
+        location_rows = []
+        for participant in participants:
+            for step in range(snapshots):
+                measured_at = now - timedelta(minutes=step)
+                health_rows.append(
+                    HealthSnapshot(
+                        participant=participant,
+                        measured_at=measured_at,
+                        heart_rate=70 + step,
+                        spo2=Decimal("97.00"),
+                    )
+                )
+                location_rows.append(
+                    LocationSnapshot(
+                        participant=participant,
+                        measured_at=measured_at,
+                        latitude=Decimal("37.566500"),
+                        longitude=Decimal("126.978000"),
+                    )
+                )
+        HealthSnapshot.objects.bulk_create(health_rows, batch_size=1000)
+        LocationSnapshot.objects.bulk_create(location_rows, batch_size=1000)
+        return trip
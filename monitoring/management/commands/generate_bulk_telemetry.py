@@ -0,0 +1,77 @@
+"""관리 커맨드: 부하 테스트용 대량 건강/위치 스냅샷과 경보를 생성한다."""
+
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from monitoring.services import DEMO_CHUNK_SIZE, generate_bulk_demo_snapshots
+from trips.models import Trip
+
+
+class Command(BaseCommand):
+    """`python manage.py generate_bulk_telemetry 1 --minutes 1440 --seed 42` 형태로 실행한다."""
+
+    help = (
+        "여행 참가자 전원에 대해 지정한 기간만큼 스냅샷과 경보를 청크 단위 bulk_create로 생성합니다. "
+        "--seed를 주면 같은 데이터셋을 다시 만들 수 있습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("trip_id", type=int, help="데이터를 생성할 Trip ID")
+        parser.add_argument(
+            "--minutes",
+            type=int,
+            default=24 * 60,
+            help="몇 분 분량의 데이터를 만들지 지정 (기본 1440분 = 하루).",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=60,
+            help="측정 간격(초). 기본값 60초.",
+        )
+        parser.add_argument("--seed", type=int, default=None, help="난수 시드 (재현 가능한 데이터셋용).")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEMO_CHUNK_SIZE,
+            help=f"한 트랜잭션에 담을 측정 시점×참가자 수 (기본 {DEMO_CHUNK_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        minutes = options["minutes"]
+        interval = options["interval"]
+        chunk_size = options["chunk_size"]
+        if minutes <= 0 or interval <= 0 or chunk_size <= 0:
+            raise CommandError("minutes, interval, chunk-size 값은 모두 1 이상이어야 합니다.")
+
+        try:
+            trip = Trip.objects.get(pk=options["trip_id"])
+        except Trip.DoesNotExist as exc:
+            raise CommandError(f"Trip(id={options['trip_id']})을 찾을 수 없습니다.") from exc
+
+        verbosity = options["verbosity"]
+
+        def report(result) -> None:
+            if verbosity >= 2:
+                self.stdout.write(f"  ... 스냅샷 {result.snapshots_created}건 저장")
+
+        started = time.perf_counter()
+        result = generate_bulk_demo_snapshots(
+            trip=trip,
+            minutes=minutes,
+            interval_seconds=interval,
+            seed=options["seed"],
+            chunk_size=chunk_size,
+            progress=report,
+        )
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Trip {trip.id}: 건강 {result.health_created}건, 위치 {result.location_created}건, "
+                f"경보 {result.alerts_created}건 생성 ({elapsed:.1f}초)"
+            )
+        )
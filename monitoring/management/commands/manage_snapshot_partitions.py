@@ -0,0 +1,94 @@
+"""관리 커맨드: 건강/위치 스냅샷의 월별 파티션을 만들고 롤링한다."""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from monitoring.partitions import (
+    PARTITIONED_MODELS,
+    MonthPartition,
+    PartitioningNotSupported,
+    archive_rows_before,
+    drop_partitions_before,
+    ensure_partitions,
+    iter_months,
+    list_partitions,
+)
+
+
+class Command(BaseCommand):
+    """`python manage.py manage_snapshot_partitions` 형태로 실행한다. 크론으로 매일 돌려도 안전하다."""
+
+    help = (
+        "운영 테이블에는 최근 --hot-months 개월 치 스냅샷만 남기고 그 이전 데이터는 월별 파티션으로 옮깁니다. "
+        "--retain-months 이전의 파티션은 통째로 삭제합니다. "
+        "PostgreSQL은 선언적 파티션, SQLite는 월별 섀도 테이블을 사용합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hot-months",
+            type=int,
+            default=None,
+            help="운영 테이블에 남길 개월 수 (이번 달 포함). 기본값은 settings.MONITORING_HOT_MONTHS.",
+        )
+        parser.add_argument(
+            "--retain-months",
+            type=int,
+            default=None,
+            help="보관할 전체 개월 수. 0이면 삭제하지 않습니다. 기본값은 settings.MONITORING_RETENTION_MONTHS.",
+        )
+        parser.add_argument(
+            "--create-only",
+            action="store_true",
+            help="데이터 이동/삭제 없이 보관 구간의 파티션만 미리 만듭니다.",
+        )
+        parser.add_argument(
+            "--list",
+            action="store_true",
+            help="현재 만들어진 파티션 목록만 출력합니다.",
+        )
+
+    def handle(self, *args, **options):
+        if not getattr(settings, "MONITORING_PARTITIONING", False):
+            raise CommandError("settings.MONITORING_PARTITIONING이 꺼져 있습니다. 환경 변수로 활성화한 뒤 실행하세요.")
+
+        hot_months = options["hot_months"]
+        if hot_months is None:
+            hot_months = settings.MONITORING_HOT_MONTHS
+        retain_months = options["retain_months"]
+        if retain_months is None:
+            retain_months = settings.MONITORING_RETENTION_MONTHS
+        if hot_months < 1:
+            raise CommandError("hot-months 값은 1 이상이어야 합니다.")
+        if retain_months and retain_months < hot_months:
+            raise CommandError("retain-months 값은 hot-months보다 작을 수 없습니다.")
+
+        current = MonthPartition.containing(timezone.now())
+        hot_cutoff = current.shift(-(hot_months - 1))
+        retain_cutoff = current.shift(-(retain_months - 1)) if retain_months else None
+
+        try:
+            for model in PARTITIONED_MODELS:
+                label = model._meta.db_table
+                if options["list"]:
+                    months = ", ".join(month.suffix for month in list_partitions(model)) or "(없음)"
+                    self.stdout.write(f"{label}: {months}")
+                    continue
+
+                if options["create_only"]:
+                    first = retain_cutoff or hot_cutoff.shift(-1)
+                    created = ensure_partitions(model, iter_months(first, hot_cutoff.shift(-1)))
+                    self.stdout.write(self.style.SUCCESS(f"{label}: 파티션 {len(created)}개 생성"))
+                    continue
+
+                moved = archive_rows_before(model, hot_cutoff)
+                dropped = drop_partitions_before(model, retain_cutoff) if retain_cutoff else []
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"{label}: {hot_cutoff.suffix} 이전 {moved}건 이동, 파티션 {len(dropped)}개 삭제"
+                    )
+                )
+        except PartitioningNotSupported as exc:
+            raise CommandError(str(exc)) from exc
+
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.1 on 2026-10-16 22:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("monitoring", "0001_initial"),
+        ("trips", "0003_trip_geofence_center_lat_trip_geofence_center_lng_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="healthsnapshot",
+            index=models.Index(
+                fields=["participant", "-measured_at"],
+                name="monitoring_hs_part_time_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="locationsnapshot",
+            index=models.Index(
+                fields=["participant", "-measured_at"],
+                name="monitoring_ls_part_time_idx",
+            ),
+        ),
+    ]
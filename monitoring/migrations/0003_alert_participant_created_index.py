@@ -0,0 +1,21 @@
+# Generated by Django 5.0.1 on 2026-10-16 22:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("monitoring", "0002_snapshot_participant_time_indexes"),
+        ("trips", "0003_trip_geofence_center_lat_trip_geofence_center_lng_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="monitoringalert",
+            index=models.Index(
+                fields=["participant", "-created_at", "-id"],
+                name="monitoring_alert_part_time_idx",
+            ),
+        ),
+    ]
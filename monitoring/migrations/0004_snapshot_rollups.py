@@ -0,0 +1,176 @@
+# Generated by Django 5.0.1 on 2026-10-16 22:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("monitoring", "0003_alert_participant_created_index"),
+        ("trips", "0003_trip_geofence_center_lat_trip_geofence_center_lng_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LocationRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "granularity",
+                    models.CharField(
+                        choices=[("minute", "1분"), ("hour", "1시간")],
+                        help_text="집계 단위 (minute/hour).",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "bucket_start",
+                    models.DateTimeField(
+                        help_text="집계 구간 시작 시각(UTC, 구간 단위로 절삭)."
+                    ),
+                ),
+                (
+                    "measured_at",
+                    models.DateTimeField(
+                        help_text="구간에서 가장 마지막 위치의 측정 시각."
+                    ),
+                ),
+                ("latitude", models.DecimalField(decimal_places=6, max_digits=9)),
+                ("longitude", models.DecimalField(decimal_places=6, max_digits=9)),
+                (
+                    "accuracy_m",
+                    models.DecimalField(
+                        blank=True, decimal_places=2, max_digits=6, null=True
+                    ),
+                ),
+                (
+                    "samples",
+                    models.PositiveIntegerField(help_text="구간에 포함된 스냅샷 수."),
+                ),
+                (
+                    "participant",
+                    models.ForeignKey(
+                        help_text="집계 대상 참가자.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="location_rollups",
+                        to="trips.tripparticipant",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "위치 집계",
+                "verbose_name_plural": "위치 집계 목록",
+                "ordering": ["-bucket_start"],
+            },
+        ),
+        migrations.CreateModel(
+            name="HealthRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "granularity",
+                    models.CharField(
+                        choices=[("minute", "1분"), ("hour", "1시간")],
+                        help_text="집계 단위 (minute/hour).",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "bucket_start",
+                    models.DateTimeField(
+                        help_text="집계 구간 시작 시각(UTC, 구간 단위로 절삭)."
+                    ),
+                ),
+                (
+                    "heart_rate_min",
+                    models.PositiveIntegerField(help_text="구간 내 최저 심박수."),
+                ),
+                (
+                    "heart_rate_max",
+                    models.PositiveIntegerField(help_text="구간 내 최고 심박수."),
+                ),
+                (
+                    "heart_rate_sum",
+                    models.BigIntegerField(
+                        help_text="평균 계산용 심박수 합계 (증분 갱신을 위해 평균 대신 보관)."
+                    ),
+                ),
+                (
+                    "spo2_min",
+                    models.DecimalField(
+                        decimal_places=2,
+                        help_text="구간 내 최저 산소포화도.",
+                        max_digits=5,
+                    ),
+                ),
+                (
+                    "samples",
+                    models.PositiveIntegerField(help_text="구간에 포함된 스냅샷 수."),
+                ),
+                (
+                    "danger_count",
+                    models.PositiveIntegerField(
+                        default=0, help_text="status가 danger인 스냅샷 수."
+                    ),
+                ),
+                (
+                    "participant",
+                    models.ForeignKey(
+                        help_text="집계 대상 참가자.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="health_rollups",
+                        to="trips.tripparticipant",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "건강 집계",
+                "verbose_name_plural": "건강 집계 목록",
+                "ordering": ["-bucket_start"],
+                "indexes": [
+                    models.Index(
+                        fields=["granularity", "bucket_start"],
+                        name="monitoring_hr_gran_time_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="healthrollup",
+            constraint=models.UniqueConstraint(
+                fields=("participant", "granularity", "bucket_start"),
+                name="monitoring_hr_unique_bucket",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="locationrollup",
+            index=models.Index(
+                fields=["granularity", "bucket_start"],
+                name="monitoring_lr_gran_time_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="locationrollup",
+            constraint=models.UniqueConstraint(
+                fields=("participant", "granularity", "bucket_start"),
+                name="monitoring_lr_unique_bucket",
+            ),
+        ),
+    ]
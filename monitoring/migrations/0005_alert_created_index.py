@@ -0,0 +1,17 @@
+# Generated by Django 5.0.1 on 2026-10-16 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("monitoring", "0004_snapshot_rollups"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="monitoringalert",
+            index=models.Index(fields=["-created_at", "-id"], name="monitoring_alert_time_idx"),
+        ),
+    ]
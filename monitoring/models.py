@@ -38,6 +38,10 @@ class HealthSnapshot(models.Model):
         ordering = ["-measured_at"]
         verbose_name = "건강 스냅샷"
         verbose_name_plural = "건강 스냅샷 목록"
+        indexes = [
+            # 참가자별 최신순 조회(최신 상태, 이력 차트)가 인덱스만으로 끝나도록 합니다.
+            models.Index(fields=["participant", "-measured_at"], name="monitoring_hs_part_time_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.participant_id} @ {self.measured_at:%Y-%m-%d %H:%M:%S}"  # pragma: no cover
@@ -79,11 +83,101 @@ class LocationSnapshot(models.Model):
         ordering = ["-measured_at"]
         verbose_name = "위치 스냅샷"
         verbose_name_plural = "위치 스냅샷 목록"
+        indexes = [
+            models.Index(fields=["participant", "-measured_at"], name="monitoring_ls_part_time_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.participant_id} @ ({self.latitude}, {self.longitude})"  # pragma: no cover
 
 
+ROLLUP_GRANULARITY_CHOICES = [
+    ("minute", "1분"),
+    ("hour", "1시간"),
+]
+
+
+class HealthRollup(models.Model):
+    """참가자별 분/시간 단위 건강 측정 집계. 스냅샷 저장 시 증분으로 갱신된다."""
+
+    participant = models.ForeignKey(
+        "trips.TripParticipant",
+        on_delete=models.CASCADE,
+        related_name="health_rollups",
+        help_text="집계 대상 참가자.",
+    )
+    granularity = models.CharField(
+        max_length=10,
+        choices=ROLLUP_GRANULARITY_CHOICES,
+        help_text="집계 단위 (minute/hour).",
+    )
+    bucket_start = models.DateTimeField(help_text="집계 구간 시작 시각(UTC, 구간 단위로 절삭).")
+    heart_rate_min = models.PositiveIntegerField(help_text="구간 내 최저 심박수.")
+    heart_rate_max = models.PositiveIntegerField(help_text="구간 내 최고 심박수.")
+    heart_rate_sum = models.BigIntegerField(help_text="평균 계산용 심박수 합계 (증분 갱신을 위해 평균 대신 보관).")
+    spo2_min = models.DecimalField(max_digits=5, decimal_places=2, help_text="구간 내 최저 산소포화도.")
+    samples = models.PositiveIntegerField(help_text="구간에 포함된 스냅샷 수.")
+    danger_count = models.PositiveIntegerField(default=0, help_text="status가 danger인 스냅샷 수.")
+
+    class Meta:
+        ordering = ["-bucket_start"]
+        verbose_name = "건강 집계"
+        verbose_name_plural = "건강 집계 목록"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["participant", "granularity", "bucket_start"], name="monitoring_hr_unique_bucket"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["granularity", "bucket_start"], name="monitoring_hr_gran_time_idx"),
+        ]
+
+    @property
+    def heart_rate_avg(self) -> float:
+        return self.heart_rate_sum / self.samples if self.samples else 0.0
+
+    def __str__(self) -> str:
+        return f"{self.participant_id} {self.granularity} @ {self.bucket_start:%Y-%m-%d %H:%M}"  # pragma: no cover
+
+
+class LocationRollup(models.Model):
+    """참가자별 분/시간 단위 마지막 위치. 스냅샷 저장 시 증분으로 갱신된다."""
+
+    participant = models.ForeignKey(
+        "trips.TripParticipant",
+        on_delete=models.CASCADE,
+        related_name="location_rollups",
+        help_text="집계 대상 참가자.",
+    )
+    granularity = models.CharField(
+        max_length=10,
+        choices=ROLLUP_GRANULARITY_CHOICES,
+        help_text="집계 단위 (minute/hour).",
+    )
+    bucket_start = models.DateTimeField(help_text="집계 구간 시작 시각(UTC, 구간 단위로 절삭).")
+    measured_at = models.DateTimeField(help_text="구간에서 가장 마지막 위치의 측정 시각.")
+    latitude = models.DecimalField(max_digits=9, decimal_places=6)
+    longitude = models.DecimalField(max_digits=9, decimal_places=6)
+    accuracy_m = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)
+    samples = models.PositiveIntegerField(help_text="구간에 포함된 스냅샷 수.")
+
+    class Meta:
+        ordering = ["-bucket_start"]
+        verbose_name = "위치 집계"
+        verbose_name_plural = "위치 집계 목록"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["participant", "granularity", "bucket_start"], name="monitoring_lr_unique_bucket"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["granularity", "bucket_start"], name="monitoring_lr_gran_time_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.participant_id} {self.granularity} @ {self.bucket_start:%Y-%m-%d %H:%M}"  # pragma: no cover
+
+
 class MonitoringAlert(models.Model):
     """임계치를 벗어난 이벤트를 간략히 보관하는 모델."""
 
@@ -115,6 +209,13 @@ class MonitoringAlert(models.Model):
         ordering = ["-created_at"]
         verbose_name = "모니터링 경보"
         verbose_name_plural = "모니터링 경보 목록"
+        indexes = [
+            # 참가자 한 명의 알림을 (created_at, id) 순으로 읽을 때 인덱스 범위 스캔으로 끝나도록 합니다.
+            models.Index(fields=["participant", "-created_at", "-id"], name="monitoring_alert_part_time_idx"),
+            # 여행 전체 알림 목록은 여러 참가자를 합쳐 정렬하므로, 정렬 순서대로 인덱스를 따라가며
+            # 해당 여행 참가자의 행만 골라 페이지 크기만큼 채우면 멈추도록 별도 인덱스를 둡니다.
+            models.Index(fields=["-created_at", "-id"], name="monitoring_alert_time_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"[{self.get_alert_type_display()}] {self.participant_id}"  # pragma: no cover
@@ -0,0 +1,98 @@
+"""모니터링 목록 API용 키셋(커서) 페이지네이션."""
+
+from __future__ import annotations
+
+from base64 import b64decode, b64encode
+from binascii import Error as BinasciiError
+from datetime import datetime
+from typing import Optional, Tuple
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class CreatedAtKeysetPagination(BasePagination):
+    """``(created_at, id)`` 내림차순 키셋 페이지네이션.
+
+    DRF의 CursorPagination은 첫 정렬 필드 값과 오프셋으로 위치를 기억하므로, 같은 시각에 대량 생성된
+    행(bulk_create)이 많으면 오프셋만큼 다시 읽게 됩니다. 여기서는 마지막 행의 ``(created_at, id)``를
+    커서에 담아 ``WHERE (created_at, id) < (커서)`` 조건으로 다음 페이지를 읽으므로, 앞 페이지들을 다시 읽지
+    않습니다(``(created_at, id)`` 인덱스를 커서 위치부터 따라감). 여행별 목록처럼 다른 조건이 붙으면 조건에
+    맞지 않는 행은 건너뛰며 읽으므로, 읽는 양은 페이지 크기에 그 조건의 선택도를 곱한 만큼입니다.
+    앞으로만 이동하며 응답은 ``{"next": url|null, "results": [...]}`` 형태입니다.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = 50
+    max_page_size = 500
+    invalid_cursor_message = "커서 값이 올바르지 않습니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by("-created_at", "-id")
+        position = self.decode_cursor(request)
+        if position is not None:
+            created_at, pk = position
+            queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+
+        # 한 건을 더 읽어 다음 페이지 존재 여부를 판단한다.
+        rows = list(queryset[: self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        page = rows[: self.page_size]
+        self.last = page[-1] if page else None
+        return page
+
+    def get_page_size(self, request) -> int:
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def decode_cursor(self, request) -> Optional[Tuple[datetime, int]]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            created_at_raw, pk_raw = b64decode(encoded.encode("ascii")).decode("ascii").rsplit("|", 1)
+            created_at = parse_datetime(created_at_raw)
+            pk = int(pk_raw)
+        except (BinasciiError, UnicodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message) from None
+        if created_at is None:
+            raise NotFound(self.invalid_cursor_message)
+        return created_at, pk
+
+    @staticmethod
+    def encode_cursor(created_at: datetime, pk: int) -> str:
+        return b64encode(f"{created_at.isoformat()}|{pk}".encode("ascii")).decode("ascii")
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or self.last is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.last.created_at, self.last.pk)
+        )
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
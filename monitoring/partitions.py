@@ -0,0 +1,207 @@
+"""HealthSnapshot/LocationSnapshot의 월 단위 파티션(보관 테이블)을 관리하는 모듈.
+
+운영 테이블(ORM이 읽고 쓰는 원본 테이블)은 최근 몇 달 치만 유지하고, 그 이전 데이터는
+월별 파티션으로 옮겨 두는 선택적 저장 구조입니다.
+
+- PostgreSQL: ``<원본>_archive``를 ``PARTITION BY RANGE (measured_at)`` 부모 테이블로 만들고
+  월마다 ``<원본>_pYYYY_MM`` 파티션을 붙입니다. 부모 테이블 하나로 전체 보관 구간을 조회할 수 있습니다.
+- SQLite: 선언적 파티션이 없으므로 같은 이름의 월별 섀도 테이블을 만들어 동일하게 관리합니다.
+
+보존 기간이 지난 달은 파티션(테이블)을 통째로 DROP하므로 대량 DELETE가 필요 없습니다.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
+from typing import Iterator, List
+
+from django.db import connections, transaction
+
+from .models import HealthSnapshot, LocationSnapshot
+
+PARTITIONED_MODELS = (HealthSnapshot, LocationSnapshot)
+
+_SUFFIX_PATTERN = re.compile(r"_p(\d{4})_(\d{2})$")
+
+
+class PartitioningNotSupported(Exception):
+    """현재 DB 백엔드에서 파티션 구성을 지원하지 않을 때 발생한다."""
+
+
+@dataclass(frozen=True)
+class MonthPartition:
+    """한 달 구간 [start, end)을 표현한다. 경계는 모두 UTC 기준."""
+
+    year: int
+    month: int
+
+    @classmethod
+    def containing(cls, value: datetime) -> "MonthPartition":
+        value = value.astimezone(dt_timezone.utc)
+        return cls(value.year, value.month)
+
+    @property
+    def start(self) -> datetime:
+        return datetime(self.year, self.month, 1, tzinfo=dt_timezone.utc)
+
+    @property
+    def end(self) -> datetime:
+        return self.shift(1).start
+
+    @property
+    def suffix(self) -> str:
+        return f"p{self.year:04d}_{self.month:02d}"
+
+    def shift(self, months: int) -> "MonthPartition":
+        index = self.year * 12 + (self.month - 1) + months
+        return MonthPartition(index // 12, index % 12 + 1)
+
+
+def iter_months(first: MonthPartition, last: MonthPartition) -> Iterator[MonthPartition]:
+    """first부터 last까지(양끝 포함) 월을 순서대로 돌려준다."""
+
+    current = first
+    while (current.year, current.month) <= (last.year, last.month):
+        yield current
+        current = current.shift(1)
+
+
+def archive_table_name(model) -> str:
+    """PostgreSQL에서 파티션을 묶는 부모 테이블 이름."""
+
+    return f"{model._meta.db_table}_archive"
+
+
+def partition_table_name(model, month: MonthPartition) -> str:
+    return f"{model._meta.db_table}_{month.suffix}"
+
+
+def _vendor(using: str) -> str:
+    vendor = connections[using].vendor
+    if vendor not in ("postgresql", "sqlite"):
+        raise PartitioningNotSupported(f"{vendor} 백엔드는 스냅샷 파티션을 지원하지 않습니다.")
+    return vendor
+
+
+def _adapt(using: str, value: datetime):
+    """raw SQL 파라미터로 넘길 datetime을 백엔드 저장 형식에 맞춘다."""
+
+    return connections[using].ops.adapt_datetimefield_value(value)
+
+
+def list_partitions(model, using: str = "default") -> List[MonthPartition]:
+    """이미 만들어진 월별 파티션을 오래된 순으로 반환한다."""
+
+    _vendor(using)
+    prefix = f"{model._meta.db_table}_p"
+    with connections[using].cursor() as cursor:
+        tables = connections[using].introspection.table_names(cursor)
+    months = []
+    for table in tables:
+        if not table.startswith(prefix):
+            continue
+        match = _SUFFIX_PATTERN.search(table)
+        if match:
+            months.append(MonthPartition(int(match.group(1)), int(match.group(2))))
+    return sorted(months, key=lambda item: (item.year, item.month))
+
+
+def ensure_partitions(model, months, using: str = "default") -> List[str]:
+    """주어진 월의 파티션이 없으면 만들고, 새로 만든 테이블 이름을 반환한다."""
+
+    vendor = _vendor(using)
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    base = model._meta.db_table
+    existing = set(list_partitions(model, using))
+    created = []
+
+    with connection.cursor() as cursor:
+        if vendor == "postgresql":
+            parent = archive_table_name(model)
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {quote(parent)} "
+                f"(LIKE {quote(base)} INCLUDING DEFAULTS) PARTITION BY RANGE (measured_at)"
+            )
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {quote(parent + '_pt_idx')} "
+                f"ON {quote(parent)} (participant_id, measured_at DESC)"
+            )
+
+        for month in months:
+            if month in existing:
+                continue
+            name = partition_table_name(model, month)
+            if vendor == "postgresql":
+                cursor.execute(
+                    f"CREATE TABLE IF NOT EXISTS {quote(name)} PARTITION OF {quote(archive_table_name(model))} "
+                    f"FOR VALUES FROM (%s) TO (%s)",
+                    [_adapt(using, month.start), _adapt(using, month.end)],
+                )
+            else:
+                cursor.execute(f"CREATE TABLE IF NOT EXISTS {quote(name)} AS SELECT * FROM {quote(base)} WHERE 0")
+                cursor.execute(
+                    f"CREATE INDEX IF NOT EXISTS {quote(name + '_pt_idx')} "
+                    f"ON {quote(name)} (participant_id, measured_at DESC)"
+                )
+            created.append(name)
+    return created
+
+
+def archive_rows_before(model, cutoff: MonthPartition, using: str = "default") -> int:
+    """cutoff 월 이전의 행을 운영 테이블에서 월별 파티션으로 옮기고 이동한 행 수를 반환한다."""
+
+    vendor = _vendor(using)
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    base = quote(model._meta.db_table)
+    cutoff_value = _adapt(using, cutoff.start)
+
+    with transaction.atomic(using=using):
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT MIN(measured_at) FROM {base} WHERE measured_at < %s", [cutoff_value])
+            oldest = cursor.fetchone()[0]
+            if oldest is None:
+                return 0
+            if isinstance(oldest, str):
+                oldest = datetime.fromisoformat(oldest).replace(tzinfo=dt_timezone.utc)
+
+            months = list(iter_months(MonthPartition.containing(oldest), cutoff.shift(-1)))
+            ensure_partitions(model, months, using)
+
+            moved = 0
+            if vendor == "postgresql":
+                cursor.execute(
+                    f"WITH moved AS (DELETE FROM {base} WHERE measured_at < %s RETURNING *) "
+                    f"INSERT INTO {quote(archive_table_name(model))} SELECT * FROM moved",
+                    [cutoff_value],
+                )
+                moved = cursor.rowcount
+            else:
+                for month in months:
+                    cursor.execute(
+                        f"INSERT INTO {quote(partition_table_name(model, month))} "
+                        f"SELECT * FROM {base} WHERE measured_at >= %s AND measured_at < %s",
+                        [_adapt(using, month.start), _adapt(using, month.end)],
+                    )
+                    moved += cursor.rowcount
+                cursor.execute(f"DELETE FROM {base} WHERE measured_at < %s", [cutoff_value])
+    return moved
+
+
+def drop_partitions_before(model, cutoff: MonthPartition, using: str = "default") -> List[str]:
+    """cutoff 월 이전의 파티션을 통째로 삭제하고 삭제한 테이블 이름을 반환한다."""
+
+    _vendor(using)
+    connection = connections[using]
+    dropped = []
+    with connection.cursor() as cursor:
+        for month in list_partitions(model, using):
+            if (month.year, month.month) >= (cutoff.year, cutoff.month):
+                continue
+            name = partition_table_name(model, month)
+            cursor.execute(f"DROP TABLE IF EXISTS {connection.ops.quote_name(name)}")
+            dropped.append(name)
+    return dropped
@@ -0,0 +1,325 @@
+"""HealthSnapshot/LocationSnapshot의 분·시간 단위 집계(rollup) 테이블을 관리하는 모듈.
+
+- 증분 갱신: 스냅샷을 저장하는 서비스가 ``apply_snapshot_rollups``를 호출하면, 새 행을 메모리에서
+  (참가자, 단위, 구간) 별로 합친 뒤 기존 집계 행과 병합합니다. 집계 행은 한 번에 조회하고
+  bulk_create/bulk_update로 저장하므로 배치 크기와 무관하게 쿼리 수가 일정합니다.
+  아직 없는 구간을 두 요청이 동시에 만들면 늦은 쪽의 INSERT가 유니크 제약에 걸리는데, 이때는
+  savepoint만 되돌리고 먼저 생긴 행을 다시 읽어 병합합니다(스냅샷 저장은 취소되지 않음).
+- 백필: ``rebuild_rollups``는 원본 테이블을 DB에서 GROUP BY로 다시 집계해 구간의 집계 행을 교체합니다.
+  (관리 커맨드 ``backfill_monitoring_rollups``)
+
+집계 구간은 UTC 기준으로 분/시간 단위로 절삭한 시각(``bucket_start``)입니다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Min, Q, Sum, Window
+from django.db.models.functions import RowNumber
+
+from .expressions import EpochBucket
+from .models import HealthRollup, HealthSnapshot, LocationRollup, LocationSnapshot
+
+GRANULARITY_SECONDS = {"minute": 60, "hour": 3600}
+ROLLUP_BATCH_SIZE = 1000
+# 동시에 같은 구간을 새로 만드는 충돌이 났을 때 병합을 다시 시도할 횟수
+MERGE_ATTEMPTS = 3
+
+RollupKey = Tuple[int, str, datetime]
+
+
+def truncate(value: datetime, granularity: str) -> datetime:
+    """측정 시각을 집계 구간 시작 시각(UTC)으로 절삭한다."""
+
+    value = value.astimezone(dt_timezone.utc)
+    if granularity == "minute":
+        return value.replace(second=0, microsecond=0)
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def _existing(model, keys: Iterable[RollupKey]) -> Dict[RollupKey, object]:
+    """병합 대상 집계 행을 한 번의 쿼리로 읽는다 (PostgreSQL에서는 행 잠금)."""
+
+    keys = list(keys)
+    if not keys:
+        return {}
+    participant_ids = {key[0] for key in keys}
+    starts = {key[2] for key in keys}
+    rows = model.objects.select_for_update().filter(
+        participant_id__in=participant_ids,
+        granularity__in={key[1] for key in keys},
+        bucket_start__gte=min(starts),
+        bucket_start__lte=max(starts),
+    )
+    wanted = set(keys)
+    found = {}
+    for row in rows:
+        key = (row.participant_id, row.granularity, row.bucket_start)
+        if key in wanted:
+            found[key] = row
+    return found
+
+
+@dataclass
+class RollupResult:
+    """증분 갱신으로 새로 만들거나 수정한 집계 행 수."""
+
+    health_created: int = 0
+    health_updated: int = 0
+    location_created: int = 0
+    location_updated: int = 0
+
+
+def apply_snapshot_rollups(
+    health_rows: Sequence[HealthSnapshot] = (),
+    location_rows: Sequence[LocationSnapshot] = (),
+) -> RollupResult:
+    """새로 저장한 스냅샷을 분/시간 집계 행에 반영한다. 호출자의 트랜잭션 안에서 실행하는 것을 권장한다."""
+
+    result = RollupResult()
+    with transaction.atomic(savepoint=False):
+        if health_rows:
+            result.health_created, result.health_updated = _merge_health(health_rows)
+        if location_rows:
+            result.location_created, result.location_updated = _merge_location(location_rows)
+    return result
+
+
+def _merge_health(rows: Sequence[HealthSnapshot]) -> Tuple[int, int]:
+    incoming: Dict[RollupKey, HealthRollup] = {}
+    for snapshot in rows:
+        for granularity in GRANULARITY_SECONDS:
+            single = HealthRollup(
+                participant_id=snapshot.participant_id,
+                granularity=granularity,
+                bucket_start=truncate(snapshot.measured_at, granularity),
+                heart_rate_min=snapshot.heart_rate,
+                heart_rate_max=snapshot.heart_rate,
+                heart_rate_sum=snapshot.heart_rate,
+                spo2_min=Decimal(snapshot.spo2),
+                samples=1,
+                danger_count=1 if snapshot.status == "danger" else 0,
+            )
+            key = (single.participant_id, granularity, single.bucket_start)
+            if key in incoming:
+                _combine_health(incoming[key], single)
+            else:
+                incoming[key] = single
+
+    return _store(
+        HealthRollup,
+        incoming,
+        _combine_health,
+        ["heart_rate_min", "heart_rate_max", "heart_rate_sum", "spo2_min", "samples", "danger_count"],
+    )
+
+
+def _store(model, incoming: Dict[RollupKey, object], combine, fields: List[str]) -> Tuple[int, int]:
+    """메모리에서 합친 집계를 기존 행과 병합해 저장하고 (생성 수, 수정 수)를 반환한다.
+
+    ``select_for_update``는 이미 있는 행만 잠그므로, 없던 구간을 다른 트랜잭션이 먼저 만들면
+    bulk_create가 유니크 제약 위반으로 실패한다. 그 경우 savepoint만 되돌리고 다시 읽어 병합한다.
+    """
+
+    for _ in range(MERGE_ATTEMPTS - 1):
+        try:
+            return _store_once(model, incoming, combine, fields)
+        except IntegrityError:
+            continue
+    return _store_once(model, incoming, combine, fields)
+
+
+def _store_once(model, incoming: Dict[RollupKey, object], combine, fields: List[str]) -> Tuple[int, int]:
+    existing = _existing(model, incoming)
+    to_create, to_update = [], []
+    for key, rollup in incoming.items():
+        stored = existing.get(key)
+        if stored is None:
+            to_create.append(rollup)
+            continue
+        combine(stored, rollup)
+        to_update.append(stored)
+
+    if to_create:
+        with transaction.atomic():
+            model.objects.bulk_create(to_create, batch_size=ROLLUP_BATCH_SIZE)
+    model.objects.bulk_update(to_update, fields, batch_size=ROLLUP_BATCH_SIZE)
+    return len(to_create), len(to_update)
+
+
+def _combine_health(target: HealthRollup, other: HealthRollup) -> None:
+    target.heart_rate_min = min(target.heart_rate_min, other.heart_rate_min)
+    target.heart_rate_max = max(target.heart_rate_max, other.heart_rate_max)
+    target.heart_rate_sum += other.heart_rate_sum
+    target.spo2_min = min(Decimal(target.spo2_min), Decimal(other.spo2_min))
+    target.samples += other.samples
+    target.danger_count += other.danger_count
+
+
+def _is_newer(snapshot_time: datetime, snapshot_id: Optional[int], rollup: LocationRollup, rollup_id) -> bool:
+    if snapshot_time != rollup.measured_at:
+        return snapshot_time > rollup.measured_at
+    # 같은 시각이면 나중에 저장된 행(더 큰 id)을 마지막 위치로 본다.
+    return (snapshot_id or 0) >= (rollup_id or 0)
+
+
+def _merge_location(rows: Sequence[LocationSnapshot]) -> Tuple[int, int]:
+    incoming: Dict[RollupKey, Tuple[LocationRollup, Optional[int]]] = {}
+    for snapshot in rows:
+        for granularity in GRANULARITY_SECONDS:
+            key = (snapshot.participant_id, granularity, truncate(snapshot.measured_at, granularity))
+            current = incoming.get(key)
+            if current is None:
+                incoming[key] = (
+                    LocationRollup(
+                        participant_id=key[0],
+                        granularity=granularity,
+                        bucket_start=key[2],
+                        measured_at=snapshot.measured_at,
+                        latitude=snapshot.latitude,
+                        longitude=snapshot.longitude,
+                        accuracy_m=snapshot.accuracy_m,
+                        samples=1,
+                    ),
+                    snapshot.id,
+                )
+                continue
+            rollup, last_id = current
+            rollup.samples += 1
+            if _is_newer(snapshot.measured_at, snapshot.id, rollup, last_id):
+                _copy_position(rollup, snapshot)
+                incoming[key] = (rollup, snapshot.id)
+
+    return _store(
+        LocationRollup,
+        {key: rollup for key, (rollup, _) in incoming.items()},
+        _combine_location,
+        ["measured_at", "latitude", "longitude", "accuracy_m", "samples"],
+    )
+
+
+def _combine_location(target: LocationRollup, other: LocationRollup) -> None:
+    target.samples += other.samples
+    if other.measured_at >= target.measured_at:
+        _copy_position(target, other)
+
+
+def _copy_position(target: LocationRollup, source) -> None:
+    target.measured_at = source.measured_at
+    target.latitude = source.latitude
+    target.longitude = source.longitude
+    target.accuracy_m = source.accuracy_m
+
+
+# ------------------------- 백필 -------------------------
+
+def align_range(start: datetime, end: datetime) -> Tuple[datetime, datetime]:
+    """백필 구간을 시간 경계로 넓혀, 분/시간 집계 구간이 잘리지 않게 한다."""
+
+    start = truncate(start, "hour")
+    aligned_end = truncate(end, "hour")
+    if aligned_end < end.astimezone(dt_timezone.utc):
+        aligned_end += timedelta(hours=1)
+    return start, aligned_end
+
+
+def rebuild_rollups(
+    *,
+    start: datetime,
+    end: datetime,
+    participant_ids: Optional[Sequence[int]] = None,
+    granularities: Sequence[str] = tuple(GRANULARITY_SECONDS),
+) -> Dict[str, int]:
+    """[start, end) 구간의 집계 행을 원본 스냅샷에서 다시 계산해 교체하고, 모델별 생성 건수를 반환한다.
+
+    구간은 ``align_range``로 시간 경계에 맞춰 넓힌 뒤 처리합니다.
+    """
+
+    start, end = align_range(start, end)
+    scope = Q(measured_at__gte=start, measured_at__lt=end)
+    rollup_scope = Q(bucket_start__gte=start, bucket_start__lt=end, granularity__in=list(granularities))
+    if participant_ids is not None:
+        scope &= Q(participant_id__in=participant_ids)
+        rollup_scope &= Q(participant_id__in=participant_ids)
+
+    counts = {"health": 0, "location": 0}
+    with transaction.atomic():
+        HealthRollup.objects.filter(rollup_scope).delete()
+        LocationRollup.objects.filter(rollup_scope).delete()
+        for granularity in granularities:
+            seconds = GRANULARITY_SECONDS[granularity]
+            health = _aggregate_health(scope, granularity, seconds)
+            location = _aggregate_location(scope, granularity, seconds)
+            HealthRollup.objects.bulk_create(health, batch_size=ROLLUP_BATCH_SIZE)
+            LocationRollup.objects.bulk_create(location, batch_size=ROLLUP_BATCH_SIZE)
+            counts["health"] += len(health)
+            counts["location"] += len(location)
+    return counts
+
+
+def _bucket_start(bucket: int, seconds: int) -> datetime:
+    return datetime.fromtimestamp(bucket * seconds, tz=dt_timezone.utc)
+
+
+def _aggregate_health(scope: Q, granularity: str, seconds: int) -> List[HealthRollup]:
+    rows = (
+        HealthSnapshot.objects.filter(scope)
+        .annotate(bucket=EpochBucket("measured_at", seconds))
+        .values("participant_id", "bucket")
+        .annotate(
+            hr_min=Min("heart_rate"),
+            hr_max=Max("heart_rate"),
+            hr_sum=Sum("heart_rate"),
+            spo2_low=Min("spo2"),
+            total=Count("id"),
+            dangers=Count("id", filter=Q(status="danger")),
+        )
+        .order_by()
+    )
+    return [
+        HealthRollup(
+            participant_id=row["participant_id"],
+            granularity=granularity,
+            bucket_start=_bucket_start(row["bucket"], seconds),
+            heart_rate_min=row["hr_min"],
+            heart_rate_max=row["hr_max"],
+            heart_rate_sum=row["hr_sum"],
+            spo2_min=row["spo2_low"],
+            samples=row["total"],
+            danger_count=row["dangers"],
+        )
+        for row in rows
+    ]
+
+
+def _aggregate_location(scope: Q, granularity: str, seconds: int) -> List[LocationRollup]:
+    partition = [F("participant_id"), EpochBucket("measured_at", seconds)]
+    rows = (
+        LocationSnapshot.objects.filter(scope)
+        .annotate(
+            bucket=EpochBucket("measured_at", seconds),
+            position=Window(RowNumber(), partition_by=partition, order_by=[F("measured_at").desc(), F("id").desc()]),
+            total=Window(Count("id"), partition_by=partition),
+        )
+        .filter(position=1)
+        .values("participant_id", "bucket", "measured_at", "latitude", "longitude", "accuracy_m", "total")
+        .order_by()
+    )
+    return [
+        LocationRollup(
+            participant_id=row["participant_id"],
+            granularity=granularity,
+            bucket_start=_bucket_start(row["bucket"], seconds),
+            measured_at=row["measured_at"],
+            latitude=row["latitude"],
+            longitude=row["longitude"],
+            accuracy_m=row["accuracy_m"],
+            samples=row["total"],
+        )
+        for row in rows
+    ]
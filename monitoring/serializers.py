@@ -1,5 +1,8 @@
 """모니터링 API 응답에 사용할 DRF Serializer."""
 
+from datetime import timedelta
+
+from django.utils import timezone
 from rest_framework import serializers
 
 from .models import HealthSnapshot, LocationSnapshot, MonitoringAlert
@@ -56,8 +59,17 @@ class MonitoringAlertSerializer(serializers.ModelSerializer):
     """경고 이력을 간단히 반환하기 위한 Serializer."""
 
     participant = serializers.PrimaryKeyRelatedField(read_only=True)
-    traveler_name = serializers.SerializerMethodField()
-    trip_id = serializers.SerializerMethodField()
+    # 조회 쿼리에서 select_related("participant__traveler")로 함께 읽으므로 행마다 추가 쿼리가 없습니다.
+    traveler_name = serializers.CharField(
+        source="participant.traveler.full_name_kr",
+        read_only=True,
+        help_text="관리자 화면에서 참가자를 바로 식별하도록 제공하는 이름.",
+    )
+    trip_id = serializers.IntegerField(
+        source="participant.trip_id",
+        read_only=True,
+        help_text="프런트에서 trip 필터링을 쉽게 하도록 노출하는 Trip ID.",
+    )
 
     class Meta:
         model = MonitoringAlert
@@ -73,26 +85,49 @@ class MonitoringAlertSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
-    def get_traveler_name(self, obj) -> str:
-        """관리자 화면에서 참가자를 바로 식별하도록 이름을 제공합니다."""
 
-        traveler = obj.participant.traveler
-        return traveler.full_name_kr
+class MonitoringAlertPageSerializer(serializers.Serializer):
+    """키셋 페이지네이션을 적용한 경보 목록 응답 (``CreatedAtKeysetPagination``)."""
+
+    next = serializers.URLField(
+        read_only=True,
+        allow_null=True,
+        help_text="다음 페이지 URL. 마지막 페이지면 null.",
+    )
+    results = MonitoringAlertSerializer(many=True, read_only=True)
+
+
+class MonitoringAlertFilterSerializer(serializers.Serializer):
+    """알림 목록 조회용 쿼리 파라미터."""
 
-    def get_trip_id(self, obj) -> int:
-        """프런트에서 trip 필터링을 쉽게 하도록 Trip ID를 노출."""
+    alert_type = serializers.ChoiceField(
+        choices=MonitoringAlert.ALERT_TYPE_CHOICES,
+        required=False,
+        help_text="health 또는 location만 조회합니다.",
+    )
+    since = serializers.DateTimeField(required=False, help_text="이 시각 이후(포함)에 생성된 알림만 조회합니다.")
+    until = serializers.DateTimeField(required=False, help_text="이 시각 이전(미포함)에 생성된 알림만 조회합니다.")
 
-        return obj.participant.trip_id
+    def validate(self, attrs):
+        since = attrs.get("since")
+        until = attrs.get("until")
+        if since and until and since >= until:
+            raise serializers.ValidationError("since는 until보다 이전 시각이어야 합니다.")
+        return attrs
 
 
 class DemoGenerationSerializer(serializers.Serializer):
     """데모 데이터를 API로 생성할 때 사용할 옵션."""
 
+    # 요청 안에서 바로 생성할 때와 백그라운드 작업으로 생성할 때의 최대 분량(분)
+    SYNC_MAX_MINUTES = 60
+    BACKGROUND_MAX_MINUTES = 1440
+
     minutes = serializers.IntegerField(
         min_value=1,
-        max_value=60,
+        max_value=BACKGROUND_MAX_MINUTES,
         default=10,
-        help_text="몇 분 분량의 데이터를 생성할지 설정합니다 (기본 10분).",
+        help_text="몇 분 분량의 데이터를 생성할지 설정합니다 (기본 10분, 최대 60분·background=true이면 1440분).",
     )
     interval = serializers.IntegerField(
         min_value=10,
@@ -100,14 +135,31 @@ class DemoGenerationSerializer(serializers.Serializer):
         default=60,
         help_text="측정 간격(초). 기본값은 60초입니다.",
     )
+    seed = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        default=None,
+        help_text="난수 시드. 같은 값을 주면 같은 측정값이 생성됩니다.",
+    )
+    background = serializers.BooleanField(
+        default=False,
+        help_text="true이면 요청을 막지 않고 백그라운드 작업으로 생성한 뒤 202와 작업 ID를 반환합니다.",
+    )
 
     def validate(self, attrs):
-        """minutes와 interval의 조합이 지나치게 많은 레코드를 만들지 확인."""
+        """minutes와 interval의 조합이 지나치게 많은 레코드를 만들지 확인.
+
+        백그라운드 작업은 요청 스레드를 점유하지 않으므로 측정 시점 개수 제한을 적용하지 않습니다.
+        """
 
         minutes = attrs["minutes"]
         interval = attrs["interval"]
+        if minutes > self.SYNC_MAX_MINUTES and not attrs.get("background"):
+            raise serializers.ValidationError(
+                {"minutes": f"{self.SYNC_MAX_MINUTES}분을 넘는 데이터는 background=true로 요청해야 합니다."}
+            )
         total_points = (minutes * 60) // interval
-        if total_points > 120:
+        if total_points > 120 and not attrs.get("background"):
             raise serializers.ValidationError(
                 "한 번에 120개를 초과하는 데이터는 생성하지 않도록 제한했습니다."
             )
@@ -125,6 +177,126 @@ class DemoGenerationSerializer(serializers.Serializer):
         )
 
 
+class HistoryQuerySerializer(serializers.Serializer):
+    """시계열 조회 쿼리 파라미터. 기간을 생략하면 최근 12시간을 조회합니다."""
+
+    DEFAULT_SPAN = timedelta(hours=12)
+    KIND_CHOICES = [("health", "건강"), ("location", "위치"), ("all", "전체")]
+
+    start = serializers.DateTimeField(required=False, help_text="조회 시작 시각(포함).")
+    end = serializers.DateTimeField(required=False, help_text="조회 종료 시각(미포함). 기본값은 현재 시각.")
+    resolution = serializers.IntegerField(
+        required=False,
+        min_value=10,
+        max_value=86400,
+        help_text="구간 크기(초). 생략하면 약 300개 구간이 되도록 자동으로 고릅니다.",
+    )
+    participant_id = serializers.IntegerField(required=False, help_text="특정 참가자만 조회할 때 지정합니다.")
+    kind = serializers.ChoiceField(choices=KIND_CHOICES, default="all", help_text="health, location, all 중 하나.")
+
+    def validate(self, attrs):
+        from .services import HISTORY_MAX_BUCKETS, choose_history_resolution
+
+        end = attrs.get("end") or timezone.now()
+        start = attrs.get("start") or end - self.DEFAULT_SPAN
+        if start >= end:
+            raise serializers.ValidationError("start는 end보다 이전 시각이어야 합니다.")
+
+        resolution = attrs.get("resolution") or choose_history_resolution(start, end)
+        if (end - start).total_seconds() / resolution > HISTORY_MAX_BUCKETS:
+            raise serializers.ValidationError(
+                f"구간 수가 {HISTORY_MAX_BUCKETS}개를 넘지 않도록 resolution을 늘리거나 기간을 줄이세요."
+            )
+        attrs.update(start=start, end=end, resolution=resolution)
+        return attrs
+
+
+class HealthBucketSerializer(serializers.Serializer):
+    """구간별 건강 측정 요약."""
+
+    participant_id = serializers.IntegerField(read_only=True)
+    bucket_start = serializers.DateTimeField(read_only=True)
+    heart_rate_min = serializers.IntegerField(read_only=True)
+    heart_rate_max = serializers.IntegerField(read_only=True)
+    heart_rate_avg = serializers.FloatField(read_only=True)
+    spo2_min = serializers.DecimalField(max_digits=5, decimal_places=2, read_only=True)
+    samples = serializers.IntegerField(read_only=True)
+
+
+class LocationBucketSerializer(serializers.Serializer):
+    """구간별 마지막 위치."""
+
+    participant_id = serializers.IntegerField(read_only=True)
+    bucket_start = serializers.DateTimeField(read_only=True)
+    measured_at = serializers.DateTimeField(read_only=True)
+    latitude = serializers.DecimalField(max_digits=9, decimal_places=6, read_only=True)
+    longitude = serializers.DecimalField(max_digits=9, decimal_places=6, read_only=True)
+    accuracy_m = serializers.DecimalField(max_digits=6, decimal_places=2, read_only=True, allow_null=True)
+    samples = serializers.IntegerField(read_only=True)
+
+
+class HistoryResponseSerializer(serializers.Serializer):
+    """다운샘플링된 시계열 응답."""
+
+    start = serializers.DateTimeField(read_only=True)
+    end = serializers.DateTimeField(read_only=True)
+    resolution = serializers.IntegerField(read_only=True, help_text="구간 크기(초).")
+    health = HealthBucketSerializer(many=True, read_only=True)
+    location = LocationBucketSerializer(many=True, read_only=True)
+
+
+class DemoGenerationJobSerializer(serializers.Serializer):
+    """백그라운드 데모 생성 작업 상태."""
+
+    job_id = serializers.CharField(read_only=True)
+    trip_id = serializers.IntegerField(read_only=True)
+    status = serializers.CharField(read_only=True, help_text="pending, running, succeeded, failed 중 하나.")
+    health_created = serializers.IntegerField(read_only=True)
+    location_created = serializers.IntegerField(read_only=True)
+    alerts_created = serializers.IntegerField(read_only=True)
+    error = serializers.CharField(read_only=True, allow_null=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    finished_at = serializers.DateTimeField(read_only=True, allow_null=True)
+
+
+class TelemetryIngestSerializer(serializers.Serializer):
+    """웨어러블 측정값 묶음을 받는 요청 본문.
+
+    각 행의 세부 검증은 서비스 계층에서 행 단위로 수행하여, 일부 행이 잘못되어도
+    나머지 행은 정상적으로 저장되도록 합니다.
+    """
+
+    MAX_READINGS = 10_000
+
+    readings = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=MAX_READINGS,
+        help_text=(
+            "측정값 목록. health 행은 participant_id/heart_rate/spo2, location 행은 "
+            "participant_id/latitude/longitude(/accuracy_m)를 포함하며 measured_at은 선택입니다."
+        ),
+    )
+
+
+class TelemetryIngestErrorSerializer(serializers.Serializer):
+    """거부된 행의 위치와 사유."""
+
+    index = serializers.IntegerField(read_only=True)
+    detail = serializers.CharField(read_only=True)
+
+
+class TelemetryIngestResultSerializer(serializers.Serializer):
+    """배치 적재 결과 요약."""
+
+    accepted = serializers.IntegerField(read_only=True)
+    rejected = serializers.IntegerField(read_only=True)
+    health_created = serializers.IntegerField(read_only=True)
+    location_created = serializers.IntegerField(read_only=True)
+    alerts_created = serializers.IntegerField(read_only=True)
+    errors = TelemetryIngestErrorSerializer(many=True, read_only=True)
+
+
 # 향후 개선 사항:
 # - Serializer에 geofence 기준점 등 Trip의 메타 데이터를 포함해 주면 프런트에서
 #   지도 반경을 그릴 때 별도의 API 호출이 필요 없습니다.
\ No newline at end of file
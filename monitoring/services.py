@@ -4,16 +4,26 @@ from __future__ import annotations
 
 import math
 import random
-from dataclasses import dataclass
-from datetime import timedelta
-from decimal import Decimal
-from typing import List, Optional
-
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, F, Max, Min, OuterRef, Subquery, Sum, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 from trips.models import Trip, TripParticipant
 
-from .models import HealthSnapshot, LocationSnapshot, MonitoringAlert
+from .events import publish_trip_events
+from .expressions import EpochBucket
+from .models import HealthRollup, HealthSnapshot, LocationRollup, LocationSnapshot, MonitoringAlert
+from .rollups import GRANULARITY_SECONDS, apply_snapshot_rollups
+from .thresholds import TripThresholds, get_trip_thresholds
+from .vectorized import evaluate_health_batch, evaluate_location_batch
 
 
 @dataclass
@@ -25,49 +35,106 @@ class ParticipantStatus:
     location: Optional[LocationSnapshot]
 
 
+@dataclass
+class IngestionResult:
+    """배치 적재 결과를 행 단위 수락/거부 건수로 요약한 구조체."""
+
+    accepted: int = 0
+    rejected: int = 0
+    health_created: int = 0
+    location_created: int = 0
+    alerts_created: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class DemoGenerationResult:
+    """대량 데모 데이터 생성 결과."""
+
+    health_created: int = 0
+    location_created: int = 0
+    alerts_created: int = 0
+
+    @property
+    def snapshots_created(self) -> int:
+        return self.health_created + self.location_created
+
+
+@dataclass
+class HealthBucket:
+    """한 참가자의 한 시간 구간 건강 측정 요약."""
+
+    participant_id: int
+    bucket_start: datetime
+    heart_rate_min: int
+    heart_rate_max: int
+    heart_rate_avg: float
+    spo2_min: Decimal
+    samples: int
+
+
+@dataclass
+class LocationBucket:
+    """한 참가자의 한 시간 구간에서 마지막으로 기록된 위치."""
+
+    participant_id: int
+    bucket_start: datetime
+    measured_at: datetime
+    latitude: Decimal
+    longitude: Decimal
+    accuracy_m: Optional[Decimal]
+    samples: int
+
+
+# 한 번의 적재 요청에서 bulk_create가 나눠서 INSERT할 행 수.
+INGEST_BATCH_SIZE = 1000
+
+# 적재 행의 허용 범위. 범위를 벗어난 값은 해당 행만 거부해, 오버플로 등으로 배치 전체가 실패하지 않게 한다.
+HEART_RATE_RANGE = (0, 300)
+SPO2_RANGE = (0, 100)
+LATITUDE_RANGE = (-90, 90)
+LONGITUDE_RANGE = (-180, 180)
+ACCURACY_M_RANGE = (0, 9999.99)
+
+# 대량 데모 생성 시 한 트랜잭션에 담을 (측정 시점 × 참가자) 수.
+DEMO_CHUNK_SIZE = 5000
+
+
 # ------------------------- 평가 로직 -------------------------
 
-def _evaluate_health(participant: TripParticipant, heart_rate: int, spo2: Decimal) -> tuple[str, Optional[str]]:
+def _evaluate_health(thresholds: TripThresholds, heart_rate: int, spo2: Decimal) -> tuple[str, Optional[str]]:
     """심박수와 산소포화도를 기준으로 상태와 경고 메시지를 계산한다."""
 
-    trip = participant.trip
     status = "normal"
     messages: List[str] = []
 
-    if trip.heart_rate_min is not None and heart_rate < trip.heart_rate_min:
+    if thresholds.heart_rate_min is not None and heart_rate < thresholds.heart_rate_min:
         status = "danger"
         messages.append(
-            f"심박수가 {heart_rate}bpm으로 설정한 최소값({trip.heart_rate_min})보다 낮습니다."
+            f"심박수가 {heart_rate}bpm으로 설정한 최소값({thresholds.heart_rate_min})보다 낮습니다."
         )
-    elif trip.heart_rate_max is not None and heart_rate > trip.heart_rate_max:
+    elif thresholds.heart_rate_max is not None and heart_rate > thresholds.heart_rate_max:
         status = "danger"
         messages.append(
-            f"심박수가 {heart_rate}bpm으로 설정한 최대값({trip.heart_rate_max})을 초과했습니다."
+            f"심박수가 {heart_rate}bpm으로 설정한 최대값({thresholds.heart_rate_max})을 초과했습니다."
         )
 
-    if trip.spo2_min is not None and spo2 < Decimal(str(trip.spo2_min)):
+    if thresholds.spo2_min is not None and spo2 < thresholds.spo2_min:
         status = "danger"
-        messages.append(f"산소포화도 {spo2}%가 기준({trip.spo2_min}%)보다 낮습니다.")
+        messages.append(f"산소포화도 {spo2}%가 기준({thresholds.spo2_min}%)보다 낮습니다.")
 
     alert_message = " ".join(messages) if messages else None
     return status, alert_message
 
 
-def _evaluate_location(participant: TripParticipant, latitude: float, longitude: float) -> Optional[str]:
+def _evaluate_location(thresholds: TripThresholds, latitude: float, longitude: float) -> Optional[str]:
     """지오펜스 기준을 벗어났는지 확인하고 메시지를 반환한다."""
 
-    trip = participant.trip
-    if (
-        trip.geofence_center_lat is None
-        or trip.geofence_center_lng is None
-        or trip.geofence_radius_km is None
-    ):
+    if not thresholds.has_geofence:
         return None
 
-    center_lat = float(trip.geofence_center_lat)
-    center_lng = float(trip.geofence_center_lng)
-    radius = float(trip.geofence_radius_km)
-    distance = _haversine_km(center_lat, center_lng, latitude, longitude)
+    radius = thresholds.geofence_radius_km
+    distance = thresholds.distance_from_center_km(latitude, longitude)
 
     if distance > radius:
         return (
@@ -77,7 +144,11 @@ def _evaluate_location(participant: TripParticipant, latitude: float, longitude:
 
 
 def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """두 위경도 좌표 간의 거리를 km 단위로 계산한다."""
+    """두 위경도 좌표 간의 거리를 km 단위로 계산한다.
+
+    평가 경로는 중심 좌표를 미리 변환해 둔 ``TripThresholds.distance_from_center_km``을 사용하며,
+    이 함수는 두 임의 좌표 간 거리를 구할 때와 테스트 기준값으로 사용합니다.
+    """
 
     r = 6371  # 지구 반지름(km)
     phi1 = math.radians(lat1)
@@ -102,24 +173,30 @@ def create_health_snapshot(
     """건강 데이터를 저장하고 필요 시 경보도 함께 기록한다."""
 
     measured_at = measured_at or timezone.now()
-    status, alert_message = _evaluate_health(participant, heart_rate, spo2)
-
-    snapshot = HealthSnapshot.objects.create(
-        participant=participant,
-        measured_at=measured_at,
-        heart_rate=heart_rate,
-        spo2=spo2,
-        status=status,
-    )
+    status, alert_message = _evaluate_health(get_trip_thresholds(participant.trip), heart_rate, spo2)
 
-    if alert_message:
-        MonitoringAlert.objects.create(
+    with transaction.atomic():
+        snapshot = HealthSnapshot.objects.create(
             participant=participant,
-            alert_type="health",
-            message=alert_message,
-            snapshot_time=measured_at,
+            measured_at=measured_at,
+            heart_rate=heart_rate,
+            spo2=spo2,
+            status=status,
         )
+        apply_snapshot_rollups(health_rows=[snapshot])
+
+        alerts = []
+        if alert_message:
+            alerts.append(
+                MonitoringAlert.objects.create(
+                    participant=participant,
+                    alert_type="health",
+                    message=alert_message,
+                    snapshot_time=measured_at,
+                )
+            )
 
+    publish_trip_events(participant.trip_id, health=[snapshot], alerts=alerts)
     return snapshot
 
 
@@ -134,85 +211,321 @@ def create_location_snapshot(
     """위치 데이터를 저장하고 임계치 위반 시 경보를 추가한다."""
 
     measured_at = measured_at or timezone.now()
-    alert_message = _evaluate_location(participant, latitude, longitude)
-
-    snapshot = LocationSnapshot.objects.create(
-        participant=participant,
-        measured_at=measured_at,
-        latitude=Decimal(str(latitude)),
-        longitude=Decimal(str(longitude)),
-        accuracy_m=Decimal(str(accuracy_m)) if accuracy_m is not None else None,
-    )
+    alert_message = _evaluate_location(get_trip_thresholds(participant.trip), latitude, longitude)
 
-    if alert_message:
-        MonitoringAlert.objects.create(
+    with transaction.atomic():
+        snapshot = LocationSnapshot.objects.create(
             participant=participant,
-            alert_type="location",
-            message=alert_message,
-            snapshot_time=measured_at,
+            measured_at=measured_at,
+            latitude=Decimal(str(latitude)),
+            longitude=Decimal(str(longitude)),
+            accuracy_m=Decimal(str(accuracy_m)) if accuracy_m is not None else None,
         )
+        apply_snapshot_rollups(location_rows=[snapshot])
+
+        alerts = []
+        if alert_message:
+            alerts.append(
+                MonitoringAlert.objects.create(
+                    participant=participant,
+                    alert_type="location",
+                    message=alert_message,
+                    snapshot_time=measured_at,
+                )
+            )
 
+    publish_trip_events(participant.trip_id, location=[snapshot], alerts=alerts)
     return snapshot
 
 
+class ReadingRejected(ValueError):
+    """적재 요청의 개별 행이 검증을 통과하지 못했음을 나타낸다."""
+
+
+def _parse_measured_at(value: Any) -> datetime:
+    """ISO 8601 문자열(또는 datetime)을 timezone-aware datetime으로 변환한다."""
+
+    if value in (None, ""):
+        return timezone.now()
+    parsed = value if isinstance(value, datetime) else parse_datetime(str(value))
+    if parsed is None:
+        raise ReadingRejected("measured_at 형식이 올바르지 않습니다. ISO 8601 문자열을 사용하세요.")
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, dt_timezone.utc)
+    return parsed
+
+
+def _parse_decimal(row: Mapping[str, Any], key: str, *, low: float, high: float) -> Decimal:
+    """필수 숫자 필드를 Decimal로 변환하고 허용 범위를 검사한다."""
+
+    raw = row.get(key)
+    if raw is None or isinstance(raw, bool):
+        raise ReadingRejected(f"{key} 값이 필요합니다.")
+    try:
+        value = Decimal(str(raw))
+    except (InvalidOperation, ValueError):
+        raise ReadingRejected(f"{key} 값은 숫자여야 합니다.") from None
+    if not value.is_finite() or not low <= value <= high:
+        raise ReadingRejected(f"{key} 값은 {low}~{high} 범위여야 합니다.")
+    return value
+
+
+def _build_alert(snapshot, alert_type: str, message: str) -> MonitoringAlert:
+    return MonitoringAlert(
+        participant=snapshot.participant,
+        alert_type=alert_type,
+        message=message,
+        snapshot_time=snapshot.measured_at,
+    )
+
+
+def _evaluate_snapshots(
+    thresholds: TripThresholds,
+    health_rows: Sequence[HealthSnapshot],
+    location_rows: Sequence[LocationSnapshot],
+    *,
+    health_keys: Sequence[int],
+    location_keys: Sequence[int],
+) -> List[MonitoringAlert]:
+    """저장 전 스냅샷들을 종류별로 한 번에 평가해 status를 채우고 경보 목록을 돌려준다.
+
+    경보 메시지는 마스크가 True인 행만 스칼라 함수로 만들며, 경보는 ``*_keys`` 순서(원본 입력 순서)로 정렬한다.
+    """
+
+    pending: List[tuple[int, MonitoringAlert]] = []
+
+    health_eval = evaluate_health_batch(
+        thresholds,
+        [snapshot.heart_rate for snapshot in health_rows],
+        [snapshot.spo2 for snapshot in health_rows],
+    )
+    for snapshot, key, label, alert in zip(
+        health_rows, health_keys, health_eval.status_labels(), health_eval.alert_mask
+    ):
+        snapshot.status = label
+        if alert:
+            _, message = _evaluate_health(thresholds, snapshot.heart_rate, snapshot.spo2)
+            pending.append((key, _build_alert(snapshot, "health", message)))
+
+    location_eval = evaluate_location_batch(
+        thresholds,
+        [float(snapshot.latitude) for snapshot in location_rows],
+        [float(snapshot.longitude) for snapshot in location_rows],
+    )
+    for snapshot, key, outside in zip(location_rows, location_keys, location_eval.outside_mask):
+        if outside:
+            message = _evaluate_location(thresholds, float(snapshot.latitude), float(snapshot.longitude))
+            if message:
+                pending.append((key, _build_alert(snapshot, "location", message)))
+
+    pending.sort(key=lambda item: item[0])
+    return [alert for _, alert in pending]
+
+
+def ingest_telemetry_batch(*, trip: Trip, readings: Sequence[Mapping[str, Any]]) -> IngestionResult:
+    """건강/위치 측정값 묶음을 검증·평가한 뒤 bulk_create로 한 번에 저장한다.
+
+    - 참가자는 여행 단위로 한 번만 조회하고, 임계치는 캐시된 ``TripThresholds``로 메모리에서 평가합니다.
+    - 임계치 판정은 ``monitoring.vectorized``의 배치 평가기로 한 번에 수행합니다.
+    - 잘못된 행은 건너뛰고 ``errors``에 행 번호와 사유를 남깁니다.
+    - 스냅샷과 경보 INSERT, 분/시간 집계(rollup) 갱신은 하나의 트랜잭션으로 묶어 부분 저장을 방지합니다.
+    - 저장된 행은 실시간 스트림 구독자에게 이벤트로 발행합니다.
+    """
+
+    participants = {participant.id: participant for participant in trip.participants.all()}
+    thresholds = get_trip_thresholds(trip)
+    result = IngestionResult()
+    health_rows: List[HealthSnapshot] = []
+    location_rows: List[LocationSnapshot] = []
+    health_indexes: List[int] = []
+    location_indexes: List[int] = []
+
+    for index, row in enumerate(readings):
+        try:
+            if not isinstance(row, Mapping):
+                raise ReadingRejected("각 측정값은 JSON 객체여야 합니다.")
+
+            kind = row.get("type")
+            if kind not in ("health", "location"):
+                raise ReadingRejected("type은 'health' 또는 'location'이어야 합니다.")
+
+            participant = participants.get(row.get("participant_id"))
+            if participant is None:
+                raise ReadingRejected("해당 여행에 속한 participant_id가 아닙니다.")
+
+            measured_at = _parse_measured_at(row.get("measured_at"))
+
+            if kind == "health":
+                heart_rate = row.get("heart_rate")
+                low, high = HEART_RATE_RANGE
+                if isinstance(heart_rate, bool) or not isinstance(heart_rate, int) or not low <= heart_rate <= high:
+                    raise ReadingRejected(f"heart_rate는 {low}~{high} 범위의 정수여야 합니다.")
+                spo2 = _parse_decimal(row, "spo2", low=SPO2_RANGE[0], high=SPO2_RANGE[1])
+
+                health_rows.append(
+                    HealthSnapshot(
+                        participant=participant,
+                        measured_at=measured_at,
+                        heart_rate=heart_rate,
+                        spo2=spo2,
+                    )
+                )
+                health_indexes.append(index)
+            else:
+                latitude = _parse_decimal(row, "latitude", low=LATITUDE_RANGE[0], high=LATITUDE_RANGE[1])
+                longitude = _parse_decimal(row, "longitude", low=LONGITUDE_RANGE[0], high=LONGITUDE_RANGE[1])
+                accuracy_m = None
+                if row.get("accuracy_m") is not None:
+                    accuracy_m = _parse_decimal(row, "accuracy_m", low=ACCURACY_M_RANGE[0], high=ACCURACY_M_RANGE[1])
+
+                location_rows.append(
+                    LocationSnapshot(
+                        participant=participant,
+                        measured_at=measured_at,
+                        latitude=latitude,
+                        longitude=longitude,
+                        accuracy_m=accuracy_m,
+                    )
+                )
+                location_indexes.append(index)
+        except ReadingRejected as exc:
+            result.rejected += 1
+            result.errors.append({"index": index, "detail": str(exc)})
+            continue
+
+        result.accepted += 1
+
+    alerts = _evaluate_snapshots(
+        thresholds,
+        health_rows,
+        location_rows,
+        health_keys=health_indexes,
+        location_keys=location_indexes,
+    )
+
+    with transaction.atomic():
+        HealthSnapshot.objects.bulk_create(health_rows, batch_size=INGEST_BATCH_SIZE)
+        LocationSnapshot.objects.bulk_create(location_rows, batch_size=INGEST_BATCH_SIZE)
+        MonitoringAlert.objects.bulk_create(alerts, batch_size=INGEST_BATCH_SIZE)
+        apply_snapshot_rollups(health_rows, location_rows)
+
+    publish_trip_events(trip.id, health=health_rows, location=location_rows, alerts=alerts)
+    result.health_created = len(health_rows)
+    result.location_created = len(location_rows)
+    result.alerts_created = len(alerts)
+    return result
+
+
 def generate_demo_snapshots_for_trip(*, trip: Trip, minutes: int, interval_seconds: int) -> int:
-    """Trip에 속한 모든 참가자에 대해 더미 스냅샷을 생성한다."""
+    """Trip에 속한 모든 참가자에 대해 더미 스냅샷을 생성하고 생성한 스냅샷 수를 반환한다."""
 
-    participants = list(trip.participants.select_related("traveler"))
+    result = generate_bulk_demo_snapshots(trip=trip, minutes=minutes, interval_seconds=interval_seconds)
+    return result.snapshots_created
+
+
+def generate_bulk_demo_snapshots(
+    *,
+    trip: Trip,
+    minutes: int,
+    interval_seconds: int,
+    seed: Optional[int] = None,
+    chunk_size: int = DEMO_CHUNK_SIZE,
+    end_at: Optional[datetime] = None,
+    progress: Optional[Callable[[DemoGenerationResult], None]] = None,
+) -> DemoGenerationResult:
+    """부하 테스트용 더미 스냅샷/경보를 청크 단위 bulk_create로 대량 생성한다.
+
+    - ``seed``를 주면 같은 입력에 대해 같은 측정값이 만들어집니다(재현 가능한 데이터셋).
+    - 참가자 조회와 기준 좌표·임계치 계산은 한 번만 수행하고, 약 ``chunk_size``개 측정 시점×참가자
+      묶음마다 평가 후 트랜잭션 하나로 INSERT하므로 메모리 사용량이 전체 기간과 무관하게 일정합니다.
+    - ``progress`` 콜백은 청크가 저장될 때마다 누적 결과를 받습니다.
+    - 과거 시각의 대량 데이터이므로 실시간 스트림(monitoring.events)에는 발행하지 않습니다.
+    """
+
+    participants = list(trip.participants.all())
+    result = DemoGenerationResult()
     if not participants:
-        return 0
+        return result
 
+    rng = random.Random(seed)
+    thresholds = get_trip_thresholds(trip)
+    base_lat, base_lng = _resolve_base_coordinates(trip)
     total_points = max(1, (minutes * 60) // interval_seconds)
-    now = timezone.now()
-    created_count = 0
-
-    for step in range(total_points):
-        measured_at = now - timedelta(seconds=(total_points - step) * interval_seconds)
-        for participant in participants:
-            heart_rate = random.randint(55, 110)
-            spo2 = Decimal(str(round(random.uniform(93, 99), 2)))
-
-            # 가끔씩 의도적으로 임계치를 벗어나도록 만들어 경보를 시연합니다.
-            if random.random() < 0.1 and trip.heart_rate_max:
-                heart_rate = int(trip.heart_rate_max + random.randint(5, 15))
-            if random.random() < 0.05 and trip.spo2_min:
-                spo2 = Decimal(
-                    str(
-                        max(
-                            85,
-                            float(trip.spo2_min) - random.uniform(1, 5),
-                        )
+    end_at = end_at or timezone.now()
+    steps_per_chunk = max(1, chunk_size // len(participants))
+
+    for chunk_start in range(0, total_points, steps_per_chunk):
+        health_rows: List[HealthSnapshot] = []
+        location_rows: List[LocationSnapshot] = []
+        for step in range(chunk_start, min(total_points, chunk_start + steps_per_chunk)):
+            measured_at = end_at - timedelta(seconds=(total_points - step) * interval_seconds)
+            for participant in participants:
+                heart_rate, spo2 = _random_health_values(rng, thresholds)
+                health_rows.append(
+                    HealthSnapshot(
+                        participant=participant,
+                        measured_at=measured_at,
+                        heart_rate=heart_rate,
+                        spo2=spo2,
+                    )
+                )
+                latitude, longitude, accuracy_m = _random_location_values(rng, base_lat, base_lng)
+                location_rows.append(
+                    LocationSnapshot(
+                        participant=participant,
+                        measured_at=measured_at,
+                        latitude=latitude,
+                        longitude=longitude,
+                        accuracy_m=accuracy_m,
                     )
                 )
 
-            create_health_snapshot(
-                participant=participant,
-                heart_rate=heart_rate,
-                spo2=spo2,
-                measured_at=measured_at,
-            )
+        keys = range(0, 2 * len(health_rows), 2)
+        alerts = _evaluate_snapshots(
+            thresholds,
+            health_rows,
+            location_rows,
+            health_keys=keys,
+            location_keys=[key + 1 for key in keys],
+        )
+        with transaction.atomic():
+            HealthSnapshot.objects.bulk_create(health_rows, batch_size=INGEST_BATCH_SIZE)
+            LocationSnapshot.objects.bulk_create(location_rows, batch_size=INGEST_BATCH_SIZE)
+            MonitoringAlert.objects.bulk_create(alerts, batch_size=INGEST_BATCH_SIZE)
+            apply_snapshot_rollups(health_rows, location_rows)
+
+        result.health_created += len(health_rows)
+        result.location_created += len(location_rows)
+        result.alerts_created += len(alerts)
+        if progress is not None:
+            progress(result)
+
+    return result
 
-            base_lat, base_lng = _resolve_base_coordinates(trip)
-            lat_offset = random.uniform(-0.01, 0.01)
-            lng_offset = random.uniform(-0.01, 0.01)
-            latitude = base_lat + lat_offset
-            longitude = base_lng + lng_offset
-
-            # 지오펜스 경고를 위해 가끔 크게 벗어나는 좌표도 생성합니다.
-            if random.random() < 0.08:
-                latitude += random.uniform(0.05, 0.1)
-                longitude += random.uniform(0.05, 0.1)
-
-            create_location_snapshot(
-                participant=participant,
-                latitude=latitude,
-                longitude=longitude,
-                accuracy_m=random.uniform(5, 50),
-                measured_at=measured_at,
-            )
-            created_count += 2
 
-    return created_count
+def _random_health_values(rng: random.Random, thresholds: TripThresholds) -> tuple[int, Decimal]:
+    heart_rate = rng.randint(55, 110)
+    spo2 = rng.uniform(93, 99)
+
+    # 가끔씩 의도적으로 임계치를 벗어나도록 만들어 경보를 시연합니다.
+    if rng.random() < 0.1 and thresholds.heart_rate_max:
+        heart_rate = int(thresholds.heart_rate_max + rng.randint(5, 15))
+    if rng.random() < 0.05 and thresholds.spo2_min:
+        spo2 = max(85, float(thresholds.spo2_min) - rng.uniform(1, 5))
+    return heart_rate, Decimal(f"{spo2:.2f}")
+
+
+def _random_location_values(
+    rng: random.Random, base_lat: float, base_lng: float
+) -> tuple[Decimal, Decimal, Decimal]:
+    latitude = base_lat + rng.uniform(-0.01, 0.01)
+    longitude = base_lng + rng.uniform(-0.01, 0.01)
+
+    # 지오펜스 경고를 위해 가끔 크게 벗어나는 좌표도 생성합니다.
+    if rng.random() < 0.08:
+        latitude += rng.uniform(0.05, 0.1)
+        longitude += rng.uniform(0.05, 0.1)
+    return Decimal(f"{latitude:.6f}"), Decimal(f"{longitude:.6f}"), Decimal(f"{rng.uniform(5, 50):.2f}")
 
 
 def _resolve_base_coordinates(trip: Trip) -> tuple[float, float]:
@@ -230,24 +543,198 @@ def _resolve_base_coordinates(trip: Trip) -> tuple[float, float]:
 # ------------------------- 조회 로직 -------------------------
 
 def get_participant_statuses(trip: Trip) -> List[ParticipantStatus]:
-    """각 참가자의 최신 스냅샷을 가져온다."""
-
-    participants = trip.participants.select_related("traveler")
-    result: List[ParticipantStatus] = []
-    for participant in participants:
-        health = participant.health_snapshots.order_by("-measured_at").first()
-        location = participant.location_snapshots.order_by("-measured_at").first()
-        result.append(
-            ParticipantStatus(
-                participant=participant,
-                health=health,
-                location=location,
-            )
+    """각 참가자의 최신 스냅샷을 가져온다.
+
+    참가자 수와 무관하게 쿼리 3회(참가자 1회 + 스냅샷 종류별 1회)로 끝나도록
+    최신 스냅샷을 한 번에 조회합니다.
+    """
+
+    participants = list(trip.participants.select_related("traveler"))
+    if not participants:
+        return []
+
+    latest_health = _latest_snapshots_by_participant(HealthSnapshot, trip.id)
+    latest_location = _latest_snapshots_by_participant(LocationSnapshot, trip.id)
+    return [
+        ParticipantStatus(
+            participant=participant,
+            health=latest_health.get(participant.id),
+            location=latest_location.get(participant.id),
         )
-    return result
+        for participant in participants
+    ]
+
+
+def _latest_snapshots_by_participant(model, trip_id: int) -> Dict[int, Any]:
+    """여행 참가자별 가장 최근 스냅샷을 단일 쿼리로 조회해 {participant_id: snapshot}으로 반환한다.
 
+    - PostgreSQL: ``DISTINCT ON (participant_id)``로 참가자별 첫 행만 읽습니다.
+    - 그 외(SQLite 등): 참가자마다 최신 ID를 상관 서브쿼리로 구한 뒤 ``id IN (...)``으로 읽습니다.
+    동일 시각 측정값이 여러 개면 나중에 저장된(id가 큰) 행을 최신으로 봅니다.
+    """
 
-# 향후 개선 사항:
-# - get_participant_statuses에서 Subquery를 사용하면 N+1 쿼리를 줄일 수 있습니다.
-# - generate_demo_snapshots_for_trip은 Celery 태스크로 분리하여 비동기 실행하도록
-#   확장하면 대규모 데이터 생성 시 웹 요청을 차단하지 않습니다.
\ No newline at end of file
+    if connection.vendor == "postgresql":
+        rows = (
+            model.objects.filter(participant__trip_id=trip_id)
+            .order_by("participant_id", "-measured_at", "-id")
+            .distinct("participant_id")
+        )
+    else:
+        latest_id = (
+            model.objects.filter(participant_id=OuterRef("pk"))
+            .order_by("-measured_at", "-id")
+            .values("id")[:1]
+        )
+        latest_ids = TripParticipant.objects.filter(trip_id=trip_id).values(latest=Subquery(latest_id))
+        rows = model.objects.filter(id__in=latest_ids)
+    return {row.participant_id: row for row in rows}
+
+
+# 시계열 조회 해상도(초) 후보. 자동 선택 시 목표 포인트 수를 넘지 않는 가장 작은 값을 사용한다.
+HISTORY_RESOLUTION_STEPS = (10, 30, 60, 120, 300, 600, 900, 1800, 3600, 7200, 10800, 21600, 43200, 86400)
+HISTORY_TARGET_POINTS = 300
+HISTORY_MAX_BUCKETS = 2000
+
+
+def choose_history_resolution(start: datetime, end: datetime, target_points: int = HISTORY_TARGET_POINTS) -> int:
+    """조회 구간을 target_points개 안팎의 구간으로 나누는 해상도(초)를 고른다."""
+
+    span = max(1, int((end - start).total_seconds()))
+    for step in HISTORY_RESOLUTION_STEPS:
+        if span / step <= target_points:
+            return step
+    return HISTORY_RESOLUTION_STEPS[-1]
+
+
+def _history_queryset(
+    model, trip: Trip, start: datetime, end: datetime, participant_id: Optional[int], time_field: str = "measured_at"
+):
+    queryset = model.objects.filter(
+        participant__trip_id=trip.id, **{f"{time_field}__gte": start, f"{time_field}__lt": end}
+    )
+    if participant_id is not None:
+        queryset = queryset.filter(participant_id=participant_id)
+    return queryset
+
+
+def _rollup_granularity(resolution_seconds: int) -> Optional[str]:
+    """집계 테이블로 답할 수 있는 해상도라면 사용할 집계 단위를, 아니면 None을 반환한다."""
+
+    if not getattr(settings, "MONITORING_HISTORY_USE_ROLLUPS", False):
+        return None
+    for granularity in ("hour", "minute"):
+        if resolution_seconds % GRANULARITY_SECONDS[granularity] == 0:
+            return granularity
+    return None
+
+
+def _bucket_start(bucket: int, resolution_seconds: int) -> datetime:
+    return datetime.fromtimestamp(bucket * resolution_seconds, tz=dt_timezone.utc)
+
+
+def get_health_history(
+    trip: Trip,
+    *,
+    start: datetime,
+    end: datetime,
+    resolution_seconds: int,
+    participant_id: Optional[int] = None,
+) -> List[HealthBucket]:
+    """[start, end) 구간의 건강 스냅샷을 참가자·구간별 최소/최대/평균 심박수와 최저 SpO2로 집계한다.
+
+    집계는 DB의 GROUP BY로 수행하므로 원본 행 수와 관계없이 구간 수만큼만 전송됩니다.
+    ``MONITORING_HISTORY_USE_ROLLUPS``가 켜져 있고 해상도가 분/시간의 배수이면 원본 대신 집계 테이블을
+    다시 묶어 계산합니다(구간 경계는 집계 단위로 맞춰짐).
+    """
+
+    granularity = _rollup_granularity(resolution_seconds)
+    if granularity is not None:
+        queryset = _history_queryset(
+            HealthRollup, trip, start, end, participant_id, time_field="bucket_start"
+        ).filter(granularity=granularity)
+        time_field = "bucket_start"
+        aggregates = {
+            "hr_low": Min("heart_rate_min"),
+            "hr_high": Max("heart_rate_max"),
+            "hr_total": Sum("heart_rate_sum"),
+            "spo2_low": Min("spo2_min"),
+            "total": Sum("samples"),
+        }
+    else:
+        queryset = _history_queryset(HealthSnapshot, trip, start, end, participant_id)
+        time_field = "measured_at"
+        aggregates = {
+            "hr_low": Min("heart_rate"),
+            "hr_high": Max("heart_rate"),
+            "hr_total": Sum("heart_rate"),
+            "spo2_low": Min("spo2"),
+            "total": Count("id"),
+        }
+
+    rows = (
+        queryset.annotate(bucket=EpochBucket(time_field, resolution_seconds))
+        .values("participant_id", "bucket")
+        .annotate(**aggregates)
+        .order_by("participant_id", "bucket")
+    )
+    return [
+        HealthBucket(
+            participant_id=row["participant_id"],
+            bucket_start=_bucket_start(row["bucket"], resolution_seconds),
+            heart_rate_min=row["hr_low"],
+            heart_rate_max=row["hr_high"],
+            heart_rate_avg=round(row["hr_total"] / row["total"], 1),
+            spo2_min=row["spo2_low"],
+            samples=row["total"],
+        )
+        for row in rows
+    ]
+
+
+def get_location_history(
+    trip: Trip,
+    *,
+    start: datetime,
+    end: datetime,
+    resolution_seconds: int,
+    participant_id: Optional[int] = None,
+) -> List[LocationBucket]:
+    """[start, end) 구간의 위치 스냅샷에서 참가자·구간별 마지막 위치만 반환한다.
+
+    ROW_NUMBER() 윈도 함수로 구간마다 가장 최근 행 하나를 고르므로, 같은 시각이면 나중에 저장된 행을 사용합니다.
+    건강 시계열과 같은 조건에서 집계 테이블(LocationRollup)을 원본 대신 사용합니다.
+    """
+
+    granularity = _rollup_granularity(resolution_seconds)
+    if granularity is not None:
+        queryset = _history_queryset(
+            LocationRollup, trip, start, end, participant_id, time_field="bucket_start"
+        ).filter(granularity=granularity)
+        time_field, samples = "bucket_start", Sum("samples")
+    else:
+        queryset = _history_queryset(LocationSnapshot, trip, start, end, participant_id)
+        time_field, samples = "measured_at", Count("id")
+
+    partition = [F("participant_id"), EpochBucket(time_field, resolution_seconds)]
+    rows = (
+        queryset.annotate(
+            bucket=EpochBucket(time_field, resolution_seconds),
+            position=Window(RowNumber(), partition_by=partition, order_by=[F("measured_at").desc(), F("id").desc()]),
+            total=Window(samples, partition_by=partition),
+        )
+        .filter(position=1)
+        .values("participant_id", "bucket", "measured_at", "latitude", "longitude", "accuracy_m", "total")
+        .order_by("participant_id", "bucket")
+    )
+    return [
+        LocationBucket(
+            participant_id=row["participant_id"],
+            bucket_start=_bucket_start(row["bucket"], resolution_seconds),
+            measured_at=row["measured_at"],
+            latitude=row["latitude"],
+            longitude=row["longitude"],
+            accuracy_m=row["accuracy_m"],
+            samples=row["total"],
+        )
+        for row in rows
+    ]
@@ -0,0 +1,16 @@
+"""monitoring 앱이 다른 앱 모델의 변경을 감지하기 위한 시그널 수신기."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from trips.models import Trip
+
+from .thresholds import invalidate_trip_thresholds
+
+
+@receiver(post_save, sender=Trip, dispatch_uid="monitoring_invalidate_thresholds_on_save")
+@receiver(post_delete, sender=Trip, dispatch_uid="monitoring_invalidate_thresholds_on_delete")
+def invalidate_thresholds(sender, instance, **kwargs):
+    """임계치가 바뀌었을 수 있으므로 캐시된 TripThresholds를 버린다."""
+
+    invalidate_trip_thresholds(instance.pk)
@@ -0,0 +1,1102 @@
+"""monitoring v7 테스트 모음.
+
+대량 텔레메트리 적재 등 성능 개선 기능을 검증한다. v5와 동일하게 임계치가 설정된
+여행과 참가자 fixture를 사용하며, 실패 시 원인을 바로 알 수 있도록 로그를 남긴다.
+"""
+
+import asyncio
+import logging
+import math
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from io import StringIO
+from types import SimpleNamespace
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import CommandError, call_command
+from django.db import connection, transaction
+from django.test import AsyncRequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from drf_spectacular.generators import SchemaGenerator
+from rest_framework.test import APIClient
+
+from monitoring import events, jobs, partitions, rollups, services, thresholds, vectorized, views
+from monitoring.models import HealthRollup, HealthSnapshot, LocationRollup, LocationSnapshot, MonitoringAlert
+from monitoring.serializers import DemoGenerationSerializer
+from trips.models import TripParticipant
+
+logger = logging.getLogger("monitoring.tests.v7")
+
+
+@pytest.fixture
+def monitored_trip(trip):
+    """임계치가 설정된 Trip 인스턴스를 반환한다."""
+
+    trip.heart_rate_min = 55
+    trip.heart_rate_max = 105
+    trip.spo2_min = Decimal("95.00")
+    trip.geofence_center_lat = Decimal("37.566500")
+    trip.geofence_center_lng = Decimal("126.978000")
+    trip.geofence_radius_km = Decimal("1.50")
+    trip.save()
+    return trip
+
+
+@pytest.fixture
+def participants(monitored_trip, traveler, additional_travelers):
+    """여러 참가자를 만들어 대량 적재 시나리오를 검증한다."""
+
+    created = [TripParticipant.objects.create(trip=monitored_trip, traveler=traveler)]
+    for extra in additional_travelers[:3]:
+        created.append(TripParticipant.objects.create(trip=monitored_trip, traveler=extra))
+    return created
+
+
+@pytest.fixture
+def participant_for_partitions(trip, traveler):
+    """파티션 테스트용 단일 참가자 (임계치 없음)."""
+
+    return TripParticipant.objects.create(trip=trip, traveler=traveler)
+
+
+@pytest.fixture
+def api_client(manager_user):
+    client = APIClient()
+    client.force_authenticate(user=manager_user)
+    return client
+
+
+def _health_row(participant, heart_rate, spo2, measured_at=None):
+    row = {
+        "type": "health",
+        "participant_id": participant.id,
+        "heart_rate": heart_rate,
+        "spo2": spo2,
+    }
+    if measured_at is not None:
+        row["measured_at"] = measured_at.isoformat()
+    return row
+
+
+def _location_row(participant, latitude, longitude, accuracy_m=None):
+    return {
+        "type": "location",
+        "participant_id": participant.id,
+        "latitude": latitude,
+        "longitude": longitude,
+        "accuracy_m": accuracy_m,
+    }
+
+
+# ------------------------- 배치 적재 서비스 -------------------------
+
+
+@pytest.mark.django_db
+def test_ingest_batch_matches_single_row_evaluation(participants):
+    """배치 적재가 단건 생성 함수와 동일한 상태/경보를 계산하는지 확인한다."""
+
+    member = participants[0]
+    trip = member.trip
+    readings = [
+        _health_row(member, 70, "97.00"),
+        _health_row(member, 130, "98.00"),
+        _health_row(member, 80, "93.50"),
+        _location_row(member, 37.5665, 126.978, 10),
+        _location_row(member, 37.6165, 126.978),
+    ]
+
+    result = services.ingest_telemetry_batch(trip=trip, readings=readings)
+    logger.info("배치 적재 결과: %s", result)
+
+    assert result.accepted == 5
+    assert result.rejected == 0
+    assert result.health_created == 3
+    assert result.location_created == 2
+    assert result.alerts_created == 3
+    statuses = sorted(HealthSnapshot.objects.values_list("heart_rate", "status"))
+    assert statuses == [(70, "normal"), (80, "danger"), (130, "danger")]
+    assert MonitoringAlert.objects.filter(alert_type="location").count() == 1
+    assert "반경" in MonitoringAlert.objects.get(alert_type="location").message
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "row_factory,reason",
+    [
+        (lambda p: {"type": "pulse", "participant_id": p.id}, "type"),
+        (lambda p: {"type": "health", "participant_id": -1, "heart_rate": 70, "spo2": 97}, "participant_id"),
+        (lambda p: {"type": "health", "participant_id": p.id, "heart_rate": "70", "spo2": 97}, "heart_rate"),
+        (lambda p: {"type": "health", "participant_id": p.id, "heart_rate": 10**20, "spo2": 97}, "heart_rate"),
+        (lambda p: {"type": "health", "participant_id": p.id, "heart_rate": 301, "spo2": 97}, "heart_rate"),
+        (lambda p: {"type": "health", "participant_id": p.id, "heart_rate": 70}, "spo2"),
+        (lambda p: {"type": "health", "participant_id": p.id, "heart_rate": 70, "spo2": "1e400"}, "spo2"),
+        (lambda p: {"type": "health", "participant_id": p.id, "heart_rate": 70, "spo2": 140}, "spo2"),
+        (lambda p: {"type": "location", "participant_id": p.id, "latitude": 91, "longitude": 0}, "latitude"),
+        (lambda p: {"type": "location", "participant_id": p.id, "latitude": 37, "longitude": "east"}, "longitude"),
+        (lambda p: {"type": "location", "participant_id": p.id, "latitude": 37, "longitude": 10**30}, "longitude"),
+        (
+            lambda p: {"type": "health", "participant_id": p.id, "heart_rate": 70, "spo2": 97, "measured_at": "어제"},
+            "measured_at",
+        ),
+        (lambda p: "not-a-dict", "JSON"),
+    ],
+)
+def test_ingest_batch_rejects_invalid_rows(participants, row_factory, reason):
+    """잘못된 행은 거부하고 나머지 행은 그대로 저장하는지 확인한다."""
+
+    member = participants[0]
+    readings = [_health_row(member, 72, "97.00"), row_factory(member)]
+
+    result = services.ingest_telemetry_batch(trip=member.trip, readings=readings)
+    logger.info("거부 사유: %s", result.errors)
+
+    assert result.accepted == 1
+    assert result.rejected == 1
+    assert result.errors[0]["index"] == 1
+    assert reason in result.errors[0]["detail"]
+    assert HealthSnapshot.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_ingest_batch_rejects_participant_of_other_trip(participants, trip_factory, additional_travelers):
+    """다른 여행의 참가자 ID는 거부되어야 한다."""
+
+    other_trip = trip_factory(_index=7)
+    outsider = TripParticipant.objects.create(trip=other_trip, traveler=additional_travelers[5])
+
+    result = services.ingest_telemetry_batch(
+        trip=participants[0].trip,
+        readings=[_health_row(outsider, 70, "97.00")],
+    )
+
+    assert result.rejected == 1
+    assert HealthSnapshot.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_ingest_batch_uses_constant_query_count(participants):
+    """행 수와 무관하게 고정된 쿼리 수로 적재되는지 확인한다."""
+
+    base_time = timezone.now() - timedelta(minutes=30)
+    readings = []
+    for step in range(50):
+        measured_at = base_time + timedelta(seconds=step * 10)
+        for member in participants:
+            readings.append(_health_row(member, 60 + step, "97.00", measured_at))
+            readings.append(_location_row(member, 37.5665 + step * 0.001, 126.978))
+
+    with CaptureQueriesContext(connection) as ctx:
+        result = services.ingest_telemetry_batch(trip=participants[0].trip, readings=readings)
+
+    logger.info("대량 적재 결과: accepted=%s alerts=%s", result.accepted, result.alerts_created)
+    assert result.accepted == len(readings)
+    # 참가자 조회 + 스냅샷/경보 INSERT + 집계 행 조회/INSERT(건강·위치, 각 INSERT는 savepoint 안)로,
+    # 행 수와 무관하게 일정하다.
+    assert len(ctx.captured_queries) <= 16
+    assert HealthSnapshot.objects.count() == 50 * len(participants)
+    assert LocationSnapshot.objects.count() == 50 * len(participants)
+
+
+@pytest.mark.django_db
+def test_ingest_batch_keeps_measured_at(participants):
+    """measured_at이 주어지면 그대로, naive 값이면 UTC로 저장한다."""
+
+    member = participants[0]
+    measured_at = timezone.now().replace(microsecond=0) - timedelta(hours=1)
+    readings = [
+        _health_row(member, 70, "97.00", measured_at),
+        {**_health_row(member, 71, "97.00"), "measured_at": "2025-01-01T09:00:00"},
+    ]
+
+    services.ingest_telemetry_batch(trip=member.trip, readings=readings)
+
+    stored = HealthSnapshot.objects.order_by("heart_rate")
+    assert stored[0].measured_at == measured_at
+    assert stored[1].measured_at.isoformat() == "2025-01-01T09:00:00+00:00"
+
+
+# ------------------------- 배치 적재 API -------------------------
+
+
+@pytest.mark.django_db
+def test_ingest_endpoint_returns_counts(api_client, participants):
+    member = participants[0]
+    url = reverse("monitoring:monitoring-trip-ingest", kwargs={"pk": member.trip_id})
+    payload = {
+        "readings": [
+            _health_row(member, 70, "97.00"),
+            _location_row(member, 37.5665, 126.978, 5.5),
+            {"type": "health", "participant_id": member.id},
+        ]
+    }
+
+    response = api_client.post(url, payload, format="json")
+    logger.info("적재 API 응답: %s", response.json())
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["accepted"] == 2
+    assert body["rejected"] == 1
+    assert body["health_created"] == 1
+    assert body["location_created"] == 1
+    assert body["errors"][0]["index"] == 2
+
+
+@pytest.mark.django_db
+def test_ingest_endpoint_requires_readings(api_client, participants):
+    url = reverse("monitoring:monitoring-trip-ingest", kwargs={"pk": participants[0].trip_id})
+
+    response = api_client.post(url, {"readings": []}, format="json")
+
+    assert response.status_code == 400
+
+
+# ------------------------- 최신 상태 조회 -------------------------
+
+
+@pytest.mark.django_db
+def test_participant_statuses_use_constant_queries(participants):
+    """참가자 수와 무관하게 최신 상태 조회가 3회의 쿼리로 끝나는지 확인한다."""
+
+    trip = participants[0].trip
+    base_time = timezone.now() - timedelta(minutes=10)
+    readings = []
+    for step in range(3):
+        for member in participants:
+            readings.append(_health_row(member, 70 + step, "97.00", base_time + timedelta(minutes=step)))
+    services.ingest_telemetry_batch(trip=trip, readings=readings)
+
+    with CaptureQueriesContext(connection) as ctx:
+        statuses = services.get_participant_statuses(trip)
+
+    logger.info("최신 상태 조회 쿼리 수: %s", len(ctx.captured_queries))
+    assert len(ctx.captured_queries) == 3
+    assert [status.participant.id for status in statuses] == [member.id for member in participants]
+    assert all(status.health.heart_rate == 72 for status in statuses)
+    assert all(status.location is None for status in statuses)
+
+
+@pytest.mark.django_db
+def test_participant_statuses_prefers_latest_insert_on_tie(participants):
+    """측정 시각이 같으면 나중에 저장된 스냅샷을 최신으로 본다."""
+
+    member = participants[0]
+    measured_at = timezone.now() - timedelta(minutes=1)
+    services.create_health_snapshot(participant=member, heart_rate=70, spo2=Decimal("97.00"), measured_at=measured_at)
+    later = services.create_health_snapshot(
+        participant=member, heart_rate=75, spo2=Decimal("97.00"), measured_at=measured_at
+    )
+
+    statuses = {status.participant.id: status for status in services.get_participant_statuses(member.trip)}
+
+    assert statuses[member.id].health.id == later.id
+
+
+@pytest.mark.django_db
+def test_participant_statuses_ignore_other_trips(participants, trip_factory, additional_travelers):
+    """다른 여행 참가자의 스냅샷이 섞이지 않는지 확인한다."""
+
+    other_trip = trip_factory(_index=9)
+    outsider = TripParticipant.objects.create(trip=other_trip, traveler=additional_travelers[6])
+    services.create_health_snapshot(participant=outsider, heart_rate=70, spo2=Decimal("97.00"))
+
+    statuses = services.get_participant_statuses(participants[0].trip)
+
+    assert all(status.health is None for status in statuses)
+    assert services.get_participant_statuses(other_trip)[0].health is not None
+
+
+# ------------------------- 월별 파티션 -------------------------
+
+
+def _months_ago(months):
+    current = partitions.MonthPartition.containing(timezone.now())
+    return current.shift(-months).start + timedelta(days=3)
+
+
+@pytest.mark.django_db
+def test_archive_rows_moves_old_snapshots_into_month_partitions(participant_for_partitions):
+    """오래된 스냅샷은 월별 파티션으로 옮겨지고 최근 데이터만 운영 테이블에 남는다."""
+
+    for months in (5, 4, 0):
+        services.create_health_snapshot(
+            participant=participant_for_partitions,
+            heart_rate=70,
+            spo2=Decimal("97.00"),
+            measured_at=_months_ago(months),
+        )
+    current = partitions.MonthPartition.containing(timezone.now())
+
+    moved = partitions.archive_rows_before(HealthSnapshot, current.shift(-2))
+    created_months = partitions.list_partitions(HealthSnapshot)
+    logger.info("이동 %s건, 파티션: %s", moved, [month.suffix for month in created_months])
+
+    assert moved == 2
+    assert HealthSnapshot.objects.count() == 1
+    assert current.shift(-5) in created_months
+    assert current.shift(-4) in created_months
+    with connection.cursor() as cursor:
+        table = partitions.partition_table_name(HealthSnapshot, current.shift(-5))
+        cursor.execute(f'SELECT COUNT(*) FROM "{table}"')
+        assert cursor.fetchone()[0] == 1
+
+    dropped = partitions.drop_partitions_before(HealthSnapshot, current.shift(-4))
+    assert dropped == [partitions.partition_table_name(HealthSnapshot, current.shift(-5))]
+    assert current.shift(-5) not in partitions.list_partitions(HealthSnapshot)
+
+
+@pytest.mark.django_db
+def test_archive_rows_without_old_data_is_noop(participant_for_partitions):
+    services.create_location_snapshot(participant=participant_for_partitions, latitude=37.5, longitude=127.0)
+    current = partitions.MonthPartition.containing(timezone.now())
+
+    assert partitions.archive_rows_before(LocationSnapshot, current) == 0
+    assert LocationSnapshot.objects.count() == 1
+
+
+def test_month_partition_shift_crosses_year_boundary():
+    january = partitions.MonthPartition(2026, 1)
+
+    assert january.shift(-1) == partitions.MonthPartition(2025, 12)
+    assert january.shift(12).suffix == "p2027_01"
+    assert january.end == partitions.MonthPartition(2026, 2).start
+
+
+@pytest.mark.django_db
+def test_partition_command_requires_setting():
+    with override_settings(MONITORING_PARTITIONING=False), pytest.raises(CommandError):
+        call_command("manage_snapshot_partitions")
+
+
+@pytest.mark.django_db
+def test_partition_command_rejects_zero_hot_months():
+    with override_settings(MONITORING_PARTITIONING=True, MONITORING_HOT_MONTHS=3):
+        with pytest.raises(CommandError, match="hot-months"):
+            call_command("manage_snapshot_partitions", "--hot-months", "0")
+
+
+@pytest.mark.django_db
+def test_partition_command_rolls_snapshots(participant_for_partitions):
+    services.create_health_snapshot(
+        participant=participant_for_partitions,
+        heart_rate=70,
+        spo2=Decimal("97.00"),
+        measured_at=_months_ago(6),
+    )
+    out = StringIO()
+
+    with override_settings(MONITORING_PARTITIONING=True):
+        call_command("manage_snapshot_partitions", "--hot-months", "2", "--retain-months", "12", stdout=out)
+    logger.info("파티션 명령 출력: %s", out.getvalue())
+
+    assert HealthSnapshot.objects.count() == 0
+    assert "1건 이동" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_trip_thresholds_are_cached_until_trip_saved(monitored_trip):
+    thresholds.clear_threshold_cache()
+    first = thresholds.get_trip_thresholds(monitored_trip)
+    assert thresholds.get_trip_thresholds(monitored_trip) is first
+    assert first.spo2_min == Decimal("95.00")
+    assert first.has_geofence
+
+    monitored_trip.heart_rate_max = 120
+    monitored_trip.save()
+
+    refreshed = thresholds.get_trip_thresholds(monitored_trip)
+    assert refreshed is not first
+    assert refreshed.heart_rate_max == 120
+
+
+def test_trip_threshold_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(thresholds, "_cache", thresholds.TTLLRUCache(max_size=2))
+    blank = dict.fromkeys(
+        ["heart_rate_min", "heart_rate_max", "spo2_min", "geofence_center_lat", "geofence_center_lng", "geofence_radius_km"]
+    )
+    trips = [SimpleNamespace(pk=pk, updated_at=None, **blank) for pk in (1, 2, 3)]
+
+    for trip in trips:
+        thresholds.get_trip_thresholds(trip)
+
+    assert len(thresholds._cache) == 2
+    assert thresholds._cache.get(1) is None
+    assert thresholds._cache.get(3).trip_id == 3
+
+
+@pytest.mark.django_db
+def test_trip_thresholds_distance_matches_haversine(monitored_trip):
+    compiled = thresholds.get_trip_thresholds(monitored_trip)
+    expected = services._haversine_km(37.5665, 126.978, 37.60, 127.01)
+
+    assert compiled.distance_from_center_km(37.60, 127.01) == pytest.approx(expected, rel=1e-9)
+
+
+@pytest.mark.django_db
+def test_ingest_evaluates_without_per_reading_trip_queries(participants):
+    trip = participants[0].trip
+    readings = [_health_row(participant, 40, 90) for participant in participants] * 25
+    thresholds.get_trip_thresholds(trip)
+
+    with CaptureQueriesContext(connection) as context:
+        result = services.ingest_telemetry_batch(trip=trip, readings=readings)
+
+    assert result.alerts_created == len(readings)
+    trip_queries = [query for query in context.captured_queries if 'FROM "trips_trip"' in query["sql"]]
+    logger.debug("ingest queries: %s", [query["sql"] for query in context.captured_queries])
+    assert trip_queries == []
+
+
+def _random_thresholds(rng, trip_id):
+    has_geofence = rng.random() < 0.8
+    return thresholds.TripThresholds.compile(
+        SimpleNamespace(
+            pk=trip_id,
+            updated_at=None,
+            heart_rate_min=rng.choice([None, rng.randint(40, 70)]),
+            heart_rate_max=rng.choice([None, rng.randint(90, 150)]),
+            spo2_min=rng.choice([None, Decimal(f"{rng.uniform(85, 98):.2f}")]),
+            geofence_center_lat=Decimal(f"{rng.uniform(-60, 60):.6f}") if has_geofence else None,
+            geofence_center_lng=Decimal(f"{rng.uniform(-179, 179):.6f}") if has_geofence else None,
+            geofence_radius_km=Decimal(f"{rng.uniform(0.1, 50):.2f}") if has_geofence else None,
+        )
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_vectorized_evaluation_matches_scalar_reference(seed):
+    pytest.importorskip("numpy")
+    rng = random.Random(seed)
+    compiled = _random_thresholds(rng, seed)
+    size = 300
+    heart_rates = [rng.randint(30, 190) for _ in range(size)]
+    spo2_values = [Decimal(f"{rng.uniform(80, 100):.2f}") for _ in range(size)]
+    center_lat = math.degrees(compiled.geofence_lat_rad) if compiled.has_geofence else 0.0
+    center_lng = math.degrees(compiled.geofence_lng_rad) if compiled.has_geofence else 0.0
+    latitudes = [center_lat + rng.uniform(-0.5, 0.5) for _ in range(size)]
+    longitudes = [center_lng + rng.uniform(-0.5, 0.5) for _ in range(size)]
+
+    health = vectorized.evaluate_health_batch(compiled, heart_rates, spo2_values)
+    location = vectorized.evaluate_location_batch(compiled, latitudes, longitudes)
+
+    for i in range(size):
+        status, message = services._evaluate_health(compiled, heart_rates[i], spo2_values[i])
+        assert health.status_labels()[i] == status
+        assert bool(health.alert_mask[i]) == (message is not None)
+        location_message = services._evaluate_location(compiled, latitudes[i], longitudes[i])
+        assert bool(location.outside_mask[i]) == (location_message is not None)
+        if compiled.has_geofence:
+            reference = services._haversine_km(center_lat, center_lng, latitudes[i], longitudes[i])
+            assert float(location.distance_km[i]) == pytest.approx(reference, rel=1e-9, abs=1e-9)
+
+
+def test_vectorized_evaluation_falls_back_without_numpy(monkeypatch):
+    monkeypatch.setattr(vectorized, "np", None)
+    compiled = _random_thresholds(random.Random(7), 7)
+
+    health = vectorized.evaluate_health_batch(compiled, [20, 80, 200], [Decimal("99.00")] * 3)
+
+    assert not vectorized.numpy_available()
+    assert health.status_labels()[1] == services._evaluate_health(compiled, 80, Decimal("99.00"))[0]
+    assert list(health.alert_mask) == [
+        services._evaluate_health(compiled, value, Decimal("99.00"))[1] is not None for value in (20, 80, 200)
+    ]
+
+
+@pytest.mark.django_db
+def test_bulk_demo_generation_is_reproducible_with_seed(participants):
+    trip = participants[0].trip
+    end_at = timezone.now()
+
+    first = services.generate_bulk_demo_snapshots(
+        trip=trip, minutes=30, interval_seconds=60, seed=11, chunk_size=20, end_at=end_at
+    )
+    first_rows = list(HealthSnapshot.objects.order_by("id").values_list("heart_rate", "spo2", "status"))
+    HealthSnapshot.objects.all().delete()
+    LocationSnapshot.objects.all().delete()
+    MonitoringAlert.objects.all().delete()
+    second = services.generate_bulk_demo_snapshots(
+        trip=trip, minutes=30, interval_seconds=60, seed=11, chunk_size=1000, end_at=end_at
+    )
+
+    assert first.health_created == second.health_created == 30 * len(participants)
+    assert first.alerts_created == second.alerts_created
+    assert list(HealthSnapshot.objects.order_by("id").values_list("heart_rate", "spo2", "status")) == first_rows
+    assert MonitoringAlert.objects.count() == second.alerts_created
+
+
+@pytest.mark.django_db
+def test_bulk_demo_generation_uses_chunked_inserts(participants):
+    trip = participants[0].trip
+    chunks = []
+
+    with CaptureQueriesContext(connection) as context:
+        result = services.generate_bulk_demo_snapshots(
+            trip=trip,
+            minutes=50,
+            interval_seconds=60,
+            seed=3,
+            chunk_size=100,
+            progress=lambda progress: chunks.append(progress.snapshots_created),
+        )
+
+    inserts = [query for query in context.captured_queries if query["sql"].startswith("INSERT")]
+    assert result.snapshots_created == 2 * 50 * len(participants)
+    assert len(chunks) == 2
+    # 청크마다 건강/위치/경보 스냅샷과 건강/위치 집계 INSERT가 최대 한 번씩 실행된다.
+    assert len(inserts) <= 5 * len(chunks)
+
+
+@pytest.mark.django_db
+def test_generate_bulk_telemetry_command(participants):
+    out = StringIO()
+    call_command("generate_bulk_telemetry", participants[0].trip_id, "--minutes", "10", "--seed", "1", stdout=out)
+
+    assert HealthSnapshot.objects.count() == 10 * len(participants)
+    assert "건강 40건" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_generate_demo_background_job(api_client, participants):
+    trip = participants[0].trip
+    jobs.set_job_runner(lambda task: task())
+    try:
+        response = api_client.post(
+            reverse("monitoring:monitoring-trip-generate-demo", kwargs={"pk": trip.id}),
+            {"minutes": 60, "interval": 10, "seed": 5, "background": True},
+            format="json",
+        )
+    finally:
+        jobs.set_job_runner(None)
+
+    assert response.status_code == 202, response.data
+    assert response.data["status"] == "succeeded"
+    assert response.data["health_created"] == 360 * len(participants)
+
+    status_response = api_client.get(
+        reverse(
+            "monitoring:monitoring-trip-demo-job",
+            kwargs={"pk": trip.id, "job_id": response.data["job_id"]},
+        )
+    )
+    assert status_response.status_code == 200
+    assert status_response.data["location_created"] == 360 * len(participants)
+
+
+@pytest.mark.parametrize(
+    "options, valid",
+    [
+        ({"minutes": 1440, "interval": 600, "background": True}, True),
+        ({"minutes": 1441, "interval": 600, "background": True}, False),
+        ({"minutes": 60, "interval": 60}, True),
+        ({"minutes": 61, "interval": 600}, False),
+    ],
+)
+def test_demo_generation_minutes_limit_depends_on_background(options, valid):
+    serializer = DemoGenerationSerializer(data=options)
+
+    assert serializer.is_valid() is valid
+    if not valid:
+        assert "minutes" in serializer.errors
+
+
+@override_settings(MONITORING_DEMO_JOB_TTL_SECONDS=60, MONITORING_DEMO_JOB_MAX=2)
+def test_finished_demo_jobs_expire_and_are_capped(monkeypatch):
+    monkeypatch.setattr(jobs, "_jobs", {})
+    jobs.set_job_runner(lambda task: None)  # 작업을 실행하지 않아 pending으로 남긴다.
+    try:
+        expired = jobs.submit_demo_generation(trip_id=1, minutes=1, interval_seconds=10)
+        recent = jobs.submit_demo_generation(trip_id=1, minutes=1, interval_seconds=10)
+        expired.finished_at = timezone.now() - timedelta(hours=1)
+        recent.finished_at = timezone.now()
+
+        pending = jobs.submit_demo_generation(trip_id=1, minutes=1, interval_seconds=10)
+        assert jobs.get_job(expired.job_id) is None
+        assert jobs.get_job(recent.job_id) is recent
+
+        # 한도(2)를 넘으면 완료된 작업부터 지우고, 실행 전/중인 작업은 남긴다.
+        later = [jobs.submit_demo_generation(trip_id=1, minutes=1, interval_seconds=10) for _ in range(2)]
+    finally:
+        jobs.set_job_runner(None)
+
+    assert jobs.get_job(recent.job_id) is None
+    assert all(jobs.get_job(job.job_id) is job for job in [pending, *later])
+
+
+@pytest.mark.django_db
+def test_generate_demo_foreground_keeps_point_limit(api_client, participants):
+    response = api_client.post(
+        reverse("monitoring:monitoring-trip-generate-demo", kwargs={"pk": participants[0].trip_id}),
+        {"minutes": 60, "interval": 10},
+        format="json",
+    )
+
+    assert response.status_code == 400
+
+
+def _alerts_url(trip_id):
+    return reverse("monitoring:monitoring-trip-alerts", kwargs={"pk": trip_id})
+
+
+@pytest.mark.django_db
+def test_alerts_endpoint_walks_pages_by_cursor(api_client, participants):
+    trip = participants[0].trip
+    services.ingest_telemetry_batch(trip=trip, readings=[_health_row(participants[0], 40, 97)] * 25)
+    expected = list(MonitoringAlert.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+
+    seen = []
+    url = _alerts_url(trip.id) + "?page_size=10"
+    while url:
+        response = api_client.get(url)
+        assert response.status_code == 200
+        assert len(response.data["results"]) <= 10
+        seen.extend(item["id"] for item in response.data["results"])
+        url = response.data["next"]
+
+    assert seen == expected
+    assert response.data["results"][0]["trip_id"] == trip.id
+
+
+@pytest.mark.django_db
+def test_alerts_endpoint_uses_constant_queries(api_client, participants):
+    trip = participants[0].trip
+    readings = [_health_row(participant, 40, 97) for participant in participants] * 20
+    services.ingest_telemetry_batch(trip=trip, readings=readings)
+
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(_alerts_url(trip.id) + "?page_size=50")
+
+    assert response.status_code == 200
+    assert len(response.data["results"]) == 50
+    # 세션/권한 확인, Trip 조회, 알림 페이지 조회를 합쳐도 페이지 크기와 무관하게 일정하다.
+    assert len(context.captured_queries) <= 5
+
+
+@pytest.mark.django_db
+def test_alerts_endpoint_filters_by_type_and_window(api_client, participants):
+    trip = participants[0].trip
+    services.ingest_telemetry_batch(
+        trip=trip,
+        readings=[_health_row(participants[0], 40, 97), _location_row(participants[1], 38.5, 127.5)],
+    )
+    MonitoringAlert.objects.filter(alert_type="location").update(created_at=timezone.now() - timedelta(days=2))
+
+    response = api_client.get(_alerts_url(trip.id), {"alert_type": "location"})
+    assert [item["alert_type"] for item in response.data["results"]] == ["location"]
+
+    since = (timezone.now() - timedelta(days=1)).isoformat()
+    response = api_client.get(_alerts_url(trip.id), {"since": since})
+    assert [item["alert_type"] for item in response.data["results"]] == ["health"]
+
+    response = api_client.get(_alerts_url(trip.id), {"alert_type": "unknown"})
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_alerts_endpoint_rejects_invalid_cursor(api_client, participants):
+    response = api_client.get(_alerts_url(participants[0].trip_id), {"cursor": "not-a-cursor"})
+
+    assert response.status_code == 404
+
+
+def test_alerts_schema_declares_paginated_envelope():
+    schema = SchemaGenerator().get_schema(request=None, public=True)
+    operation = schema["paths"]["/api/monitoring/trips/{id}/alerts/"]["get"]
+    body = operation["responses"]["200"]["content"]["application/json"]["schema"]
+    page = schema["components"]["schemas"][body["$ref"].rsplit("/", 1)[-1]]
+
+    assert set(page["properties"]) == {"next", "results"}
+    assert page["properties"]["next"]["nullable"] is True
+    assert page["properties"]["results"]["items"]["$ref"].endswith("/MonitoringAlert")
+
+
+class _RecordingBus:
+    def __init__(self):
+        self.published = []
+
+    def publish(self, trip_id, events):
+        self.published.append((trip_id, events))
+
+
+class _StubRedisPubSub:
+    """redis.asyncio PubSub처럼 await로 기다리는 구독 대역."""
+
+    def __init__(self, client):
+        self.client = client
+        self.channels = []
+        self.messages = []
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+        self.client.subscribers.setdefault(channel, []).append(self)
+        self.messages.append({"type": "subscribe", "channel": channel, "data": 1})
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        deadline = time.monotonic() + timeout
+        while True:
+            while self.messages:
+                message = self.messages.pop(0)
+                if ignore_subscribe_messages and message["type"] in ("subscribe", "unsubscribe"):
+                    continue
+                return message
+            if time.monotonic() >= deadline:
+                return None
+            await asyncio.sleep(0.005)
+
+    async def unsubscribe(self, channel):
+        self.client.subscribers[channel].remove(self)
+        self.messages.append({"type": "unsubscribe", "channel": channel, "data": 0})
+
+
+class _StubRedis:
+    """publish/pubsub만 구현한 로컬 Redis 대역."""
+
+    def __init__(self):
+        self.subscribers = {}
+        self.pubsubs = []
+
+    def publish(self, channel, message):
+        for pubsub in self.subscribers.get(channel, []):
+            pubsub.messages.append({"type": "message", "channel": channel, "data": message.encode("utf-8")})
+        return len(self.subscribers.get(channel, []))
+
+    def pubsub(self):
+        pubsub = _StubRedisPubSub(self)
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+
+@pytest.fixture
+def recording_bus():
+    bus = _RecordingBus()
+    events.set_event_bus(bus)
+    yield bus
+    events.set_event_bus(None)
+
+
+@pytest.mark.django_db
+def test_ingest_publishes_saved_rows_to_event_bus(participants, recording_bus):
+    trip = participants[0].trip
+    services.ingest_telemetry_batch(
+        trip=trip,
+        readings=[_health_row(participants[0], 40, 97), _location_row(participants[1], 37.5665, 126.978)],
+    )
+
+    assert len(recording_bus.published) == 1
+    trip_id, published = recording_bus.published[0]
+    assert trip_id == trip.id
+    assert [event["type"] for event in published] == ["health", "location", "alert"]
+    assert published[0]["id"] == HealthSnapshot.objects.get().id
+    assert published[2]["alert_type"] == "health"
+
+
+@pytest.mark.django_db
+def test_create_snapshot_publishes_after_commit(participants, recording_bus):
+    with transaction.atomic():
+        services.create_health_snapshot(participant=participants[0], heart_rate=70, spo2=Decimal("97.00"))
+        assert recording_bus.published == []
+        # 테스트 DB는 수동 트랜잭션이므로 on_commit 콜백을 직접 실행한다.
+        callbacks = list(connection.run_on_commit)
+    for _, callback, _ in callbacks:
+        callback()
+
+    assert [event["type"] for event in recording_bus.published[0][1]] == ["health"]
+
+
+def test_in_process_bus_delivers_events_across_threads():
+    bus = events.InProcessEventBus()
+
+    async def scenario():
+        subscription = await bus.subscribe(7)
+        publisher = threading.Thread(target=bus.publish, args=(7, [{"type": "health"}]))
+        publisher.start()
+        received = await subscription.get(timeout=2)
+        publisher.join()
+        other = await subscription.get(timeout=0.01)
+        await subscription.close()
+        return received, other
+
+    received, other = asyncio.run(scenario())
+    assert received == [{"type": "health"}]
+    assert other is None
+    assert bus._subscribers == {}
+
+
+def test_redis_bus_round_trips_through_stub_client():
+    client = _StubRedis()
+    bus = events.RedisEventBus(client, lambda: client)
+    bus.poll_seconds = 0.02
+
+    async def scenario():
+        threads_before = threading.active_count()
+        first = await bus.subscribe(3)
+        second = await bus.subscribe(3)
+        bus.publish(3, [{"type": "alert", "id": 1}])
+        bus.publish(4, [{"type": "alert", "id": 2}])
+        received = [await first.get(timeout=1), await second.get(timeout=1)]
+        nothing = await first.get(timeout=0.05)
+        # 구독자가 늘어도 스레드를 더 쓰지 않고 pubsub 연결 하나를 공유한다.
+        threads_during = threading.active_count()
+        await first.close()
+        await second.close()
+        await asyncio.sleep(bus.poll_seconds * 3)
+        listener = bus._listeners[asyncio.get_running_loop()]
+        return received, nothing, threads_before, threads_during, listener
+
+    received, nothing, threads_before, threads_during, listener = asyncio.run(scenario())
+    assert received == [[{"type": "alert", "id": 1}]] * 2
+    assert nothing is None
+    assert threads_during == threads_before
+    assert len(client.pubsubs) == 1 and client.pubsubs[0].channels == [bus.channel(3)]
+    assert client.subscribers[bus.channel(3)] == []
+    assert listener._task is None
+
+
+@pytest.mark.django_db
+@override_settings(MONITORING_STREAM_HEARTBEAT_SECONDS=1, MONITORING_STREAM_MAX_SECONDS=2)
+def test_stream_view_pushes_published_events(participants):
+    trip = participants[0].trip
+    bus = events.InProcessEventBus()
+    events.set_event_bus(bus)
+    request = AsyncRequestFactory().get(f"/api/monitoring/trips/{trip.id}/stream/")
+
+    async def scenario():
+        response = await views.trip_event_stream(request, pk=trip.id)
+        chunks = response.streaming_content
+        first = await chunks.__anext__()
+        bus.publish(trip.id, [{"type": "health", "participant_id": participants[0].id}])
+        second = await chunks.__anext__()
+        await chunks.aclose()
+        return response, first, second
+
+    try:
+        response, first, second = async_to_sync(scenario)()
+    finally:
+        events.set_event_bus(None)
+
+    assert response["Content-Type"] == "text/event-stream"
+    assert first.startswith(b"retry:")
+    assert b"event: monitoring" in second
+    assert f'"participant_id": {participants[0].id}'.encode() in second
+    assert bus._subscribers == {}
+
+
+@pytest.mark.django_db
+@override_settings(DEMO_MODE=False)
+def test_stream_view_requires_approved_staff(participants):
+    request = AsyncRequestFactory().get("/stream/")
+
+    async def anonymous():
+        return AnonymousUser()
+
+    request.auser = anonymous
+    response = async_to_sync(views.trip_event_stream)(request, pk=participants[0].trip_id)
+
+    assert response.status_code == 403
+
+
+HISTORY_BASE = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def _seed_history(participant, minutes):
+    HealthSnapshot.objects.bulk_create(
+        HealthSnapshot(
+            participant=participant,
+            measured_at=HISTORY_BASE + timedelta(minutes=minute),
+            heart_rate=60 + minute,
+            spo2=Decimal("99.00") - minute,
+        )
+        for minute in range(minutes)
+    )
+    LocationSnapshot.objects.bulk_create(
+        LocationSnapshot(
+            participant=participant,
+            measured_at=HISTORY_BASE + timedelta(minutes=minute),
+            latitude=Decimal("37.500000") + Decimal(minute) / 1000,
+            longitude=Decimal("127.000000"),
+        )
+        for minute in range(minutes)
+    )
+
+
+@pytest.mark.django_db
+def test_health_history_aggregates_per_bucket(participants):
+    _seed_history(participants[0], 10)
+    _seed_history(participants[1], 3)
+
+    buckets = services.get_health_history(
+        participants[0].trip,
+        start=HISTORY_BASE,
+        end=HISTORY_BASE + timedelta(hours=1),
+        resolution_seconds=300,
+        participant_id=participants[0].id,
+    )
+
+    assert [bucket.bucket_start for bucket in buckets] == [HISTORY_BASE, HISTORY_BASE + timedelta(minutes=5)]
+    first = buckets[0]
+    assert (first.heart_rate_min, first.heart_rate_max, first.heart_rate_avg) == (60, 64, 62.0)
+    assert first.spo2_min == Decimal("95.00")
+    assert first.samples == 5
+
+
+@pytest.mark.django_db
+def test_location_history_returns_last_position_per_bucket(participants):
+    _seed_history(participants[0], 10)
+    _seed_history(participants[1], 3)
+
+    buckets = services.get_location_history(
+        participants[0].trip,
+        start=HISTORY_BASE,
+        end=HISTORY_BASE + timedelta(hours=1),
+        resolution_seconds=300,
+    )
+
+    by_participant = {}
+    for bucket in buckets:
+        by_participant.setdefault(bucket.participant_id, []).append(bucket)
+    mine = by_participant[participants[0].id]
+    assert [bucket.latitude for bucket in mine] == [Decimal("37.504000"), Decimal("37.509000")]
+    assert [bucket.samples for bucket in mine] == [5, 5]
+    assert by_participant[participants[1].id][0].measured_at == HISTORY_BASE + timedelta(minutes=2)
+
+
+@pytest.mark.django_db
+def test_history_endpoint_downsamples_with_constant_queries(api_client, participants):
+    _seed_history(participants[0], 12 * 60)
+    url = reverse("monitoring:monitoring-trip-history", kwargs={"pk": participants[0].trip_id})
+    params = {"start": HISTORY_BASE.isoformat(), "end": (HISTORY_BASE + timedelta(hours=12)).isoformat()}
+
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(url, params)
+
+    assert response.status_code == 200, response.data
+    assert response.data["resolution"] == 300
+    assert len(response.data["health"]) == 144
+    assert len(response.data["location"]) == 144
+    assert len(context.captured_queries) <= 5
+
+    response = api_client.get(url, {**params, "resolution": 3600, "kind": "health"})
+    assert len(response.data["health"]) == 12
+    assert response.data["location"] == []
+
+
+@pytest.mark.django_db
+def test_history_endpoint_validates_window_and_participant(api_client, participants, trip_factory, traveler):
+    url = reverse("monitoring:monitoring-trip-history", kwargs={"pk": participants[0].trip_id})
+
+    response = api_client.get(
+        url,
+        {"start": HISTORY_BASE.isoformat(), "end": (HISTORY_BASE + timedelta(days=30)).isoformat(), "resolution": 60},
+    )
+    assert response.status_code == 400
+
+    outsider = TripParticipant.objects.create(trip=trip_factory(_index=5), traveler=traveler)
+    response = api_client.get(url, {"participant_id": outsider.id})
+    assert response.status_code == 404
+
+
+def _rollup_rows(model, fields):
+    return sorted(model.objects.values_list("participant_id", "granularity", "bucket_start", *fields))
+
+
+HEALTH_ROLLUP_FIELDS = ("heart_rate_min", "heart_rate_max", "heart_rate_sum", "spo2_min", "samples", "danger_count")
+LOCATION_ROLLUP_FIELDS = ("measured_at", "latitude", "longitude", "samples")
+
+
+@pytest.mark.django_db
+def test_incremental_rollups_match_backfill(participants):
+    trip = participants[0].trip
+    services.generate_bulk_demo_snapshots(
+        trip=trip, minutes=150, interval_seconds=45, seed=9, chunk_size=60, end_at=HISTORY_BASE
+    )
+    services.ingest_telemetry_batch(
+        trip=trip,
+        readings=[
+            _health_row(participants[0], 130, 90, HISTORY_BASE - timedelta(seconds=30)),
+            _location_row(participants[0], 37.6, 127.0),
+        ],
+    )
+    incremental_health = _rollup_rows(HealthRollup, HEALTH_ROLLUP_FIELDS)
+    incremental_location = _rollup_rows(LocationRollup, LOCATION_ROLLUP_FIELDS)
+    assert {row[1] for row in incremental_health} == {"minute", "hour"}
+
+    out = StringIO()
+    call_command("backfill_monitoring_rollups", "--trip", str(trip.id), stdout=out)
+
+    assert _rollup_rows(HealthRollup, HEALTH_ROLLUP_FIELDS) == incremental_health
+    assert _rollup_rows(LocationRollup, LOCATION_ROLLUP_FIELDS) == incremental_location
+    assert "집계 완료" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_rollups_merge_into_existing_buckets(participant_for_partitions):
+    participant = participant_for_partitions
+    services.create_health_snapshot(
+        participant=participant, heart_rate=70, spo2=Decimal("97.00"), measured_at=HISTORY_BASE
+    )
+    services.create_health_snapshot(
+        participant=participant, heart_rate=90, spo2=Decimal("95.50"), measured_at=HISTORY_BASE + timedelta(seconds=20)
+    )
+
+    minute = HealthRollup.objects.get(granularity="minute")
+    assert (minute.heart_rate_min, minute.heart_rate_max, minute.samples) == (70, 90, 2)
+    assert minute.heart_rate_avg == 80
+    assert minute.spo2_min == Decimal("95.50")
+    assert HealthRollup.objects.get(granularity="hour").samples == 2
+
+
+@pytest.mark.django_db
+def test_history_reads_rollups_when_enabled(participants):
+    trip = participants[0].trip
+    services.generate_bulk_demo_snapshots(
+        trip=trip, minutes=180, interval_seconds=30, seed=4, end_at=HISTORY_BASE + timedelta(hours=3)
+    )
+    window = {"start": HISTORY_BASE, "end": HISTORY_BASE + timedelta(hours=3), "resolution_seconds": 600}
+    raw_health = services.get_health_history(trip, **window)
+    raw_location = services.get_location_history(trip, **window)
+
+    with override_settings(MONITORING_HISTORY_USE_ROLLUPS=True):
+        with CaptureQueriesContext(connection) as context:
+            rolled_health = services.get_health_history(trip, **window)
+            rolled_location = services.get_location_history(trip, **window)
+
+    assert all("monitoring_healthsnapshot" not in query["sql"] for query in context.captured_queries)
+    assert rolled_health == raw_health
+    assert rolled_location == raw_location
+
+
+@pytest.mark.django_db
+def test_rollups_retry_when_bucket_is_created_concurrently(participant_for_partitions, monkeypatch):
+    """없던 구간을 다른 요청이 먼저 만든 경우에도 스냅샷은 저장되고 집계는 병합된다."""
+
+    participant = participant_for_partitions
+    services.create_health_snapshot(
+        participant=participant, heart_rate=70, spo2=Decimal("97.00"), measured_at=HISTORY_BASE
+    )
+
+    original = rollups._existing
+    calls = []
+
+    def _stale_read(model, keys):
+        # 첫 조회는 다른 트랜잭션이 행을 만들기 전 시점을 흉내 내어 빈 결과를 돌려준다.
+        calls.append(model)
+        if len(calls) == 1:
+            return {}
+        return original(model, keys)
+
+    monkeypatch.setattr(rollups, "_existing", _stale_read)
+    services.create_health_snapshot(
+        participant=participant, heart_rate=90, spo2=Decimal("95.50"), measured_at=HISTORY_BASE + timedelta(seconds=20)
+    )
+
+    assert HealthSnapshot.objects.filter(participant=participant).count() == 2
+    minute = HealthRollup.objects.get(granularity="minute")
+    assert (minute.heart_rate_min, minute.heart_rate_max, minute.samples) == (70, 90, 2)
+    assert HealthRollup.objects.get(granularity="hour").samples == 2
@@ -0,0 +1,101 @@
+"""여행별 모니터링 임계치를 미리 계산해 메모리에 보관하는 모듈.
+
+측정값을 평가할 때마다 Trip 필드를 읽어 ``Decimal(str(...))``/``float(...)`` 변환과
+라디안 계산을 반복하지 않도록, 여행마다 한 번만 변환한 ``TripThresholds``를 재사용합니다.
+캐시는 Trip 저장/삭제 시그널(monitoring.signals)과 ``updated_at`` 비교로 무효화되며,
+끝난 여행이 계속 쌓이지 않도록 크기 한도와 TTL이 있는 LRU(``TTLLRUCache``)에 보관합니다.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from schedules.services.memory_cache import TTLLRUCache
+
+EARTH_RADIUS_KM = 6371
+
+# 동시에 모니터링하는 여행 수보다 넉넉하게 잡은 캐시 한도와, 쓰지 않는 항목을 비우는 주기(초)
+THRESHOLD_CACHE_SIZE = 1024
+THRESHOLD_CACHE_TTL_SECONDS = 60 * 60
+
+
+@dataclass(frozen=True)
+class TripThresholds:
+    """한 여행의 임계치를 평가에 바로 쓸 수 있는 형태로 변환한 값."""
+
+    trip_id: int
+    version: Optional[datetime]
+    heart_rate_min: Optional[int]
+    heart_rate_max: Optional[int]
+    spo2_min: Optional[Decimal]
+    geofence_lat_rad: Optional[float]
+    geofence_lng_rad: Optional[float]
+    geofence_cos_lat: Optional[float]
+    geofence_radius_km: Optional[float]
+
+    @classmethod
+    def compile(cls, trip) -> "TripThresholds":
+        """Trip 인스턴스의 임계치 필드를 한 번만 변환한다."""
+
+        has_geofence = (
+            trip.geofence_center_lat is not None
+            and trip.geofence_center_lng is not None
+            and trip.geofence_radius_km is not None
+        )
+        lat_rad = math.radians(float(trip.geofence_center_lat)) if has_geofence else None
+        return cls(
+            trip_id=trip.pk,
+            version=trip.updated_at,
+            heart_rate_min=trip.heart_rate_min,
+            heart_rate_max=trip.heart_rate_max,
+            spo2_min=Decimal(str(trip.spo2_min)) if trip.spo2_min is not None else None,
+            geofence_lat_rad=lat_rad,
+            geofence_lng_rad=math.radians(float(trip.geofence_center_lng)) if has_geofence else None,
+            geofence_cos_lat=math.cos(lat_rad) if has_geofence else None,
+            geofence_radius_km=float(trip.geofence_radius_km) if has_geofence else None,
+        )
+
+    @property
+    def has_geofence(self) -> bool:
+        return self.geofence_radius_km is not None
+
+    def distance_from_center_km(self, latitude: float, longitude: float) -> float:
+        """지오펜스 중심에서 좌표까지의 거리(km). 중심의 라디안/코사인 값은 재사용한다."""
+
+        phi2 = math.radians(latitude)
+        d_phi = phi2 - self.geofence_lat_rad
+        d_lambda = math.radians(longitude) - self.geofence_lng_rad
+        a = math.sin(d_phi / 2) ** 2 + self.geofence_cos_lat * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        return EARTH_RADIUS_KM * c
+
+
+_cache = TTLLRUCache(max_size=THRESHOLD_CACHE_SIZE)
+
+
+def get_trip_thresholds(trip) -> TripThresholds:
+    """캐시된 임계치를 반환하고, 없거나 Trip이 그 사이 수정되었다면 다시 계산한다."""
+
+    cached = _cache.get(trip.pk)
+    if cached is not None and cached.version == trip.updated_at:
+        return cached
+
+    compiled = TripThresholds.compile(trip)
+    _cache.set(trip.pk, compiled, ttl_seconds=THRESHOLD_CACHE_TTL_SECONDS)
+    return compiled
+
+
+def invalidate_trip_thresholds(trip_id: int) -> None:
+    """Trip이 저장/삭제되면 해당 여행의 캐시를 비운다."""
+
+    _cache.invalidate(trip_id)
+
+
+def clear_threshold_cache() -> None:
+    """테스트 등에서 캐시 전체를 초기화할 때 사용한다."""
+
+    _cache.clear()
@@ -3,7 +3,7 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import TripMonitoringViewSet, health_check
+from .views import TripMonitoringViewSet, health_check, trip_event_stream
 
 # ViewSet 라우터 설정
 router = DefaultRouter()
@@ -15,6 +15,9 @@ urlpatterns = [
     # ✅ 헬스체크 엔드포인트 (인증 불필요)
     path("health/", health_check, name="health-check"),
 
+    # 실시간 스트림 (SSE, 비동기 뷰)
+    path("monitoring/trips/<int:pk>/stream/", trip_event_stream, name="monitoring-trip-stream"),
+
     # ViewSet 라우트들
     path("", include(router.urls)),
 ]
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""여러 측정값을 한 번에 평가하는 배치 평가기.
+
+대량 적재·백필처럼 한 여행의 측정값 수천 건을 평가할 때, 참가자 단위로 ``math``를 반복 호출하는
+대신 NumPy 배열 연산으로 상태 코드와 경보 마스크를 한 번에 계산합니다.
+
+- NumPy는 선택 의존성입니다. 설치되어 있지 않으면 ``services._evaluate_health`` /
+  ``services._evaluate_location`` 스칼라 구현을 그대로 반복해 같은 결과를 돌려줍니다.
+- 스칼라 함수가 기준 구현이며, 두 경로가 같은 결과를 내는지는 test_v7의 속성 테스트로 검증합니다.
+- 경보 메시지 문자열은 여기서 만들지 않습니다. 마스크가 True인 행만 스칼라 함수로 메시지를 생성하세요.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from .thresholds import EARTH_RADIUS_KM, TripThresholds
+
+try:  # pragma: no cover - 설치 여부에 따라 분기
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# HealthSnapshot.status에 저장되는 문자열과 상태 코드의 대응.
+STATUS_NORMAL = 0
+STATUS_DANGER = 1
+STATUS_LABELS = ("normal", "danger")
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+@dataclass
+class HealthBatchResult:
+    """건강 측정값 배치의 평가 결과. 모든 필드는 입력과 같은 길이를 가진다."""
+
+    status_codes: Sequence[int]
+    heart_rate_low: Sequence[bool]
+    heart_rate_high: Sequence[bool]
+    spo2_low: Sequence[bool]
+
+    @property
+    def alert_mask(self) -> Sequence[bool]:
+        if np is not None and isinstance(self.status_codes, np.ndarray):
+            return self.status_codes == STATUS_DANGER
+        return [code == STATUS_DANGER for code in self.status_codes]
+
+    def status_labels(self) -> List[str]:
+        return [STATUS_LABELS[int(code)] for code in self.status_codes]
+
+
+@dataclass
+class LocationBatchResult:
+    """위치 측정값 배치의 평가 결과. 지오펜스가 없으면 거리는 모두 0으로 채운다."""
+
+    distance_km: Sequence[float]
+    outside_mask: Sequence[bool]
+
+
+def evaluate_health_batch(
+    thresholds: TripThresholds,
+    heart_rates: Sequence[int],
+    spo2_values: Sequence,
+) -> HealthBatchResult:
+    """심박수/산소포화도 배열을 한 번에 평가한다.
+
+    심박수 최소값 위반이 있으면 최대값 검사는 건너뛰는 스칼라 구현의 ``elif`` 의미를 그대로 따릅니다.
+    """
+
+    if np is None:
+        return _evaluate_health_scalar(thresholds, heart_rates, spo2_values)
+
+    heart = np.asarray(heart_rates, dtype=np.int64)
+    # Decimal(소수 둘째 자리) → float 변환은 단조이므로 비교 결과가 Decimal 비교와 같다.
+    spo2 = np.asarray([float(value) for value in spo2_values], dtype=np.float64)
+    size = heart.shape[0]
+
+    if thresholds.heart_rate_min is not None:
+        low = heart < thresholds.heart_rate_min
+    else:
+        low = np.zeros(size, dtype=bool)
+    if thresholds.heart_rate_max is not None:
+        high = ~low & (heart > thresholds.heart_rate_max)
+    else:
+        high = np.zeros(size, dtype=bool)
+    if thresholds.spo2_min is not None:
+        spo2_low = spo2 < float(thresholds.spo2_min)
+    else:
+        spo2_low = np.zeros(size, dtype=bool)
+
+    codes = np.where(low | high | spo2_low, STATUS_DANGER, STATUS_NORMAL).astype(np.int8)
+    return HealthBatchResult(codes, low, high, spo2_low)
+
+
+def evaluate_location_batch(
+    thresholds: TripThresholds,
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+) -> LocationBatchResult:
+    """위경도 배열과 지오펜스 중심 사이 거리를 한 번에 계산하고 반경 초과 여부를 표시한다."""
+
+    if np is None:
+        return _evaluate_location_scalar(thresholds, latitudes, longitudes)
+
+    lat = np.asarray(latitudes, dtype=np.float64)
+    lng = np.asarray(longitudes, dtype=np.float64)
+    if not thresholds.has_geofence:
+        return LocationBatchResult(np.zeros(lat.shape[0]), np.zeros(lat.shape[0], dtype=bool))
+
+    phi2 = np.radians(lat)
+    d_phi = phi2 - thresholds.geofence_lat_rad
+    d_lambda = np.radians(lng) - thresholds.geofence_lng_rad
+    a = np.sin(d_phi / 2) ** 2 + thresholds.geofence_cos_lat * np.cos(phi2) * np.sin(d_lambda / 2) ** 2
+    distance = EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return LocationBatchResult(distance, distance > thresholds.geofence_radius_km)
+
+
+# ------------------------- NumPy 미설치 시 대체 경로 -------------------------
+
+def _evaluate_health_scalar(thresholds, heart_rates, spo2_values) -> HealthBatchResult:
+    codes, low, high, spo2_low = [], [], [], []
+    for heart_rate, spo2 in zip(heart_rates, spo2_values):
+        is_low = thresholds.heart_rate_min is not None and heart_rate < thresholds.heart_rate_min
+        is_high = (
+            not is_low and thresholds.heart_rate_max is not None and heart_rate > thresholds.heart_rate_max
+        )
+        is_spo2_low = thresholds.spo2_min is not None and spo2 < thresholds.spo2_min
+        low.append(is_low)
+        high.append(is_high)
+        spo2_low.append(is_spo2_low)
+        codes.append(STATUS_DANGER if (is_low or is_high or is_spo2_low) else STATUS_NORMAL)
+    return HealthBatchResult(codes, low, high, spo2_low)
+
+
+def _evaluate_location_scalar(thresholds, latitudes, longitudes) -> LocationBatchResult:
+    if not thresholds.has_geofence:
+        size = len(latitudes)
+        return LocationBatchResult([0.0] * size, [False] * size)
+    distances = [
+        thresholds.distance_from_center_km(float(lat), float(lng)) for lat, lng in zip(latitudes, longitudes)
+    ]
+    radius = thresholds.geofence_radius_km
+    return LocationBatchResult(distances, [distance > radius for distance in distances])
+
+
+__all__ = [
+    "STATUS_DANGER",
+    "STATUS_LABELS",
+    "STATUS_NORMAL",
+    "HealthBatchResult",
+    "LocationBatchResult",
+    "evaluate_health_batch",
+    "evaluate_location_batch",
+    "numpy_available",
+]
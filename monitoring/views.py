@@ -1,5 +1,10 @@
 """모니터링 관련 DRF ViewSet 구현."""
 
+import json
+import time
+
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import (
     OpenApiParameter,
@@ -15,16 +20,32 @@ from rest_framework.views import APIView
 from trips.models import Trip
 from users.permissions import IsApprovedStaff
 
+from .events import get_event_bus
+from .jobs import get_job, submit_demo_generation
 from .models import MonitoringAlert
+from .pagination import CreatedAtKeysetPagination
 from .serializers import (
+    DemoGenerationJobSerializer,
     DemoGenerationSerializer,
     HealthCheckSerializer,
+    HistoryQuerySerializer,
+    HistoryResponseSerializer,
+    MonitoringAlertFilterSerializer,
+    MonitoringAlertPageSerializer,
     MonitoringAlertSerializer,
     ParticipantLatestSerializer,
     HealthSnapshotSerializer,
     LocationSnapshotSerializer,
+    TelemetryIngestResultSerializer,
+    TelemetryIngestSerializer,
+)
+from .services import (
+    generate_bulk_demo_snapshots,
+    get_health_history,
+    get_location_history,
+    get_participant_statuses,
+    ingest_telemetry_batch,
 )
-from .services import get_participant_statuses, generate_demo_snapshots_for_trip
 
 
 # ✅ 간단한 함수 기반 뷰 (추천)
@@ -115,32 +136,197 @@ class TripMonitoringViewSet(viewsets.ViewSet):
 
     @extend_schema(
         summary="여행 알림 목록",
-        description="특정 여행에 대한 모니터링 알림 목록을 조회합니다.",
-        parameters=[trip_id_parameter],
-        responses={200: MonitoringAlertSerializer(many=True)},
+        description=(
+            "특정 여행에 대한 모니터링 알림을 최신순으로 조회합니다. (created_at, id) 키셋 커서로 "
+            "페이지를 나누며, 응답의 next URL을 그대로 호출하면 다음 페이지를 받습니다."
+        ),
+        parameters=[
+            trip_id_parameter,
+            MonitoringAlertFilterSerializer,
+            OpenApiParameter(name="cursor", type=OpenApiTypes.STR, description="이전 응답의 next에 포함된 커서."),
+            OpenApiParameter(
+                name="page_size",
+                type=OpenApiTypes.INT,
+                description=f"페이지 크기 (기본 {CreatedAtKeysetPagination.page_size}, "
+                f"최대 {CreatedAtKeysetPagination.max_page_size}).",
+            ),
+        ],
+        responses={200: MonitoringAlertPageSerializer},
     )
     @action(detail=True, methods=["get"], url_path="alerts")
     def alerts(self, request, pk=None):
         trip = self.get_trip(pk)
-        alerts = MonitoringAlert.objects.filter(participant__trip=trip).order_by('-created_at')
-        serializer = MonitoringAlertSerializer(alerts, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        filters = MonitoringAlertFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+
+        alerts = MonitoringAlert.objects.filter(participant__trip_id=trip.id).select_related("participant__traveler")
+        if "alert_type" in filters.validated_data:
+            alerts = alerts.filter(alert_type=filters.validated_data["alert_type"])
+        if "since" in filters.validated_data:
+            alerts = alerts.filter(created_at__gte=filters.validated_data["since"])
+        if "until" in filters.validated_data:
+            alerts = alerts.filter(created_at__lt=filters.validated_data["until"])
+
+        paginator = CreatedAtKeysetPagination()
+        page = paginator.paginate_queryset(alerts, request, view=self)
+        serializer = MonitoringAlertSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+    @extend_schema(
+        summary="건강/위치 시계열 (다운샘플링)",
+        description=(
+            "기간 내 건강/위치 스냅샷을 resolution초 구간으로 묶어 반환합니다. 건강은 구간별 최소/최대/평균 "
+            "심박수와 최저 SpO2, 위치는 구간별 마지막 좌표입니다. participant_id를 주면 한 참가자만 조회합니다."
+        ),
+        parameters=[trip_id_parameter, HistoryQuerySerializer],
+        responses={200: HistoryResponseSerializer},
+    )
+    @action(detail=True, methods=["get"], url_path="history")
+    def history(self, request, pk=None):
+        trip = self.get_trip(pk)
+        query = HistoryQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        participant_id = params.get("participant_id")
+        if participant_id is not None and not trip.participants.filter(pk=participant_id).exists():
+            return Response({"detail": "해당 여행의 참가자가 아닙니다."}, status=status.HTTP_404_NOT_FOUND)
+
+        window = {
+            "start": params["start"],
+            "end": params["end"],
+            "resolution_seconds": params["resolution"],
+            "participant_id": participant_id,
+        }
+        payload = {
+            "start": params["start"],
+            "end": params["end"],
+            "resolution": params["resolution"],
+            "health": get_health_history(trip, **window) if params["kind"] in ("health", "all") else [],
+            "location": get_location_history(trip, **window) if params["kind"] in ("location", "all") else [],
+        }
+        return Response(HistoryResponseSerializer(payload).data, status=status.HTTP_200_OK)
 
     @extend_schema(
         summary="데모 건강/위치 스냅샷 생성",
-        description="minutes 동안 interval_seconds 간격으로 더미 건강/위치 스냅샷을 생성하고 경보를 함께 기록합니다.",
+        description=(
+            "minutes 동안 interval_seconds 간격으로 더미 건강/위치 스냅샷을 생성하고 경보를 함께 기록합니다. "
+            "background=true이면 즉시 202와 작업 정보를 반환하고 생성은 백그라운드에서 진행합니다."
+        ),
         parameters=[trip_id_parameter],
         request=DemoGenerationSerializer,
-        responses={200: {"type": "object", "properties": {"created": {"type": "integer"}}}},
+        responses={
+            200: {"type": "object", "properties": {"created": {"type": "integer"}}},
+            202: DemoGenerationJobSerializer,
+        },
     )
     @action(detail=True, methods=["post"], url_path="generate-demo")
     def generate_demo(self, request, pk=None):
         trip = self.get_trip(pk)
         serializer = DemoGenerationSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        created = generate_demo_snapshots_for_trip(
+        options = serializer.validated_data
+
+        if options["background"]:
+            job = submit_demo_generation(
+                trip_id=trip.id,
+                minutes=options["minutes"],
+                interval_seconds=options["interval"],
+                seed=options["seed"],
+            )
+            return Response(DemoGenerationJobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+        result = generate_bulk_demo_snapshots(
+            trip=trip,
+            minutes=options["minutes"],
+            interval_seconds=options["interval"],
+            seed=options["seed"],
+        )
+        return Response({"created": result.snapshots_created}, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary="데모 생성 작업 상태 조회",
+        description="background=true로 요청한 데모 생성 작업의 진행 상태와 생성 건수를 반환합니다.",
+        parameters=[
+            trip_id_parameter,
+            OpenApiParameter(
+                name="job_id",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description="generate-demo 응답의 job_id.",
+            ),
+        ],
+        responses={200: DemoGenerationJobSerializer},
+    )
+    @action(detail=True, methods=["get"], url_path=r"generate-demo/(?P<job_id>[0-9a-f]{32})")
+    def demo_job(self, request, pk=None, job_id=None):
+        trip = self.get_trip(pk)
+        job = get_job(job_id)
+        if job is None or job.trip_id != trip.id:
+            return Response({"detail": "작업을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(DemoGenerationJobSerializer(job).data, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary="건강/위치 측정값 일괄 적재",
+        description=(
+            "웨어러블에서 수집한 건강/위치 측정값 묶음을 한 번에 저장합니다. 임계치 평가는 메모리에서 "
+            "수행하고 스냅샷/경보는 bulk_create로 단일 트랜잭션에 기록하며, 행 단위 수락/거부 건수를 반환합니다."
+        ),
+        parameters=[trip_id_parameter],
+        request=TelemetryIngestSerializer,
+        responses={200: TelemetryIngestResultSerializer},
+    )
+    @action(detail=True, methods=["post"], url_path="ingest")
+    def ingest(self, request, pk=None):
+        trip = self.get_trip(pk)
+        serializer = TelemetryIngestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = ingest_telemetry_batch(
             trip=trip,
-            minutes=serializer.validated_data["minutes"],
-            interval_seconds=serializer.validated_data["interval"],
+            readings=serializer.validated_data["readings"],
         )
-        return Response({"created": created}, status=status.HTTP_200_OK)
+        return Response(TelemetryIngestResultSerializer(result).data, status=status.HTTP_200_OK)
+
+
+async def trip_event_stream(request, pk: int):
+    """여행의 새 스냅샷/경보를 Server-Sent Events로 전달하는 비동기 뷰.
+
+    DRF는 비동기 뷰를 지원하지 않으므로 일반 Django 뷰로 작성하고, IsApprovedStaff와 같은 기준
+    (DEMO_MODE 통과, 그 외에는 승인된 로그인 직원)으로 접근을 제한합니다.
+    연결은 ``MONITORING_STREAM_MAX_SECONDS`` 후 종료되며 EventSource가 자동으로 재연결합니다.
+    ASGI 서버(Hi_Trip_v3/asgi.py)에서 실행해야 응답이 버퍼링되지 않습니다.
+    """
+
+    if not getattr(settings, "DEMO_MODE", False):
+        user = await request.auser()
+        if not (user and user.is_authenticated and getattr(user, "is_approved", False)):
+            return JsonResponse({"detail": IsApprovedStaff.message}, status=status.HTTP_403_FORBIDDEN)
+
+    if not await Trip.objects.filter(pk=pk).aexists():
+        return JsonResponse({"detail": "여행을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+    heartbeat = settings.MONITORING_STREAM_HEARTBEAT_SECONDS
+    max_seconds = settings.MONITORING_STREAM_MAX_SECONDS
+    subscription = await get_event_bus().subscribe(pk)
+
+    async def stream():
+        deadline = time.monotonic() + max_seconds
+        sequence = 0
+        try:
+            yield "retry: 3000\n\n"
+            while (remaining := deadline - time.monotonic()) > 0:
+                events = await subscription.get(timeout=min(heartbeat, remaining))
+                if events is None:
+                    # 프록시가 유휴 연결을 끊지 않도록 주석 줄을 보낸다.
+                    yield ": keep-alive\n\n"
+                    continue
+                sequence += 1
+                yield f"id: {sequence}\nevent: monitoring\ndata: {json.dumps(events, ensure_ascii=False)}\n\n"
+        finally:
+            # 정상 종료뿐 아니라 클라이언트 연결이 끊겨 작업이 취소될 때도 구독을 해제한다.
+            await subscription.close()
+
+    response = StreamingHttpResponse(stream(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
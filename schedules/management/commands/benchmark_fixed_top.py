@@ -0,0 +1,88 @@
+"""고정 추천(fixed-top) 카테고리 검색의 순차/동시 실행 지연 시간을 비교하는 관리 명령."""
+
+from __future__ import annotations
+
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from schedules.constants import FIXED_RECOMMENDATION_PLACE_TYPES
+from schedules.services.fanout import fetch_categories_concurrently
+from schedules.services.google_maps import GoogleMapsError, GooglePlace
+
+
+def build_stub_fetch(delay_seconds: float, results_per_category: int = 6, fail_category: str = ""):
+    """Google 호출 대신 ``delay_seconds``만큼 기다린 뒤 합성 장소 목록을 돌려주는 가짜 Nearby Search."""
+
+    def _fetch(*, latitude, longitude, place_type, radius, **kwargs):
+        time.sleep(delay_seconds)
+        if place_type == fail_category:
+            raise GoogleMapsError(f"{place_type} 스텁 실패")
+        return [
+            GooglePlace(
+                place_id=f"{place_type}_{index}",
+                name=f"{place_type} {index}",
+                latitude=latitude + index * 0.001,
+                longitude=longitude + index * 0.001,
+                types=[place_type],
+                rating=4.0,
+                user_ratings_total=100,
+                raw={},
+            )
+            for index in range(results_per_category)
+        ]
+
+    return _fetch
+
+
+class Command(BaseCommand):
+    """`python manage.py benchmark_fixed_top --delay-ms 200 --runs 5` 형태로 실행합니다."""
+
+    help = (
+        "지연 시간을 설정할 수 있는 가짜 Google 백엔드로 fixed-top 카테고리 검색을 실행해,\n"
+        "순차 실행(작업자 1개)과 동시 실행의 지연 시간을 비교합니다. 실제 API는 호출하지 않습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--delay-ms", type=int, default=200, help="가짜 Nearby Search 한 번의 지연(ms).")
+        parser.add_argument("--runs", type=int, default=5, help="모드별 반복 횟수.")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=len(FIXED_RECOMMENDATION_PLACE_TYPES),
+            help="동시 실행 모드의 작업자 수.",
+        )
+        parser.add_argument("--fail-category", default="", help="지정한 카테고리는 실패하도록 만듭니다.")
+
+    def handle(self, *args, **options):
+        if options["runs"] <= 0 or options["workers"] <= 0 or options["delay_ms"] < 0:
+            raise CommandError("runs/workers는 1 이상, delay-ms는 0 이상이어야 합니다.")
+
+        fetch = build_stub_fetch(options["delay_ms"] / 1000, fail_category=options["fail_category"])
+        modes = [("sequential", 1), ("concurrent", options["workers"])]
+        summary = {}
+        for label, workers in modes:
+            samples = []
+            for _ in range(options["runs"]):
+                started = time.perf_counter()
+                results = fetch_categories_concurrently(
+                    latitude=37.5665,
+                    longitude=126.9780,
+                    place_types=FIXED_RECOMMENDATION_PLACE_TYPES,
+                    radius=10_000,
+                    fetch=fetch,
+                    max_workers=workers,
+                )
+                samples.append((time.perf_counter() - started) * 1000)
+            failed = [result.category for result in results if result.failed]
+            summary[label] = statistics.median(samples)
+            self.stdout.write(
+                f"{label:<10} workers={workers:<2} median={statistics.median(samples):8.1f}ms "
+                f"max={max(samples):8.1f}ms failed={failed or '-'}"
+            )
+
+        if summary["concurrent"] > 0:
+            self.stdout.write(
+                self.style.SUCCESS(f"동시 실행이 {summary['sequential'] / summary['concurrent']:.1f}배 빠릅니다.")
+            )
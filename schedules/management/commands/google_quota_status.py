@@ -0,0 +1,38 @@
+"""Google Maps 서비스별 호출 한도와 일일 사용량을 출력하는 관리 명령."""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from schedules.services.quota import get_governor
+
+
+class Command(BaseCommand):
+    """`python manage.py google_quota_status` 형태로 실행합니다."""
+
+    help = (
+        "GOOGLE_MAPS_RATE_LIMITS에 설정한 서비스별 QPS/일일 할당량과 오늘 사용량을 출력합니다.\n"
+        "여러 프로세스의 사용량을 합쳐 보려면 GOOGLE_MAPS_GOVERNOR_BACKEND=cache로 실행 중이어야 합니다."
+    )
+
+    def handle(self, *args, **options):
+        backend = getattr(settings, "GOOGLE_MAPS_GOVERNOR_BACKEND", "memory")
+        if backend != "cache":
+            self.stdout.write(
+                self.style.WARNING("memory 백엔드는 프로세스별로 집계하므로 이 명령에서는 사용량이 0으로 보입니다.")
+            )
+
+        report = get_governor().usage()
+        if not report:
+            self.stdout.write(self.style.NOTICE("설정된 호출 한도가 없습니다(GOOGLE_MAPS_RATE_LIMITS)."))
+            return
+
+        for usage in report:
+            qps = f"{usage.qps:g}" if usage.qps else "-"
+            quota = usage.daily_quota if usage.daily_quota is not None else "-"
+            remaining = usage.remaining_today if usage.remaining_today is not None else "-"
+            self.stdout.write(
+                f"{usage.service_name:<16} qps={qps:<6} used_today={usage.used_today}/{quota} "
+                f"remaining={remaining}"
+            )
@@ -0,0 +1,80 @@
+"""GoogleApiCache/RouteLegCache의 만료 행 정리와 서비스별 용량 한도를 적용하는 관리 명령."""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from schedules.services.cache_janitor import DEFAULT_BATCH_SIZE, cache_report, run_janitor
+
+
+def _parse_budgets(values, option):
+    budgets = {}
+    for value in values or []:
+        service_name, _, limit = value.partition("=")
+        try:
+            budgets[service_name] = int(limit)
+        except ValueError:
+            raise CommandError(f"{option} 값은 서비스명=숫자 형식이어야 합니다: {value}") from None
+        if not service_name or budgets[service_name] < 0:
+            raise CommandError(f"{option} 값은 서비스명=0 이상의 숫자 형식이어야 합니다: {value}")
+    return budgets
+
+
+class Command(BaseCommand):
+    """`python manage.py prune_google_cache --max-rows places_nearby=5000 --report` 형태로 실행합니다.
+
+    cron 등으로 주기 실행하면 다시 읽히지 않는 만료 캐시가 쌓이지 않습니다.
+    """
+
+    help = (
+        "GoogleApiCache와 구간 캐시(RouteLegCache)에서 만료된 행을 배치 단위로 삭제하고, 서비스별 행 수/바이트 한도를 넘으면\n"
+        "오래 사용하지 않은 행부터 정리합니다. 한도를 지정하지 않으면 settings의 GOOGLE_API_CACHE_*_BUDGETS를 사용합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="한 번에 삭제할 행 수.")
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="만료 행 삭제 배치 수 상한. 생략하면 만료 행을 모두 지웁니다.",
+        )
+        parser.add_argument(
+            "--max-rows",
+            action="append",
+            metavar="SERVICE=ROWS",
+            help="서비스별 최대 행 수 (여러 번 지정 가능).",
+        )
+        parser.add_argument(
+            "--max-bytes",
+            action="append",
+            metavar="SERVICE=BYTES",
+            help="서비스별 최대 응답 크기 합계(근사치, 여러 번 지정 가능).",
+        )
+        parser.add_argument("--report", action="store_true", help="정리 후 서비스별 사용 현황을 출력합니다.")
+
+    def handle(self, *args, **options):
+        if options["batch_size"] <= 0:
+            raise CommandError("batch-size는 1 이상이어야 합니다.")
+        if options["max_batches"] is not None and options["max_batches"] <= 0:
+            raise CommandError("max-batches는 1 이상이어야 합니다.")
+
+        result = run_janitor(
+            batch_size=options["batch_size"],
+            max_batches=options["max_batches"],
+            row_budgets=_parse_budgets(options["max_rows"], "--max-rows") if options["max_rows"] else None,
+            byte_budgets=_parse_budgets(options["max_bytes"], "--max-bytes") if options["max_bytes"] else None,
+        )
+
+        self.stdout.write(self.style.SUCCESS(f"만료 캐시 {result.expired_deleted}건을 삭제했습니다."))
+        self.stdout.write(self.style.SUCCESS(f"만료 구간 캐시 {result.legs_deleted}건을 삭제했습니다."))
+        for service_name, count in sorted(result.evicted.items()):
+            self.stdout.write(f"  한도 초과로 {service_name} 캐시 {count}건을 정리했습니다.")
+
+        if options["report"]:
+            self.stdout.write("서비스별 캐시 현황:")
+            for stats in cache_report():
+                self.stdout.write(
+                    f"  {stats.service_name:<16} rows={stats.rows:<7} bytes≈{stats.approx_bytes:<10} "
+                    f"expired={stats.expired_rows:<6} hits={stats.hits:<7} hit_ratio={stats.hit_ratio:.1%}"
+                )
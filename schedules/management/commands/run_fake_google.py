@@ -0,0 +1,59 @@
+"""부하 테스트용 가짜 Google Maps 서버를 실행하는 관리 명령."""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from schedules.services.fake_google_maps import FakeGoogleConfig, FakeGoogleMapsServer
+
+
+class Command(BaseCommand):
+    """`python manage.py run_fake_google --port 8765 --latency-ms 80 --error-rate 0.02` 형태로 실행합니다."""
+
+    help = (
+        "Geocoding / Nearby Search / Place Details / computeRoutes / computeRouteMatrix를 흉내 내는\n"
+        "가짜 서버를 띄웁니다. 서버 실행 후 GOOGLE_MAPS_BASE_URL을 출력된 주소로, GOOGLE_MAPS_API_KEY를 아무 값으로\n"
+        "설정하면 네트워크 없이 추천/재배치 API를 부하 테스트할 수 있습니다. Ctrl+C로 종료합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument("--latency-ms", type=float, default=0.0, help="모든 응답에 더할 지연(ms).")
+        parser.add_argument("--jitter-ms", type=float, default=0.0, help="0~지정값(ms) 사이의 추가 임의 지연.")
+        parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율(0~1).")
+        parser.add_argument("--error-status", type=int, default=503, help="주입할 오류 HTTP 상태 코드.")
+        parser.add_argument(
+            "--error-service",
+            action="append",
+            default=[],
+            help="오류를 주입할 서비스(geocoding, places_nearby, place_details, routes_compute, routes_matrix). "
+            "여러 번 지정할 수 있고, 생략하면 모든 서비스.",
+        )
+        parser.add_argument("--results-per-type", type=int, default=20, help="Nearby Search 결과 수.")
+        parser.add_argument("--seed", type=int, default=0, help="지연/오류 주입 난수 시드.")
+
+    def handle(self, *args, **options):
+        if not 0 <= options["error_rate"] <= 1:
+            raise CommandError("error-rate는 0~1 사이여야 합니다.")
+
+        config = FakeGoogleConfig(
+            latency_ms=options["latency_ms"],
+            jitter_ms=options["jitter_ms"],
+            error_rate=options["error_rate"],
+            error_status=options["error_status"],
+            error_services=frozenset(options["error_service"]),
+            results_per_type=options["results_per_type"],
+            seed=options["seed"],
+        )
+        server = FakeGoogleMapsServer(options["host"], options["port"], config)
+        self.stdout.write(self.style.SUCCESS(f"가짜 Google Maps 서버 실행 중: {server.url}"))
+        self.stdout.write(f"GOOGLE_MAPS_BASE_URL={server.url} GOOGLE_MAPS_API_KEY=fake 로 API 서버를 실행하세요.")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.stop()
+            counts = ", ".join(f"{name}={count}" for name, count in sorted(server.request_counts.items()))
+            self.stdout.write(f"종료. 처리한 요청: {counts or '없음'}")
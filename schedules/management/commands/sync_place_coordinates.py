@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
-
-from django.core.management.base import BaseCommand
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
 from django.db.models import Q
 from django.utils import timezone
 
 from schedules.models import Place
 from schedules.services import GoogleMapsError, fetch_place_details
+from schedules.services.rate_limit import TokenBucket
+
+UPDATE_FIELDS = ["latitude", "longitude", "google_synced_at"]
 
 
 class Command(BaseCommand):
@@ -18,7 +27,9 @@ class Command(BaseCommand):
     help = (
         "Google Place ID가 저장된 Place 레코드에 대해 좌표와 동기화 시각을 새로 가져옵니다.\n"
         "- 기본적으로 24시간 이상 지난 데이터만 갱신해 Google API 호출 수를 절약합니다.\n"
-        "- --force 플래그를 사용하면 모든 Place를 강제로 갱신합니다."
+        "- --force 플래그를 사용하면 모든 Place를 강제로 갱신합니다.\n"
+        "- --workers로 상세 조회를 동시에 실행하고, --qps로 초당 호출 수를 제한합니다.\n"
+        "- pk 순서로 --chunk-size개씩 읽고 저장하며, --checkpoint 파일을 주면 중단된 지점부터 이어서 실행합니다."
     )
 
     def add_arguments(self, parser):
@@ -41,6 +52,54 @@ class Command(BaseCommand):
             action="store_true",
             help="조건과 무관하게 모든 Place를 갱신합니다.",
         )
+        parser.add_argument("--workers", type=int, default=1, help="동시에 실행할 상세 조회 작업자 수.")
+        parser.add_argument(
+            "--qps",
+            type=float,
+            default=None,
+            help="초당 최대 Place Details 호출 수. 생략하면 settings.GOOGLE_PLACE_DETAILS_QPS를 사용합니다.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=200, help="한 번에 읽고 저장할 Place 수.")
+        parser.add_argument(
+            "--checkpoint",
+            default=None,
+            help="진행 상황을 기록할 JSON 파일 경로. 파일이 있으면 기록된 지점부터 이어서 실행하고, 끝나면 삭제합니다.",
+        )
+
+    # ------------------------------------------------------------------
+    # 체크포인트
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _load_checkpoint(path):
+        if not path or not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as fp:
+            return json.load(fp)
+
+    @staticmethod
+    def _save_checkpoint(path, state):
+        if not path:
+            return
+        # 중간에 끊겨도 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체합니다.
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as fp:
+            json.dump(state, fp)
+        os.replace(temp_path, path)
+
+    # ------------------------------------------------------------------
+    # 상세 조회
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _fetch(bucket: TokenBucket, google_place_id: str):
+        """속도 제한을 지킨 뒤 상세 정보를 조회합니다. 작업 스레드가 연 DB 연결(캐시 조회용)은 정리합니다."""
+
+        bucket.acquire()
+        try:
+            return fetch_place_details(google_place_id), None
+        except GoogleMapsError as exc:
+            return None, exc
+        finally:
+            close_old_connections()
 
     def handle(self, *args, **options):
         """커맨드의 메인 로직."""
@@ -48,59 +107,110 @@ class Command(BaseCommand):
         max_age_hours: int = options["max_age_hours"]
         limit: int | None = options["limit"]
         force_refresh: bool = options["force"]
+        workers: int = options["workers"]
+        chunk_size: int = options["chunk_size"]
+        qps: float = options["qps"] or getattr(settings, "GOOGLE_PLACE_DETAILS_QPS", 10)
+        checkpoint_path: str | None = options["checkpoint"]
+
+        if workers <= 0 or chunk_size <= 0 or qps <= 0:
+            raise CommandError("workers, chunk-size, qps는 0보다 커야 합니다.")
 
         if max_age_hours <= 0:
             self.stdout.write(self.style.WARNING("max-age-hours가 0 이하로 설정되어 1시간으로 강제 조정합니다."))
             max_age_hours = 1
 
-        queryset = Place.objects.exclude(google_place_id__isnull=True).exclude(google_place_id="")
+        state = self._load_checkpoint(checkpoint_path)
+        if state:
+            # 이어서 실행할 때는 처음 실행의 기준 시각을 그대로 써야 대상이 바뀌지 않습니다.
+            threshold = datetime.fromisoformat(state["threshold"]) if state.get("threshold") else None
+            self.stdout.write(self.style.NOTICE(f"체크포인트에서 이어서 실행합니다: pk > {state['last_pk']}"))
+        else:
+            threshold = None if force_refresh else timezone.now() - timedelta(hours=max_age_hours)
+            state = {
+                "last_pk": 0,
+                "threshold": threshold.isoformat() if threshold else None,
+                "processed": 0,
+                "updated": 0,
+                "skipped": 0,
+            }
 
-        if not force_refresh:
-            threshold = timezone.now() - timedelta(hours=max_age_hours)
+        queryset = Place.objects.exclude(google_place_id__isnull=True).exclude(google_place_id="")
+        if threshold is not None:
             queryset = queryset.filter(Q(google_synced_at__isnull=True) | Q(google_synced_at__lt=threshold))
 
+        remaining = queryset.filter(pk__gt=state["last_pk"]).count()
         if limit:
-            queryset = queryset[:limit]
-
-        total = queryset.count()
-        if total == 0:
+            remaining = min(remaining, max(limit - state["processed"], 0))
+        if remaining == 0:
             self.stdout.write(self.style.NOTICE("갱신 대상 Place가 없습니다."))
+            if checkpoint_path and os.path.exists(checkpoint_path):
+                os.remove(checkpoint_path)
             return
 
-        updated = 0
-        skipped = 0
+        bucket = TokenBucket(rate=qps, capacity=max(qps, workers))
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="place-sync") as executor:
+                while limit is None or state["processed"] < limit:
+                    size = chunk_size if limit is None else min(chunk_size, limit - state["processed"])
+                    # pk 기준 keyset 페이지네이션: OFFSET 없이 마지막 pk 다음부터 읽어 메모리와 쿼리 비용이 일정합니다.
+                    chunk = list(
+                        queryset.filter(pk__gt=state["last_pk"])
+                        .order_by("pk")
+                        .only("pk", "name", "google_place_id", *UPDATE_FIELDS)[:size]
+                        .iterator(chunk_size=size)
+                    )
+                    if not chunk:
+                        break
+                    self._sync_chunk(executor, bucket, chunk, state, options["verbosity"])
+                    self._save_checkpoint(checkpoint_path, state)
+        except KeyboardInterrupt:
+            self.stderr.write(
+                self.style.WARNING(
+                    f"중단됨: pk {state['last_pk']}까지 저장했습니다. 같은 --checkpoint로 다시 실행하면 이어서 처리합니다."
+                )
+            )
+            raise
 
-        for place in queryset:
-            google_place_id = place.google_place_id
-            if not google_place_id:
-                skipped += 1
-                continue
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(
+                f"완료: 총 {state['processed']}건 중 {state['updated']}건 갱신, {state['skipped']}건 건너뜀"
+            )
+        )
 
-            try:
-                details = fetch_place_details(google_place_id)
-            except GoogleMapsError as exc:
-                skipped += 1
+    def _sync_chunk(self, executor, bucket, chunk, state, verbosity):
+        """한 묶음의 상세 정보를 동시에 조회하고, 성공한 행을 bulk_update 한 번으로 저장합니다."""
+
+        futures = [executor.submit(self._fetch, bucket, place.google_place_id) for place in chunk]
+        changed = []
+        for place, future in zip(chunk, futures):
+            details, error = future.result()
+            if error is not None:
+                state["skipped"] += 1
                 self.stderr.write(
                     self.style.WARNING(
-                        f"{place.name or '이름 없는 장소'}(ID={place.id}) 상세 조회 실패: {exc}"
+                        f"{place.name or '이름 없는 장소'}(ID={place.id}) 상세 조회 실패: {error}"
                     )
                 )
                 continue
 
-            place.latitude = details.latitude
-            place.longitude = details.longitude
+            place.latitude = Decimal(str(details.latitude)) if details.latitude is not None else None
+            place.longitude = Decimal(str(details.longitude)) if details.longitude is not None else None
             place.google_synced_at = timezone.now()
-            place.save(update_fields=["latitude", "longitude", "google_synced_at"])
-            updated += 1
+            changed.append(place)
+            if verbosity >= 2:
+                self.stdout.write(f"갱신: {place.name or '이름 없는 장소'} (Place ID={place.google_place_id})")
 
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"갱신 완료: {place.name or '이름 없는 장소'} (Place ID={google_place_id})"
-                )
-            )
+        if changed:
+            Place.objects.bulk_update(changed, UPDATE_FIELDS, batch_size=len(changed))
 
+        state["last_pk"] = chunk[-1].pk
+        state["processed"] += len(chunk)
+        state["updated"] += len(changed)
         self.stdout.write(
-            self.style.MIGRATE_HEADING(
-                f"완료: 총 {total}건 중 {updated}건 갱신, {skipped}건 건너뜀"
+            self.style.SUCCESS(
+                f"{state['processed']}건 처리 (pk ≤ {state['last_pk']}): 이번 묶음 {len(changed)}/{len(chunk)}건 갱신"
             )
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,93 @@
+# Generated by Django 5.0.1 on 2026-10-16 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schedules", "0005_place_google_place_id_place_google_synced_at_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RouteLegCache",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "origin_key",
+                    models.CharField(
+                        help_text="예: place:ChIJ... 또는 latlng:37.56650,126.97800",
+                        max_length=255,
+                        verbose_name="출발지 키",
+                    ),
+                ),
+                (
+                    "destination_key",
+                    models.CharField(
+                        help_text="출발지 키와 같은 형식",
+                        max_length=255,
+                        verbose_name="도착지 키",
+                    ),
+                ),
+                (
+                    "travel_mode",
+                    models.CharField(
+                        help_text="DRIVE, WALK, BICYCLE, TRANSIT",
+                        max_length=20,
+                        verbose_name="이동 수단",
+                    ),
+                ),
+                (
+                    "time_bucket",
+                    models.PositiveSmallIntegerField(
+                        help_text="하루를 ROUTE_LEG_BUCKET_HOURS 시간 단위로 나눈 구간 번호 (교통 상황 차이 반영)",
+                        verbose_name="시간대 구간",
+                    ),
+                ),
+                (
+                    "duration_seconds",
+                    models.PositiveIntegerField(verbose_name="이동 시간(초)"),
+                ),
+                (
+                    "distance_meters",
+                    models.PositiveIntegerField(
+                        blank=True, null=True, verbose_name="이동 거리(m)"
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="저장 일시"),
+                ),
+                (
+                    "expires_at",
+                    models.DateTimeField(
+                        help_text="이 시간이 지나면 구간을 다시 계산합니다.",
+                        verbose_name="만료 시각",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "경로 구간 캐시",
+                "verbose_name_plural": "경로 구간 캐시 목록",
+                "indexes": [
+                    models.Index(fields=["expires_at"], name="route_leg_expires_idx")
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="routelegcache",
+            constraint=models.UniqueConstraint(
+                fields=("origin_key", "destination_key", "travel_mode", "time_bucket"),
+                name="uniq_route_leg",
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.0.1 on 2026-10-16 23:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schedules", "0006_route_leg_cache"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="googleapicache",
+            name="hit_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="DB 캐시에서 응답을 재사용한 횟수 (메모리 캐시 적중은 포함하지 않음)",
+                verbose_name="적중 횟수",
+            ),
+        ),
+        migrations.AddField(
+            model_name="googleapicache",
+            name="last_accessed_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="DB 캐시에서 마지막으로 읽거나 저장한 시각. 용량 한도 초과 시 오래 안 쓴 항목부터 정리합니다.",
+                null=True,
+                verbose_name="마지막 사용 시각",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="googleapicache",
+            index=models.Index(
+                fields=["service_name", "last_accessed_at"], name="google_cache_lru_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.1 on 2026-10-16 23:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schedules", "0007_google_cache_usage_tracking"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="googleapicache",
+            name="response_data",
+            field=models.JSONField(
+                help_text='Google API 응답 중 파서가 사용하는 필드만 저장합니다. 압축 설정 시 {"_z": base64} 형태입니다.',
+                verbose_name="응답 데이터",
+            ),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.0.1 on 2026-10-16 23:25
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def merge_duplicate_places(apps, schema_editor):
+    """google_place_id가 같은 장소를 가장 먼저 만든 행 하나로 합칩니다.
+
+    - 남길 행: pk가 가장 작은 행(기존 ``.first()`` 조회가 고르던 행)
+    - 남길 행의 주소/좌표/동기화 시각이 비어 있으면 중복 행의 값으로 채웁니다.
+    - 중복 행을 가리키던 일정/담당자/선택 지출 등은 남길 행으로 옮긴 뒤 중복 행을 삭제합니다.
+    """
+
+    Place = apps.get_model("schedules", "Place")
+    duplicated_ids = (
+        Place.objects.filter(google_place_id__gt="")
+        .values("google_place_id")
+        .annotate(total=Count("id"))
+        .filter(total__gt=1)
+        .values_list("google_place_id", flat=True)
+    )
+    relations = [
+        relation
+        for relation in Place._meta.related_objects
+        if relation.one_to_many or relation.one_to_one
+    ]
+
+    for google_place_id in list(duplicated_ids):
+        keeper, *duplicates = Place.objects.filter(google_place_id=google_place_id).order_by("pk")
+        duplicate_pks = [place.pk for place in duplicates]
+
+        update_fields = []
+        for field in ("address", "latitude", "longitude", "google_synced_at"):
+            if getattr(keeper, field) in (None, ""):
+                value = next(
+                    (getattr(place, field) for place in duplicates if getattr(place, field) not in (None, "")),
+                    None,
+                )
+                if value is not None:
+                    setattr(keeper, field, value)
+                    update_fields.append(field)
+        if update_fields:
+            keeper.save(update_fields=update_fields)
+
+        for relation in relations:
+            relation.related_model.objects.filter(
+                **{f"{relation.field.name}__in": duplicate_pks}
+            ).update(**{relation.field.name: keeper.pk})
+        Place.objects.filter(pk__in=duplicate_pks).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schedules", "0008_google_cache_projected_payload"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_places, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="place",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("google_place_id__gt", "")),
+                fields=("google_place_id",),
+                name="uniq_place_google_place_id",
+            ),
+        ),
+    ]
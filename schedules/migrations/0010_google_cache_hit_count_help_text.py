@@ -0,0 +1,22 @@
+# Generated by Django 5.0.1 on 2026-10-17 00:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schedules", "0009_place_google_place_id_unique"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="googleapicache",
+            name="hit_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="캐시에서 응답을 재사용한 횟수 (메모리/DB 계층 적중 모두 포함, 주기적으로 모아서 반영)",
+                verbose_name="적중 횟수",
+            ),
+        ),
+    ]
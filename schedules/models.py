@@ -376,6 +376,15 @@ class Place(models.Model):
         verbose_name = '장소'
         verbose_name_plural = '장소 목록'
         ordering = ['name']
+        constraints = [
+            # Google Place ID가 있는 장소만 유일하게 유지합니다(NULL/빈 문자열은 여러 개 허용).
+            # 부분 유니크 인덱스가 google_place_id 조회용 인덱스 역할도 합니다.
+            models.UniqueConstraint(
+                fields=['google_place_id'],
+                condition=models.Q(google_place_id__gt=''),
+                name='uniq_place_google_place_id',
+            ),
+        ]
 
     def __str__(self):
         if self.category:
@@ -480,8 +489,8 @@ class GoogleApiCache(models.Model):
     )
 
     response_data = models.JSONField(
-        verbose_name='응답 원본 데이터',
-        help_text='Google API에서 받은 응답 전문(JSON)을 그대로 저장해둡니다.'
+        verbose_name='응답 데이터',
+        help_text='Google API 응답 중 파서가 사용하는 필드만 저장합니다. 압축 설정 시 {"_z": base64} 형태입니다.'
     )
 
     created_at = models.DateTimeField(
@@ -495,13 +504,27 @@ class GoogleApiCache(models.Model):
         help_text='이 시간이 지나면 캐시를 무시하고 실제 API를 다시 호출합니다.'
     )
 
+    last_accessed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='마지막 사용 시각',
+        help_text='DB 캐시에서 마지막으로 읽거나 저장한 시각. 용량 한도 초과 시 오래 안 쓴 항목부터 정리합니다.'
+    )
+
+    hit_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='적중 횟수',
+        help_text='캐시에서 응답을 재사용한 횟수 (메모리/DB 계층 적중 모두 포함, 주기적으로 모아서 반영)'
+    )
+
     class Meta:
         verbose_name = 'Google API 캐시'
         verbose_name_plural = 'Google API 캐시 목록'
         unique_together = [['service_name', 'request_hash']]
         indexes = [
             models.Index(fields=['service_name', 'request_hash']),
-            models.Index(fields=['expires_at'])
+            models.Index(fields=['expires_at']),
+            models.Index(fields=['service_name', 'last_accessed_at'], name='google_cache_lru_idx'),
         ]
 
     def __str__(self):
@@ -518,7 +541,77 @@ class GoogleApiCache(models.Model):
         if not self.expires_at:
             # 만료 시각이 비어 있으면 즉시 만료로 간주 (안전장치)
             return True
-        return timezone.now() >= self.expires_at
+        return datetime.now(timezone.utc) >= self.expires_at
+
+
+class RouteLegCache(models.Model):
+    """두 지점 사이 한 구간(leg)의 이동 시간을 저장하는 캐시 테이블
+
+    GoogleApiCache는 요청 본문 전체의 해시로 저장하므로, 경유지 3개짜리 경로 안의 A→B와
+    단독 A→B 요청이 서로 캐시를 공유하지 못합니다. 이 테이블은 구간 단위로 저장해
+    일정 재배치·대체 장소 추천 등에서 같은 구간을 다시 계산하지 않도록 합니다.
+    """
+
+    origin_key = models.CharField(
+        max_length=255,
+        verbose_name='출발지 키',
+        help_text='예: place:ChIJ... 또는 latlng:37.56650,126.97800'
+    )
+
+    destination_key = models.CharField(
+        max_length=255,
+        verbose_name='도착지 키',
+        help_text='출발지 키와 같은 형식'
+    )
+
+    travel_mode = models.CharField(
+        max_length=20,
+        verbose_name='이동 수단',
+        help_text='DRIVE, WALK, BICYCLE, TRANSIT'
+    )
+
+    time_bucket = models.PositiveSmallIntegerField(
+        verbose_name='시간대 구간',
+        help_text='하루를 ROUTE_LEG_BUCKET_HOURS 시간 단위로 나눈 구간 번호 (교통 상황 차이 반영)'
+    )
+
+    duration_seconds = models.PositiveIntegerField(
+        verbose_name='이동 시간(초)'
+    )
+
+    distance_meters = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='이동 거리(m)'
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='저장 일시'
+    )
+
+    expires_at = models.DateTimeField(
+        verbose_name='만료 시각',
+        help_text='이 시간이 지나면 구간을 다시 계산합니다.'
+    )
+
+    class Meta:
+        verbose_name = '경로 구간 캐시'
+        verbose_name_plural = '경로 구간 캐시 목록'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['origin_key', 'destination_key', 'travel_mode', 'time_bucket'],
+                name='uniq_route_leg',
+            )
+        ]
+        indexes = [
+            models.Index(fields=['expires_at'], name='route_leg_expires_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.origin_key} → {self.destination_key} ({self.travel_mode}, {self.duration_seconds}초)"
+
+
 # ========== CoordinatorRole 모델 ==========
 class CoordinatorRole(models.Model):
     """
@@ -2,6 +2,7 @@
 
 from .google_maps import (
     GoogleMapsError,
+    GoogleQuotaExceeded,
     GeocodeResult,
     GooglePlace,
     RouteDuration,
@@ -11,12 +12,18 @@ from .google_maps import (
     fetch_place_details,
     compute_route_duration,
     compute_route_matrix,
+    compute_leg_durations,
+    find_cached_legs,
     build_place_id_payload,
     build_location_payload,
 )
+from .fanout import CategoryPlaces, fetch_categories_concurrently
+from .place_sync import lookup_place_pks, sync_google_places
+from .quota import get_governor
 
 __all__ = [
     "GoogleMapsError",
+    "GoogleQuotaExceeded",
     "GeocodeResult",
     "GooglePlace",
     "RouteDuration",
@@ -26,6 +33,13 @@ __all__ = [
     "fetch_place_details",
     "compute_route_duration",
     "compute_route_matrix",
+    "compute_leg_durations",
+    "find_cached_legs",
     "build_place_id_payload",
     "build_location_payload",
+    "CategoryPlaces",
+    "fetch_categories_concurrently",
+    "lookup_place_pks",
+    "sync_google_places",
+    "get_governor",
 ]
@@ -0,0 +1,140 @@
+"""GoogleApiCache 사용 기록(``hit_count``, ``last_accessed_at``)을 모아서 반영하는 모듈.
+
+캐시 적중마다 UPDATE를 실행하면 읽기 경로에 쓰기가 끼고, 메모리 계층에서 응답한 적중은 기록되지 않아
+LRU 한도(``cache_janitor.enforce_budgets``)가 오히려 가장 자주 쓰는 키부터 지우게 됩니다.
+여기서는 메모리/DB 계층의 적중을 모두 프로세스 안에 모아 두었다가, ``GOOGLE_API_ACCESS_FLUSH_SECONDS``가
+지나거나 모인 키가 ``GOOGLE_API_ACCESS_FLUSH_MAX_KEYS``개를 넘으면 적중 수가 같은 키끼리 묶은 UPDATE로
+한꺼번에 씁니다. 행마다 flush 간격에 한 번만 쓰므로 ``last_accessed_at``은 그만큼 늦게 반영될 수 있습니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from schedules.models import GoogleApiCache
+
+logger = logging.getLogger(__name__)
+
+# UPDATE 한 번에 넣을 request_hash 수
+FLUSH_BATCH_SIZE = 500
+
+AccessKey = Tuple[str, str]
+
+
+class AccessRecorder:
+    """캐시 적중을 (서비스, 요청 해시)별로 모았다가 주기적으로 DB에 반영한다. 여러 스레드에서 공유한다."""
+
+    def __init__(
+        self,
+        *,
+        flush_seconds: float = 300,
+        max_keys: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.flush_seconds = flush_seconds
+        self.max_keys = max_keys
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending: Dict[AccessKey, Tuple[int, datetime]] = {}
+        self._last_flush = clock()
+
+    def record(self, service_name: str, request_hash: str) -> None:
+        """적중 한 번을 기록한다. flush 시점이 되었으면 모인 기록을 바로 반영한다."""
+
+        now = timezone.now()
+        with self._lock:
+            count, _ = self._pending.get((service_name, request_hash), (0, now))
+            self._pending[(service_name, request_hash)] = (count + 1, now)
+            due = len(self._pending) >= self.max_keys or self._clock() - self._last_flush >= self.flush_seconds
+        if due:
+            self.flush()
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """모인 기록을 DB에 반영하고 갱신한 행 수를 반환한다. 실패하면 기록을 버리고 0을 반환한다."""
+
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            self._last_flush = self._clock()
+        if not batch:
+            return 0
+
+        # 적중 수가 같은 키끼리 묶어 UPDATE 수를 줄입니다. 마지막 사용 시각은 묶음 안의 가장 늦은 값을 씁니다.
+        groups: Dict[Tuple[str, int], List[str]] = defaultdict(list)
+        latest: Dict[Tuple[str, int], datetime] = {}
+        for (service_name, request_hash), (count, accessed_at) in batch.items():
+            group = (service_name, count)
+            groups[group].append(request_hash)
+            latest[group] = max(latest.get(group, accessed_at), accessed_at)
+
+        updated = 0
+        try:
+            with transaction.atomic():
+                for (service_name, count), hashes in groups.items():
+                    for start in range(0, len(hashes), FLUSH_BATCH_SIZE):
+                        updated += GoogleApiCache.objects.filter(
+                            service_name=service_name,
+                            request_hash__in=hashes[start:start + FLUSH_BATCH_SIZE],
+                        ).update(hit_count=F("hit_count") + count, last_accessed_at=latest[(service_name, count)])
+        except DatabaseError:  # pragma: no cover - 사용 기록 실패가 API 응답을 깨뜨리지 않도록 한다.
+            logger.exception("GoogleApiCache 사용 기록 반영 실패")
+            return 0
+        return updated
+
+
+_recorder: Optional[AccessRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_access_recorder() -> AccessRecorder:
+    """설정값으로 만든 공용 사용 기록기를 반환합니다."""
+
+    global _recorder
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                _recorder = AccessRecorder(
+                    flush_seconds=getattr(settings, "GOOGLE_API_ACCESS_FLUSH_SECONDS", 300),
+                    max_keys=getattr(settings, "GOOGLE_API_ACCESS_FLUSH_MAX_KEYS", 1000),
+                )
+    return _recorder
+
+
+def reset_access_recorder() -> None:
+    """모인 기록을 버리고, 다음 호출 때 현재 설정값으로 다시 만듭니다(설정 변경/테스트용)."""
+
+    global _recorder
+    with _recorder_lock:
+        _recorder = None
+
+
+def record_cache_access(service_name: str, request_hash: str) -> None:
+    get_access_recorder().record(service_name, request_hash)
+
+
+def flush_access_stats() -> int:
+    """이 프로세스에 모인 사용 기록을 바로 반영합니다. 용량 정리 전에 호출합니다."""
+
+    return get_access_recorder().flush()
+
+
+__all__ = [
+    "AccessRecorder",
+    "flush_access_stats",
+    "get_access_recorder",
+    "record_cache_access",
+    "reset_access_recorder",
+]
@@ -0,0 +1,46 @@
+"""GoogleApiCache.response_data 저장 형식 변환.
+
+``GOOGLE_API_CACHE_COMPRESS``를 켜면 응답 JSON을 zlib으로 압축해 ``{"_z": "<base64>"}`` 형태로 저장합니다.
+컬럼은 그대로 JSONField이므로 마이그레이션 없이 켜고 끌 수 있고, 압축 전/후 행이 섞여 있어도 읽을 수 있습니다.
+압축 효과가 없는 작은 응답은 원본 그대로 저장합니다.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import zlib
+from typing import Any
+
+from django.conf import settings
+
+COMPRESSED_KEY = "_z"
+# 이보다 짧은 응답은 압축해도 base64 오버헤드 때문에 거의 줄지 않습니다.
+MIN_COMPRESS_BYTES = 512
+
+
+def encode_payload(data: Any, *, compress: bool = None) -> Any:
+    """DB에 저장할 형태로 변환합니다. compress를 생략하면 설정값을 따릅니다."""
+
+    if compress is None:
+        compress = getattr(settings, "GOOGLE_API_CACHE_COMPRESS", False)
+    if not compress:
+        return data
+    raw = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if len(raw) < MIN_COMPRESS_BYTES:
+        return data
+    packed = base64.b64encode(zlib.compress(raw, 6)).decode("ascii")
+    if len(packed) >= len(raw):
+        return data
+    return {COMPRESSED_KEY: packed}
+
+
+def decode_payload(stored: Any) -> Any:
+    """DB에 저장된 값을 원래 응답 JSON으로 되돌립니다."""
+
+    if isinstance(stored, dict) and len(stored) == 1 and COMPRESSED_KEY in stored:
+        return json.loads(zlib.decompress(base64.b64decode(stored[COMPRESSED_KEY])).decode("utf-8"))
+    return stored
+
+
+__all__ = ["decode_payload", "encode_payload"]
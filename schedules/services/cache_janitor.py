@@ -0,0 +1,265 @@
+"""GoogleApiCache 테이블 정리(janitor) 로직.
+
+만료된 행은 같은 키를 다시 읽을 때만 지워지므로, 다시 읽히지 않는 행은 계속 쌓입니다.
+이 모듈은 다음 작업을 제한된 배치 단위로 수행합니다.
+
+- ``purge_expired``: ``expires_at`` 인덱스를 따라 만료된 행을 배치 단위로 삭제
+- ``purge_expired_legs``: 구간 캐시(RouteLegCache)의 만료 행을 같은 방식으로 삭제
+- ``enforce_budgets``: 서비스별 행 수/바이트 한도를 넘으면 오래 사용하지 않은 행부터 삭제(LRU)
+- ``cache_report``: 서비스별 행 수, 대략적인 크기, 만료 행 수, 적중률 집계
+
+LRU 기준인 사용 기록은 ``cache_access``가 모아서 주기적으로 쓰므로, ``run_janitor``는 정리 전에 이 프로세스에
+모인 기록을 먼저 반영합니다.
+
+관리 명령 ``prune_google_cache``로 실행하며(cron 등록 권장), ``GOOGLE_API_CACHE_JANITOR_INTERVAL_SECONDS``를
+설정하면 캐시 저장 시 주기적으로 만료 행 한 배치를 함께 정리합니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Mapping, Optional
+
+from django.conf import settings
+from django.db.models import Count, Q, Sum, TextField
+from django.db.models.functions import Cast, Coalesce, Length
+from django.utils import timezone
+
+from schedules.models import GoogleApiCache, RouteLegCache
+
+from .cache_access import flush_access_stats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+_last_run = float("-inf")
+_run_lock = threading.Lock()
+
+
+@dataclass
+class ServiceCacheStats:
+    """서비스 하나의 캐시 사용 현황."""
+
+    service_name: str
+    rows: int
+    approx_bytes: int
+    expired_rows: int
+    hits: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """DB 캐시 적중률 근사치. 행 하나는 실제 API 호출(캐시 미스) 한 번으로 만들어졌다고 봅니다."""
+
+        total = self.hits + self.rows
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class JanitorResult:
+    """정리 작업 결과(삭제 건수)."""
+
+    expired_deleted: int = 0
+    evicted: Dict[str, int] = field(default_factory=dict)
+    legs_deleted: int = 0
+
+    @property
+    def total_deleted(self) -> int:
+        return self.expired_deleted + sum(self.evicted.values()) + self.legs_deleted
+
+
+def _delete_ids(ids: List[int], batch_size: int) -> int:
+    deleted = 0
+    for start in range(0, len(ids), batch_size):
+        deleted += GoogleApiCache.objects.filter(id__in=ids[start:start + batch_size]).delete()[0]
+    return deleted
+
+
+def purge_expired(
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_batches: Optional[int] = None,
+    now: Optional[datetime] = None,
+    grace_seconds: Optional[int] = None,
+) -> int:
+    """만료된 행을 ``batch_size``씩 삭제하고 삭제 건수를 반환합니다.
+
+    한 번에 큰 DELETE를 실행하지 않도록, 만료 시각 순으로 id를 조금씩 읽어 지웁니다.
+    ``max_batches``를 지정하면 그만큼만 처리하고 멈춥니다(남은 행은 다음 실행에서 처리).
+    만료 후 ``grace_seconds``(기본값 ``GOOGLE_API_STALE_GRACE_SECONDS``)가 지나지 않은 행은
+    stale-while-revalidate 응답에 쓰이므로 남겨 둡니다.
+    """
+
+    if grace_seconds is None:
+        grace_seconds = getattr(settings, "GOOGLE_API_STALE_GRACE_SECONDS", 0)
+    cutoff = (now or timezone.now()) - timedelta(seconds=max(int(grace_seconds), 0))
+    return _purge_before(GoogleApiCache, cutoff, batch_size, max_batches)
+
+
+def purge_expired_legs(
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_batches: Optional[int] = None,
+    now: Optional[datetime] = None,
+) -> int:
+    """RouteLegCache의 만료 행을 ``batch_size``씩 삭제하고 삭제 건수를 반환합니다.
+
+    구간 캐시는 같은 키를 upsert할 때만 덮어쓰므로, (구간, 이동 수단, 시간대)가 바뀌면 행이 계속 늘어납니다.
+    """
+
+    return _purge_before(RouteLegCache, now or timezone.now(), batch_size, max_batches)
+
+
+def _purge_before(model, cutoff: datetime, batch_size: int, max_batches: Optional[int]) -> int:
+    deleted = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        ids = list(
+            model.objects.filter(expires_at__lte=cutoff).order_by("expires_at").values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        deleted += model.objects.filter(id__in=ids).delete()[0]
+        batches += 1
+    return deleted
+
+
+def _recency():
+    # 한 번도 다시 읽히지 않은 행은 저장 시각을 마지막 사용 시각으로 봅니다.
+    return Coalesce("last_accessed_at", "created_at")
+
+
+def _approx_size():
+    return Length(Cast("response_data", output_field=TextField()))
+
+
+def enforce_budgets(
+    *,
+    row_budgets: Optional[Mapping[str, int]] = None,
+    byte_budgets: Optional[Mapping[str, int]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Dict[str, int]:
+    """서비스별 행 수/바이트 한도를 넘는 만큼 오래 사용하지 않은 행부터 삭제하고, 서비스별 삭제 건수를 반환합니다.
+
+    바이트는 응답 JSON을 문자열로 바꾼 길이로 계산한 근사치입니다.
+    """
+
+    evicted: Dict[str, int] = {}
+    for service_name, budget in (row_budgets or {}).items():
+        queryset = GoogleApiCache.objects.filter(service_name=service_name)
+        overflow = queryset.count() - max(int(budget), 0)
+        if overflow <= 0:
+            continue
+        ids = list(
+            queryset.annotate(recency=_recency()).order_by("recency", "id").values_list("id", flat=True)[:overflow]
+        )
+        evicted[service_name] = evicted.get(service_name, 0) + _delete_ids(ids, batch_size)
+
+    for service_name, budget in (byte_budgets or {}).items():
+        # 최근에 사용한 행부터 크기를 더해 가다가 한도를 넘는 지점 이후의 행을 지웁니다.
+        rows = (
+            GoogleApiCache.objects.filter(service_name=service_name)
+            .annotate(recency=_recency(), size=_approx_size())
+            .order_by("-recency", "-id")
+            .values_list("id", "size")
+        )
+        used = 0
+        ids = []
+        for row_id, size in rows.iterator(chunk_size=batch_size):
+            used += size or 0
+            if used > budget:
+                ids.append(row_id)
+        if ids:
+            evicted[service_name] = evicted.get(service_name, 0) + _delete_ids(ids, batch_size)
+
+    return evicted
+
+
+def cache_report(now: Optional[datetime] = None) -> List[ServiceCacheStats]:
+    """서비스별 캐시 사용 현황을 쿼리 한 번으로 집계합니다."""
+
+    now = now or timezone.now()
+    rows = (
+        GoogleApiCache.objects.values("service_name")
+        .annotate(
+            total=Count("id"),
+            size_total=Coalesce(Sum(_approx_size()), 0),
+            expired=Count("id", filter=Q(expires_at__lte=now)),
+            hits=Coalesce(Sum("hit_count"), 0),
+        )
+        .order_by("service_name")
+    )
+    return [
+        ServiceCacheStats(
+            service_name=row["service_name"],
+            rows=row["total"],
+            approx_bytes=row["size_total"],
+            expired_rows=row["expired"],
+            hits=row["hits"],
+        )
+        for row in rows
+    ]
+
+
+def run_janitor(
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_batches: Optional[int] = None,
+    row_budgets: Optional[Mapping[str, int]] = None,
+    byte_budgets: Optional[Mapping[str, int]] = None,
+) -> JanitorResult:
+    """만료 행 정리 후 한도 적용까지 한 번에 수행합니다. 한도를 생략하면 설정값을 사용합니다."""
+
+    if row_budgets is None:
+        row_budgets = getattr(settings, "GOOGLE_API_CACHE_ROW_BUDGETS", {})
+    if byte_budgets is None:
+        byte_budgets = getattr(settings, "GOOGLE_API_CACHE_BYTE_BUDGETS", {})
+
+    flush_access_stats()
+    result = JanitorResult()
+    result.expired_deleted = purge_expired(batch_size=batch_size, max_batches=max_batches)
+    result.legs_deleted = purge_expired_legs(batch_size=batch_size, max_batches=max_batches)
+    result.evicted = enforce_budgets(row_budgets=row_budgets, byte_budgets=byte_budgets, batch_size=batch_size)
+    return result
+
+
+def maybe_run_janitor() -> None:
+    """주기 실행 훅. 설정한 간격이 지났을 때만 응답/구간 캐시의 만료 행을 한 배치씩 정리합니다(프로세스 단위).
+
+    ``GOOGLE_API_CACHE_JANITOR_INTERVAL_SECONDS``가 0(기본값)이면 아무것도 하지 않습니다.
+    정리 중 오류가 나도 캐시 저장 흐름은 계속 진행합니다.
+    """
+
+    global _last_run
+    interval = getattr(settings, "GOOGLE_API_CACHE_JANITOR_INTERVAL_SECONDS", 0)
+    if not interval:
+        return
+    now = time.monotonic()
+    with _run_lock:
+        if now - _last_run < interval:
+            return
+        _last_run = now
+    try:
+        deleted = purge_expired(batch_size=DEFAULT_BATCH_SIZE, max_batches=1)
+        legs_deleted = purge_expired_legs(batch_size=DEFAULT_BATCH_SIZE, max_batches=1)
+    except Exception:  # pragma: no cover - 정리 실패가 API 응답을 깨뜨리지 않도록 한다.
+        logger.exception("GoogleApiCache 주기 정리 실패")
+        return
+    if deleted or legs_deleted:
+        logger.info("Google 캐시 만료 행 정리: 응답 %s건, 구간 %s건", deleted, legs_deleted)
+
+
+__all__ = [
+    "JanitorResult",
+    "ServiceCacheStats",
+    "cache_report",
+    "enforce_budgets",
+    "maybe_run_janitor",
+    "purge_expired",
+    "purge_expired_legs",
+    "run_janitor",
+]
@@ -0,0 +1,367 @@
+"""네트워크 없이 쓰는 가짜 Google Maps 서버(부하 테스트/개발용).
+
+``google_maps`` 모듈이 호출하는 다섯 엔드포인트를 같은 경로로 흉내 냅니다.
+
+- ``GET  /maps/api/geocode/json``               (Geocoding)
+- ``GET  /maps/api/place/nearbysearch/json``    (Nearby Search)
+- ``GET  /maps/api/place/details/json``         (Place Details)
+- ``POST /directions/v2:computeRoutes``         (Routes)
+- ``POST /distanceMatrix/v2:computeRouteMatrix`` (Route Matrix)
+
+응답은 입력값의 해시로 만든 합성 데이터라 같은 요청에는 항상 같은 응답을 돌려줍니다.
+Nearby Search가 만든 place_id(``fake:<type>:<위도>:<경도>``)에는 좌표가 들어 있어, Place Details와 Routes가
+같은 장소를 같은 위치로 계산합니다. 이동 시간은 직선 거리 × 1.3을 이동 수단별 평균 속도로 나눈 값입니다.
+
+``FakeGoogleConfig``로 응답 지연(latency/jitter)과 오류 주입(비율, 상태 코드, 대상 서비스)을 조절합니다.
+``python manage.py run_fake_google``로 띄운 뒤 ``GOOGLE_MAPS_BASE_URL``을 이 서버 주소로, ``GOOGLE_MAPS_API_KEY``를
+아무 값으로 설정하면 됩니다. 응답 캐시(GoogleApiCache)와 구간 캐시(RouteLegCache)는 ``GOOGLE_MAPS_BASE_URL``을
+키에 포함하므로, 같은 DB를 써도 합성 데이터가 실제 Google 응답과 섞이지 않습니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+# 좌표가 없는 입력(주소, 알 수 없는 place_id)은 서울 시청 주변 20km 안의 위치로 만듭니다.
+DEFAULT_CENTER = (37.5665, 126.9780)
+DEFAULT_SPREAD_METERS = 20_000
+ROAD_FACTOR = 1.3
+# 이동 수단별 평균 속도(m/s)
+TRAVEL_SPEEDS = {
+    "DRIVE": 8.3,
+    "TWO_WHEELER": 9.0,
+    "BICYCLE": 4.2,
+    "WALK": 1.3,
+    "TRANSIT": 6.0,
+}
+METERS_PER_DEGREE = 111_320
+
+SERVICE_PATHS = {
+    ("GET", "/maps/api/geocode/json"): "geocoding",
+    ("GET", "/maps/api/place/nearbysearch/json"): "places_nearby",
+    ("GET", "/maps/api/place/details/json"): "place_details",
+    ("POST", "/directions/v2:computeRoutes"): "routes_compute",
+    ("POST", "/distanceMatrix/v2:computeRouteMatrix"): "routes_matrix",
+}
+
+
+@dataclass
+class FakeGoogleConfig:
+    """가짜 서버 동작 설정."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    # 비어 있으면 모든 서비스에 오류를 주입합니다. 예: frozenset({"routes_matrix"})
+    error_services: FrozenSet[str] = field(default_factory=frozenset)
+    results_per_type: int = 20
+    seed: int = 0
+
+
+def _unit(*parts: Any) -> float:
+    """입력값으로 정해지는 0 이상 1 미만의 수."""
+
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") / 2 ** 64
+
+
+def _offset(lat: float, lng: float, distance_m: float, angle: float) -> Tuple[float, float]:
+    new_lat = lat + distance_m * math.cos(angle) / METERS_PER_DEGREE
+    new_lng = lng + distance_m * math.sin(angle) / (METERS_PER_DEGREE * math.cos(math.radians(lat)))
+    return round(new_lat, 6), round(new_lng, 6)
+
+
+def _scatter(lat: float, lng: float, radius_m: float, *seed: Any) -> Tuple[float, float]:
+    """중심에서 radius_m 안의 임의(결정적) 위치."""
+
+    return _offset(lat, lng, radius_m * math.sqrt(_unit(*seed, "r")), 2 * math.pi * _unit(*seed, "a"))
+
+
+def _haversine_meters(a: Tuple[float, float], b: Tuple[float, float]) -> float:
+    lat1, lng1, lat2, lng2 = map(math.radians, (*a, *b))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 2 * 6_371_000 * math.asin(math.sqrt(h))
+
+
+def make_place_id(place_type: str, lat: float, lng: float) -> str:
+    return f"fake:{place_type}:{lat:.6f}:{lng:.6f}"
+
+
+def parse_place_id(place_id: str) -> Tuple[str, Tuple[float, float]]:
+    """가짜 place_id에서 (유형, 좌표)를 꺼냅니다. 형식이 다르면 해시로 만든 좌표를 씁니다."""
+
+    if place_id.startswith("fake:"):
+        try:
+            place_type, lat, lng = place_id[len("fake:"):].rsplit(":", 2)
+            return place_type, (float(lat), float(lng))
+        except ValueError:
+            pass
+    return "point_of_interest", _scatter(*DEFAULT_CENTER, DEFAULT_SPREAD_METERS, "place", place_id)
+
+
+def _place(place_id: str, name: str, place_type: str, location: Tuple[float, float]) -> Dict[str, Any]:
+    return {
+        "place_id": place_id,
+        "name": name,
+        "geometry": {"location": {"lat": location[0], "lng": location[1]}},
+        "types": [place_type, "point_of_interest", "establishment"],
+        "rating": round(3.0 + 2.0 * _unit(place_id, "rating"), 1),
+        "user_ratings_total": int(5_000 * _unit(place_id, "reviews")),
+        "vicinity": f"서울특별시 가짜구 테스트로 {int(_unit(place_id, 'addr') * 300) + 1}",
+        "formatted_address": f"대한민국 서울특별시 가짜구 테스트로 {int(_unit(place_id, 'addr') * 300) + 1}",
+        "photos": [{"photo_reference": f"fake-photo-{place_id}", "width": 800, "height": 600}],
+    }
+
+
+# ---------------------------------------------------------------------------
+# 서비스별 응답
+# ---------------------------------------------------------------------------
+
+
+def geocode(params: Dict[str, str]) -> Dict[str, Any]:
+    address = params.get("address", "")
+    if not address:
+        return {"status": "INVALID_REQUEST", "error_message": "address가 필요합니다.", "results": []}
+    location = _scatter(*DEFAULT_CENTER, DEFAULT_SPREAD_METERS, "geocode", address)
+    return {
+        "status": "OK",
+        "results": [
+            {
+                "formatted_address": address,
+                "geometry": {"location": {"lat": location[0], "lng": location[1]}},
+                "place_id": make_place_id("geocode", *location),
+            }
+        ],
+    }
+
+
+def nearby_search(params: Dict[str, str], results_per_type: int) -> Dict[str, Any]:
+    try:
+        lat, lng = (float(value) for value in params["location"].split(","))
+    except (KeyError, ValueError):
+        return {"status": "INVALID_REQUEST", "error_message": "location이 필요합니다.", "results": []}
+    radius = float(params.get("radius", 1000))
+    place_type = params.get("type", "point_of_interest")
+
+    results = []
+    for index in range(results_per_type):
+        location = _scatter(lat, lng, radius, params["location"], place_type, index)
+        place_id = make_place_id(place_type, *location)
+        results.append(_place(place_id, f"가짜 {place_type} {index + 1}", place_type, location))
+    return {"status": "OK" if results else "ZERO_RESULTS", "results": results}
+
+
+def place_details(params: Dict[str, str]) -> Dict[str, Any]:
+    place_id = params.get("place_id", "")
+    if not place_id:
+        return {"status": "INVALID_REQUEST", "error_message": "place_id가 필요합니다."}
+    place_type, location = parse_place_id(place_id)
+    return {"status": "OK", "result": _place(place_id, f"가짜 장소 {place_id[-6:]}", place_type, location)}
+
+
+def _waypoint_location(waypoint: Dict[str, Any]) -> Tuple[float, float]:
+    if waypoint.get("placeId"):
+        return parse_place_id(waypoint["placeId"])[1]
+    lat_lng = (waypoint.get("location") or {}).get("latLng") or {}
+    return float(lat_lng.get("latitude", DEFAULT_CENTER[0])), float(lat_lng.get("longitude", DEFAULT_CENTER[1]))
+
+
+def _leg(origin: Dict[str, Any], destination: Dict[str, Any], travel_mode: str) -> Tuple[int, int]:
+    """(초, 미터). 같은 지점이면 0."""
+
+    distance = int(_haversine_meters(_waypoint_location(origin), _waypoint_location(destination)) * ROAD_FACTOR)
+    if distance == 0:
+        return 0, 0
+    speed = TRAVEL_SPEEDS.get(travel_mode, TRAVEL_SPEEDS["DRIVE"])
+    # 출발/도착 준비 시간 1분을 더합니다.
+    return int(distance / speed) + 60, distance
+
+
+def compute_routes(body: Dict[str, Any]) -> Dict[str, Any]:
+    waypoints = [body["origin"], *(body.get("intermediates") or []), body["destination"]]
+    travel_mode = body.get("travelMode", "DRIVE")
+    legs = [_leg(start, end, travel_mode) for start, end in zip(waypoints, waypoints[1:])]
+    return {
+        "routes": [
+            {
+                "duration": f"{sum(seconds for seconds, _ in legs)}s",
+                "distanceMeters": sum(meters for _, meters in legs),
+                "legs": [{"duration": f"{seconds}s", "distanceMeters": meters} for seconds, meters in legs],
+            }
+        ]
+    }
+
+
+def _matrix_waypoint(entry: Any, field: str) -> Dict[str, Any]:
+    if not isinstance(entry, dict) or not isinstance(entry.get("waypoint"), dict):
+        raise ValueError(f"{field}의 각 항목은 waypoint를 포함해야 합니다.")
+    return entry["waypoint"]
+
+
+def compute_route_matrix(body: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """출발지/도착지는 실제 API처럼 ``{"waypoint": ...}``로 감싸야 하며, 아니면 400(INVALID_ARGUMENT)입니다."""
+
+    travel_mode = body.get("travelMode", "DRIVE")
+    origins = [_matrix_waypoint(origin, "origins") for origin in body.get("origins", [])]
+    destinations = [_matrix_waypoint(destination, "destinations") for destination in body.get("destinations", [])]
+    elements = []
+    for origin_index, origin in enumerate(origins):
+        for destination_index, destination in enumerate(destinations):
+            seconds, meters = _leg(origin, destination, travel_mode)
+            elements.append(
+                {
+                    "originIndex": origin_index,
+                    "destinationIndex": destination_index,
+                    "duration": f"{seconds}s",
+                    "distanceMeters": meters,
+                    "status": {},
+                    "condition": "ROUTE_EXISTS",
+                }
+            )
+    return elements
+
+
+# ---------------------------------------------------------------------------
+# HTTP 서버
+# ---------------------------------------------------------------------------
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_FakeHTTPServer"
+
+    def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler 시그니처
+        # 부하 테스트 중 요청마다 stderr에 찍히지 않도록 합니다.
+        pass
+
+    def _send_json(self, status_code: int, body: Any) -> None:
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _handle(self, method: str) -> None:
+        split = urlsplit(self.path)
+        service = SERVICE_PATHS.get((method, split.path))
+        if service is None:
+            self._send_json(404, {"error": {"code": 404, "message": f"알 수 없는 경로: {split.path}"}})
+            return
+
+        fake = self.server.fake
+        fake.record(service)
+        fake.delay()
+        if fake.should_fail(service):
+            self._send_json(
+                fake.config.error_status,
+                {"error": {"code": fake.config.error_status, "message": "fake injected error", "status": "UNAVAILABLE"}},
+            )
+            return
+
+        if method == "GET":
+            params = {key: values[-1] for key, values in parse_qs(split.query).items()}
+            if not params.get("key"):
+                self._send_json(200, {"status": "REQUEST_DENIED", "error_message": "API 키가 없습니다."})
+                return
+            if service == "geocoding":
+                self._send_json(200, geocode(params))
+            elif service == "places_nearby":
+                self._send_json(200, nearby_search(params, fake.config.results_per_type))
+            else:
+                self._send_json(200, place_details(params))
+            return
+
+        if not self.headers.get("X-Goog-Api-Key"):
+            self._send_json(403, {"error": {"code": 403, "message": "API 키가 없습니다.", "status": "PERMISSION_DENIED"}})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+            data = compute_routes(body) if service == "routes_compute" else compute_route_matrix(body)
+        except (KeyError, TypeError, ValueError) as exc:
+            self._send_json(400, {"error": {"code": 400, "message": str(exc), "status": "INVALID_ARGUMENT"}})
+            return
+        self._send_json(200, data)
+
+    def do_GET(self):  # noqa: N802 - BaseHTTPRequestHandler 규칙
+        self._handle("GET")
+
+    def do_POST(self):  # noqa: N802 - BaseHTTPRequestHandler 규칙
+        self._handle("POST")
+
+
+class _FakeHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    fake: "FakeGoogleMapsServer"
+
+
+class FakeGoogleMapsServer:
+    """가짜 Google Maps HTTP 서버. ``with FakeGoogleMapsServer() as server:`` 형태로도 쓸 수 있습니다."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, config: Optional[FakeGoogleConfig] = None):
+        self.config = config or FakeGoogleConfig()
+        self.request_counts: Counter = Counter()
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+        self._httpd = _FakeHTTPServer((host, port), _Handler)
+        self._httpd.fake = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, service: str) -> None:
+        with self._lock:
+            self.request_counts[service] += 1
+
+    def delay(self) -> None:
+        with self._lock:
+            jitter = self._random.uniform(0, self.config.jitter_ms) if self.config.jitter_ms else 0.0
+        seconds = (self.config.latency_ms + jitter) / 1000
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def should_fail(self, service: str) -> bool:
+        if self.config.error_rate <= 0:
+            return False
+        if self.config.error_services and service not in self.config.error_services:
+            return False
+        with self._lock:
+            return self._random.random() < self.config.error_rate
+
+    def start(self) -> "FakeGoogleMapsServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-google", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "FakeGoogleMapsServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+__all__ = ["FakeGoogleConfig", "FakeGoogleMapsServer", "make_place_id", "parse_place_id"]
@@ -0,0 +1,103 @@
+"""여러 Google API 호출을 스레드 풀에서 동시에 수행하는 보조 모듈.
+
+고정 추천(fixed-top)처럼 카테고리마다 Nearby Search를 한 번씩 호출하는 경우, 순차 호출이면
+지연 시간이 카테고리 수만큼 더해집니다. 호출은 대부분 네트워크 대기이므로 스레드 풀로 겹쳐 실행하고,
+결과는 입력 순서대로 돌려줍니다. 한 카테고리가 실패해도 나머지 결과는 그대로 사용할 수 있도록
+예외를 결과 객체에 담아 반환합니다.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from .google_maps import GoogleMapsError, GooglePlace, fetch_nearby_places
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+@dataclass
+class CategoryPlaces:
+    """카테고리 하나의 Nearby Search 결과. 실패했다면 places는 비어 있고 error에 사유가 담깁니다."""
+
+    category: str
+    places: List[GooglePlace] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+
+def get_fanout_executor() -> ThreadPoolExecutor:
+    """요청 사이에서 공유하는 스레드 풀. 크기는 ``GOOGLE_MAPS_FANOUT_WORKERS`` 설정으로 제한합니다."""
+
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "GOOGLE_MAPS_FANOUT_WORKERS", 8),
+                    thread_name_prefix="google-fanout",
+                )
+    return _executor
+
+
+def _in_worker(func: Callable, *args, **kwargs):
+    """작업 스레드에서 실행하고, 스레드가 연 DB 연결(캐시 조회용)을 정리한다."""
+
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+def fetch_categories_concurrently(
+    *,
+    latitude: float,
+    longitude: float,
+    place_types: Sequence[str],
+    radius: int,
+    fetch: Callable[..., List[GooglePlace]] = fetch_nearby_places,
+    max_workers: Optional[int] = None,
+) -> List[CategoryPlaces]:
+    """카테고리별 Nearby Search를 동시에 실행하고, ``place_types`` 순서대로 결과를 반환합니다.
+
+    ``max_workers``를 지정하면 이 호출 전용 스레드 풀을 만들고(벤치마크 비교용),
+    생략하면 공유 스레드 풀을 사용합니다. ``GoogleMapsError``만 카테고리 실패로 처리하며,
+    그 밖의 예외는 코드 오류이므로 그대로 전파합니다.
+    """
+
+    def _run(executor: Executor) -> List[CategoryPlaces]:
+        futures = [
+            executor.submit(
+                _in_worker,
+                fetch,
+                latitude=latitude,
+                longitude=longitude,
+                place_type=place_type,
+                radius=radius,
+            )
+            for place_type in place_types
+        ]
+        results = []
+        for place_type, future in zip(place_types, futures):
+            try:
+                results.append(CategoryPlaces(category=place_type, places=future.result()))
+            except GoogleMapsError as exc:
+                results.append(CategoryPlaces(category=place_type, error=str(exc)))
+        return results
+
+    if max_workers is None:
+        return _run(get_fanout_executor())
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="google-fanout") as executor:
+        return _run(executor)
+
+
+__all__ = ["CategoryPlaces", "fetch_categories_concurrently", "get_fanout_executor"]
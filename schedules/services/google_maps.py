@@ -10,16 +10,29 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
 
 import requests
 from django.conf import settings
+from django.db import IntegrityError, close_old_connections
 from django.utils import timezone
 
 from schedules.models import GoogleApiCache
 
+from .cache_access import record_cache_access
+from .cache_codec import decode_payload, encode_payload
+from .cache_janitor import maybe_run_janitor
+from .http_client import get_http_session, get_service_timeout, on_retry
+from .memory_cache import TTLLRUCache
+from .quota import QuotaExceeded, get_governor
+from .route_legs import lookup_legs, store_legs
+from .single_flight import SingleFlight, advisory_lock
+
 logger = logging.getLogger(__name__)
 
 # Google Maps 각 서비스의 엔드포인트를 한 곳에 모아두면 유지보수가 쉽습니다.
@@ -28,6 +41,8 @@ PLACES_NEARBY_ENDPOINT = "https://maps.googleapis.com/maps/api/place/nearbysearc
 PLACE_DETAILS_ENDPOINT = "https://maps.googleapis.com/maps/api/place/details/json"
 ROUTES_COMPUTE_ENDPOINT = "https://routes.googleapis.com/directions/v2:computeRoutes"
 ROUTE_MATRIX_ENDPOINT = "https://routes.googleapis.com/distanceMatrix/v2:computeRouteMatrix"
+# GOOGLE_MAPS_BASE_URL(예: http://127.0.0.1:8765)을 설정하면 위 주소의 경로는 그대로 두고 호스트만 바꿔 호출합니다.
+# 부하 테스트용 가짜 서버(``python manage.py run_fake_google``)를 가리킬 때 사용합니다.
 
 # 서비스별 기본 캐시 시간(초). 프로젝트 요구사항에 맞춰 필요시 조정합니다.
 GEOCODING_CACHE_SECONDS = 60 * 60 * 24  # 24시간 유지
@@ -37,15 +52,36 @@ ROUTES_CACHE_SECONDS = 60 * 15          # 경로 정보는 교통 상황이 자
 ROUTE_MATRIX_CACHE_SECONDS = 60 * 15
 
 # Google Routes API는 FieldMask를 반드시 지정해야 하며,
-# duration(총 소요 시간)과 distanceMeters(총 거리)만 받으면 충분하므로 이렇게 고정합니다.
-ROUTES_FIELD_MASK = "routes.duration,routes.distanceMeters"
-ROUTE_MATRIX_FIELD_MASK = "originIndex,destinationIndex,duration,distanceMeters"
+# duration(총 소요 시간)과 distanceMeters(총 거리)에, 구간 캐시(RouteLegCache)를 채우기 위한 구간별 값만 받습니다.
+ROUTES_FIELD_MASK = "routes.duration,routes.distanceMeters,routes.legs.duration,routes.legs.distanceMeters"
+ROUTE_MATRIX_FIELD_MASK = "originIndex,destinationIndex,duration,distanceMeters,status,condition"
+
+
+# 캐시에 저장할 응답 필드. 파서와 뷰가 읽는 값만 남겨 캐시 크기와 역직렬화 비용을 줄입니다.
+# Routes API 두 서비스는 FieldMask로 이미 필요한 필드만 받으므로 그대로 저장합니다.
+PLACE_RESULT_FIELDS = (
+    "place_id",
+    "name",
+    "geometry",
+    "types",
+    "rating",
+    "user_ratings_total",
+    "formatted_address",
+    "vicinity",
+    "photos",
+)
+GEOCODE_RESULT_FIELDS = ("formatted_address", "geometry", "place_id")
+PHOTO_FIELDS = ("photo_reference", "width", "height")
 
 
 class GoogleMapsError(Exception):
     """Google API 호출 중 발생한 예외를 의미하는 간단한 커스텀 예외"""
 
 
+class GoogleQuotaExceeded(GoogleMapsError):
+    """호출 속도/일일 할당량 한도(``GOOGLE_MAPS_RATE_LIMITS``) 때문에 Google을 호출하지 않은 경우"""
+
+
 @dataclass
 class GeocodeResult:
     """Geocoding API의 핵심 정보를 구조화한 자료형"""
@@ -97,6 +133,15 @@ class RouteMatrixElement:
     duration_seconds: int
     distance_meters: Optional[int]
     raw: Dict[str, Any]
+    condition: Optional[str] = None
+
+    @property
+    def has_route(self) -> bool:
+        """경로를 찾은 요소인지 여부. 경로가 없거나 요소 단위 오류(status.code)가 있으면 False."""
+
+        if (self.raw.get("status") or {}).get("code"):
+            return False
+        return self.condition in (None, "ROUTE_EXISTS")
 
 
 def _require_api_key() -> str:
@@ -110,27 +155,172 @@ def _require_api_key() -> str:
     return api_key
 
 
+_memory_cache: Optional[TTLLRUCache] = None
+_memory_cache_lock = threading.Lock()
+
+
+def get_memory_cache() -> TTLLRUCache:
+    """DB 캐시 앞단의 프로세스 메모리 캐시를 반환합니다.
+
+    크기는 ``GOOGLE_API_MEMORY_CACHE_SIZE`` 설정(항목 수)으로 정하며, 0이면 메모리 계층을 사용하지 않습니다.
+    """
+
+    global _memory_cache
+    if _memory_cache is None:
+        with _memory_cache_lock:
+            if _memory_cache is None:
+                _memory_cache = TTLLRUCache(getattr(settings, "GOOGLE_API_MEMORY_CACHE_SIZE", 1024))
+    return _memory_cache
+
+
+def reset_memory_cache() -> None:
+    """메모리 캐시를 버립니다. 다음 호출 때 현재 설정값으로 다시 만듭니다(설정 변경/테스트용)."""
+
+    global _memory_cache
+    with _memory_cache_lock:
+        _memory_cache = None
+
+
+def _base_url_override() -> str:
+    return getattr(settings, "GOOGLE_MAPS_BASE_URL", "").rstrip("/")
+
+
+def _endpoint(url: str) -> str:
+    """``GOOGLE_MAPS_BASE_URL``이 설정되어 있으면 엔드포인트의 호스트를 그 주소로 바꿉니다."""
+
+    base_url = _base_url_override()
+    if not base_url:
+        return url
+    return base_url + urlsplit(url).path
+
+
 def _build_request_hash(payload: Dict[str, Any]) -> str:
-    """요청 파라미터를 문자열로 직렬화한 뒤 SHA-256 해시를 계산합니다."""
+    """요청 파라미터를 문자열로 직렬화한 뒤 SHA-256 해시를 계산합니다.
+
+    ``GOOGLE_MAPS_BASE_URL``로 다른 서버(가짜 서버 등)를 호출 중이면 그 주소도 키에 포함해
+    실제 Google 응답 캐시와 섞이지 않게 합니다.
+    """
 
+    base_url = _base_url_override()
+    if base_url:
+        payload = {"payload": payload, "base_url": base_url}
     normalized = json.dumps(payload, sort_keys=True, ensure_ascii=False)
     return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
 
-def _load_cache(service_name: str, request_payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """캐시가 존재하고 아직 유효하면 JSON 응답을 반환합니다."""
+def _pick(source: Dict[str, Any], fields: Sequence[str]) -> Dict[str, Any]:
+    return {name: source[name] for name in fields if name in source}
+
+
+def _project_place(place: Dict[str, Any]) -> Dict[str, Any]:
+    projected = _pick(place, PLACE_RESULT_FIELDS)
+    if "geometry" in projected:
+        # viewport 등은 쓰지 않고 좌표(location)만 읽습니다.
+        projected["geometry"] = _pick(projected["geometry"] or {}, ("location",))
+    if projected.get("photos"):
+        # 추천 응답은 첫 번째 사진의 photo_reference만 사용합니다(출처 표기 html_attributions 제외).
+        projected["photos"] = [_pick(projected["photos"][0], PHOTO_FIELDS)]
+    return projected
+
+
+def _project_geocoding(data: Dict[str, Any]) -> Dict[str, Any]:
+    projected = _pick(data, ("status",))
+    projected["results"] = [
+        {**_pick(result, GEOCODE_RESULT_FIELDS), "geometry": _pick(result.get("geometry") or {}, ("location",))}
+        for result in data.get("results", [])
+    ]
+    return projected
+
+
+def _project_places_nearby(data: Dict[str, Any]) -> Dict[str, Any]:
+    projected = _pick(data, ("status",))
+    projected["results"] = [_project_place(place) for place in data.get("results", [])]
+    return projected
+
+
+def _project_place_details(data: Dict[str, Any]) -> Dict[str, Any]:
+    projected = _pick(data, ("status",))
+    if data.get("result"):
+        projected["result"] = _project_place(data["result"])
+    return projected
+
+
+RESPONSE_PROJECTIONS = {
+    "geocoding": _project_geocoding,
+    "places_nearby": _project_places_nearby,
+    "place_details": _project_place_details,
+}
+
+
+def project_response(service_name: str, data: Any) -> Any:
+    """서비스별로 파서가 사용하는 필드만 남긴 응답을 반환합니다. 등록되지 않은 서비스는 그대로 반환합니다."""
+
+    projection = RESPONSE_PROJECTIONS.get(service_name)
+    if projection is None or not isinstance(data, dict):
+        return data
+    return projection(data)
+
+
+def _stale_grace_seconds() -> int:
+    """만료 후에도 캐시를 돌려줄 수 있는 시간(초). 0이면 stale-while-revalidate를 쓰지 않습니다."""
+
+    return max(int(getattr(settings, "GOOGLE_API_STALE_GRACE_SECONDS", 0)), 0)
+
+
+def _lookup_cache(
+    service_name: str,
+    request_payload: Dict[str, Any],
+    *,
+    stale_grace: int = 0,
+    request_hash: Optional[str] = None,
+) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """캐시를 찾아 (응답, 만료 여부)를 반환합니다.
+
+    메모리 캐시를 먼저 확인하고, 없을 때만 DB(GoogleApiCache)를 조회합니다.
+    DB에서 찾은 값은 같은 만료 시각으로 메모리 캐시에 올려 두어 다음 조회부터 쿼리가 생기지 않습니다.
+    두 계층의 적중은 모두 ``cache_access``에 모아 두었다가 주기적으로 한꺼번에 DB에 기록합니다.
+    만료된 행은 ``stale_grace``초 안이면 (응답, True)로 돌려주고, 그보다 오래됐으면 삭제합니다.
+    ``request_hash``를 넘기면 해시를 다시 계산하지 않습니다.
+    """
+
+    request_hash = request_hash or _build_request_hash(request_payload)
+    memory = get_memory_cache()
+    key = (service_name, request_hash)
+    cached = memory.get(key)
+    if cached is not None:
+        record_cache_access(service_name, request_hash)
+        return cached, False
 
-    request_hash = _build_request_hash(request_payload)
     try:
         cache = GoogleApiCache.objects.get(service_name=service_name, request_hash=request_hash)
     except GoogleApiCache.DoesNotExist:
-        return None
+        return None, False
 
+    now = timezone.now()
     if cache.is_expired:
+        if stale_grace and cache.expires_at and now < cache.expires_at + timedelta(seconds=stale_grace):
+            # 유예 시간 안의 만료 캐시는 그대로 응답하고, 갱신은 호출자가 백그라운드로 처리합니다.
+            return decode_payload(cache.response_data), True
         # 만료된 캐시는 바로 삭제해 두면 불필요한 용량을 줄일 수 있습니다.
         cache.delete()
-        return None
-    return cache.response_data
+        memory.invalidate(key)
+        return None, False
+    # 용량 정리(cache_janitor)가 오래 안 쓴 항목부터 지울 수 있도록 사용 기록을 남깁니다.
+    record_cache_access(service_name, request_hash)
+    data = decode_payload(cache.response_data)
+    memory.set(key, data, expires_at=cache.expires_at)
+    return data, False
+
+
+def _load_cache(
+    service_name: str,
+    request_payload: Dict[str, Any],
+    *,
+    request_hash: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """캐시가 존재하고 아직 유효하면 JSON 응답을 반환합니다."""
+
+    return _lookup_cache(service_name, request_payload, request_hash=request_hash)[0]
 
 
 def _save_cache(
@@ -138,40 +328,149 @@ def _save_cache(
     request_payload: Dict[str, Any],
     response_data: Dict[str, Any],
     ttl_seconds: int,
+    *,
+    request_hash: Optional[str] = None,
 ) -> None:
-    """API 응답을 캐시에 저장합니다."""
+    """API 응답을 캐시에 저장합니다. DB와 메모리 캐시에 같은 만료 시각으로 기록합니다.
 
-    request_hash = _build_request_hash(request_payload)
-    expires_at = timezone.now() + timedelta(seconds=ttl_seconds)
-    GoogleApiCache.objects.update_or_create(
-        service_name=service_name,
-        request_hash=request_hash,
-        defaults={
-            "response_data": response_data,
-            "expires_at": expires_at,
-        },
-    )
+    DB에는 ``GOOGLE_API_CACHE_COMPRESS`` 설정에 따라 압축한 형태로, 메모리에는 원본 그대로 둡니다.
+    """
+
+    request_hash = request_hash or _build_request_hash(request_payload)
+    now = timezone.now()
+    expires_at = now + timedelta(seconds=ttl_seconds)
+    values = {"response_data": encode_payload(response_data), "expires_at": expires_at, "last_accessed_at": now}
+    try:
+        GoogleApiCache.objects.update_or_create(
+            service_name=service_name,
+            request_hash=request_hash,
+            defaults=values,
+        )
+    except IntegrityError:
+        # 다른 프로세스가 같은 키를 먼저 만든 경우입니다. 그 행을 덮어쓰면 됩니다.
+        GoogleApiCache.objects.filter(service_name=service_name, request_hash=request_hash).update(**values)
+    get_memory_cache().set((service_name, request_hash), response_data, expires_at=expires_at)
+    maybe_run_janitor()
 
 
-def _perform_get(
+_refresh_flight = SingleFlight()
+_call_flight = SingleFlight()
+_refresh_executor = None
+_refresh_executor_lock = threading.Lock()
+
+
+def get_refresh_executor():
+    """만료 캐시 백그라운드 갱신에 쓰는 스레드 풀(``GOOGLE_API_REFRESH_WORKERS``)."""
+
+    global _refresh_executor
+    if _refresh_executor is None:
+        with _refresh_executor_lock:
+            if _refresh_executor is None:
+                _refresh_executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "GOOGLE_API_REFRESH_WORKERS", 2),
+                    thread_name_prefix="google-refresh",
+                )
+    return _refresh_executor
+
+
+def set_refresh_executor(executor) -> None:
+    """백그라운드 갱신 executor를 교체합니다. None이면 다음 갱신 때 기본 스레드 풀을 만듭니다(테스트용)."""
+
+    global _refresh_executor
+    with _refresh_executor_lock:
+        _refresh_executor = executor
+
+
+def _schedule_refresh(
     service_name: str,
-    url: str,
-    params: Dict[str, Any],
+    request_payload: Dict[str, Any],
+    fetch,
+    ttl_seconds: int,
+    request_hash: str,
+) -> bool:
+    """만료 캐시를 백그라운드에서 갱신합니다. 같은 키의 갱신이 진행 중이면 새로 시작하지 않습니다."""
+
+    def _refresh():
+        try:
+            _save_cache(service_name, request_payload, fetch(), ttl_seconds, request_hash=request_hash)
+        except Exception:
+            # 갱신에 실패해도 유예 시간 동안은 기존 응답을 계속 제공합니다.
+            logger.warning("%s 캐시 백그라운드 갱신 실패", service_name, exc_info=True)
+        finally:
+            close_old_connections()
+
+    _, started = _refresh_flight.submit((service_name, request_hash), get_refresh_executor(), _refresh)
+    return started
+
+
+def _cached_call(
+    service_name: str,
+    request_payload: Dict[str, Any],
     ttl_seconds: int,
-    timeout: int = 5,
+    fetch,
 ) -> Dict[str, Any]:
-    """GET 요청을 수행하기 전에 캐시를 확인하고, 필요 시 실제 API 호출을 수행합니다."""
+    """캐시를 확인하고, 없으면 fetch로 실제 API를 호출해 저장합니다.
 
-    cached = _load_cache(service_name, params)
+    ``GOOGLE_API_STALE_GRACE_SECONDS``가 설정되어 있으면 유예 시간 안의 만료 캐시를 즉시 돌려주고,
+    새 응답은 백그라운드에서 받아 캐시에 저장합니다(stale-while-revalidate).
+    요청 해시는 여기서 한 번만 계산해 조회/저장/갱신에 함께 씁니다.
+    """
+
+    request_hash = _build_request_hash(request_payload)
+    cached, stale = _lookup_cache(
+        service_name, request_payload, stale_grace=_stale_grace_seconds(), request_hash=request_hash
+    )
     if cached is not None:
-        logger.debug("%s 캐시 적중: params=%s", service_name, params)
+        if stale:
+            logger.debug("%s 만료 캐시 응답 후 백그라운드 갱신: payload=%s", service_name, request_payload)
+            _schedule_refresh(service_name, request_payload, fetch, ttl_seconds, request_hash)
+        else:
+            logger.debug("%s 캐시 적중: payload=%s", service_name, request_payload)
         return cached
 
+    def _fetch_once() -> Dict[str, Any]:
+        with advisory_lock(f"google:{service_name}:{request_hash}") as locked:
+            if locked:
+                # 다른 프로세스가 잠금을 잡고 있던 동안 캐시를 채웠을 수 있습니다.
+                filled = _load_cache(service_name, request_payload, request_hash=request_hash)
+                if filled is not None:
+                    return filled
+            data = fetch()
+            _save_cache(service_name, request_payload, data, ttl_seconds, request_hash=request_hash)
+            return data
+
+    # 같은 요청이 동시에 캐시를 놓치면 한 번만 호출하고 나머지는 그 결과를 기다립니다.
+    data, _ = _call_flight.do((service_name, request_hash), _fetch_once)
+    return data
+
+
+def _acquire_quota(service_name: str) -> None:
+    """서비스별 호출 속도/일일 할당량 한도를 확인합니다. 한도를 넘으면 ``GoogleQuotaExceeded``.
+
+    첫 요청 전과, HTTP 세션이 429/5xx 등으로 재전송하기 직전마다 호출합니다.
+    """
+
+    try:
+        get_governor().acquire(service_name)
+    except QuotaExceeded as exc:
+        logger.warning("Google 호출 거절(한도 초과): %s", exc)
+        raise GoogleQuotaExceeded(str(exc)) from exc
+
+
+def _fetch_get(service_name: str, url: str, params: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+    """캐시와 무관하게 GET 요청을 보내고 응답 JSON을 검증해 반환합니다."""
+
     api_key = _require_api_key()
+    _acquire_quota(service_name)
     params_with_key = {**params, "key": api_key}
 
     try:
-        response = requests.get(url, params=params_with_key, timeout=timeout)
+        with on_retry(lambda: _acquire_quota(service_name)):
+            response = get_http_session().get(
+                _endpoint(url),
+                params=params_with_key,
+                timeout=timeout if timeout is not None else get_service_timeout(service_name),
+            )
     except requests.RequestException as exc:
         raise GoogleMapsError(f"{service_name} 호출 중 네트워크 오류가 발생했습니다: {exc}") from exc
 
@@ -185,27 +484,20 @@ def _perform_get(
     # Google API는 status 필드를 통해 세부 에러를 제공하므로 확인합니다.
     if data.get("status") not in (None, "OK", "ZERO_RESULTS"):
         raise GoogleMapsError(f"{service_name} 호출 실패: {data.get('status')} / {data.get('error_message')}")
-
-    _save_cache(service_name, params, data, ttl_seconds)
     return data
 
 
-def _perform_post(
+def _fetch_post(
     service_name: str,
     url: str,
     json_payload: Dict[str, Any],
-    ttl_seconds: int,
-    field_mask: Optional[str] = None,
-    timeout: int = 5,
+    field_mask: Optional[str],
+    timeout: Optional[float],
 ) -> Dict[str, Any]:
-    """POST 요청을 수행하기 전에 캐시를 확인하고, 동일 요청은 캐시 결과를 반환합니다."""
-
-    cached = _load_cache(service_name, json_payload)
-    if cached is not None:
-        logger.debug("%s 캐시 적중: payload=%s", service_name, json_payload)
-        return cached
+    """캐시와 무관하게 POST 요청을 보내고 응답 JSON을 검증해 반환합니다."""
 
     api_key = _require_api_key()
+    _acquire_quota(service_name)
 
     headers = {
         "Content-Type": "application/json",
@@ -215,7 +507,13 @@ def _perform_post(
         headers["X-Goog-FieldMask"] = field_mask
 
     try:
-        response = requests.post(url, json=json_payload, headers=headers, timeout=timeout)
+        with on_retry(lambda: _acquire_quota(service_name)):
+            response = get_http_session().post(
+                _endpoint(url),
+                json=json_payload,
+                headers=headers,
+                timeout=timeout if timeout is not None else get_service_timeout(service_name),
+            )
     except requests.RequestException as exc:
         raise GoogleMapsError(f"{service_name} 호출 중 네트워크 오류가 발생했습니다: {exc}") from exc
 
@@ -227,10 +525,47 @@ def _perform_post(
     data = response.json()
     if "error" in data:
         raise GoogleMapsError(f"{service_name} 호출 실패: {data['error']}")
-    _save_cache(service_name, json_payload, data, ttl_seconds)
     return data
 
 
+def _perform_get(
+    service_name: str,
+    url: str,
+    params: Dict[str, Any],
+    ttl_seconds: int,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """GET 요청을 수행하기 전에 캐시를 확인하고, 필요 시 실제 API 호출을 수행합니다.
+
+    timeout을 생략하면 서비스별 기본값(``http_client.get_service_timeout``)을 사용합니다.
+    """
+
+    return _cached_call(
+        service_name,
+        params,
+        ttl_seconds,
+        lambda: project_response(service_name, _fetch_get(service_name, url, params, timeout)),
+    )
+
+
+def _perform_post(
+    service_name: str,
+    url: str,
+    json_payload: Dict[str, Any],
+    ttl_seconds: int,
+    field_mask: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """POST 요청을 수행하기 전에 캐시를 확인하고, 동일 요청은 캐시 결과를 반환합니다."""
+
+    return _cached_call(
+        service_name,
+        json_payload,
+        ttl_seconds,
+        lambda: project_response(service_name, _fetch_post(service_name, url, json_payload, field_mask, timeout)),
+    )
+
+
 def geocode_address(address: str, language: str = "ko") -> GeocodeResult:
     """주소 문자열을 위도/경도로 변환합니다."""
 
@@ -318,14 +653,13 @@ def fetch_place_details(place_id: str, language: str = "ko") -> GooglePlace:
     )
 
 
-def compute_route_duration(
-    *,
+def _route_request_body(
     origin: Dict[str, Any],
     destination: Dict[str, Any],
-    intermediates: Optional[Sequence[Dict[str, Any]]] = None,
-    travel_mode: str = "DRIVE",
-) -> RouteDuration:
-    """Routes API(ComputeRoutes)를 호출하여 총 이동 시간을 계산합니다."""
+    intermediates: Optional[Sequence[Dict[str, Any]]],
+    travel_mode: str,
+) -> Dict[str, Any]:
+    """ComputeRoutes 요청 본문. 캐시 키도 이 본문으로 만들어지므로 구간 캐시 조회에도 같은 함수를 씁니다."""
 
     body: Dict[str, Any] = {
         "origin": origin,
@@ -334,15 +668,10 @@ def compute_route_duration(
     }
     if intermediates:
         body["intermediates"] = list(intermediates)
+    return body
 
-    data = _perform_post(
-        "routes_compute",
-        ROUTES_COMPUTE_ENDPOINT,
-        body,
-        ROUTES_CACHE_SECONDS,
-        field_mask=ROUTES_FIELD_MASK,
-    )
 
+def _parse_route(data: Dict[str, Any]) -> RouteDuration:
     routes = data.get("routes", [])
     if not routes:
         raise GoogleMapsError("Routes API에서 경로를 찾지 못했습니다.")
@@ -354,17 +683,85 @@ def compute_route_duration(
     return RouteDuration(seconds=seconds, distance_meters=distance, raw=route)
 
 
+def compute_route_duration(
+    *,
+    origin: Dict[str, Any],
+    destination: Dict[str, Any],
+    intermediates: Optional[Sequence[Dict[str, Any]]] = None,
+    travel_mode: str = "DRIVE",
+) -> RouteDuration:
+    """Routes API(ComputeRoutes)를 호출하여 총 이동 시간을 계산합니다.
+
+    경유지가 없는 단일 구간은 구간 캐시(RouteLegCache)를 먼저 확인하고,
+    응답의 구간별 시간은 구간 캐시에 저장해 다른 요청에서도 재사용합니다.
+    """
+
+    if not intermediates:
+        cached_leg = lookup_legs([(origin, destination)], travel_mode)[0]
+        if cached_leg is not None:
+            return _leg_route(cached_leg.seconds, cached_leg.distance_meters)
+
+    body = _route_request_body(origin, destination, intermediates, travel_mode)
+    data = _perform_post(
+        "routes_compute",
+        ROUTES_COMPUTE_ENDPOINT,
+        body,
+        ROUTES_CACHE_SECONDS,
+        field_mask=ROUTES_FIELD_MASK,
+    )
+    route = _parse_route(data)
+
+    waypoints = [origin, *(intermediates or []), destination]
+    legs = route.raw.get("legs") or []
+    if len(legs) == len(waypoints) - 1:
+        store_legs(
+            [
+                (start, end, _parse_duration_seconds(leg.get("duration", "0s")), leg.get("distanceMeters"))
+                for start, end, leg in zip(waypoints, waypoints[1:], legs)
+            ],
+            travel_mode,
+        )
+    elif not intermediates:
+        store_legs([(origin, destination, route.seconds, route.distance_meters)], travel_mode)
+    return route
+
+
+def _leg_route(seconds: int, distance_meters: Optional[int]) -> RouteDuration:
+    """구간 캐시 값을 ComputeRoutes 응답과 같은 모양의 RouteDuration으로 만듭니다."""
+
+    raw: Dict[str, Any] = {"duration": f"{seconds}s"}
+    if distance_meters is not None:
+        raw["distanceMeters"] = distance_meters
+    return RouteDuration(seconds=seconds, distance_meters=distance_meters, raw=raw)
+
+
+def find_cached_legs(
+    pairs: Sequence[tuple],
+    travel_mode: str = "DRIVE",
+) -> List[Optional[RouteDuration]]:
+    """(출발지, 도착지) 구간들의 캐시된 이동 시간을 쿼리 한 번으로 찾습니다. 없는 구간은 None."""
+
+    return [
+        _leg_route(leg.seconds, leg.distance_meters) if leg is not None else None
+        for leg in lookup_legs(pairs, travel_mode)
+    ]
+
+
 def compute_route_matrix(
     *,
     origins: Sequence[Dict[str, Any]],
     destinations: Sequence[Dict[str, Any]],
     travel_mode: str = "DRIVE",
 ) -> List[RouteMatrixElement]:
-    """Routes API(ComputeRouteMatrix)를 호출하여 다건 경로의 이동 시간을 한번에 계산합니다."""
+    """Routes API(ComputeRouteMatrix)를 호출하여 다건 경로의 이동 시간을 한번에 계산합니다.
+
+    ``origins``/``destinations``에는 ``build_place_id_payload`` 등으로 만든 waypoint를 그대로 넘기면 되고,
+    API가 요구하는 ``RouteMatrixOrigin``/``RouteMatrixDestination`` 형태(``{"waypoint": ...}``)로는 여기서 감쌉니다.
+    """
 
     body: Dict[str, Any] = {
-        "origins": list(origins),
-        "destinations": list(destinations),
+        "origins": [{"waypoint": waypoint} for waypoint in origins],
+        "destinations": [{"waypoint": waypoint} for waypoint in destinations],
         "travelMode": travel_mode,
     }
 
@@ -374,7 +771,6 @@ def compute_route_matrix(
         body,
         ROUTE_MATRIX_CACHE_SECONDS,
         field_mask=ROUTE_MATRIX_FIELD_MASK,
-        timeout=10,  # 행렬 계산은 시간이 조금 더 걸릴 수 있어 여유를 둡니다.
     )
 
     elements: List[RouteMatrixElement] = []
@@ -388,11 +784,99 @@ def compute_route_matrix(
                 duration_seconds=seconds,
                 distance_meters=element.get("distanceMeters"),
                 raw=element,
+                condition=element.get("condition"),
             )
         )
+
+    # 경로가 있는 요소는 구간 캐시에 저장해, 다른 조합의 요청에서도 재사용합니다.
+    store_legs(
+        [
+            (origins[element.origin_index], destinations[element.destination_index],
+             element.duration_seconds, element.distance_meters)
+            for element in elements
+            if element.has_route
+            and element.origin_index < len(origins)
+            and element.destination_index < len(destinations)
+        ],
+        travel_mode,
+    )
     return elements
 
 
+# Route Matrix 한 번에 요청할 최대 요소 수(출발지 수 × 도착지 수). 대중교통(TRANSIT) 한도가 100이라 이에 맞춥니다.
+ROUTE_MATRIX_MAX_ELEMENTS = 100
+
+
+def _waypoint_key(waypoint: Dict[str, Any]) -> str:
+    return json.dumps(waypoint, sort_keys=True)
+
+
+def _group_matrix_pairs(pairs: Sequence[tuple]) -> List[List[tuple]]:
+    """(출발지, 도착지) 쌍을 Route Matrix 요소 한도를 넘지 않는 묶음으로 나눕니다."""
+
+    groups: List[List[tuple]] = []
+    current: List[tuple] = []
+    origins: set = set()
+    destinations: set = set()
+    for pair in pairs:
+        origin_key, destination_key = _waypoint_key(pair[0]), _waypoint_key(pair[1])
+        next_origins = len(origins | {origin_key})
+        next_destinations = len(destinations | {destination_key})
+        if current and next_origins * next_destinations > ROUTE_MATRIX_MAX_ELEMENTS:
+            groups.append(current)
+            current, origins, destinations = [], set(), set()
+        current.append(pair)
+        origins.add(origin_key)
+        destinations.add(destination_key)
+    if current:
+        groups.append(current)
+    return groups
+
+
+def compute_leg_durations(
+    waypoints: Sequence[Optional[Dict[str, Any]]],
+    travel_mode: str = "DRIVE",
+) -> List[Optional[RouteDuration]]:
+    """연속한 경유지 사이(0→1, 1→2, ...)의 구간 이동 시간을 한꺼번에 계산합니다.
+
+    - 구간 캐시(RouteLegCache)를 쿼리 한 번으로 확인해, 이미 계산된 구간은 재사용합니다.
+    - 남은 구간만 모아 Route Matrix 한 번(요소 한도를 넘으면 몇 번)으로 계산합니다.
+      계산된 구간은 ``compute_route_matrix``가 구간 캐시에 저장합니다.
+    - 반환 목록 길이는 ``len(waypoints) - 1``이며, 경유지가 None이거나 경로가 없는 구간은 None입니다.
+    - Route Matrix 호출 자체가 실패하면 ``GoogleMapsError``를 그대로 전파합니다.
+    """
+
+    pairs = list(zip(waypoints, waypoints[1:]))
+    legs: List[Optional[RouteDuration]] = find_cached_legs(pairs, travel_mode)
+    missing: Dict[tuple, List[int]] = {}
+    for index, (origin, destination) in enumerate(pairs):
+        if legs[index] is not None or not origin or not destination:
+            continue
+        key = (_waypoint_key(origin), _waypoint_key(destination))
+        missing.setdefault(key, []).append(index)
+
+    to_fetch = [(waypoints[indexes[0]], waypoints[indexes[0] + 1], indexes) for indexes in missing.values()]
+    for group in _group_matrix_pairs(to_fetch):
+        origins = list({_waypoint_key(pair[0]): pair[0] for pair in group}.values())
+        destinations = list({_waypoint_key(pair[1]): pair[1] for pair in group}.values())
+        origin_index = {_waypoint_key(waypoint): position for position, waypoint in enumerate(origins)}
+        destination_index = {_waypoint_key(waypoint): position for position, waypoint in enumerate(destinations)}
+
+        elements = compute_route_matrix(origins=origins, destinations=destinations, travel_mode=travel_mode)
+        by_position = {
+            (element.origin_index, element.destination_index): element for element in elements if element.has_route
+        }
+        for origin, destination, indexes in group:
+            element = by_position.get(
+                (origin_index[_waypoint_key(origin)], destination_index[_waypoint_key(destination)])
+            )
+            if element is None:
+                continue
+            for index in indexes:
+                legs[index] = _leg_route(element.duration_seconds, element.distance_meters)
+    return legs
+
+
 def _parse_duration_seconds(duration: str) -> int:
     """Routes API가 ISO 8601 형식으로 제공하는 duration 문자열을 초 단위 정수로 변환"""
 
@@ -433,6 +917,8 @@ __all__ = [
     "fetch_place_details",
     "compute_route_duration",
     "compute_route_matrix",
+    "compute_leg_durations",
+    "find_cached_legs",
     "build_place_id_payload",
     "build_location_payload",
 ]
@@ -0,0 +1,146 @@
+"""Google Maps 호출에 공용으로 사용하는 HTTP 세션.
+
+- ``requests.get/post``는 호출마다 새 TCP+TLS 연결을 맺으므로, 연결 풀을 가진 ``requests.Session``을
+  프로세스 전체에서 재사용합니다(keep-alive).
+- 429/5xx 응답과 연결 오류는 지수 백오프로 몇 차례 재시도합니다. Google 응답 헤더의 Retry-After도 따릅니다.
+  재전송도 Google 호출이므로 ``on_retry``로 등록한 콜백(governor 할당량 확인)을 재전송마다 호출합니다.
+- 서비스별 타임아웃은 ``SERVICE_TIMEOUTS`` 기본값에 ``GOOGLE_MAPS_TIMEOUTS`` 설정을 덮어써 정합니다.
+- 테스트나 벤치마크에서는 ``set_http_session``으로 가짜 전송 계층을 가진 세션을 주입할 수 있습니다.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+import requests
+from django.conf import settings
+from urllib3.util.retry import Retry
+
+# 재시도 대상 상태 코드: 쿼터 초과(429)와 일시적인 서버 오류
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# 서비스별 기본 타임아웃(초). (연결, 읽기) 튜플도 사용할 수 있습니다.
+SERVICE_TIMEOUTS: Dict[str, Union[float, Tuple[float, float]]] = {
+    "geocoding": 5,
+    "places_nearby": 5,
+    "place_details": 5,
+    "routes_compute": 5,
+    "routes_matrix": 10,  # 행렬 계산은 시간이 조금 더 걸릴 수 있어 여유를 둡니다.
+}
+DEFAULT_TIMEOUT = 5
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# 현재 요청이 재전송될 때마다 호출할 콜백(스레드/작업마다 따로 둡니다)
+_retry_callback: ContextVar[Optional[Callable[[], None]]] = ContextVar("google_maps_retry_callback", default=None)
+
+
+class ChargedRetry(Retry):
+    """재전송 직전마다 ``on_retry`` 콜백을 호출하는 Retry.
+
+    콜백이 예외를 던지면(예: 할당량 초과) 재전송하지 않고 그 예외가 호출자에게 그대로 전달됩니다.
+    """
+
+    def increment(self, *args, **kwargs):
+        retry = super().increment(*args, **kwargs)
+        callback = _retry_callback.get()
+        if callback is not None:
+            callback()
+        return retry
+
+
+@contextmanager
+def on_retry(callback: Callable[[], None]) -> Iterator[None]:
+    """이 블록 안에서 보낸 요청이 재전송될 때마다 callback을 호출합니다."""
+
+    token = _retry_callback.set(callback)
+    try:
+        yield
+    finally:
+        _retry_callback.reset(token)
+
+
+def build_session(
+    *,
+    pool_connections: Optional[int] = None,
+    pool_maxsize: Optional[int] = None,
+    max_retries: Optional[int] = None,
+    backoff_factor: Optional[float] = None,
+) -> requests.Session:
+    """연결 풀과 재시도 정책을 가진 세션을 만듭니다. 인자를 생략하면 설정값을 사용합니다."""
+
+    from requests.adapters import HTTPAdapter
+
+    if pool_connections is None:
+        pool_connections = getattr(settings, "GOOGLE_MAPS_HTTP_POOL_CONNECTIONS", 4)
+    if pool_maxsize is None:
+        pool_maxsize = getattr(settings, "GOOGLE_MAPS_HTTP_POOL_MAXSIZE", 16)
+    if max_retries is None:
+        max_retries = getattr(settings, "GOOGLE_MAPS_HTTP_MAX_RETRIES", 2)
+    if backoff_factor is None:
+        backoff_factor = getattr(settings, "GOOGLE_MAPS_HTTP_BACKOFF_FACTOR", 0.3)
+
+    retry = ChargedRetry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        # Google Maps 호출은 POST(Routes)도 조회 성격이라 재시도해도 안전합니다.
+        allowed_methods=frozenset({"GET", "POST"}),
+        # 재시도가 끝나면 마지막 응답을 그대로 돌려받아 기존처럼 상태 코드로 오류 메시지를 만듭니다.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """프로세스 전체에서 공유하는 세션을 반환합니다(처음 호출할 때 생성)."""
+
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = build_session()
+    return _session
+
+
+def set_http_session(session: Optional[Any]) -> None:
+    """공용 세션을 교체합니다. None을 주면 기존 세션을 닫고 다음 호출 때 설정으로 다시 만듭니다."""
+
+    global _session
+    with _session_lock:
+        previous, _session = _session, session
+    if session is None and previous is not None:
+        previous.close()
+
+
+def get_service_timeout(service_name: str) -> Union[float, Tuple[float, float]]:
+    """서비스별 타임아웃을 반환합니다. ``GOOGLE_MAPS_TIMEOUTS`` 설정이 기본값보다 우선합니다."""
+
+    overrides = getattr(settings, "GOOGLE_MAPS_TIMEOUTS", None) or {}
+    if service_name in overrides:
+        return overrides[service_name]
+    return SERVICE_TIMEOUTS.get(service_name, DEFAULT_TIMEOUT)
+
+
+__all__ = [
+    "ChargedRetry",
+    "RETRY_STATUS_CODES",
+    "SERVICE_TIMEOUTS",
+    "build_session",
+    "get_http_session",
+    "get_service_timeout",
+    "on_retry",
+    "set_http_session",
+]
@@ -0,0 +1,124 @@
+"""GoogleApiCache 앞단에 두는 프로세스 메모리 캐시(LRU + TTL).
+
+- 같은 지오코딩/주변 검색 결과를 여러 요청이 반복해서 읽을 때 DB SELECT 없이 바로 돌려줍니다.
+- 항목의 만료 시각은 DB 행의 ``expires_at``과 같게 맞추므로, 두 계층이 서로 다른 값을 내놓지 않습니다.
+- 크기 한도를 넘으면 가장 오래 사용하지 않은 항목부터 버립니다.
+- 프로세스(워커)마다 따로 존재하므로, 다른 프로세스에서 갱신한 값은 만료 시각이 지나야 반영됩니다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """메모리 캐시의 현재 크기와 누적 적중/실패 횟수."""
+
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TTLLRUCache:
+    """항목마다 만료 시각을 가지는 크기 제한 LRU 캐시. 여러 스레드에서 함께 사용해도 안전하다."""
+
+    def __init__(self, max_size: int = 1024, clock: Callable[[], float] = time.time):
+        self.max_size = max(0, int(max_size))
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """만료되지 않은 값을 반환한다. 없거나 만료되었으면 None."""
+
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        *,
+        ttl_seconds: Optional[float] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        """값을 저장한다. ``expires_at``(DB 행의 만료 시각)이나 ``ttl_seconds`` 중 하나를 지정한다."""
+
+        if expires_at is not None:
+            deadline = expires_at.timestamp()
+        elif ttl_seconds is not None:
+            deadline = self._clock() + ttl_seconds
+        else:
+            raise ValueError("ttl_seconds 또는 expires_at 중 하나는 지정해야 합니다.")
+
+        if self.max_size == 0:
+            return
+        with self._lock:
+            if deadline <= self._clock():
+                # 이미 만료된 값은 보관하지 않고, 남아 있던 이전 값도 지운다.
+                self._data.pop(key, None)
+                return
+            self._data[key] = (deadline, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 항목과 통계를 초기화한다."""
+
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                size=len(self._data),
+                max_size=self.max_size,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+__all__ = ["CacheStats", "TTLLRUCache"]
@@ -0,0 +1,205 @@
+"""Google Places 결과를 로컬 Place 테이블에 묶어서 반영하는 모듈.
+
+추천 API는 한 요청에서 수십 개 장소를 Place 테이블에 기록합니다. 장소마다 조회 + INSERT/UPDATE를 하면
+쿼리가 장소 수의 두 배로 늘어나므로, 다음과 같이 처리합니다.
+
+- 들어온 ``google_place_id`` 전체를 쿼리 한 번으로 조회
+- 새 장소는 ``bulk_create`` 한 번으로 저장
+- 기존 장소는 실제로 바뀐 필드만 모아, 같은 필드 조합끼리 ``bulk_update``로 갱신
+
+``google_place_id``는 유니크 제약(``uniq_place_google_place_id``)이 있으므로, 동시에 같은 장소를 넣는 요청이
+있으면 INSERT는 충돌을 무시하고 이미 저장된 행을 다시 읽어 옵니다.
+Google Place ID → Place pk는 프로세스 메모리 캐시(``get_place_pk_cache``)에 보관해, 자주 추천되는 장소는
+기본 키 조회로 바로 찾습니다.
+"""
+
+from __future__ import annotations
+
+import threading
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from schedules.models import Place
+
+from .google_maps import GooglePlace
+from .memory_cache import TTLLRUCache
+
+_pk_cache: Optional[TTLLRUCache] = None
+_pk_cache_lock = threading.Lock()
+
+
+def get_place_pk_cache() -> TTLLRUCache:
+    """Google Place ID → Place pk 캐시. 크기는 ``PLACE_PK_CACHE_SIZE``(0이면 사용 안 함)."""
+
+    global _pk_cache
+    if _pk_cache is None:
+        with _pk_cache_lock:
+            if _pk_cache is None:
+                _pk_cache = TTLLRUCache(max_size=getattr(settings, "PLACE_PK_CACHE_SIZE", 4096))
+    return _pk_cache
+
+
+def reset_place_pk_cache() -> None:
+    """캐시를 버립니다. 다음 호출 때 현재 설정값으로 다시 만듭니다(설정 변경/테스트용)."""
+
+    global _pk_cache
+    with _pk_cache_lock:
+        _pk_cache = None
+
+
+def _remember(places: Iterable[Place]) -> None:
+    cache = get_place_pk_cache()
+    ttl = getattr(settings, "PLACE_PK_CACHE_SECONDS", 60 * 60)
+    for place in places:
+        if place.pk and place.google_place_id:
+            cache.set(place.google_place_id, place.pk, ttl_seconds=ttl)
+
+
+def _load_places(google_place_ids: Set[str]) -> Dict[str, Place]:
+    """google_place_id로 Place를 읽어 옵니다. 캐시에 pk가 있는 장소는 기본 키로 찾습니다."""
+
+    cache = get_place_pk_cache()
+    cached_pks = {}
+    for google_place_id in google_place_ids:
+        pk = cache.get(google_place_id)
+        if pk is not None:
+            cached_pks[google_place_id] = pk
+    uncached = google_place_ids - set(cached_pks)
+
+    condition = Q(google_place_id__in=uncached)
+    if cached_pks:
+        condition |= Q(pk__in=cached_pks.values())
+    places = {
+        place.google_place_id: place
+        for place in Place.objects.filter(condition)
+        if place.google_place_id in google_place_ids
+    }
+
+    # 캐시 이후 삭제되었거나 ID가 바뀐 장소는 캐시를 비우고 google_place_id로 다시 찾습니다.
+    stale = {google_place_id for google_place_id in cached_pks if google_place_id not in places}
+    if stale:
+        for google_place_id in stale:
+            cache.invalidate(google_place_id)
+        places.update({place.google_place_id: place for place in Place.objects.filter(google_place_id__in=stale)})
+
+    _remember(places.values())
+    return places
+
+
+def lookup_place_pks(google_place_ids: Sequence[str]) -> Dict[str, int]:
+    """Google Place ID들의 로컬 Place pk를 반환합니다. 캐시에 없는 ID만 쿼리 한 번으로 조회합니다."""
+
+    cache = get_place_pk_cache()
+    found: Dict[str, int] = {}
+    missing = set()
+    for google_place_id in google_place_ids:
+        if not google_place_id:
+            continue
+        pk = cache.get(google_place_id)
+        if pk is None:
+            missing.add(google_place_id)
+        else:
+            found[google_place_id] = pk
+    if missing:
+        rows = list(Place.objects.filter(google_place_id__in=missing).only("pk", "google_place_id"))
+        _remember(rows)
+        found.update({place.google_place_id: place.pk for place in rows})
+    return found
+
+
+def _formatted_address(google_place: GooglePlace) -> Optional[str]:
+    if not getattr(google_place, "raw", None):
+        return None
+    return google_place.raw.get("formatted_address") or google_place.raw.get("vicinity")
+
+
+def _new_place(google_place: GooglePlace, synced_at) -> Place:
+    # 기존 Place가 없다면 최소한의 정보로 신규 레코드를 만들어 둡니다.
+    place = Place(
+        name=google_place.name or "이름 미상 장소",
+        google_place_id=google_place.place_id,
+        google_synced_at=synced_at,
+    )
+    formatted_address = _formatted_address(google_place)
+    if formatted_address:
+        place.address = formatted_address
+    if google_place.latitude is not None:
+        place.latitude = Decimal(str(google_place.latitude))
+    if google_place.longitude is not None:
+        place.longitude = Decimal(str(google_place.longitude))
+    return place
+
+
+def _apply_changes(place: Place, google_place: GooglePlace) -> Set[str]:
+    """기존 Place에 Google 응답을 반영하고, 값이 바뀐 필드 이름을 반환합니다."""
+
+    changed: Set[str] = set()
+
+    formatted_address = _formatted_address(google_place)
+    if formatted_address and place.address != formatted_address:
+        place.address = formatted_address
+        changed.add("address")
+
+    if google_place.latitude is not None:
+        new_lat = Decimal(str(google_place.latitude))
+        if place.latitude != new_lat:
+            place.latitude = new_lat
+            changed.add("latitude")
+
+    if google_place.longitude is not None:
+        new_lng = Decimal(str(google_place.longitude))
+        if place.longitude != new_lng:
+            place.longitude = new_lng
+            changed.add("longitude")
+
+    return changed
+
+
+def sync_google_places(google_places: Iterable[GooglePlace]) -> Dict[str, Place]:
+    """Places API 결과들을 Place 테이블에 기록하거나 갱신하고, {google_place_id: Place}를 반환합니다.
+
+    - place_id가 없는 결과는 후속 연동이 불가능하므로 건너뜁니다.
+    - 같은 place_id가 여러 번 들어오면 순서대로 반영한 최종 값으로 한 번만 저장합니다.
+    - 기존 장소는 바뀐 필드와 ``google_synced_at``만 갱신합니다.
+    """
+
+    incoming: List[GooglePlace] = [place for place in google_places if place.place_id]
+    if not incoming:
+        return {}
+
+    existing = _load_places({place.place_id for place in incoming})
+
+    synced_at = timezone.now()
+    created: Dict[str, Place] = {}
+    changed: Dict[str, Set[str]] = {}
+    for google_place in incoming:
+        place_id = google_place.place_id
+        if place_id in existing:
+            changed.setdefault(place_id, {"google_synced_at"}).update(_apply_changes(existing[place_id], google_place))
+            existing[place_id].google_synced_at = synced_at
+        elif place_id in created:
+            _apply_changes(created[place_id], google_place)
+        else:
+            created[place_id] = _new_place(google_place, synced_at)
+
+    if created:
+        # 다른 요청이 먼저 같은 장소를 넣었다면 그 행을 그대로 사용합니다(충돌 행은 INSERT하지 않음).
+        # 충돌을 무시하면 pk가 채워지지 않으므로 저장 후 한 번 더 읽어 옵니다.
+        Place.objects.bulk_create(list(created.values()), ignore_conflicts=True)
+        created = _load_places(set(created))
+
+    # bulk_update는 지정한 필드를 모든 행에 쓰므로, 바뀐 필드 조합이 같은 행끼리 묶어서 갱신합니다.
+    groups: Dict[Tuple[str, ...], List[Place]] = {}
+    for place_id, fields in changed.items():
+        groups.setdefault(tuple(sorted(fields)), []).append(existing[place_id])
+    for fields, places in groups.items():
+        Place.objects.bulk_update(places, list(fields))
+
+    return {**existing, **created}
+
+
+__all__ = ["get_place_pk_cache", "lookup_place_pks", "reset_place_pk_cache", "sync_google_places"]
@@ -0,0 +1,285 @@
+"""Google Maps 서비스별 호출 속도(QPS)와 일일 할당량을 관리하는 governor.
+
+실제 Google 호출 직전(``google_maps._fetch_get`` / ``_fetch_post``)에 ``acquire(service_name)``을 호출합니다.
+HTTP 세션이 429/5xx로 재전송할 때도 시도마다 다시 호출하므로 재시도 역시 속도/할당량을 씁니다
+(``http_client.on_retry``). 캐시 적중은 Google을 부르지 않으므로 할당량을 쓰지 않습니다.
+
+- 한도는 ``GOOGLE_MAPS_RATE_LIMITS = {"places_nearby": {"qps": 10, "burst": 20, "daily_quota": 5000}}``처럼
+  서비스별로 지정합니다. 지정하지 않은 서비스나 항목은 제한하지 않습니다.
+- 토큰이 없으면 ``GOOGLE_MAPS_GOVERNOR_MAX_WAIT_SECONDS``까지 기다리고(대기열), 그래도 안 되거나
+  일일 할당량을 다 쓰면 ``QuotaExceeded``로 호출을 거절합니다(shed).
+- ``GOOGLE_MAPS_GOVERNOR_BACKEND``
+  - ``"memory"``(기본): 프로세스 안에서 스레드끼리 공유하는 토큰 버킷과 사용량 카운터
+  - ``"cache"``: Django 캐시(Redis, DatabaseCache 등)에 초 단위 호출 수와 일일 사용량을 기록해 여러 프로세스가
+    같은 한도를 나눠 씁니다. 속도 제한은 토큰 버킷 대신 1초 고정 창(window)으로 근사합니다.
+- 일일 사용량은 Google 할당량 초기화 기준(``GOOGLE_MAPS_QUOTA_TIMEZONE``, 기본 미국 태평양 시간 자정)으로 나눕니다.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Mapping, Optional
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .rate_limit import TokenBucket
+
+
+class QuotaExceeded(Exception):
+    """호출 속도/일일 할당량 한도 때문에 호출을 허용하지 않은 경우.
+
+    ``google_maps``는 이 예외를 ``GoogleQuotaExceeded``(``GoogleMapsError`` 하위 클래스)로 바꿔 전달합니다.
+    """
+
+
+@dataclass(frozen=True)
+class ServiceLimit:
+    """서비스 하나의 한도. None이면 해당 항목은 제한하지 않습니다."""
+
+    qps: Optional[float] = None
+    burst: Optional[float] = None
+    daily_quota: Optional[int] = None
+
+    @classmethod
+    def from_setting(cls, value: Mapping) -> "ServiceLimit":
+        return cls(qps=value.get("qps"), burst=value.get("burst"), daily_quota=value.get("daily_quota"))
+
+
+@dataclass
+class ServiceUsage:
+    """운영자 확인용 서비스별 사용 현황."""
+
+    service_name: str
+    qps: Optional[float]
+    daily_quota: Optional[int]
+    used_today: int
+    calls: int
+    waited: int
+    shed: int
+
+    @property
+    def remaining_today(self) -> Optional[int]:
+        if self.daily_quota is None:
+            return None
+        return max(self.daily_quota - self.used_today, 0)
+
+
+class _MemoryBackend:
+    """프로세스 안에서만 공유하는 속도/사용량 저장소."""
+
+    def __init__(self, limits: Mapping[str, ServiceLimit], clock, sleep):
+        self._lock = threading.Lock()
+        self._buckets = {
+            name: TokenBucket(limit.qps, limit.burst, clock=clock, sleep=sleep)
+            for name, limit in limits.items()
+            if limit.qps
+        }
+        self._usage: Dict[tuple, int] = {}
+
+    def wait_for_slot(self, service_name: str, limit: ServiceLimit, max_wait: float) -> Optional[float]:
+        """토큰을 얻으면 기다린 시간을, max_wait 안에 못 얻으면 None을 반환합니다."""
+
+        bucket = self._buckets.get(service_name)
+        if bucket is None:
+            return 0.0
+        expected_wait = bucket.try_acquire()
+        if expected_wait == 0:
+            return 0.0
+        if not bucket.acquire(timeout=max_wait):
+            return None
+        return expected_wait
+
+    def reserve(self, service_name: str, day: str, quota: Optional[int]) -> bool:
+        with self._lock:
+            key = (service_name, day)
+            used = self._usage.get(key, 0)
+            if quota is not None and used >= quota:
+                return False
+            self._usage[key] = used + 1
+            return True
+
+    def used(self, service_name: str, day: str) -> int:
+        with self._lock:
+            return self._usage.get((service_name, day), 0)
+
+
+class _CacheBackend:
+    """Django 캐시에 카운터를 두어 여러 프로세스가 같은 한도를 나눠 쓰는 저장소."""
+
+    def __init__(self, alias: str, prefix: str, clock, sleep):
+        self._cache = caches[alias]
+        self._prefix = prefix
+        self._clock = clock
+        self._sleep = sleep
+
+    def _incr(self, key: str, timeout: int) -> int:
+        self._cache.add(key, 0, timeout=timeout)
+        try:
+            return self._cache.incr(key)
+        except ValueError:
+            # add와 incr 사이에 키가 만료된 경우입니다.
+            self._cache.add(key, 0, timeout=timeout)
+            return self._cache.incr(key)
+
+    def wait_for_slot(self, service_name: str, limit: ServiceLimit, max_wait: float) -> Optional[float]:
+        if not limit.qps:
+            return 0.0
+        allowed = max(int(math.ceil(limit.qps)), 1)
+        started = self._clock()
+        while True:
+            now = self._clock()
+            window = int(now)
+            if self._incr(f"{self._prefix}:rate:{service_name}:{window}", timeout=5) <= allowed:
+                return now - started
+            wait = window + 1 - now
+            if now + wait - started > max_wait:
+                return None
+            self._sleep(wait)
+
+    def reserve(self, service_name: str, day: str, quota: Optional[int]) -> bool:
+        key = f"{self._prefix}:daily:{service_name}:{day}"
+        used = self._incr(key, timeout=60 * 60 * 48)
+        if quota is not None and used > quota:
+            self._cache.decr(key)
+            return False
+        return True
+
+    def used(self, service_name: str, day: str) -> int:
+        return int(self._cache.get(f"{self._prefix}:daily:{service_name}:{day}", 0))
+
+
+class GoogleApiGovernor:
+    """서비스별 호출 속도/일일 할당량 governor. 여러 스레드에서 공유합니다."""
+
+    def __init__(
+        self,
+        limits: Mapping[str, ServiceLimit],
+        *,
+        backend: str = "memory",
+        max_wait_seconds: float = 2.0,
+        quota_timezone: str = "America/Los_Angeles",
+        cache_alias: str = "default",
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        now: Callable[[], datetime] = None,
+    ):
+        """``clock``은 메모리 토큰 버킷용, ``wall_clock``은 프로세스 간 공유하는 캐시 창(초 단위)용 시계입니다."""
+
+        self.limits = dict(limits)
+        self.max_wait_seconds = max_wait_seconds
+        self._zone = ZoneInfo(quota_timezone)
+        self._now = now or (lambda: datetime.now(tz=self._zone))
+        if backend == "cache":
+            self._backend = _CacheBackend(cache_alias, "google-governor", wall_clock, sleep)
+        elif backend == "memory":
+            self._backend = _MemoryBackend(self.limits, clock, sleep)
+        else:
+            raise ValueError(f"알 수 없는 governor backend: {backend}")
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def _day(self) -> str:
+        return self._now().astimezone(self._zone).date().isoformat()
+
+    def _count(self, service_name: str, name: str) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(service_name, {"calls": 0, "waited": 0, "shed": 0})
+            counters[name] += 1
+
+    def acquire(self, service_name: str) -> None:
+        """호출 하나를 허용받습니다. 한도를 넘으면 잠시 기다리고, 그래도 안 되면 ``QuotaExceeded``."""
+
+        limit = self.limits.get(service_name)
+        if limit is None:
+            self._count(service_name, "calls")
+            return
+
+        # 할당량이 이미 바닥났다면 기다리지 않고 바로 거절합니다.
+        if limit.daily_quota is not None and self._backend.used(service_name, self._day()) >= limit.daily_quota:
+            self._count(service_name, "shed")
+            raise QuotaExceeded(f"{service_name} 일일 할당량({limit.daily_quota}회)을 모두 사용했습니다.")
+
+        waited = self._backend.wait_for_slot(service_name, limit, self.max_wait_seconds)
+        if waited is None:
+            self._count(service_name, "shed")
+            raise QuotaExceeded(
+                f"{service_name} 호출이 몰려 {self.max_wait_seconds:g}초 안에 처리하지 못했습니다(초당 {limit.qps:g}회 제한)."
+            )
+        if waited > 0:
+            self._count(service_name, "waited")
+
+        if not self._backend.reserve(service_name, self._day(), limit.daily_quota):
+            self._count(service_name, "shed")
+            raise QuotaExceeded(f"{service_name} 일일 할당량({limit.daily_quota}회)을 모두 사용했습니다.")
+        self._count(service_name, "calls")
+
+    def usage(self) -> List[ServiceUsage]:
+        """설정된 서비스와 이 프로세스에서 호출한 서비스의 사용 현황을 이름순으로 반환합니다."""
+
+        day = self._day()
+        with self._lock:
+            counters = {name: dict(values) for name, values in self._counters.items()}
+        report = []
+        for service_name in sorted(set(self.limits) | set(counters)):
+            limit = self.limits.get(service_name, ServiceLimit())
+            values = counters.get(service_name, {})
+            report.append(
+                ServiceUsage(
+                    service_name=service_name,
+                    qps=limit.qps,
+                    daily_quota=limit.daily_quota,
+                    used_today=self._backend.used(service_name, day) if service_name in self.limits else 0,
+                    calls=values.get("calls", 0),
+                    waited=values.get("waited", 0),
+                    shed=values.get("shed", 0),
+                )
+            )
+        return report
+
+
+_governor: Optional[GoogleApiGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_governor() -> GoogleApiGovernor:
+    """설정값으로 만든 공용 governor를 반환합니다."""
+
+    global _governor
+    if _governor is None:
+        with _governor_lock:
+            if _governor is None:
+                _governor = GoogleApiGovernor(
+                    {
+                        name: ServiceLimit.from_setting(value)
+                        for name, value in getattr(settings, "GOOGLE_MAPS_RATE_LIMITS", {}).items()
+                    },
+                    backend=getattr(settings, "GOOGLE_MAPS_GOVERNOR_BACKEND", "memory"),
+                    max_wait_seconds=getattr(settings, "GOOGLE_MAPS_GOVERNOR_MAX_WAIT_SECONDS", 2.0),
+                    quota_timezone=getattr(settings, "GOOGLE_MAPS_QUOTA_TIMEZONE", "America/Los_Angeles"),
+                )
+    return _governor
+
+
+def set_governor(governor: Optional[GoogleApiGovernor]) -> None:
+    """governor를 교체합니다. None이면 다음 호출 때 현재 설정값으로 다시 만듭니다(설정 변경/테스트용)."""
+
+    global _governor
+    with _governor_lock:
+        _governor = governor
+
+
+__all__ = [
+    "GoogleApiGovernor",
+    "QuotaExceeded",
+    "ServiceLimit",
+    "ServiceUsage",
+    "get_governor",
+    "set_governor",
+]
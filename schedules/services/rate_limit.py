@@ -0,0 +1,73 @@
+"""Google API 호출 속도 제한용 토큰 버킷.
+
+초당 ``rate``개씩 토큰이 채워지고 최대 ``capacity``개까지 쌓입니다. 호출 전에 ``acquire``로 토큰을 하나
+가져가며, 토큰이 없으면 채워질 때까지 기다립니다. 여러 스레드에서 같은 버킷을 공유해도 안전합니다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Optional
+
+
+class TokenBucket:
+    """스레드 간 공유 가능한 토큰 버킷."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self._updated, 0.0)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """토큰을 가져오면 0을, 부족하면 다시 시도할 때까지 기다려야 하는 시간(초)을 반환합니다."""
+
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        """토큰을 가져올 때까지 기다립니다. ``timeout``초 안에 못 가져오면 False를 반환합니다."""
+
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait == 0:
+                return True
+            if deadline is not None:
+                remaining = deadline - self._clock()
+                if remaining <= 0 or wait > remaining:
+                    return False
+            self._sleep(wait)
+
+    @property
+    def available(self) -> float:
+        """현재 남은 토큰 수(조회 시점 기준으로 채운 값)."""
+
+        with self._lock:
+            self._refill(self._clock())
+            return self._tokens
+
+
+__all__ = ["TokenBucket"]
@@ -0,0 +1,138 @@
+"""구간(leg) 단위 이동 시간 캐시(RouteLegCache)를 읽고 쓰는 모듈.
+
+- 키: (출발지, 도착지, 이동 수단, 시간대 구간). 출발/도착지는 Routes API waypoint payload에서
+  ``place:<placeId>`` 또는 ``latlng:<위도>,<경도>``(소수 5자리) 문자열로 만듭니다.
+- 시간대 구간은 현지 시각을 ``ROUTE_LEG_BUCKET_HOURS``시간 단위로 나눈 번호입니다.
+  출근 시간대와 심야의 이동 시간이 다르므로 같은 구간이라도 시간대별로 따로 저장합니다.
+- 조회는 여러 구간을 쿼리 한 번으로, 저장은 bulk upsert 한 번으로 처리합니다.
+- ``GOOGLE_MAPS_BASE_URL``로 다른 서버(가짜 서버 등)를 호출 중이면 키 앞에 그 주소별 접두사를 붙여,
+  합성 데이터로 계산한 구간이 실제 구간과 섞이지 않게 합니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+
+from schedules.models import RouteLegCache
+
+Waypoint = Dict[str, Any]
+LegKey = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class CachedLeg:
+    """캐시에 저장된 구간 이동 시간."""
+
+    seconds: int
+    distance_meters: Optional[int]
+
+
+def waypoint_key(waypoint: Optional[Waypoint]) -> Optional[str]:
+    """waypoint payload를 캐시 키 문자열로 바꿉니다. 알 수 없는 형식이면 None(캐시하지 않음)."""
+
+    if not waypoint:
+        return None
+    place_id = waypoint.get("placeId")
+    if place_id:
+        return f"place:{place_id}"
+    lat_lng = (waypoint.get("location") or {}).get("latLng") or {}
+    if lat_lng.get("latitude") is not None and lat_lng.get("longitude") is not None:
+        return f"latlng:{float(lat_lng['latitude']):.5f},{float(lat_lng['longitude']):.5f}"
+    return None
+
+
+def _key_namespace() -> str:
+    base_url = getattr(settings, "GOOGLE_MAPS_BASE_URL", "").rstrip("/")
+    if not base_url:
+        return ""
+    return f"ns:{hashlib.sha256(base_url.encode('utf-8')).hexdigest()[:12]}|"
+
+
+def _leg_key(origin: Optional[Waypoint], destination: Optional[Waypoint], namespace: str) -> Optional[LegKey]:
+    origin_key, destination_key = waypoint_key(origin), waypoint_key(destination)
+    if not origin_key or not destination_key:
+        return None
+    return namespace + origin_key, namespace + destination_key
+
+
+def time_bucket(at: Optional[datetime] = None) -> int:
+    """현지 시각 기준 시간대 구간 번호를 반환합니다."""
+
+    hours = max(1, int(getattr(settings, "ROUTE_LEG_BUCKET_HOURS", 3)))
+    local = timezone.localtime(at) if at is not None else timezone.localtime()
+    return local.hour // hours
+
+
+def lookup_legs(
+    pairs: Sequence[Tuple[Optional[Waypoint], Optional[Waypoint]]],
+    travel_mode: str,
+    *,
+    at: Optional[datetime] = None,
+) -> List[Optional[CachedLeg]]:
+    """구간 목록의 캐시 값을 쿼리 한 번으로 읽어, 입력 순서대로 반환합니다(없으면 None)."""
+
+    namespace = _key_namespace()
+    keys = [_leg_key(origin, destination, namespace) for origin, destination in pairs]
+    wanted = {key for key in keys if key is not None}
+    if not wanted:
+        return [None] * len(pairs)
+
+    rows = RouteLegCache.objects.filter(
+        origin_key__in={key[0] for key in wanted},
+        destination_key__in={key[1] for key in wanted},
+        travel_mode=travel_mode,
+        time_bucket=time_bucket(at),
+        expires_at__gt=timezone.now(),
+    ).values_list("origin_key", "destination_key", "duration_seconds", "distance_meters")
+    found = {
+        (origin_key, destination_key): CachedLeg(seconds, distance)
+        for origin_key, destination_key, seconds, distance in rows
+        if (origin_key, destination_key) in wanted
+    }
+    return [found.get(key) for key in keys]
+
+
+def store_legs(
+    legs: Iterable[Tuple[Optional[Waypoint], Optional[Waypoint], int, Optional[int]]],
+    travel_mode: str,
+    *,
+    at: Optional[datetime] = None,
+) -> int:
+    """(출발지, 도착지, 초, 거리) 구간들을 저장(있으면 갱신)하고 저장한 건수를 반환합니다."""
+
+    bucket = time_bucket(at)
+    expires_at = timezone.now() + timedelta(seconds=getattr(settings, "ROUTE_LEG_CACHE_SECONDS", 60 * 60 * 24))
+    namespace = _key_namespace()
+    rows: Dict[LegKey, RouteLegCache] = {}
+    for origin, destination, seconds, distance in legs:
+        key = _leg_key(origin, destination, namespace)
+        if key is None:
+            continue
+        rows[key] = RouteLegCache(
+            origin_key=key[0],
+            destination_key=key[1],
+            travel_mode=travel_mode,
+            time_bucket=bucket,
+            duration_seconds=max(int(seconds), 0),
+            distance_meters=distance,
+            expires_at=expires_at,
+        )
+    if not rows:
+        return 0
+
+    RouteLegCache.objects.bulk_create(
+        list(rows.values()),
+        update_conflicts=True,
+        unique_fields=["origin_key", "destination_key", "travel_mode", "time_bucket"],
+        update_fields=["duration_seconds", "distance_meters", "expires_at"],
+    )
+    return len(rows)
+
+
+__all__ = ["CachedLeg", "lookup_legs", "store_legs", "time_bucket", "waypoint_key"]
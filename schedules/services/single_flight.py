@@ -0,0 +1,147 @@
+"""같은 키의 작업이 동시에 여러 번 실행되지 않도록 묶어 주는 single-flight 도구.
+
+키마다 진행 중인 작업(Future)을 하나만 유지합니다. 같은 키로 다시 요청하면 새 작업을 만들지 않고
+진행 중인 Future를 돌려주며, 작업이 끝나면 키를 비워 다음 요청부터 다시 실행할 수 있게 합니다.
+
+- ``SingleFlight.submit``: executor에서 실행(백그라운드 갱신용)
+- ``SingleFlight.do``: 호출한 스레드에서 실행하고, 같은 키의 다른 호출자는 그 결과를 기다림
+- ``advisory_lock``: 여러 프로세스(워커) 사이의 중복 호출을 PostgreSQL advisory lock으로 막음
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, Tuple
+
+from django.db import connection
+
+
+class InlineExecutor:
+    """submit 즉시 현재 스레드에서 실행하는 executor (테스트/동기 실행용)."""
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:  # noqa: B902 - Future에 그대로 전달한다.
+            future.set_exception(exc)
+        return future
+
+
+class SingleFlight:
+    """키별로 진행 중인 작업을 하나로 합친다. 여러 스레드에서 함께 사용해도 안전하다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+
+    def submit(self, key: Hashable, executor, fn: Callable[[], Any]) -> Tuple[Future, bool]:
+        """``executor``에서 fn을 실행한다. 이미 같은 키가 진행 중이면 그 Future를 반환한다.
+
+        반환값은 (Future, 새로 시작했는지 여부)입니다.
+        """
+
+        with self._lock:
+            existing = self._in_flight.get(key)
+            if existing is not None:
+                return existing, False
+            # 실행 전에 자리를 잡아 두어, executor가 작업을 시작하기 전의 중복 요청도 합친다.
+            placeholder: Future = Future()
+            self._in_flight[key] = placeholder
+
+        def _run():
+            try:
+                result = fn()
+            except BaseException as exc:  # noqa: B902 - 대기 중인 호출자에게 그대로 전달한다.
+                self._finish(key, placeholder, exc=exc)
+                raise
+            self._finish(key, placeholder, result=result)
+            return result
+
+        try:
+            executor.submit(_run)
+        except BaseException as exc:  # noqa: B902 - executor 종료 등으로 제출 자체가 실패한 경우
+            self._finish(key, placeholder, exc=exc)
+            raise
+        return placeholder, True
+
+    def do(self, key: Hashable, fn: Callable[[], Any], *, timeout: float = None) -> Tuple[Any, bool]:
+        """fn을 실행해 결과를 반환한다. 같은 키가 이미 실행 중이면 실행하지 않고 그 결과를 기다린다.
+
+        반환값은 (결과, 직접 실행했는지 여부)입니다. 실행 중인 호출의 예외는 기다리던 호출자에게도 그대로 전달됩니다.
+        """
+
+        with self._lock:
+            existing = self._in_flight.get(key)
+            if existing is None:
+                future: Future = Future()
+                self._in_flight[key] = future
+        if existing is not None:
+            return existing.result(timeout=timeout), False
+
+        try:
+            result = fn()
+        except BaseException as exc:  # noqa: B902 - 대기 중인 호출자에게 그대로 전달한다.
+            self._finish(key, future, exc=exc)
+            raise
+        self._finish(key, future, result=result)
+        return result, True
+
+    def _finish(self, key: Hashable, future: Future, *, result: Any = None, exc: BaseException = None) -> None:
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    def in_flight(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._in_flight
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._in_flight)
+
+
+def _advisory_key(key: str) -> int:
+    # pg_advisory_lock은 signed bigint를 받으므로 해시 앞 15자리(60비트)만 사용합니다.
+    return int(hashlib.sha256(key.encode("utf-8")).hexdigest()[:15], 16)
+
+
+@contextmanager
+def advisory_lock(key: str, *, timeout: float = 5.0, poll_interval: float = 0.05) -> Iterator[bool]:
+    """PostgreSQL 세션 advisory lock을 잡고 실행합니다. 잡았는지 여부를 넘겨 줍니다.
+
+    다른 프로세스가 같은 키를 잡고 있으면 ``timeout``초까지 기다리고, 그래도 못 잡으면 False로 진행합니다
+    (중복 호출이 생길 수는 있지만 요청이 막히지는 않음). PostgreSQL이 아니면 아무것도 하지 않고 False를 넘깁니다.
+    """
+
+    if connection.vendor != "postgresql":
+        yield False
+        return
+
+    lock_id = _advisory_key(key)
+    deadline = time.monotonic() + timeout
+    acquired = False
+    with connection.cursor() as cursor:
+        while True:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", [lock_id])
+            acquired = bool(cursor.fetchone()[0])
+            if acquired or time.monotonic() >= deadline:
+                break
+            time.sleep(poll_interval)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_id])
+
+
+__all__ = ["InlineExecutor", "SingleFlight", "advisory_lock"]
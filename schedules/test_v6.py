@@ -62,7 +62,7 @@ from rest_framework.test import APIClient
 
 from schedules.constants import FIXED_RECOMMENDATION_PLACE_TYPES
 from schedules.models import Place, Schedule
-from schedules.services.google_maps import GeocodeResult, GooglePlace, RouteDuration
+from schedules.services.google_maps import GeocodeResult, GooglePlace, RouteDuration, RouteMatrixElement
 
 
 LOGGER = logging.getLogger("tests.schedules.v6")
@@ -1602,18 +1602,34 @@ def test_alternative_recommendations(case, api_client, monkeypatch):
 
     route_seconds = case["route_seconds"]
 
-    def fake_compute_route_duration(origin, destination, intermediates=None, travel_mode=None):
-        if intermediates:
-            place_id = intermediates[0].get("placeId")
-            if place_id == case["request"]["unavailable_place_id"]:
-                seconds = route_seconds["base"]
-            else:
-                seconds = route_seconds[place_id]
-        else:
-            seconds = 0
-        return RouteDuration(seconds=seconds, distance_meters=1000, raw={"seconds": seconds})
+    matrix_calls: List[Tuple[int, int]] = []
+
+    def fake_compute_route_matrix(origins, destinations, travel_mode=None):
+        # A→경유지 구간에 경로 전체 시간을 두고, 경유지→Y 구간은 0초로 두어 합계가 route_seconds와 같게 합니다.
+        matrix_calls.append((len(origins), len(destinations)))
+        elements = []
+        for origin_index, origin in enumerate(origins):
+            for destination_index, destination in enumerate(destinations):
+                if len(origins) == 1:
+                    place_id = destination.get("placeId")
+                    if place_id == case["request"]["unavailable_place_id"]:
+                        seconds = route_seconds["base"]
+                    else:
+                        seconds = route_seconds[place_id]
+                else:
+                    seconds = 0
+                elements.append(
+                    RouteMatrixElement(
+                        origin_index=origin_index,
+                        destination_index=destination_index,
+                        duration_seconds=seconds,
+                        distance_meters=500,
+                        raw={"seconds": seconds},
+                    )
+                )
+        return elements
 
-    monkeypatch.setattr("schedules.views.compute_route_duration", fake_compute_route_duration)
+    monkeypatch.setattr("schedules.views.compute_route_matrix", fake_compute_route_matrix)
 
     url = reverse("place-recommendation-alternatives")
     response = api_client.post(url, case["request"], format="json")
@@ -1630,6 +1646,7 @@ def test_alternative_recommendations(case, api_client, monkeypatch):
     assert payload["base_route"]["original_duration_seconds"] == base_duration, (
         f"{debug_header} 기본 경로 시간이 예상과 다릅니다."
     )
+    assert len(matrix_calls) == 2, f"{debug_header} Route Matrix 호출은 두 번이어야 합니다: {matrix_calls}"
 
     alternatives = payload["alternatives"]
     returned_ids = [item["place"]["place_id"] for item in alternatives]
@@ -1686,13 +1703,21 @@ def test_rebalance_day_updates_schedule_times(scenario, api_client, trip_factory
         )
         schedule_map[place_info["code"]] = schedule
 
-    def fake_compute_route_duration(origin, destination, intermediates=None, travel_mode=None):
-        origin_id = origin.get("placeId")
-        destination_id = destination.get("placeId")
-        seconds = scenario["route_seconds"].get((origin_id, destination_id), 0)
-        return RouteDuration(seconds=seconds, distance_meters=4000, raw={"origin": origin_id, "dest": destination_id})
+    leg_calls: List[int] = []
+
+    def fake_compute_leg_durations(waypoints, travel_mode=None):
+        leg_calls.append(len(waypoints))
+        legs = []
+        for origin, destination in zip(waypoints, waypoints[1:]):
+            origin_id = origin.get("placeId")
+            destination_id = destination.get("placeId")
+            seconds = scenario["route_seconds"].get((origin_id, destination_id), 0)
+            legs.append(
+                RouteDuration(seconds=seconds, distance_meters=4000, raw={"origin": origin_id, "dest": destination_id})
+            )
+        return legs
 
-    monkeypatch.setattr("schedules.views.compute_route_duration", fake_compute_route_duration)
+    monkeypatch.setattr("schedules.views.compute_leg_durations", fake_compute_leg_durations)
 
     new_order_ids = [schedule_map[code].id for code in scenario["new_order_codes"]]
     url = reverse("trip-schedule-rebalance-day", kwargs={"trip_pk": trip.id})
@@ -1733,6 +1758,7 @@ def test_rebalance_day_updates_schedule_times(scenario, api_client, trip_factory
     assert len(travel_segments) == len(expected["segments"]), (
         f"{debug_header} 이동 구간 개수가 다릅니다."
     )
+    assert leg_calls == [len(new_order_ids)], f"{debug_header} 구간 계산은 한 번에 이뤄져야 합니다: {leg_calls}"
     for actual_segment, expected_segment in zip(travel_segments, expected["segments"]):
         assert actual_segment["duration_seconds"] == expected_segment["duration_seconds"], (
             f"{debug_header} 이동 시간 초 단위가 다릅니다: {actual_segment}"
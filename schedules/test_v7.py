@@ -0,0 +1,1690 @@
+"""Schedules v7 테스트 모음.
+
+Google Maps 연동 계층의 성능 개선(캐시 계층 등)을 검증합니다. 외부 HTTP 호출은 하지 않으며,
+필요한 경우 모듈 내부 함수를 monkeypatch로 교체하거나 로컬 가짜 Google 서버를 사용합니다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+from importlib import import_module
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+
+import pytest
+import requests
+from django.apps import apps as django_apps
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from schedules.constants import FIXED_RECOMMENDATION_PLACE_TYPES
+from schedules.management.commands import sync_place_coordinates
+from schedules.management.commands.benchmark_fixed_top import build_stub_fetch
+from schedules.models import GoogleApiCache, OptionalExpense, Place, RouteLegCache
+from schedules.services import cache_access, cache_janitor, fake_google_maps, fanout, google_maps, http_client, place_sync, quota, rate_limit, route_legs, single_flight
+from schedules.services.memory_cache import TTLLRUCache
+from schedules.services.single_flight import SingleFlight
+from schedules.views import PlaceRecommendationViewSet
+
+LOGGER = logging.getLogger("tests.schedules.v7")
+
+
+@pytest.fixture(autouse=True)
+def fresh_memory_cache():
+    """테스트끼리 메모리 캐시/호출 한도 상태를 공유하지 않도록 매번 새로 만든다."""
+
+    google_maps.reset_memory_cache()
+    place_sync.reset_place_pk_cache()
+    quota.set_governor(None)
+    cache_access.reset_access_recorder()
+    yield
+    google_maps.reset_memory_cache()
+    place_sync.reset_place_pk_cache()
+    quota.set_governor(None)
+    cache_access.reset_access_recorder()
+
+
+@pytest.fixture
+def http_session():
+    """공용 HTTP 세션을 테스트용으로 교체하고, 끝나면 원래 상태(지연 생성)로 돌린다."""
+
+    def _install(session):
+        http_client.set_http_session(session)
+        return session
+
+    yield _install
+    http_client.set_http_session(None)
+
+
+@pytest.fixture
+def cache_db(db):
+    """GoogleApiCache 테이블을 비운 상태로 시작한다.
+
+    update_or_create 내부의 savepoint가 테스트 트랜잭션 밖에서 커밋될 수 있어, 앞선 테스트의 행이 남지 않도록 정리한다.
+    """
+
+    GoogleApiCache.objects.all().delete()
+    RouteLegCache.objects.all().delete()
+    yield
+    GoogleApiCache.objects.all().delete()
+    RouteLegCache.objects.all().delete()
+
+
+class _FakeClock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_lru_cache_evicts_least_recently_used():
+    cache = TTLLRUCache(max_size=2, clock=_FakeClock())
+    cache.set("a", 1, ttl_seconds=60)
+    cache.set("b", 2, ttl_seconds=60)
+    assert cache.get("a") == 1  # a를 최근 사용으로 갱신
+    cache.set("c", 3, ttl_seconds=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    LOGGER.info("LRU 통계: %s", stats)
+    assert (stats.size, stats.hits, stats.misses, stats.evictions) == (2, 3, 1, 1)
+    assert stats.hit_ratio == pytest.approx(0.75)
+
+
+def test_ttl_lru_cache_expires_entries():
+    clock = _FakeClock()
+    cache = TTLLRUCache(max_size=10, clock=clock)
+    cache.set("key", {"v": 1}, ttl_seconds=30)
+    clock.now += 29
+    assert cache.get("key") == {"v": 1}
+    clock.now += 1
+    assert cache.get("key") is None
+    assert cache.stats().expirations == 1
+    assert len(cache) == 0
+
+
+def test_ttl_lru_cache_with_zero_size_stores_nothing():
+    cache = TTLLRUCache(max_size=0)
+    cache.set("key", 1, ttl_seconds=60)
+    assert cache.get("key") is None
+
+
+def test_load_cache_serves_repeated_reads_from_memory(cache_db):
+    payload = {"address": "서울시청", "language": "ko"}
+    google_maps._save_cache("geocoding", payload, {"results": [1]}, google_maps.GEOCODING_CACHE_SECONDS)
+
+    with CaptureQueriesContext(connection) as ctx:
+        for _ in range(5):
+            assert google_maps._load_cache("geocoding", payload) == {"results": [1]}
+    assert len(ctx.captured_queries) == 0
+
+    stats = google_maps.get_memory_cache().stats()
+    assert stats.hits == 5
+
+
+def test_load_cache_promotes_db_rows_with_same_expiry(cache_db):
+    payload = {"place_id": "abc", "language": "ko"}
+    request_hash = google_maps._build_request_hash(payload)
+    row = GoogleApiCache.objects.create(
+        service_name="place_details",
+        request_hash=request_hash,
+        response_data={"result": {"name": "DB"}},
+        expires_at=timezone.now() + timedelta(minutes=5),
+    )
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert google_maps._load_cache("place_details", payload) == {"result": {"name": "DB"}}
+        assert google_maps._load_cache("place_details", payload) == {"result": {"name": "DB"}}
+    # 첫 조회만 DB를 읽는다. 사용 기록은 모았다가 나중에 반영하므로 UPDATE가 없다.
+    assert len(ctx.captured_queries) == 1
+
+    # 메모리 항목은 DB 행의 expires_at을 그대로 따른다.
+    deadline, _ = google_maps.get_memory_cache()._data[("place_details", request_hash)]
+    assert deadline == pytest.approx(row.expires_at.timestamp())
+
+
+def test_save_cache_overwrites_memory_entry(cache_db):
+    payload = {"location": "37.5,127.0", "type": "cafe"}
+    google_maps._save_cache("places_nearby", payload, {"results": ["old"]}, 60)
+    assert google_maps._load_cache("places_nearby", payload) == {"results": ["old"]}
+
+    google_maps._save_cache("places_nearby", payload, {"results": ["new"]}, 60)
+    assert google_maps._load_cache("places_nearby", payload) == {"results": ["new"]}
+    assert GoogleApiCache.objects.get().response_data == {"results": ["new"]}
+
+
+def test_expired_db_row_is_deleted_and_not_cached(cache_db):
+    payload = {"address": "부산역"}
+    GoogleApiCache.objects.create(
+        service_name="geocoding",
+        request_hash=google_maps._build_request_hash(payload),
+        response_data={"results": []},
+        expires_at=timezone.now() - timedelta(seconds=1),
+    )
+
+    assert google_maps._load_cache("geocoding", payload) is None
+    assert not GoogleApiCache.objects.exists()
+    assert len(google_maps.get_memory_cache()) == 0
+
+
+@override_settings(GOOGLE_API_MEMORY_CACHE_SIZE=0)
+def test_memory_tier_can_be_disabled(cache_db):
+    google_maps.reset_memory_cache()
+    payload = {"address": "제주공항"}
+    google_maps._save_cache("geocoding", payload, {"results": [2]}, 60)
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert google_maps._load_cache("geocoding", payload) == {"results": [2]}
+    assert len(ctx.captured_queries) == 1
+
+
+# ---------------------------------------------------------------------------
+# 공용 HTTP 세션 (연결 풀 / 재시도 / 서비스별 타임아웃)
+# ---------------------------------------------------------------------------
+
+
+class _RecordingAdapter(requests.adapters.BaseAdapter):
+    """네트워크 없이 고정 JSON을 돌려주는 전송 계층. 받은 요청과 타임아웃, 요청 본문을 기록한다."""
+
+    def __init__(self, body):
+        super().__init__()
+        self.body = body
+        self.calls = []
+        self.bodies = []
+
+    def send(self, request, timeout=None, **kwargs):
+        self.calls.append((request.method, request.url, timeout))
+        self.bodies.append(json.loads(request.body) if request.body else None)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(self.body).encode("utf-8")
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+def test_shared_session_is_reused():
+    http_client.set_http_session(None)
+    try:
+        first = http_client.get_http_session()
+        assert http_client.get_http_session() is first
+        adapter = first.get_adapter("https://maps.googleapis.com/")
+        assert adapter.max_retries.total == 2
+        assert 429 in adapter.max_retries.status_forcelist
+        assert "POST" in adapter.max_retries.allowed_methods
+    finally:
+        http_client.set_http_session(None)
+
+
+@override_settings(GOOGLE_MAPS_API_KEY="test-key", GOOGLE_MAPS_TIMEOUTS={"geocoding": (1, 2)})
+def test_geocode_uses_injected_session_and_service_timeout(cache_db, http_session):
+    adapter = _RecordingAdapter(
+        {
+            "status": "OK",
+            "results": [
+                {"formatted_address": "서울", "geometry": {"location": {"lat": 37.5, "lng": 127.0}}, "place_id": "p1"}
+            ],
+        }
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    http_session(session)
+
+    result = google_maps.geocode_address("서울")
+    google_maps.geocode_address("서울")  # 두 번째 호출은 캐시에서 응답
+
+    assert result.place_id == "p1"
+    assert len(adapter.calls) == 1
+    method, url, timeout = adapter.calls[0]
+    assert method == "GET" and "key=test-key" in url
+    assert timeout == (1, 2)
+
+
+@override_settings(GOOGLE_MAPS_API_KEY="test-key")
+def test_route_matrix_uses_longer_default_timeout(cache_db, http_session):
+    adapter = _RecordingAdapter([{"originIndex": 0, "destinationIndex": 0, "duration": "60s"}])
+    session = requests.Session()
+    session.mount("https://", adapter)
+    http_session(session)
+
+    elements = google_maps.compute_route_matrix(origins=[{"placeId": "a"}], destinations=[{"placeId": "b"}])
+
+    assert elements[0].duration_seconds == 60
+    assert adapter.calls[0][0] == "POST"
+    assert adapter.calls[0][2] == http_client.SERVICE_TIMEOUTS["routes_matrix"]
+
+
+@override_settings(GOOGLE_MAPS_API_KEY="test-key")
+def test_route_matrix_wraps_waypoints_in_request_body(cache_db, http_session):
+    adapter = _RecordingAdapter([{"originIndex": 0, "destinationIndex": 0, "duration": "60s"}])
+    session = requests.Session()
+    session.mount("https://", adapter)
+    http_session(session)
+
+    google_maps.compute_route_matrix(
+        origins=[google_maps.build_place_id_payload("a")],
+        destinations=[google_maps.build_place_id_payload("b")],
+    )
+
+    body = adapter.bodies[0]
+    assert body["origins"] == [{"waypoint": {"placeId": "a"}}]
+    assert body["destinations"] == [{"waypoint": {"placeId": "b"}}]
+    # 구간 캐시 키는 감싸기 전 waypoint 기준이다.
+    assert google_maps.find_cached_legs([({"placeId": "a"}, {"placeId": "b"})])[0] is not None
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    """처음 몇 번은 503을, 이후에는 200을 돌려주는 로컬 HTTP 핸들러."""
+
+    failures_left = 0
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        if type(self).failures_left > 0:
+            type(self).failures_left -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+        body = json.dumps({"status": "OK", "results": []}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_server():
+    _FlakyHandler.failures_left = 0
+    _FlakyHandler.hits = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FlakyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/geocode/json"
+    server.shutdown()
+    server.server_close()
+
+
+@override_settings(GOOGLE_MAPS_API_KEY="test-key")
+def test_session_retries_transient_server_errors(cache_db, http_session, flaky_server):
+    _FlakyHandler.failures_left = 2
+    http_session(http_client.build_session(max_retries=2, backoff_factor=0))
+
+    data = google_maps._perform_get("geocoding", flaky_server, {"address": "재시도"}, 60)
+
+    assert data == {"status": "OK", "results": []}
+    assert _FlakyHandler.hits == 3
+
+
+@override_settings(GOOGLE_MAPS_API_KEY="test-key")
+def test_session_gives_up_after_max_retries(cache_db, http_session, flaky_server):
+    _FlakyHandler.failures_left = 10
+    http_session(http_client.build_session(max_retries=1, backoff_factor=0))
+
+    with pytest.raises(google_maps.GoogleMapsError, match="status=503"):
+        google_maps._perform_get("geocoding", flaky_server, {"address": "실패"}, 60)
+    assert _FlakyHandler.hits == 2
+
+
+@override_settings(GOOGLE_MAPS_API_KEY="test-key")
+def test_transport_retries_are_charged_to_governor(cache_db, http_session, flaky_server):
+    governor = quota.GoogleApiGovernor({"geocoding": quota.ServiceLimit(daily_quota=5)})
+    quota.set_governor(governor)
+    _FlakyHandler.failures_left = 2
+    http_session(http_client.build_session(max_retries=2, backoff_factor=0))
+
+    google_maps._perform_get("geocoding", flaky_server, {"address": "재시도 할당량"}, 60)
+
+    assert _FlakyHandler.hits == 3
+    assert {item.service_name: item for item in governor.usage()}["geocoding"].used_today == 3
+
+
+@override_settings(GOOGLE_MAPS_API_KEY="test-key")
+def test_transport_retry_stops_when_quota_runs_out(cache_db, http_session, flaky_server):
+    quota.set_governor(quota.GoogleApiGovernor({"geocoding": quota.ServiceLimit(daily_quota=2)}))
+    _FlakyHandler.failures_left = 10
+    http_session(http_client.build_session(max_retries=5, backoff_factor=0))
+
+    with pytest.raises(google_maps.GoogleQuotaExceeded):
+        google_maps._perform_get("geocoding", flaky_server, {"address": "할당량 소진"}, 60)
+    assert _FlakyHandler.hits == 2
+
+
+# ---------------------------------------------------------------------------
+# fixed-top 카테고리 동시 검색
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def api_client(manager_user):
+    client = APIClient()
+    client.force_authenticate(user=manager_user)
+    return client
+
+
+def test_fanout_runs_categories_concurrently_and_keeps_order():
+    # 다섯 카테고리가 모두 동시에 barrier에 도달해야 통과한다(순차 실행이면 timeout).
+    barrier = threading.Barrier(len(FIXED_RECOMMENDATION_PLACE_TYPES), timeout=5)
+    stub = build_stub_fetch(0)
+
+    def fetch(**kwargs):
+        barrier.wait()
+        return stub(**kwargs)
+
+    results = fanout.fetch_categories_concurrently(
+        latitude=37.5,
+        longitude=127.0,
+        place_types=FIXED_RECOMMENDATION_PLACE_TYPES,
+        radius=1000,
+        fetch=fetch,
+        max_workers=len(FIXED_RECOMMENDATION_PLACE_TYPES),
+    )
+
+    assert [result.category for result in results] == list(FIXED_RECOMMENDATION_PLACE_TYPES)
+    assert all(result.places and not result.failed for result in results)
+
+
+def test_fixed_top_returns_partial_result_when_one_category_fails(api_client, monkeypatch):
+    monkeypatch.setattr("schedules.views.fetch_nearby_places", build_stub_fetch(0, fail_category="museum"))
+
+    response = api_client.post(
+        reverse("place-recommendation-fixed-top"), {"latitude": 37.5665, "longitude": 126.978}, format="json"
+    )
+
+    assert response.status_code == 200
+    categories = response.json()["categories"]
+    assert [item["category"] for item in categories] == list(FIXED_RECOMMENDATION_PLACE_TYPES)
+    failed = {item["category"]: item for item in categories if item["error"]}
+    assert list(failed) == ["museum"]
+    assert failed["museum"]["places"] == []
+    assert Place.objects.filter(google_place_id="park_0").exists()
+
+
+def test_fixed_top_returns_502_when_every_category_fails(api_client, monkeypatch):
+    def always_fail(**kwargs):
+        raise google_maps.GoogleMapsError("쿼터 초과")
+
+    monkeypatch.setattr("schedules.views.fetch_nearby_places", always_fail)
+
+    response = api_client.post(
+        reverse("place-recommendation-fixed-top"), {"latitude": 37.5665, "longitude": 126.978}, format="json"
+    )
+
+    assert response.status_code == 502
+    assert response.json()["failed_category"] == FIXED_RECOMMENDATION_PLACE_TYPES[0]
+
+
+def test_benchmark_fixed_top_command_reports_both_modes():
+    out = StringIO()
+    call_command("benchmark_fixed_top", "--delay-ms", "0", "--runs", "1", stdout=out)
+    output = out.getvalue()
+    LOGGER.info("벤치마크 출력:\n%s", output)
+    assert "sequential" in output and "concurrent" in output
+
+
+# ---------------------------------------------------------------------------
+# 대체 장소 추천: Route Matrix 기반 후보 평가
+# ---------------------------------------------------------------------------
+
+
+def _matrix_element(origin_index, destination_index, seconds, condition="ROUTE_EXISTS"):
+    return google_maps.RouteMatrixElement(
+        origin_index=origin_index,
+        destination_index=destination_index,
+        duration_seconds=seconds,
+        distance_meters=1000,
+        raw={"condition": condition},
+        condition=condition,
+    )
+
+
+@pytest.fixture
+def alternatives_backend(monkeypatch):
+    """X(museum_x) 주변에 후보 세 곳이 있는 가짜 Places 응답을 설치한다."""
+
+    def fake_details(place_id):
+        return google_maps.GooglePlace(place_id, "방문 불가", 37.5, 127.0, ["museum"], 4.0, 10, {})
+
+    def fake_nearby(latitude, longitude, place_type, radius):
+        return [
+            google_maps.GooglePlace(f"cand_{index}", f"후보 {index}", latitude, longitude, [place_type], 4.0, 10, {})
+            for index in range(3)
+        ]
+
+    monkeypatch.setattr("schedules.views.fetch_place_details", fake_details)
+    monkeypatch.setattr("schedules.views.fetch_nearby_places", fake_nearby)
+    return {"previous_place_id": "A", "unavailable_place_id": "museum_x", "next_place_id": "Y", "travel_mode": "DRIVE"}
+
+
+def test_alternatives_sum_matrix_legs_and_skip_unroutable_candidates(api_client, alternatives_backend, monkeypatch):
+    inbound_seconds = [600, 300, 900, 100]  # X, cand_0, cand_1, cand_2
+    outbound_seconds = [600, 400, 100, 0]
+
+    def fake_matrix(origins, destinations, travel_mode=None):
+        if len(origins) == 1:
+            return [_matrix_element(0, index, seconds) for index, seconds in enumerate(inbound_seconds)]
+        elements = [_matrix_element(index, 0, seconds) for index, seconds in enumerate(outbound_seconds)]
+        elements[3] = _matrix_element(3, 0, 0, condition="ROUTE_NOT_FOUND")
+        return elements
+
+    monkeypatch.setattr("schedules.views.compute_route_matrix", fake_matrix)
+
+    response = api_client.post(reverse("place-recommendation-alternatives"), alternatives_backend, format="json")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["base_route"]["original_duration_seconds"] == 1200
+    # cand_2는 Y로 가는 경로가 없어 제외되고, 나머지는 ΔETA 오름차순으로 정렬된다.
+    ranked = [(item["place"]["place_id"], item["delta_seconds"]) for item in payload["alternatives"]]
+    assert ranked == [("cand_0", -500), ("cand_1", -200)]
+
+
+def test_alternatives_report_matrix_failure(api_client, alternatives_backend, monkeypatch):
+    def failing_matrix(origins, destinations, travel_mode=None):
+        raise google_maps.GoogleMapsError("Routes 쿼터 초과")
+
+    monkeypatch.setattr("schedules.views.compute_route_matrix", failing_matrix)
+
+    response = api_client.post(reverse("place-recommendation-alternatives"), alternatives_backend, format="json")
+
+    assert response.status_code == 502
+    assert response.json()["failed_step"] == "route_matrix"
+
+
+def test_route_matrix_element_condition_is_parsed():
+    assert _matrix_element(0, 0, 10).has_route
+    assert not _matrix_element(0, 0, 0, condition="ROUTE_NOT_FOUND").has_route
+    errored = google_maps.RouteMatrixElement(0, 0, 0, None, raw={"status": {"code": 5}})
+    assert not errored.has_route
+
+
+# ---------------------------------------------------------------------------
+# 하루 일정 구간 이동 시간 일괄 계산
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def matrix_recorder(monkeypatch):
+    """Route Matrix HTTP 호출을 가짜 응답으로 바꾸고, 호출마다 (출발지 수, 도착지 수)를 기록한다.
+
+    구간 시간은 '출발 placeId 숫자 * 100 + 도착 placeId 숫자' 초로 계산한다.
+    """
+
+    calls = []
+    original = google_maps._perform_post
+
+    def fake_perform_post(service_name, url, json_payload, ttl_seconds, field_mask=None, timeout=None):
+        if service_name != "routes_matrix":
+            return original(service_name, url, json_payload, ttl_seconds, field_mask=field_mask, timeout=timeout)
+        origins = [origin["waypoint"] for origin in json_payload["origins"]]
+        destinations = [destination["waypoint"] for destination in json_payload["destinations"]]
+        calls.append((len(origins), len(destinations)))
+        return [
+            {
+                "originIndex": o,
+                "destinationIndex": d,
+                "duration": f"{int(origin['placeId'][1:]) * 100 + int(destination['placeId'][1:])}s",
+                "distanceMeters": 1000,
+                "condition": "ROUTE_EXISTS",
+            }
+            for o, origin in enumerate(origins)
+            for d, destination in enumerate(destinations)
+        ]
+
+    monkeypatch.setattr(google_maps, "_perform_post", fake_perform_post)
+    return calls
+
+
+def _stops(*numbers):
+    return [google_maps.build_place_id_payload(f"p{number}") if number is not None else None for number in numbers]
+
+
+def test_leg_durations_fetch_missing_legs_in_one_matrix_call(cache_db, matrix_recorder):
+    legs = google_maps.compute_leg_durations(_stops(1, 2, None, 3, 4))
+
+    assert [leg.seconds if leg else None for leg in legs] == [102, None, None, 304]
+    assert matrix_recorder == [(2, 2)]
+
+
+def test_leg_durations_reuse_cached_legs(cache_db, matrix_recorder, monkeypatch):
+    google_maps.compute_leg_durations(_stops(1, 2, 3))
+    legs = google_maps.compute_leg_durations(_stops(1, 2, 3, 4))
+
+    assert [leg.seconds for leg in legs] == [102, 203, 304]
+    # 두 번째 호출은 새 구간(3→4)만 계산한다.
+    assert matrix_recorder == [(2, 2), (1, 1)]
+
+    # 저장된 구간은 단일 경로 계산(compute_route_duration)의 캐시로도 재사용된다.
+    def fail_post(*args, **kwargs):
+        raise AssertionError("캐시된 구간에서 HTTP 호출이 일어났습니다.")
+
+    monkeypatch.setattr(google_maps, "get_http_session", fail_post)
+    route = google_maps.compute_route_duration(origin=_stops(2)[0], destination=_stops(3)[0])
+    assert route.seconds == 203
+
+
+def test_leg_durations_split_requests_over_element_limit(cache_db, matrix_recorder):
+    legs = google_maps.compute_leg_durations(_stops(*range(1, 13)))
+
+    assert len(legs) == 11 and all(leg is not None for leg in legs)
+    assert all(origins * destinations <= google_maps.ROUTE_MATRIX_MAX_ELEMENTS for origins, destinations in matrix_recorder)
+    assert matrix_recorder == [(10, 10), (1, 1)]
+
+
+def test_leg_durations_deduplicate_repeated_pairs(cache_db, matrix_recorder):
+    legs = google_maps.compute_leg_durations(_stops(1, 2, 1, 2))
+
+    assert [leg.seconds for leg in legs] == [102, 201, 102]
+    assert matrix_recorder == [(2, 2)]
+
+
+# ---------------------------------------------------------------------------
+# 구간(leg) 단위 이동 시간 캐시
+# ---------------------------------------------------------------------------
+
+
+def test_waypoint_key_formats():
+    assert route_legs.waypoint_key({"placeId": "abc"}) == "place:abc"
+    assert route_legs.waypoint_key(google_maps.build_location_payload(37.1234567, 127.0)) == "latlng:37.12346,127.00000"
+    assert route_legs.waypoint_key({}) is None
+
+
+def test_route_legs_are_separated_by_time_bucket(cache_db):
+    morning = timezone.make_aware(datetime(2026, 3, 2, 8, 30))
+    night = timezone.make_aware(datetime(2026, 3, 2, 23, 0))
+    origin, destination = _stops(1, 2)
+    route_legs.store_legs([(origin, destination, 900, 5000)], "DRIVE", at=morning)
+
+    assert route_legs.lookup_legs([(origin, destination)], "DRIVE", at=morning) == [route_legs.CachedLeg(900, 5000)]
+    assert route_legs.lookup_legs([(origin, destination)], "DRIVE", at=night) == [None]
+    assert route_legs.lookup_legs([(origin, destination)], "WALK", at=morning) == [None]
+
+
+def test_multi_waypoint_route_fills_leg_cache(cache_db, monkeypatch):
+    posts = []
+
+    def fake_perform_post(service_name, url, json_payload, ttl_seconds, field_mask=None, timeout=None):
+        posts.append(service_name)
+        return {
+            "routes": [
+                {
+                    "duration": "700s",
+                    "distanceMeters": 7000,
+                    "legs": [
+                        {"duration": "300s", "distanceMeters": 3000},
+                        {"duration": "400s", "distanceMeters": 4000},
+                    ],
+                }
+            ]
+        }
+
+    monkeypatch.setattr(google_maps, "_perform_post", fake_perform_post)
+    a, b, c = _stops(1, 2, 3)
+
+    total = google_maps.compute_route_duration(origin=a, destination=c, intermediates=[b])
+    assert total.seconds == 700
+
+    # A→B, B→C는 더 이상 Routes API를 부르지 않는다.
+    assert google_maps.compute_route_duration(origin=a, destination=b).seconds == 300
+    assert [leg.seconds for leg in google_maps.compute_leg_durations([a, b, c])] == [300, 400]
+    assert posts == ["routes_compute"]
+
+
+def test_alternatives_reuse_legs_from_leg_cache(api_client, cache_db, matrix_recorder, monkeypatch):
+    def fake_details(place_id):
+        return google_maps.GooglePlace(place_id, "방문 불가", 37.5, 127.0, ["museum"], 4.0, 10, {})
+
+    def fake_nearby(latitude, longitude, place_type, radius):
+        return [
+            google_maps.GooglePlace(f"p{index}", f"후보 {index}", latitude, longitude, [place_type], 4.0, 10, {})
+            for index in (3, 4)
+        ]
+
+    monkeypatch.setattr("schedules.views.fetch_place_details", fake_details)
+    monkeypatch.setattr("schedules.views.fetch_nearby_places", fake_nearby)
+    # views 모듈의 compute_route_matrix도 실제 함수(구간 캐시 저장 포함)를 쓰도록 맞춘다.
+    monkeypatch.setattr("schedules.views.compute_route_matrix", google_maps.compute_route_matrix)
+    request = {"previous_place_id": "p1", "unavailable_place_id": "p2", "next_place_id": "p9", "travel_mode": "DRIVE"}
+
+    first = api_client.post(reverse("place-recommendation-alternatives"), request, format="json").json()
+    assert matrix_recorder == [(1, 3), (3, 1)]
+
+    second = api_client.post(reverse("place-recommendation-alternatives"), request, format="json").json()
+    assert matrix_recorder == [(1, 3), (3, 1)]
+    assert second["alternatives"] == first["alternatives"]
+    # A→X→Y = (102) + (209), 후보 p3 = (103) + (309)
+    assert first["base_route"]["original_duration_seconds"] == 311
+    assert first["alternatives"][0]["place"]["place_id"] == "p3"
+
+
+def test_via_legs_send_wrapped_waypoints(cache_db, monkeypatch):
+    bodies = []
+
+    def fake_perform_post(service_name, url, json_payload, ttl_seconds, field_mask=None, timeout=None):
+        bodies.append(json_payload)
+        return [
+            {"originIndex": o, "destinationIndex": d, "duration": "60s", "condition": "ROUTE_EXISTS"}
+            for o in range(len(json_payload["origins"]))
+            for d in range(len(json_payload["destinations"]))
+        ]
+
+    monkeypatch.setattr(google_maps, "_perform_post", fake_perform_post)
+    monkeypatch.setattr("schedules.views.compute_route_matrix", google_maps.compute_route_matrix)
+
+    legs = PlaceRecommendationViewSet._compute_via_legs(
+        previous_place_id="p1", next_place_id="p9", via_place_ids=["p2", "p3"], travel_mode="DRIVE"
+    )
+
+    assert [leg.seconds for leg in legs] == [120, 120]
+    assert bodies[0]["origins"] == [{"waypoint": {"placeId": "p1"}}]
+    assert bodies[0]["destinations"] == [{"waypoint": {"placeId": "p2"}}, {"waypoint": {"placeId": "p3"}}]
+    assert bodies[1]["origins"] == [{"waypoint": {"placeId": "p2"}}, {"waypoint": {"placeId": "p3"}}]
+    assert bodies[1]["destinations"] == [{"waypoint": {"placeId": "p9"}}]
+
+
+# ---------------------------------------------------------------------------
+# GoogleApiCache 정리(janitor)
+# ---------------------------------------------------------------------------
+
+
+def _cache_row(service_name, index, *, expires_in=3600, accessed_minutes_ago=None, size=10):
+    now = timezone.now()
+    return GoogleApiCache.objects.create(
+        service_name=service_name,
+        request_hash=f"{service_name}-{index}",
+        response_data={"blob": "x" * size},
+        expires_at=now + timedelta(seconds=expires_in),
+        last_accessed_at=now - timedelta(minutes=accessed_minutes_ago) if accessed_minutes_ago is not None else None,
+    )
+
+
+def test_db_cache_hit_records_usage(cache_db):
+    payload = {"address": "인천공항"}
+    google_maps._save_cache("geocoding", payload, {"results": []}, 60)
+    google_maps.reset_memory_cache()
+    GoogleApiCache.objects.update(last_accessed_at=None)
+
+    with CaptureQueriesContext(connection) as queries:
+        google_maps._load_cache("geocoding", payload)
+    assert [query["sql"] for query in queries if query["sql"].startswith("UPDATE")] == []
+
+    assert cache_access.flush_access_stats() == 1
+    row = GoogleApiCache.objects.get()
+    assert row.hit_count == 1
+    assert row.last_accessed_at is not None
+
+
+def test_memory_tier_hits_count_towards_lru(cache_db):
+    hot, cold = {"address": "서울역"}, {"address": "부산역"}
+    google_maps._save_cache("geocoding", hot, {"results": []}, 60)
+    google_maps._save_cache("geocoding", cold, {"results": []}, 60)
+    GoogleApiCache.objects.update(last_accessed_at=timezone.now() - timedelta(hours=1))
+
+    for _ in range(3):
+        assert google_maps._load_cache("geocoding", hot) is not None  # 모두 메모리 계층 적중
+
+    cache_janitor.run_janitor(row_budgets={"geocoding": 1}, byte_budgets={})
+
+    row = GoogleApiCache.objects.get()
+    assert row.request_hash == google_maps._build_request_hash(hot)
+    assert row.hit_count == 3
+
+
+def test_access_recorder_flushes_at_most_once_per_interval(cache_db):
+    clock = _FakeClock()
+    recorder = cache_access.AccessRecorder(flush_seconds=300, max_keys=100, clock=clock)
+    rows = [_cache_row("geocoding", index) for index in range(3)]
+
+    for row in rows + rows[:1]:
+        recorder.record("geocoding", row.request_hash)
+    assert recorder.pending() == 3
+    assert GoogleApiCache.objects.filter(hit_count__gt=0).count() == 0
+
+    clock.now += 300
+    with CaptureQueriesContext(connection) as queries:
+        recorder.record("geocoding", rows[1].request_hash)
+    # 적중 수(2회, 2회, 1회)별로 묶어 UPDATE 두 번으로 반영한다.
+    assert len([query for query in queries if query["sql"].startswith("UPDATE")]) == 2
+    assert recorder.pending() == 0
+    hits = dict(GoogleApiCache.objects.values_list("request_hash", "hit_count"))
+    assert hits == {"geocoding-0": 2, "geocoding-1": 2, "geocoding-2": 1}
+
+
+def test_purge_expired_deletes_in_bounded_batches(cache_db):
+    for index in range(5):
+        _cache_row("geocoding", index, expires_in=-60)
+    _cache_row("geocoding", "live")
+
+    assert cache_janitor.purge_expired(batch_size=2, max_batches=2) == 4
+    assert cache_janitor.purge_expired(batch_size=2) == 1
+    assert list(GoogleApiCache.objects.values_list("request_hash", flat=True)) == ["geocoding-live"]
+
+
+def test_row_budget_evicts_least_recently_used(cache_db):
+    for index, minutes in enumerate([5, 50, 1, 30]):
+        _cache_row("places_nearby", index, accessed_minutes_ago=minutes)
+    _cache_row("geocoding", 0, accessed_minutes_ago=100)
+
+    evicted = cache_janitor.enforce_budgets(row_budgets={"places_nearby": 2})
+
+    assert evicted == {"places_nearby": 2}
+    remaining = set(GoogleApiCache.objects.values_list("request_hash", flat=True))
+    assert remaining == {"places_nearby-0", "places_nearby-2", "geocoding-0"}
+
+
+def test_byte_budget_keeps_most_recent_rows(cache_db):
+    for index, minutes in enumerate([1, 2, 3]):
+        _cache_row("place_details", index, accessed_minutes_ago=minutes, size=100)
+    row_size = len(json.dumps({"blob": "x" * 100}))
+
+    evicted = cache_janitor.enforce_budgets(byte_budgets={"place_details": row_size * 2 + 5})
+
+    assert evicted == {"place_details": 1}
+    assert not GoogleApiCache.objects.filter(request_hash="place_details-2").exists()
+
+
+def test_prune_google_cache_command_reports_usage(cache_db):
+    _cache_row("geocoding", 0, expires_in=-1)
+    live = _cache_row("geocoding", 1)
+    GoogleApiCache.objects.filter(pk=live.pk).update(hit_count=3)
+
+    out = StringIO()
+    call_command("prune_google_cache", "--max-rows", "geocoding=10", "--report", stdout=out)
+    output = out.getvalue()
+    LOGGER.info("janitor 출력:\n%s", output)
+
+    assert "만료 캐시 1건" in output
+    assert "geocoding" in output and "hits=3" in output and "hit_ratio=75.0%" in output
+
+
+def _leg_row(index, *, expires_in=3600):
+    return RouteLegCache.objects.create(
+        origin_key=f"place:origin-{index}",
+        destination_key="place:destination",
+        travel_mode="DRIVE",
+        time_bucket=0,
+        duration_seconds=600,
+        expires_at=timezone.now() + timedelta(seconds=expires_in),
+    )
+
+
+def test_purge_expired_legs_deletes_in_bounded_batches(cache_db):
+    for index in range(5):
+        _leg_row(index, expires_in=-60)
+    _leg_row("live")
+
+    assert cache_janitor.purge_expired_legs(batch_size=2, max_batches=2) == 4
+    assert cache_janitor.purge_expired_legs(batch_size=2) == 1
+    assert list(RouteLegCache.objects.values_list("origin_key", flat=True)) == ["place:origin-live"]
+
+
+def test_prune_google_cache_command_purges_expired_legs(cache_db):
+    _leg_row(0, expires_in=-1)
+    _leg_row(1)
+
+    out = StringIO()
+    call_command("prune_google_cache", stdout=out)
+
+    assert "만료 구간 캐시 1건" in out.getvalue()
+    assert RouteLegCache.objects.count() == 1
+
+
+@override_settings(GOOGLE_API_CACHE_JANITOR_INTERVAL_SECONDS=3600)
+def test_periodic_janitor_hook_runs_once_per_interval(cache_db, monkeypatch):
+    monkeypatch.setattr(cache_janitor, "_last_run", float("-inf"))
+    _cache_row("geocoding", "old", expires_in=-1)
+
+    google_maps._save_cache("geocoding", {"address": "a"}, {"results": []}, 60)
+    assert not GoogleApiCache.objects.filter(request_hash="geocoding-old").exists()
+
+    _cache_row("geocoding", "old2", expires_in=-1)
+    google_maps._save_cache("geocoding", {"address": "b"}, {"results": []}, 60)
+    assert GoogleApiCache.objects.filter(request_hash="geocoding-old2").exists()
+
+
+# ---------------------------------------------------------------------------
+# stale-while-revalidate
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def refresh_executor():
+    """백그라운드 갱신을 직접 실행할 수 있도록 제출된 작업을 모아 두는 executor."""
+
+    class _QueuedExecutor:
+        def __init__(self):
+            self.jobs = []
+
+        def submit(self, fn):
+            self.jobs.append(fn)
+
+        def run_all(self):
+            jobs, self.jobs = self.jobs, []
+            for job in jobs:
+                job()
+
+    executor = _QueuedExecutor()
+    google_maps.set_refresh_executor(executor)
+    yield executor
+    google_maps.set_refresh_executor(None)
+
+
+def _expire(service_name, seconds_ago):
+    GoogleApiCache.objects.filter(service_name=service_name).update(
+        expires_at=timezone.now() - timedelta(seconds=seconds_ago)
+    )
+    google_maps.reset_memory_cache()
+
+
+@override_settings(GOOGLE_API_STALE_GRACE_SECONDS=600, GOOGLE_MAPS_API_KEY="test-key")
+def test_stale_entry_is_served_and_refreshed_once(cache_db, refresh_executor, monkeypatch):
+    calls = []
+
+    def _fake_fetch(service_name, url, params, timeout):
+        calls.append(params)
+        return {"status": "OK", "version": len(calls)}
+
+    monkeypatch.setattr(google_maps, "_fetch_get", _fake_fetch)
+    params = {"address": "서울역"}
+    assert google_maps._perform_get("test_api", "https://example.test", params, 60)["version"] == 1
+    _expire("test_api", 60)
+
+    # 만료됐지만 유예 시간 안이므로 이전 응답을 그대로 받고, 갱신은 한 번만 예약된다.
+    for _ in range(3):
+        assert google_maps._perform_get("test_api", "https://example.test", params, 60)["version"] == 1
+    assert len(calls) == 1
+    assert len(refresh_executor.jobs) == 1
+
+    refresh_executor.run_all()
+    assert len(calls) == 2
+    row = GoogleApiCache.objects.get()
+    assert row.response_data["version"] == 2 and not row.is_expired
+    assert google_maps._perform_get("test_api", "https://example.test", params, 60)["version"] == 2
+
+
+@override_settings(GOOGLE_API_STALE_GRACE_SECONDS=600, GOOGLE_MAPS_API_KEY="test-key")
+def test_entry_past_grace_window_is_fetched_synchronously(cache_db, refresh_executor, monkeypatch):
+    monkeypatch.setattr(google_maps, "_fetch_get", lambda *args: {"status": "OK", "fresh": True})
+    google_maps._save_cache("test_api", {"address": "a"}, {"status": "OK", "fresh": False}, 60)
+    _expire("test_api", 601)
+
+    assert google_maps._perform_get("test_api", "https://example.test", {"address": "a"}, 60)["fresh"] is True
+    assert refresh_executor.jobs == []
+
+
+@override_settings(GOOGLE_API_STALE_GRACE_SECONDS=600, GOOGLE_MAPS_API_KEY="test-key")
+def test_failed_refresh_keeps_stale_entry(cache_db, refresh_executor, monkeypatch):
+    google_maps._save_cache("test_api", {"address": "a"}, {"status": "OK", "v": 1}, 60)
+    _expire("test_api", 30)
+
+    def _broken(*args):
+        raise google_maps.GoogleMapsError("upstream down")
+
+    monkeypatch.setattr(google_maps, "_fetch_get", _broken)
+    assert google_maps._perform_get("test_api", "https://example.test", {"address": "a"}, 60)["v"] == 1
+    refresh_executor.run_all()
+
+    assert GoogleApiCache.objects.get().response_data["v"] == 1
+    # 실패 후에는 키가 비워져 다음 요청에서 다시 갱신을 시도한다.
+    assert google_maps._perform_get("test_api", "https://example.test", {"address": "a"}, 60)["v"] == 1
+    assert len(refresh_executor.jobs) == 1
+
+
+def test_single_flight_coalesces_concurrent_submissions():
+    flight = SingleFlight()
+    release = threading.Event()
+    runs = []
+
+    def _work():
+        runs.append(1)
+        release.wait(5)
+        return "done"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        first, started = flight.submit("key", executor, _work)
+        second, started_again = flight.submit("key", executor, _work)
+        assert started and not started_again and first is second
+        release.set()
+        assert first.result(5) == "done"
+
+    assert runs == [1]
+    assert not flight.in_flight("key")
+
+
+@override_settings(GOOGLE_API_STALE_GRACE_SECONDS=600)
+def test_purge_expired_keeps_rows_within_grace_window(cache_db):
+    _cache_row("geocoding", "recent", expires_in=-60)
+    _cache_row("geocoding", "old", expires_in=-3600)
+
+    assert cache_janitor.purge_expired() == 1
+    assert list(GoogleApiCache.objects.values_list("request_hash", flat=True)) == ["geocoding-recent"]
+
+
+# ---------------------------------------------------------------------------
+# 동시 요청 합치기(single-flight)
+# ---------------------------------------------------------------------------
+
+
+def test_concurrent_misses_share_one_upstream_call(monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+    saved = []
+
+    def _slow_fetch(service_name, url, params, timeout):
+        calls.append(params)
+        started.set()
+        release.wait(5)
+        return {"status": "OK", "results": ["서울역"]}
+
+    # DB는 쓰지 않고 캐시를 항상 놓치도록 만들어, 합치기 동작만 확인한다.
+    monkeypatch.setattr(google_maps, "_lookup_cache", lambda *args, **kwargs: (None, False))
+    monkeypatch.setattr(google_maps, "_save_cache", lambda *args, **kwargs: saved.append(args))
+    monkeypatch.setattr(google_maps, "_fetch_get", _slow_fetch)
+
+    def _call():
+        return google_maps._perform_get("test_api", "https://example.test", {"address": "서울역"}, 60)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        leader = executor.submit(_call)
+        assert started.wait(5)
+        followers = [executor.submit(_call) for _ in range(4)]
+        # 뒤따르는 호출이 모두 진행 중인 호출을 기다리기 시작할 시간을 준 뒤 응답을 돌려준다.
+        time.sleep(0.2)
+        release.set()
+        results = [leader.result(5)] + [future.result(5) for future in followers]
+
+    assert len(calls) == 1
+    assert len(saved) == 1
+    assert all(result == {"status": "OK", "results": ["서울역"]} for result in results)
+
+
+def test_single_flight_do_propagates_leader_error_and_resets():
+    flight = SingleFlight()
+
+    def _boom():
+        raise google_maps.GoogleMapsError("fail")
+
+    with pytest.raises(google_maps.GoogleMapsError):
+        flight.do("key", _boom)
+    assert flight.do("key", lambda: 42) == (42, True)
+    assert len(flight) == 0
+
+
+def test_save_cache_recovers_from_integrity_error(cache_db, monkeypatch):
+    google_maps._save_cache("geocoding", {"address": "a"}, {"v": 1}, 60)
+
+    def _conflict(**kwargs):
+        raise google_maps.IntegrityError("duplicate key")
+
+    monkeypatch.setattr(GoogleApiCache.objects, "update_or_create", _conflict)
+    google_maps._save_cache("geocoding", {"address": "a"}, {"v": 2}, 60)
+
+    assert GoogleApiCache.objects.get().response_data == {"v": 2}
+
+
+def test_advisory_lock_uses_postgres_session_lock(monkeypatch):
+    executed = []
+
+    class _Cursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, sql, params):
+            executed.append((sql, params[0]))
+
+        def fetchone(self):
+            return (True,)
+
+    class _Connection:
+        vendor = "postgresql"
+
+        def cursor(self):
+            return _Cursor()
+
+    monkeypatch.setattr(single_flight, "connection", _Connection())
+    with single_flight.advisory_lock("google:geocoding:abc") as locked:
+        assert locked
+
+    assert [sql for sql, _ in executed] == ["SELECT pg_try_advisory_lock(%s)", "SELECT pg_advisory_unlock(%s)"]
+    assert executed[0][1] == executed[1][1] < 2 ** 63
+
+
+def test_advisory_lock_is_noop_on_sqlite():
+    with single_flight.advisory_lock("google:geocoding:abc") as locked:
+        assert locked is False
+
+
+# ---------------------------------------------------------------------------
+# 캐시 키 계산 / 응답 축소 / 압축 저장
+# ---------------------------------------------------------------------------
+
+
+NEARBY_RESPONSE = {
+    "status": "OK",
+    "html_attributions": [],
+    "next_page_token": "token",
+    "results": [
+        {
+            "place_id": "p1",
+            "name": "경복궁",
+            "geometry": {"location": {"lat": 37.5796, "lng": 126.977}, "viewport": {"northeast": {}}},
+            "types": ["tourist_attraction"],
+            "rating": 4.6,
+            "user_ratings_total": 1000,
+            "vicinity": "서울 종로구",
+            "icon": "https://example.test/icon.png",
+            "plus_code": {"global_code": "8Q98HXHG+RQ"},
+            "photos": [
+                {"photo_reference": "ref-1", "width": 800, "height": 600, "html_attributions": ["<a>..</a>"]},
+                {"photo_reference": "ref-2", "width": 800, "height": 600, "html_attributions": []},
+            ],
+        }
+    ],
+}
+
+
+@override_settings(GOOGLE_MAPS_API_KEY="test-key")
+def test_nearby_response_is_projected_before_caching(cache_db, monkeypatch):
+    monkeypatch.setattr(google_maps, "_fetch_get", lambda *args: json.loads(json.dumps(NEARBY_RESPONSE)))
+
+    places = google_maps.fetch_nearby_places(latitude=37.5, longitude=126.9, place_type="tourist_attraction")
+
+    stored = GoogleApiCache.objects.get(service_name="places_nearby").response_data
+    assert set(stored) == {"status", "results"}
+    assert set(stored["results"][0]) == {
+        "place_id", "name", "geometry", "types", "rating", "user_ratings_total", "vicinity", "photos",
+    }
+    assert stored["results"][0]["geometry"] == {"location": {"lat": 37.5796, "lng": 126.977}}
+    assert stored["results"][0]["photos"] == [{"photo_reference": "ref-1", "width": 800, "height": 600}]
+    # 첫 호출 결과와 캐시 적중 결과가 같은 모양이어야 한다.
+    assert places[0].raw == stored["results"][0]
+    assert places[0].latitude == 37.5796 and places[0].rating == 4.6
+
+
+def test_unknown_service_response_is_not_projected():
+    data = {"status": "OK", "anything": [1, 2]}
+    assert google_maps.project_response("routes_compute", data) is data
+
+
+@override_settings(GOOGLE_MAPS_API_KEY="test-key")
+def test_request_hash_is_computed_once_per_call(cache_db, monkeypatch):
+    calls = []
+    original = google_maps._build_request_hash
+
+    def _counting(payload):
+        calls.append(payload)
+        return original(payload)
+
+    monkeypatch.setattr(google_maps, "_build_request_hash", _counting)
+    monkeypatch.setattr(google_maps, "_fetch_get", lambda *args: {"status": "OK", "results": []})
+
+    google_maps._perform_get("geocoding", "https://example.test", {"address": "부산역"}, 60)
+    google_maps.reset_memory_cache()
+    google_maps._perform_get("geocoding", "https://example.test", {"address": "부산역"}, 60)
+
+    assert len(calls) == 2
+
+
+@override_settings(GOOGLE_API_CACHE_COMPRESS=True)
+def test_compressed_payload_round_trips(cache_db):
+    payload = {"status": "OK", "results": [{"name": f"장소 {index}", "types": ["cafe"] * 5} for index in range(50)]}
+    google_maps._save_cache("places_nearby", {"q": 1}, payload, 60)
+
+    stored = GoogleApiCache.objects.get().response_data
+    assert set(stored) == {"_z"}
+    assert len(json.dumps(stored)) < len(json.dumps(payload, ensure_ascii=False))
+
+    google_maps.reset_memory_cache()
+    assert google_maps._load_cache("places_nearby", {"q": 1}) == payload
+
+
+def test_uncompressed_rows_still_load_when_compression_enabled(cache_db):
+    google_maps._save_cache("geocoding", {"q": 1}, {"status": "OK", "results": []}, 60)
+    google_maps.reset_memory_cache()
+
+    with override_settings(GOOGLE_API_CACHE_COMPRESS=True):
+        assert google_maps._load_cache("geocoding", {"q": 1}) == {"status": "OK", "results": []}
+
+
+# ---------------------------------------------------------------------------
+# Place 메타데이터 일괄 동기화
+# ---------------------------------------------------------------------------
+
+
+def _google_place(place_id, *, name="장소", lat=37.5, lng=127.0, address=None):
+    raw = {"vicinity": address} if address else {}
+    return google_maps.GooglePlace(
+        place_id=place_id,
+        name=name,
+        latitude=lat,
+        longitude=lng,
+        types=["cafe"],
+        rating=4.0,
+        user_ratings_total=10,
+        raw=raw,
+    )
+
+
+def test_sync_google_places_uses_constant_number_of_queries(db):
+    for index in range(5):
+        Place.objects.create(
+            name=f"기존 {index}",
+            google_place_id=f"existing-{index}",
+            latitude=Decimal("37.500000"),
+            longitude=Decimal("127.000000"),
+        )
+    incoming = [_google_place(f"existing-{index}") for index in range(5)]
+    incoming += [_google_place(f"new-{index}", name=f"신규 {index}") for index in range(25)]
+
+    with CaptureQueriesContext(connection) as queries:
+        synced = place_sync.sync_google_places(incoming)
+
+    # 조회 1번 + INSERT 1번 + 새 행 pk 조회 1번 + 바뀐 필드 조합(google_synced_at만) UPDATE 1번
+    assert len(queries) == 4
+    assert len(synced) == 30
+    assert Place.objects.filter(google_place_id__startswith="new-").count() == 25
+    assert all(place.pk for place in synced.values())
+
+
+def test_sync_google_places_updates_only_changed_fields(db):
+    unchanged = Place.objects.create(
+        name="그대로", google_place_id="same", address="서울", latitude=Decimal("37.500000"),
+        longitude=Decimal("127.000000"),
+    )
+    moved = Place.objects.create(
+        name="이동", google_place_id="moved", address="서울", latitude=Decimal("37.500000"),
+        longitude=Decimal("127.000000"),
+    )
+    # 로컬에서 바꾼 이름은 Google 동기화가 덮어쓰지 않는다.
+    Place.objects.filter(pk=moved.pk).update(name="운영자 수정")
+
+    place_sync.sync_google_places([
+        _google_place("same", address="서울"),
+        _google_place("moved", lat=37.6, address="부산"),
+    ])
+
+    unchanged.refresh_from_db()
+    moved.refresh_from_db()
+    assert unchanged.google_synced_at is not None and unchanged.address == "서울"
+    assert moved.address == "부산" and moved.latitude == Decimal("37.600000")
+    assert moved.longitude == Decimal("127.000000") and moved.name == "운영자 수정"
+
+
+def test_sync_google_places_merges_duplicate_ids_and_skips_missing_ids(db):
+    synced = place_sync.sync_google_places([
+        _google_place("dup", name="첫 번째", address="서울"),
+        _google_place("", name="ID 없음"),
+        _google_place("dup", name="두 번째", address="부산"),
+    ])
+
+    assert list(synced) == ["dup"]
+    place = Place.objects.get(google_place_id="dup")
+    assert place.name == "첫 번째" and place.address == "부산"
+    assert not Place.objects.filter(name="ID 없음").exists()
+
+
+def test_fixed_top_syncs_places_in_one_batch(api_client, db, monkeypatch):
+    def _fake_nearby(*, place_type, **kwargs):
+        return [_google_place(f"{place_type}-{index}") for index in range(3)]
+
+    monkeypatch.setattr("schedules.views.fetch_nearby_places", _fake_nearby)
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.post(
+            reverse("place-recommendation-fixed-top"),
+            {"latitude": 37.5, "longitude": 127.0},
+            format="json",
+        )
+
+    assert response.status_code == 200
+    place_queries = [query for query in queries if "schedules_place" in query["sql"]]
+    assert len(place_queries) == 3  # 조회 1번 + INSERT 1번 + 새 행 pk 조회 1번
+    assert Place.objects.count() == 3 * len(FIXED_RECOMMENDATION_PLACE_TYPES)
+
+
+def test_duplicate_google_place_id_is_rejected(db):
+    Place.objects.create(name="A", google_place_id="same-id")
+    Place.objects.create(name="빈 ID 1", google_place_id="")
+    Place.objects.create(name="빈 ID 2", google_place_id="")
+    Place.objects.create(name="ID 없음 1")
+    Place.objects.create(name="ID 없음 2")
+
+    with pytest.raises(IntegrityError), transaction.atomic():
+        Place.objects.create(name="B", google_place_id="same-id")
+
+
+def test_sync_google_places_tolerates_rows_inserted_concurrently(db, monkeypatch):
+    # 조회 시점에는 없었지만 INSERT 직전에 다른 요청이 같은 장소를 넣은 상황을 재현한다.
+    original = place_sync._load_places
+    calls = []
+
+    def _racing_load(ids):
+        calls.append(ids)
+        if len(calls) == 1:
+            result = original(ids)
+            Place.objects.create(name="먼저 저장됨", google_place_id="racy")
+            return result
+        return original(ids)
+
+    monkeypatch.setattr(place_sync, "_load_places", _racing_load)
+    synced = place_sync.sync_google_places([_google_place("racy", name="늦게 저장")])
+
+    assert Place.objects.filter(google_place_id="racy").count() == 1
+    assert synced["racy"].name == "먼저 저장됨"
+
+
+def test_place_pk_cache_serves_repeated_lookups(db):
+    place_sync.sync_google_places([_google_place("hot-1"), _google_place("hot-2")])
+
+    with CaptureQueriesContext(connection) as queries:
+        pks = place_sync.lookup_place_pks(["hot-1", "hot-2"])
+    assert len(queries) == 0
+    assert pks == dict(Place.objects.filter(google_place_id__startswith="hot-").values_list("google_place_id", "pk"))
+
+
+def test_place_pk_cache_recovers_from_deleted_rows(db):
+    place_sync.sync_google_places([_google_place("gone")])
+    Place.objects.filter(google_place_id="gone").delete()
+
+    synced = place_sync.sync_google_places([_google_place("gone", name="다시 추가")])
+
+    assert synced["gone"].name == "다시 추가"
+    assert place_sync.lookup_place_pks(["gone"]) == {"gone": synced["gone"].pk}
+
+
+def test_merge_duplicate_places_migration_repoints_relations(db):
+    migration = import_module("schedules.migrations.0009_place_google_place_id_unique")
+    keeper = Place.objects.create(name="원본", google_place_id="dup-id")
+    blank_place = Place.objects.create(name="빈 ID", google_place_id="")
+    # 마이그레이션 이전 상태(중복 허용)를 재현하기 위해 테스트 트랜잭션 안에서만 유니크 인덱스를 내린다.
+    with connection.cursor() as cursor:
+        cursor.execute('DROP INDEX "uniq_place_google_place_id"')
+    try:
+        duplicate = Place.objects.create(name="중복", google_place_id="dup-id", address="서울", latitude=Decimal("37.1"))
+        expense = OptionalExpense.objects.create(place=duplicate, item_name="오디오 가이드", price=3000)
+
+        migration.merge_duplicate_places(django_apps, None)
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'CREATE UNIQUE INDEX "uniq_place_google_place_id" ON "schedules_place" ("google_place_id") '
+                "WHERE \"google_place_id\" > ''"
+            )
+
+    keeper.refresh_from_db()
+    expense.refresh_from_db()
+    assert list(Place.objects.filter(google_place_id="dup-id")) == [keeper]
+    assert keeper.address == "서울" and keeper.latitude == Decimal("37.100000")
+    assert expense.place_id == keeper.pk
+    assert Place.objects.filter(pk=blank_place.pk).exists()
+
+
+# ---------------------------------------------------------------------------
+# 토큰 버킷 / sync_place_coordinates
+# ---------------------------------------------------------------------------
+
+
+def test_token_bucket_waits_for_refill():
+    clock = _FakeClock(0.0)
+    slept = []
+
+    def _sleep(seconds):
+        slept.append(seconds)
+        clock.now += seconds
+
+    bucket = rate_limit.TokenBucket(rate=2, capacity=2, clock=clock, sleep=_sleep)
+    for _ in range(4):
+        assert bucket.acquire()
+
+    # 처음 2개는 바로, 이후 2개는 각각 0.5초씩 기다린다.
+    assert slept == [0.5, 0.5]
+    assert bucket.acquire(timeout=0.1) is False
+
+
+@pytest.fixture
+def details_stub(monkeypatch):
+    """sync_place_coordinates가 부르는 fetch_place_details를 기록용 가짜로 바꾼다."""
+
+    calls = []
+    behaviours = {}
+
+    def _fake(google_place_id):
+        calls.append(google_place_id)
+        behaviour = behaviours.get(google_place_id)
+        if behaviour is not None:
+            raise behaviour
+        number = int(google_place_id.split("-")[1])
+        return _google_place(google_place_id, lat=37.0 + number / 100, lng=127.0 + number / 100)
+
+    monkeypatch.setattr(sync_place_coordinates, "fetch_place_details", _fake)
+    return calls, behaviours
+
+
+def _catalog(count):
+    return [Place.objects.create(name=f"장소 {index}", google_place_id=f"gp-{index}") for index in range(count)]
+
+
+def test_sync_place_coordinates_updates_in_chunks_with_workers(db, details_stub):
+    calls, behaviours = details_stub
+    places = _catalog(7)
+    behaviours["gp-3"] = google_maps.GoogleMapsError("NOT_FOUND")
+
+    out, err = StringIO(), StringIO()
+    with CaptureQueriesContext(connection) as queries:
+        call_command(
+            "sync_place_coordinates", "--workers", "4", "--chunk-size", "3", "--qps", "1000",
+            stdout=out, stderr=err,
+        )
+
+    assert sorted(calls) == sorted(place.google_place_id for place in places)
+    updates = [query for query in queries if query["sql"].startswith("UPDATE")]
+    assert len(updates) == 3  # 3개씩 3묶음, 묶음마다 bulk_update 한 번
+    assert "총 7건 중 6건 갱신, 1건 건너뜀" in out.getvalue()
+    assert "gp-3" not in out.getvalue() and "상세 조회 실패" in err.getvalue()
+
+    refreshed = {place.google_place_id: place for place in Place.objects.filter(google_place_id__startswith="gp-")}
+    assert refreshed["gp-5"].latitude == Decimal("37.050000") and refreshed["gp-5"].google_synced_at
+    assert refreshed["gp-3"].latitude is None and refreshed["gp-3"].google_synced_at is None
+
+
+def test_sync_place_coordinates_resumes_from_checkpoint(db, details_stub, tmp_path):
+    calls, behaviours = details_stub
+    _catalog(5)
+    checkpoint = tmp_path / "sync.json"
+    behaviours["gp-3"] = KeyboardInterrupt()
+
+    with pytest.raises(KeyboardInterrupt):
+        call_command(
+            "sync_place_coordinates", "--force", "--chunk-size", "2", "--checkpoint", str(checkpoint),
+            stdout=StringIO(), stderr=StringIO(),
+        )
+    saved = json.loads(checkpoint.read_text())
+    assert saved["processed"] == 2 and saved["threshold"] is None
+
+    del behaviours["gp-3"]
+    calls.clear()
+    out = StringIO()
+    call_command(
+        "sync_place_coordinates", "--force", "--chunk-size", "2", "--checkpoint", str(checkpoint), stdout=out,
+    )
+
+    assert calls == ["gp-2", "gp-3", "gp-4"]
+    assert "총 5건 중 5건 갱신" in out.getvalue()
+    assert not checkpoint.exists()
+    assert not Place.objects.filter(google_place_id__startswith="gp-", google_synced_at__isnull=True).exists()
+
+
+def test_sync_place_coordinates_honours_limit_and_max_age(db, details_stub):
+    calls, _ = details_stub
+    places = _catalog(4)
+    Place.objects.filter(pk=places[0].pk).update(google_synced_at=timezone.now())
+
+    call_command("sync_place_coordinates", "--limit", "2", stdout=StringIO())
+
+    assert calls == ["gp-1", "gp-2"]
+
+
+# ---------------------------------------------------------------------------
+# 서비스별 호출 한도(governor)
+# ---------------------------------------------------------------------------
+
+
+def _memory_governor(limits, clock, **kwargs):
+    def _sleep(seconds):
+        clock.now += seconds
+
+    return quota.GoogleApiGovernor(limits, clock=clock, sleep=_sleep, **kwargs)
+
+
+def test_governor_queues_within_max_wait_and_sheds_beyond():
+    clock = _FakeClock(0.0)
+    governor = _memory_governor({"places_nearby": quota.ServiceLimit(qps=2, burst=2)}, clock, max_wait_seconds=0.5)
+
+    for _ in range(3):
+        governor.acquire("places_nearby")  # 2건은 바로, 3번째는 토큰이 찰 때까지 0.5초 대기
+    assert clock.now == pytest.approx(0.5)
+
+    slow = _memory_governor({"places_nearby": quota.ServiceLimit(qps=1, burst=1)}, clock, max_wait_seconds=0.5)
+    slow.acquire("places_nearby")
+    with pytest.raises(quota.QuotaExceeded):
+        slow.acquire("places_nearby")  # 1초를 기다려야 하므로 거절
+
+    usage = {item.service_name: item for item in governor.usage()}["places_nearby"]
+    assert (usage.calls, usage.waited, usage.shed) == (3, 1, 0)
+    usage = {item.service_name: item for item in slow.usage()}["places_nearby"]
+    assert (usage.calls, usage.shed) == (1, 1)
+
+
+def test_governor_enforces_daily_quota_and_reports_usage():
+    governor = _memory_governor({"geocoding": quota.ServiceLimit(daily_quota=2)}, _FakeClock())
+    governor.acquire("geocoding")
+    governor.acquire("geocoding")
+    governor.acquire("routes_compute")  # 한도 없는 서비스는 집계만 한다.
+
+    with pytest.raises(quota.QuotaExceeded, match="일일 할당량"):
+        governor.acquire("geocoding")
+
+    report = {item.service_name: item for item in governor.usage()}
+    assert report["geocoding"].used_today == 2 and report["geocoding"].remaining_today == 0
+    assert report["geocoding"].shed == 1
+    assert report["routes_compute"].calls == 1 and report["routes_compute"].remaining_today is None
+
+
+def test_cache_backed_governors_share_limits_across_instances():
+    cache.clear()
+    wall = _FakeClock(1_000.2)
+    sleeps = []
+
+    def _sleep(seconds):
+        sleeps.append(seconds)
+        wall.now += seconds
+
+    limits = {"place_details": quota.ServiceLimit(qps=2, daily_quota=3)}
+    # 두 인스턴스는 서로 다른 워커 프로세스를 흉내 낸다.
+    first, second = (
+        quota.GoogleApiGovernor(limits, backend="cache", wall_clock=wall, sleep=_sleep, max_wait_seconds=1)
+        for _ in range(2)
+    )
+    first.acquire("place_details")
+    second.acquire("place_details")
+    first.acquire("place_details")  # 같은 1초 창에서 3번째이므로 다음 창까지 대기
+    assert sleeps == [pytest.approx(0.8)]
+
+    with pytest.raises(quota.QuotaExceeded):
+        second.acquire("place_details")
+    assert {item.service_name: item for item in first.usage()}["place_details"].used_today == 3
+    cache.clear()
+
+
+@override_settings(GOOGLE_MAPS_API_KEY="test-key")
+def test_quota_exceeded_is_a_google_maps_error_and_skips_http(cache_db, http_session):
+    adapter = _RecordingAdapter({"status": "OK", "results": []})
+    session = requests.Session()
+    session.mount("https://", adapter)
+    http_session(session)
+    quota.set_governor(quota.GoogleApiGovernor({"geocoding": quota.ServiceLimit(daily_quota=0)}))
+
+    with pytest.raises(google_maps.GoogleQuotaExceeded):
+        google_maps.geocode_address("서울")
+    assert issubclass(google_maps.GoogleQuotaExceeded, google_maps.GoogleMapsError)
+    assert adapter.calls == []
+
+
+def test_google_usage_endpoint_exposes_governor_state(api_client):
+    governor = quota.GoogleApiGovernor({"places_nearby": quota.ServiceLimit(qps=5, daily_quota=100)})
+    governor.acquire("places_nearby")
+    quota.set_governor(governor)
+
+    response = api_client.get(reverse("place-recommendation-google-usage"))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["backend"] == "memory"
+    assert body["services"] == [
+        {
+            "service_name": "places_nearby",
+            "qps": 5,
+            "daily_quota": 100,
+            "used_today": 1,
+            "calls": 1,
+            "waited": 0,
+            "shed": 0,
+            "remaining_today": 99,
+        }
+    ]
+
+
+@override_settings(GOOGLE_MAPS_RATE_LIMITS={"geocoding": {"qps": 5, "daily_quota": 10}})
+def test_google_quota_status_command_lists_configured_services():
+    out = StringIO()
+    call_command("google_quota_status", stdout=out)
+
+    assert "geocoding" in out.getvalue() and "used_today=0/10" in out.getvalue()
+
+
+
+# ---------------------------------------------------------------------------
+# 오프라인 가짜 Google 서버
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def fake_google(cache_db, http_session):
+    """가짜 Google 서버를 띄우고 GOOGLE_MAPS_BASE_URL이 그 주소를 가리키게 한다. 오류 주입 확인을 위해 재시도는 끈다."""
+
+    http_session(http_client.build_session(max_retries=0))
+    with fake_google_maps.FakeGoogleMapsServer() as server:
+        with override_settings(GOOGLE_MAPS_BASE_URL=server.url, GOOGLE_MAPS_API_KEY="fake-key"):
+            yield server
+
+
+def test_fake_google_serves_consistent_places(fake_google):
+    location = google_maps.geocode_address("서울특별시 중구 세종대로 110")
+    again = google_maps.geocode_address("서울특별시 중구 세종대로 110")
+    assert (location.latitude, location.longitude) == (again.latitude, again.longitude)
+    assert fake_google.request_counts["geocoding"] == 1  # 두 번째는 캐시 적중
+
+    places = google_maps.fetch_nearby_places(
+        latitude=location.latitude, longitude=location.longitude, place_type="cafe", radius=500
+    )
+    assert len(places) == fake_google.config.results_per_type
+    assert all(place.rating is not None and "cafe" in place.types for place in places)
+
+    details = google_maps.fetch_place_details(places[0].place_id)
+    assert (details.latitude, details.longitude) == (places[0].latitude, places[0].longitude)
+
+
+def test_fake_google_routes_match_matrix(fake_google):
+    stops = [
+        {"location": {"latLng": {"latitude": 37.5665, "longitude": 126.9780}}},
+        {"placeId": "fake:cafe:37.580000:127.000000"},
+    ]
+
+    route = google_maps.compute_route_duration(origin=stops[0], destination=stops[1])
+    google_maps.reset_memory_cache()
+    RouteLegCache.objects.all().delete()
+    elements = google_maps.compute_route_matrix(origins=stops, destinations=stops)
+
+    assert route.seconds > 60 and route.distance_meters > 0
+    by_pair = {(element.origin_index, element.destination_index): element for element in elements}
+    assert by_pair[(0, 1)].duration_seconds == route.seconds
+    assert by_pair[(0, 0)].duration_seconds == 0
+    walk = google_maps.compute_route_duration(origin=stops[0], destination=stops[1], travel_mode="WALK")
+    assert walk.seconds > route.seconds
+
+
+def test_fake_google_matrix_rejects_unwrapped_waypoints(fake_google):
+    url = google_maps._endpoint(google_maps.ROUTE_MATRIX_ENDPOINT)
+    headers = {"X-Goog-Api-Key": "fake-key"}
+    bare = {"origins": [{"placeId": "fake:cafe:37.580000:127.000000"}], "destinations": [{"placeId": "fake:cafe:37.580000:127.000000"}]}
+    wrapped = {key: [{"waypoint": waypoint} for waypoint in value] for key, value in bare.items()}
+
+    rejected = requests.post(url, json=bare, headers=headers, timeout=5)
+    assert rejected.status_code == 400
+    assert rejected.json()["error"]["status"] == "INVALID_ARGUMENT"
+
+    accepted = requests.post(url, json=wrapped, headers=headers, timeout=5)
+    assert accepted.status_code == 200
+    assert accepted.json()[0]["duration"] == "0s"
+
+
+def test_fake_google_injects_errors_and_latency(fake_google):
+    fake_google.config.error_rate = 1.0
+    fake_google.config.error_services = frozenset({"places_nearby"})
+    with pytest.raises(google_maps.GoogleMapsError):
+        google_maps.fetch_nearby_places(latitude=37.5, longitude=127.0, place_type="cafe")
+    # 대상이 아닌 서비스는 정상 응답합니다.
+    assert google_maps.geocode_address("부산").latitude is not None
+
+    fake_google.config.error_rate = 0.0
+    fake_google.config.latency_ms = 50
+    started = time.perf_counter()
+    google_maps.fetch_place_details("fake:museum:37.500000:127.000000")
+    assert time.perf_counter() - started >= 0.05
+
+
+def test_base_url_override_separates_cache_keys():
+    payload = {"address": "서울"}
+    real = google_maps._build_request_hash(payload)
+    assert google_maps._endpoint(google_maps.GEOCODING_ENDPOINT) == google_maps.GEOCODING_ENDPOINT
+
+    with override_settings(GOOGLE_MAPS_BASE_URL="http://127.0.0.1:8765/"):
+        assert google_maps._build_request_hash(payload) != real
+        assert (
+            google_maps._endpoint(google_maps.ROUTES_COMPUTE_ENDPOINT)
+            == "http://127.0.0.1:8765/directions/v2:computeRoutes"
+        )
+
+
+def test_fake_google_legs_do_not_leak_into_real_leg_cache(fake_google):
+    origin = {"placeId": "fake:cafe:37.570000:126.980000"}
+    destination = {"placeId": "fake:museum:37.580000:127.000000"}
+    google_maps.compute_route_duration(origin=origin, destination=destination)
+    assert route_legs.lookup_legs([(origin, destination)], "DRIVE")[0] is not None
+
+    with override_settings(GOOGLE_MAPS_BASE_URL=""):
+        assert route_legs.lookup_legs([(origin, destination)], "DRIVE") == [None]
+        route_legs.store_legs([(origin, destination, 42, 100)], "DRIVE")
+    # 실제 구간을 저장해도 가짜 서버 쪽 값은 그대로다.
+    assert route_legs.lookup_legs([(origin, destination)], "DRIVE")[0].seconds != 42
+    assert RouteLegCache.objects.count() == 2
+
+
+def test_fixed_top_runs_against_fake_google(api_client, fake_google, monkeypatch):
+    # 테스트 DB는 트랜잭션 안의 SQLite라 작업 스레드가 같은 테이블을 읽지 못하므로 카테고리 조회를 현재 스레드에서 실행한다.
+    monkeypatch.setattr(fanout, "get_fanout_executor", single_flight.InlineExecutor)
+    monkeypatch.setattr(fanout, "close_old_connections", lambda: None)
+    response = api_client.post(
+        reverse("place-recommendation-fixed-top"),
+        {"latitude": 37.5665, "longitude": 126.9780},
+        format="json",
+    )
+
+    assert response.status_code == 200
+    assert fake_google.request_counts["places_nearby"] == len(FIXED_RECOMMENDATION_PLACE_TYPES)
+    assert Place.objects.filter(google_place_id__startswith="fake:").exists()
@@ -5,9 +5,10 @@
 각 클래스/메서드에 한국어 주석을 충분히 추가해 초보 개발자도 흐름을 따라올 수 있도록 배려합니다.
 """
 import logging
+from dataclasses import asdict
 from datetime import datetime, time, timedelta
-from decimal import Decimal
 
+from django.conf import settings
 from django.db import transaction
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
@@ -47,10 +48,16 @@ from .services import (
     GooglePlace,
     build_location_payload,
     build_place_id_payload,
-    compute_route_duration,
+    RouteDuration,
+    compute_leg_durations,
+    compute_route_matrix,
+    fetch_categories_concurrently,
+    find_cached_legs,
     fetch_nearby_places,
     fetch_place_details,
     geocode_address,
+    get_governor,
+    sync_google_places,
 )
 from drf_spectacular.utils import (
     OpenApiParameter,
@@ -167,7 +174,7 @@ class ScheduleViewSet(TripLookupMixin, viewsets.ModelViewSet):
         1. 요청으로 전달된 Schedule ID 순서를 신뢰하여 `order` 값을 새로 지정합니다.
         2. 각 일정의 체류 시간(Place.activity_time → 기존 duration → 기본값)을 기준으로
            `start_time`과 `end_time`을 다시 계산합니다.
-        3. 인접한 일정 사이의 이동 시간은 Google Routes API로 계산하되,
+        3. 인접한 일정 사이의 이동 시간은 Google Routes API(Route Matrix 일괄 호출)로 계산하되,
            좌표/Place ID가 없는 경우에는 0분으로 간주합니다.
         4. 모든 계산이 끝나면 최신 Schedule 목록과 이동 요약 정보를 반환합니다.
         """
@@ -327,34 +334,22 @@ class ScheduleViewSet(TripLookupMixin, viewsets.ModelViewSet):
         return self.DEFAULT_VISIT_MINUTES
 
     def _calculate_travel_seconds(self, schedules, travel_mode):
-        """인접한 일정 간 이동 시간을 초 단위로 반환합니다."""
+        """인접한 일정 간 이동 시간을 초 단위로 반환합니다.
 
-        travel_seconds = []
-
-        for current, nxt in zip(schedules, schedules[1:]):
-            origin = self._build_route_waypoint(current)
-            destination = self._build_route_waypoint(nxt)
-
-            if not origin or not destination:
-                # 좌표/Place ID가 없는 경우에는 이동 시간을 계산할 수 없어 0초로 간주합니다.
-                travel_seconds.append(0)
-                continue
+        구간마다 Routes API를 부르지 않고 ``compute_leg_durations``로 하루 전체 구간을 한꺼번에 계산합니다.
+        좌표/Place ID가 없거나 경로를 찾지 못한 구간, API 호출이 실패한 경우는 0초로 간주합니다.
+        """
 
-            try:
-                route = compute_route_duration(
-                    origin=origin,
-                    destination=destination,
-                    travel_mode=travel_mode,
-                )
-            except GoogleMapsError as exc:
-                logger.warning(
-                    "Routes API 호출 실패로 이동 시간을 0초로 처리합니다: %s", exc
-                )
-                travel_seconds.append(0)
-            else:
-                travel_seconds.append(route.seconds)
+        waypoints = [self._build_route_waypoint(schedule) for schedule in schedules]
+        try:
+            legs = compute_leg_durations(waypoints, travel_mode=travel_mode)
+        except GoogleMapsError as exc:
+            logger.warning(
+                "Routes API 호출 실패로 이동 시간을 0초로 처리합니다: %s", exc
+            )
+            return [0] * max(len(schedules) - 1, 0)
 
-        return travel_seconds
+        return [leg.seconds if leg is not None else 0 for leg in legs]
 
     def _build_route_waypoint(self, schedule: Schedule):
         """Routes API 호출에 사용할 waypoint payload를 생성합니다."""
@@ -474,29 +469,34 @@ class PlaceRecommendationViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # ---- 2) 고정된 카테고리 목록을 순회하며 Places API 결과를 수집합니다. ----
-        category_results = []
-        for place_type in FIXED_RECOMMENDATION_PLACE_TYPES:
-            try:
-                places = fetch_nearby_places(
-                    latitude=latitude,
-                    longitude=longitude,
-                    place_type=place_type,
-                    radius=self.RECOMMENDATION_RADIUS_METERS,
-                )
-            except GoogleMapsError as exc:
-                return Response(
-                    {
-                        "detail": str(exc),
-                        "failed_category": place_type,
-                    },
-                    status=status.HTTP_502_BAD_GATEWAY,
-                )
+        # ---- 2) 고정된 카테고리를 동시에 검색합니다(순서는 FIXED_RECOMMENDATION_PLACE_TYPES 그대로). ----
+        fetched = fetch_categories_concurrently(
+            latitude=latitude,
+            longitude=longitude,
+            place_types=FIXED_RECOMMENDATION_PLACE_TYPES,
+            radius=self.RECOMMENDATION_RADIUS_METERS,
+            fetch=fetch_nearby_places,
+        )
+        if all(result.failed for result in fetched):
+            # 모든 카테고리가 실패했다면 Google API 자체 문제이므로 기존처럼 502로 알립니다.
+            return Response(
+                {
+                    "detail": fetched[0].error,
+                    "failed_category": fetched[0].category,
+                },
+                status=status.HTTP_502_BAD_GATEWAY,
+            )
+
+        # 추천 결과도 Place 테이블에 저장해 두면 이후 재요청 시 DB에서 곧바로 재사용할 수 있습니다.
+        # 카테고리 전체 결과를 모아 한 번에 반영합니다.
+        self._sync_places_metadata(
+            place for result in fetched for place in result.places[: self.MAX_RESULTS_PER_CATEGORY]
+        )
 
+        category_results = []
+        for result in fetched:
             shortlisted = []
-            for place in places[: self.MAX_RESULTS_PER_CATEGORY]:
-                # 추천 결과도 Place 테이블에 저장해 두면 이후 재요청 시 DB에서 곧바로 재사용할 수 있습니다.
-                self._sync_place_metadata(place)
+            for place in result.places[: self.MAX_RESULTS_PER_CATEGORY]:
                 # Places API 응답의 첫 번째 사진을 가져옵니다. 없으면 None을 그대로 유지합니다.
                 photo_reference = None
                 photos = place.raw.get("photos") if place.raw else None
@@ -521,8 +521,10 @@ class PlaceRecommendationViewSet(viewsets.ViewSet):
 
             category_results.append(
                 {
-                    "category": place_type,
+                    "category": result.category,
                     "places": shortlisted,
+                    # 일부 카테고리만 실패하면 나머지 결과는 그대로 주고, 실패 사유를 표시합니다.
+                    "error": result.error,
                 }
             )
 
@@ -609,49 +611,44 @@ class PlaceRecommendationViewSet(viewsets.ViewSet):
                 status=status.HTTP_200_OK,
             )
 
-        # ---- 3) 원본 경로(A→X→Y) 이동 시간을 구합니다. ----
+        # ---- 3) A→X→Y와 A→후보→Y 구간 시간을 Route Matrix 두 번으로 한꺼번에 구합니다. ----
+        # 후보가 많을 경우 상위 10개까지만 평가합니다(결과는 최대 5개).
+        evaluated = [candidate for candidate in candidates[: self.MAX_ALTERNATIVE_RESULTS * 2] if candidate.place_id]
         try:
-            original_route = compute_route_duration(
-                origin=build_place_id_payload(params["previous_place_id"]),
-                destination=build_place_id_payload(params["next_place_id"]),
-                intermediates=[build_place_id_payload(unavailable_place.place_id)],
+            legs = self._compute_via_legs(
+                previous_place_id=params["previous_place_id"],
+                next_place_id=params["next_place_id"],
+                via_place_ids=[unavailable_place.place_id] + [candidate.place_id for candidate in evaluated],
                 travel_mode=params["travel_mode"],
             )
         except GoogleMapsError as exc:
             return Response(
                 {
                     "detail": str(exc),
+                    "failed_step": "route_matrix",
+                },
+                status=status.HTTP_502_BAD_GATEWAY,
+            )
+
+        original_route = legs[0]
+        if original_route is None:
+            return Response(
+                {
+                    "detail": "원래 경로(A→X→Y)의 이동 시간을 계산하지 못했습니다.",
                     "failed_step": "original_route",
                 },
                 status=status.HTTP_502_BAD_GATEWAY,
             )
 
         alternative_payloads = []
-        # 후보가 많을 경우 상위 5개만 평가합니다.
-        for candidate in candidates[: self.MAX_ALTERNATIVE_RESULTS * 2]:
-            # 후보 중 위경도 등이 누락된 경우가 있으므로 방어적으로 처리합니다.
-            if not candidate.place_id:
-                continue
-
-            try:
-                candidate_route = compute_route_duration(
-                    origin=build_place_id_payload(params["previous_place_id"]),
-                    destination=build_place_id_payload(params["next_place_id"]),
-                    intermediates=[build_place_id_payload(candidate.place_id)],
-                    travel_mode=params["travel_mode"],
-                )
-            except GoogleMapsError as exc:
-                # 개별 후보에서만 실패하면 다음 후보를 이어서 평가합니다.
-                logger.warning(
-                    "Routes API 실패로 후보를 건너뜀: place_id=%s error=%s",
-                    candidate.place_id,
-                    exc,
-                )
+        accepted = []
+        for candidate, candidate_route in zip(evaluated, legs[1:]):
+            if candidate_route is None:
+                # 개별 후보에서만 경로를 찾지 못하면 다음 후보를 이어서 평가합니다.
+                logger.warning("Route Matrix에 경로가 없어 후보를 건너뜀: place_id=%s", candidate.place_id)
                 continue
 
-            # 후보 정보도 Place 테이블에 저장해 두면 추후 재사용이 편해집니다.
-            self._sync_place_metadata(candidate)
-
+            accepted.append(candidate)
             delta_seconds = candidate_route.seconds - original_route.seconds
             alternative_payloads.append(
                 {
@@ -676,6 +673,8 @@ class PlaceRecommendationViewSet(viewsets.ViewSet):
             if len(alternative_payloads) >= self.MAX_ALTERNATIVE_RESULTS:
                 break
 
+        # 후보 정보도 Place 테이블에 저장해 두면 추후 재사용이 편해집니다.
+        self._sync_places_metadata(accepted)
         alternative_payloads.sort(key=lambda item: item["delta_seconds"])
 
         response_payload = {
@@ -689,9 +688,104 @@ class PlaceRecommendationViewSet(viewsets.ViewSet):
 
         return Response(response_payload, status=status.HTTP_200_OK)
 
+    # ------------------------------------------------------------------
+    # 3) Google API 사용 현황 (운영자용)
+    # ------------------------------------------------------------------
+    @extend_schema(summary="Google Maps 서비스별 호출 한도/사용 현황", request=None, responses={200: None})
+    @action(detail=False, methods=["get"], url_path="google-usage")
+    def google_usage(self, request, *args, **kwargs):
+        """서비스별 QPS 한도, 일일 할당량 사용량, 대기/거절 횟수를 반환합니다.
+
+        calls/waited/shed는 응답한 서버 프로세스 기준이며, used_today는 cache 백엔드를 쓰면 전체 프로세스 합계입니다.
+        """
+
+        services = []
+        for usage in get_governor().usage():
+            payload = asdict(usage)
+            payload["remaining_today"] = usage.remaining_today
+            services.append(payload)
+        return Response(
+            {
+                "backend": getattr(settings, "GOOGLE_MAPS_GOVERNOR_BACKEND", "memory"),
+                "services": services,
+                "generated_at": timezone.now().isoformat(),
+            },
+            status=status.HTTP_200_OK,
+        )
+
     # ------------------------------------------------------------------
     # Helper methods
     # ------------------------------------------------------------------
+    @staticmethod
+    def _compute_via_legs(*, previous_place_id, next_place_id, via_place_ids, travel_mode):
+        """A→경유지→Y 총 이동 시간을 경유지마다 계산합니다.
+
+        경유지마다 computeRoutes를 부르는 대신, 구간 캐시(RouteLegCache)에 없는 구간만 모아
+        A→[경유지들]과 [경유지들]→Y 최대 두 번의 Route Matrix 호출로 구한 뒤 더합니다.
+        반환 목록은 via_place_ids 순서를 따르며, 어느 한 구간이라도 경로가 없으면 해당 위치는 None입니다.
+        waypoint는 감싸지 않은 채 넘기며, ``{"waypoint": ...}`` 형태로는 compute_route_matrix가 감쌉니다.
+        """
+
+        previous = build_place_id_payload(previous_place_id)
+        following = build_place_id_payload(next_place_id)
+        via_payloads = [build_place_id_payload(place_id) for place_id in via_place_ids]
+        count = len(via_payloads)
+
+        cached = find_cached_legs(
+            [(previous, via) for via in via_payloads] + [(via, following) for via in via_payloads],
+            travel_mode=travel_mode,
+        )
+        to_via, from_via = cached[:count], cached[count:]
+
+        missing_inbound = [index for index, leg in enumerate(to_via) if leg is None]
+        if missing_inbound:
+            inbound = compute_route_matrix(
+                origins=[previous],
+                destinations=[via_payloads[index] for index in missing_inbound],
+                travel_mode=travel_mode,
+            )
+            for element in inbound:
+                if element.has_route and element.destination_index < len(missing_inbound):
+                    to_via[missing_inbound[element.destination_index]] = element
+
+        missing_outbound = [index for index, leg in enumerate(from_via) if leg is None]
+        if missing_outbound:
+            outbound = compute_route_matrix(
+                origins=[via_payloads[index] for index in missing_outbound],
+                destinations=[following],
+                travel_mode=travel_mode,
+            )
+            for element in outbound:
+                if element.has_route and element.origin_index < len(missing_outbound):
+                    from_via[missing_outbound[element.origin_index]] = element
+
+        routes = []
+        for first, second in zip(to_via, from_via):
+            if first is None or second is None:
+                routes.append(None)
+                continue
+            first_seconds, first_distance = PlaceRecommendationViewSet._leg_values(first)
+            second_seconds, second_distance = PlaceRecommendationViewSet._leg_values(second)
+            distance = None
+            if first_distance is not None and second_distance is not None:
+                distance = first_distance + second_distance
+            routes.append(
+                RouteDuration(
+                    seconds=first_seconds + second_seconds,
+                    distance_meters=distance,
+                    raw={"legs": [first.raw, second.raw]},
+                )
+            )
+        return routes
+
+    @staticmethod
+    def _leg_values(leg):
+        """구간 캐시(RouteDuration)와 Route Matrix 요소(RouteMatrixElement)에서 (초, 거리)를 꺼냅니다."""
+
+        if isinstance(leg, RouteDuration):
+            return leg.seconds, leg.distance_meters
+        return leg.duration_seconds, leg.distance_meters
+
     def _build_base_route_payload(self, params, unavailable_place, route):
         """응답 공통 영역(원본 경로 정보)을 생성합니다."""
 
@@ -764,64 +858,13 @@ class PlaceRecommendationViewSet(viewsets.ViewSet):
     def _sync_place_metadata(self, google_place: GooglePlace):
         """Places API 결과를 로컬 Place 모델에 기록하거나 갱신합니다."""
 
-        if not google_place.place_id:
-            # place_id가 없으면 후속 연동이 불가능하므로 조용히 종료합니다.
-            return
-
-        place = Place.objects.filter(google_place_id=google_place.place_id).first()
-
-        formatted_address = None
-        if getattr(google_place, "raw", None):
-            formatted_address = (
-                    google_place.raw.get("formatted_address")
-                    or google_place.raw.get("vicinity")
-            )
-
-        if place is None:
-            # 기존 Place가 없다면 최소한의 정보로 신규 레코드를 만들어 둡니다.
-            place = Place(
-                name=google_place.name or "이름 미상 장소",
-                google_place_id=google_place.place_id,
-            )
-            if formatted_address:
-                place.address = formatted_address
-
-            if google_place.latitude is not None:
-                place.latitude = Decimal(str(google_place.latitude))
-            if google_place.longitude is not None:
-                place.longitude = Decimal(str(google_place.longitude))
-
-            place.google_synced_at = timezone.now()
-            place.save()
-            return
-
-        fields_to_update = []
+        self._sync_places_metadata([google_place])
 
-        if not place.google_place_id:
-            place.google_place_id = google_place.place_id
-            fields_to_update.append("google_place_id")
-
-        if formatted_address and place.address != formatted_address:
-            place.address = formatted_address
-            fields_to_update.append("address")
-
-        if google_place.latitude is not None:
-            new_lat = Decimal(str(google_place.latitude))
-            if place.latitude != new_lat:
-                place.latitude = new_lat
-                fields_to_update.append("latitude")
-
-        if google_place.longitude is not None:
-            new_lng = Decimal(str(google_place.longitude))
-            if place.longitude != new_lng:
-                place.longitude = new_lng
-                fields_to_update.append("longitude")
-
-        place.google_synced_at = timezone.now()
-        fields_to_update.append("google_synced_at")
+    @staticmethod
+    def _sync_places_metadata(google_places):
+        """여러 Places API 결과를 조회 한 번 + bulk 저장으로 Place 모델에 반영합니다."""
 
-        if fields_to_update:
-            place.save(update_fields=fields_to_update)
+        return sync_google_places(google_places)
 
 
 # ============================================================================